@@ -16,7 +16,82 @@
  *  - MODEL_THRESHOLD_Q15, SCALE_DECISION_TH    (optional; to get float threshold)
  *  - IFOREST_MAX_SAMPLES, IFOREST_C_MAXSAMPLES (float const)
  */
+#if MODEL_RUNTIME_IMAGE
+/* Same symbols, served from a binary image loaded at runtime (see model_image.h).
+ * The node layout is fixed at build time (-DCHILDREN_ADJACENT=1 etc.); images with
+ * another layout are rejected. */
+#include "model_image.h"
+#ifndef CHILDREN_TREE_LOCAL
+#define CHILDREN_TREE_LOCAL 0
+#endif
+#ifndef CHILDREN_ADJACENT
+#define CHILDREN_ADJACENT 0
+#endif
+#ifndef MODEL_NARROW_TYPES
+#define MODEL_NARROW_TYPES 0
+#endif
+#define MODEL_LAYOUT ((CHILDREN_TREE_LOCAL ? MODEL_LAYOUT_TREE_LOCAL : 0u) | \
+                      (CHILDREN_ADJACENT ? MODEL_LAYOUT_ADJACENT : 0u) | \
+                      (MODEL_NARROW_TYPES ? MODEL_LAYOUT_NARROW : 0u))
+#if MODEL_NARROW_TYPES
+typedef int16_t child_t; typedef int8_t feat_t;
+#else
+typedef int32_t child_t; typedef int16_t feat_t;
+#endif
+static model_image_t g_model;
+#define NUM_FEATURES          5
+#define NUM_TREES             ((int)g_model.num_trees)
+#define SCALE_MEAN            (g_model.scale_mean)
+#define SCALE_SCALE           (g_model.scale_scale)
+#define SCALE_THRESHOLDS      (g_model.scale_thresholds)
+#define SCALE_DECISION_TH     (g_model.scale_decision_th)
+#define IFOREST_C_MAXSAMPLES  (g_model.c_maxsamples)
+#define MODEL_THRESHOLD_Q15   (g_model.model_threshold_q15)
+#define scaler_mean_q15       (g_model.scaler_mean_q15)
+#define scaler_scale_q15      (g_model.scaler_scale_q15)
+#define features_idx          ((const feat_t*)g_model.features_idx)
+#define thresholds_q15        (g_model.thresholds_q15)
+#define children_left         ((const child_t*)g_model.children_left)
+#define children_right        ((const child_t*)g_model.children_right)
+#define node_samples          (g_model.node_samples)
+#define tree_offsets          (g_model.tree_offsets)
+
+bool iforest_load_image(const char* path)
+{
+  model_image_t m;
+  const int rc = model_image_load_file(path, &m);
+  if (rc != MODEL_IMAGE_OK){
+    fprintf(stderr, "model image %s: error %d\n", path, rc);
+    return false;
+  }
+  if (m.num_features != NUM_FEATURES || m.flags != MODEL_LAYOUT){
+    fprintf(stderr, "model image %s: %u features / layout %u, firmware expects %d / %u\n", path,
+            (unsigned)m.num_features, (unsigned)m.flags, NUM_FEATURES, (unsigned)MODEL_LAYOUT);
+    model_image_free(&m);
+    return false;
+  }
+  model_image_free(&g_model);   /* scoring is single-threaded: swap between windows */
+  g_model = m;
+  fprintf(stdout, "model image %s loaded (version %s, %u trees)\n", path, g_model.version, (unsigned)g_model.num_trees);
+  return true;
+}
+#else
 #include "ml/model_iforest.h"
+/* make_z() fills exactly these five; a header for another feature set must not build. */
+#if !defined(NUM_FEATURES) || NUM_FEATURES != 5
+#error "ml/model_iforest.h must define NUM_FEATURES 5 (the features computed in this file)"
+#endif
+
+bool iforest_load_image(const char* path){ (void)path; return false; }
+#endif
+
+/* Node layout written by the exporter (src/forest_opt.py); absent = sklearn layout. */
+#ifndef CHILDREN_TREE_LOCAL
+#define CHILDREN_TREE_LOCAL 0
+#endif
+#ifndef CHILDREN_ADJACENT
+#define CHILDREN_ADJACENT 0
+#endif
 
 /* ---------- ring buffer for last few milliseconds ---------- */
 #define BUF_MAX  ( (FS_HZ/1000) * (WIN_MS + 4) )  // slightly longer than window
@@ -158,13 +233,18 @@ static inline float c_of(float n)
 /* Traverse one tree, return path length with leaf-size correction. */
 static float tree_path_length(int tree_idx, const float z[])
 {
-  int node = tree_offsets[tree_idx];
+  const int base = tree_offsets[tree_idx];
+  int node = base;
   int steps = 0;
 
   for (;;){
     const int feat  = features_idx[node];
     const int left  = children_left[node];
+#if CHILDREN_ADJACENT
+    const int right = (left == -1) ? -1 : left + 1;
+#else
     const int right = children_right[node];
+#endif
 
     if (left == -1 && right == -1) {        // leaf
       const int ns = (node_samples[node] <= 0) ? 1 : node_samples[node];
@@ -172,7 +252,7 @@ static float tree_path_length(int tree_idx, const float z[])
     }
     const float thr = q15_to_real(thresholds_q15[node], SCALE_THRESHOLDS);
     const float val = z[feat];
-    node = (val <= thr) ? left : right;
+    node = ((val <= thr) ? left : right) + (CHILDREN_TREE_LOCAL ? base : 0);
 
     if (++steps > 1024) return (float)steps; // safety
   }
@@ -181,6 +261,9 @@ static float tree_path_length(int tree_idx, const float z[])
 /* Aggregate path lengths across trees → anomaly score s(x)=2^{-E[h]/c(ms)} (higher ⇒ more anomalous). */
 float iforest_score(const features_t* f)
 {
+#if MODEL_RUNTIME_IMAGE
+  if (NUM_TREES == 0) return 0.0f;          // no image loaded: rules only
+#endif
   float z[NUM_FEATURES]; make_z(f, z);
 
   float sum_h = 0.0f;
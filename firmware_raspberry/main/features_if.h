@@ -23,6 +23,10 @@ bool  feats_compute(features_t* out);
 */
 float iforest_score(const features_t* f);
 
+/* Load or replace the forest from a binary model image (params.h MODEL_RUNTIME_IMAGE=1).
+   Returns false, keeping the current model, if the image is invalid or runtime images are disabled. */
+bool  iforest_load_image(const char* path);
+
 /* Return IF threshold (float). Uses the model’s exported value if available; otherwise fallback. */
 float iforest_threshold(void);
 
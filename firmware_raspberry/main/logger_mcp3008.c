@@ -51,9 +51,57 @@ static inline uint16_t mcp3008_read(int fd, uint8_t ch){
   return (uint16_t)(((rx[1] & 3) << 8) | rx[2]); // 10 bits
 }
 
+// --- Sortie binaire colonnaire (.praw), format décrit dans src/rawcap.py ---
+#define PRAW_COLS  7
+#define PRAW_CHUNK 4096
+static const char* PRAW_NAMES[PRAW_COLS] = {"time_s","Vin_V","Iin_A","Vout_V","Iout_A","Temp_C","ripple_V"};
+static double praw_t[PRAW_CHUNK];
+static float  praw_c[PRAW_COLS-1][PRAW_CHUNK];
+static uint32_t praw_n = 0;
+
+static int ends_with(const char* s, const char* suf){
+  size_t a = strlen(s), b = strlen(suf);
+  return a >= b && strcmp(s + a - b, suf) == 0;
+}
+
+static void praw_header(FILE* f, double fs){
+  uint8_t hdr[64] = {0};
+  const uint16_t version = 1, ncols = PRAW_COLS;
+  const uint32_t data_off = 64 + 32*PRAW_COLS;
+  const double t0 = 0.0;
+  memcpy(hdr, "PSRAW1\0\0", 8);
+  memcpy(hdr+8, &version, 2); memcpy(hdr+10, &ncols, 2); memcpy(hdr+12, &data_off, 4);
+  memcpy(hdr+16, &fs, 8); memcpy(hdr+24, &t0, 8);
+  fwrite(hdr, 1, sizeof hdr, f);
+  for (int k=0; k<PRAW_COLS; k++){
+    uint8_t col[32] = {0};
+    const double scale = 1.0, offset = 0.0;
+    strncpy((char*)col, PRAW_NAMES[k], 14);
+    col[14] = (k == 0) ? 'd' : 'f';
+    memcpy(col+16, &scale, 8); memcpy(col+24, &offset, 8);
+    fwrite(col, 1, sizeof col, f);
+  }
+}
+
+static void praw_flush(FILE* f){
+  if (!praw_n) return;
+  static const uint8_t zero[8] = {0};
+  uint8_t chdr[16] = {'C','H','N','K'};
+  memcpy(chdr+4, &praw_n, 4);
+  fwrite(chdr, 1, sizeof chdr, f);
+  fwrite(praw_t, sizeof(double), praw_n, f);
+  const size_t fbytes = praw_n * sizeof(float);
+  for (int k=0; k<PRAW_COLS-1; k++){
+    fwrite(praw_c[k], 1, fbytes, f);
+    fwrite(zero, 1, ((fbytes + 7) & ~(size_t)7) - fbytes, f);  // colonnes alignées sur 8 octets
+  }
+  fflush(f);
+  praw_n = 0;
+}
+
 int main(int argc, char** argv){
   if (argc < 4){
-    fprintf(stderr, "Usage: %s out.csv sample_rate_Hz duration_s\n", argv[0]);
+    fprintf(stderr, "Usage: %s out.csv|out.praw sample_rate_Hz duration_s\n", argv[0]);
     return 1;
   }
   const char* csv = argv[1];
@@ -80,7 +128,9 @@ int main(int argc, char** argv){
   if (!f){ perror("fopen"); return 1; }
   setvbuf(f, NULL, _IOFBF, 1<<20); // gros buffer
 
-  fprintf(f, "time_s,Vin_V,Iin_A,Vout_V,Iout_A,Temp_C,ripple_V\n");
+  const int binary = ends_with(csv, ".praw");
+  if (binary) praw_header(f, (double)rate);
+  else fprintf(f, "time_s,Vin_V,Iin_A,Vout_V,Iout_A,Temp_C,ripple_V\n");
 
   const double ts = 1.0 / (double)rate;
   const double t0 = now_s();
@@ -131,12 +181,22 @@ int main(int argc, char** argv){
     double ripple_v = USE_RIPPLE ? (v_rip_adc * K_RIPPLE) : 0.0;
 
     double rel_t = now_s() - t0;
+    if (binary){
+      praw_t[praw_n] = rel_t;
+      praw_c[0][praw_n] = (float)vin;  praw_c[1][praw_n] = (float)iin;
+      praw_c[2][praw_n] = (float)vout; praw_c[3][praw_n] = (float)iout;
+      praw_c[4][praw_n] = (float)temp_c; praw_c[5][praw_n] = (float)ripple_v;
+      if (++praw_n == PRAW_CHUNK) praw_flush(f);  // un bloc complet = lisible côté Python
+      ++n;
+      continue;
+    }
     fprintf(f, "%.6f,%.6f,%.6f,%.6f,%.6f,%.3f,%.6f\n",
             rel_t, vin, iin, vout, iout, temp_c, ripple_v);
 
     if ((++n % (rate/2)) == 0) fflush(f); // flush ~2x/s
   }
 
+  if (binary) praw_flush(f);
   fclose(f);
   close(spi_fd);
   fprintf(stderr, "Done. Wrote %s\n", csv);
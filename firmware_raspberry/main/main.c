@@ -3,11 +3,17 @@
 #include <time.h>
 #include <sched.h>
 #include <unistd.h>
+#include <signal.h>
 
 #include "params.h"
 #include "features_if.h"
 #include "power_fdir.h"
 
+static volatile sig_atomic_t reload_model = 0;
+#if MODEL_RUNTIME_IMAGE
+static void on_sighup(int sig){ (void)sig; reload_model = 1; }
+#endif
+
 /* Sleep helper with CLOCK_MONOTONIC. */
 static void sleep_ms(int ms){
   struct timespec ts = { ms/1000, (long)(ms%1000)*1000000L };
@@ -28,13 +34,26 @@ int main(void)
   }
   feats_reset();
 
+#if MODEL_RUNTIME_IMAGE
+  if (!iforest_load_image(MODEL_IMAGE_PATH)){
+    fprintf(stderr, "no valid model image at %s\n", MODEL_IMAGE_PATH);
+    return 1;
+  }
+  signal(SIGHUP, on_sighup);     /* new image pushed: `kill -HUP <pid>` */
+#endif
+
   const int hop_ms = HOP_MS;     // 1 ms
-  const float thr  = iforest_threshold();  // from model, or fallback
+  float thr = iforest_threshold();  // from model, or fallback
 
   fprintf(stdout, "IF threshold = %.6f ; loop hop = %d ms\n", thr, hop_ms);
 
   /* === Main 1 ms loop === */
   while (1){
+    if (reload_model){
+      reload_model = 0;
+      if (iforest_load_image(MODEL_IMAGE_PATH)) thr = iforest_threshold();
+    }
+
     /* 1) Read latest raw samples (replace stub in power_fdir.c with real ADC). */
     float vin,iin,vout,iout,temp,ripple;
     read_latest_raw(&vin,&iin,&vout,&iout,&temp,&ripple);
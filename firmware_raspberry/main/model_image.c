@@ -0,0 +1,169 @@
+#include "model_image.h"
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+/* Little-endian host assumed (Raspberry Pi, x86): arrays are used in place. */
+
+static uint32_t rd32(const uint8_t* p){ uint32_t v; memcpy(&v, p, 4); return v; }
+static uint16_t rd16(const uint8_t* p){ uint16_t v; memcpy(&v, p, 2); return v; }
+static float    rdf(const uint8_t* p){ float v; memcpy(&v, p, 4); return v; }
+
+uint32_t model_image_crc32(uint32_t crc, const uint8_t* p, size_t n)
+{
+  static uint32_t table[256];
+  static int ready = 0;
+  if (!ready){
+    for (uint32_t i=0; i<256; ++i){
+      uint32_t c = i;
+      for (int k=0; k<8; ++k) c = (c & 1) ? 0xEDB88320u ^ (c >> 1) : (c >> 1);
+      table[i] = c;
+    }
+    ready = 1;
+  }
+  crc = ~crc;
+  while (n--) crc = table[(crc ^ *p++) & 0xFF] ^ (crc >> 8);
+  return ~crc;
+}
+
+static size_t pad4(size_t n){ return (n + 3u) & ~(size_t)3u; }
+
+int32_t model_image_child(const model_image_t* m, const void* children, size_t i)
+{
+  return (m->flags & MODEL_LAYOUT_NARROW) ? ((const int16_t*)children)[i] : ((const int32_t*)children)[i];
+}
+
+int model_image_parse(const uint8_t* buf, size_t len, model_image_t* m)
+{
+  if (len < MODEL_IMAGE_HDR_SIZE) return MODEL_IMAGE_E_SIZE;
+  if (memcmp(buf, "PSIMG1\0\0", 8) != 0) return MODEL_IMAGE_E_MAGIC;
+  if (rd16(buf + 8) != MODEL_IMAGE_FORMAT) return MODEL_IMAGE_E_FORMAT;
+
+  const size_t hsize = rd16(buf + 10);
+  const size_t plen  = rd32(buf + 72);
+  if (hsize < MODEL_IMAGE_HDR_SIZE || len < hsize + plen) return MODEL_IMAGE_E_SIZE;
+  uint32_t crc = model_image_crc32(0, buf, 76);
+  crc = model_image_crc32(crc, buf + hsize, plen);
+  if (crc != rd32(buf + 76)) return MODEL_IMAGE_E_CRC;
+
+  memset(m, 0, sizeof(*m));
+  m->flags        = rd32(buf + 12);
+  m->num_trees    = rd32(buf + 16);
+  m->num_features = rd32(buf + 20);
+  m->num_nodes    = rd32(buf + 24);
+  m->max_samples  = rd32(buf + 28);
+  m->scale_mean        = rdf(buf + 32);
+  m->scale_scale       = rdf(buf + 36);
+  m->scale_thresholds  = rdf(buf + 40);
+  m->scale_decision_th = rdf(buf + 44);
+  m->c_maxsamples      = rdf(buf + 48);
+  m->model_threshold_q15 = (int16_t)rd16(buf + 52);
+  memcpy(m->version, buf + 56, 16);
+  m->version[16] = '\0';
+
+  const size_t F = m->num_features, N = m->num_nodes, T = m->num_trees;
+  const int narrow   = (m->flags & MODEL_LAYOUT_NARROW) != 0;
+  const int adjacent = (m->flags & MODEL_LAYOUT_ADJACENT) != 0;
+  const int local    = (m->flags & MODEL_LAYOUT_TREE_LOCAL) != 0;
+  const size_t fb = narrow ? 1 : 2, cb = narrow ? 2 : 4;
+  const size_t need = 2*pad4(2*F) + pad4(fb*N) + 2*pad4(2*N) + (adjacent ? 1 : 2)*pad4(cb*N) + pad4(4*T);
+  if (need > plen) return MODEL_IMAGE_E_SIZE;
+
+  const uint8_t* p = buf + hsize;
+  m->scaler_mean_q15  = (const int16_t*)p; p += pad4(2*F);
+  m->scaler_scale_q15 = (const int16_t*)p; p += pad4(2*F);
+  m->features_idx     = p;                 p += pad4(fb*N);
+  m->thresholds_q15   = (const int16_t*)p; p += pad4(2*N);
+  m->node_samples     = (const int16_t*)p; p += pad4(2*N);
+  m->children_left    = p;                 p += pad4(cb*N);
+  if (!adjacent){ m->children_right = p;   p += pad4(cb*N); }
+  m->tree_offsets     = (const int32_t*)p;
+
+  /* never walk outside a tree or backwards, whatever the image says */
+  for (size_t t=0; t<T; ++t){
+    const int32_t base = m->tree_offsets[t];
+    const int32_t end  = (t + 1 < T) ? m->tree_offsets[t+1] : (int32_t)N;
+    if (base < 0 || base >= end || end > (int32_t)N) return MODEL_IMAGE_E_SIZE;
+    for (int32_t i=base; i<end; ++i){
+      const int32_t l = model_image_child(m, m->children_left, (size_t)i);
+      const int32_t r = adjacent ? (l < 0 ? -1 : l + 1) : model_image_child(m, m->children_right, (size_t)i);
+      if ((l < 0) != (r < 0)) return MODEL_IMAGE_E_SIZE;
+      if (l < 0) continue;
+      const int32_t gl = l + (local ? base : 0), gr = r + (local ? base : 0);
+      if (gl <= i || gl >= end || gr <= i || gr >= end) return MODEL_IMAGE_E_SIZE;
+      const int feat = narrow ? ((const int8_t*)m->features_idx)[i] : ((const int16_t*)m->features_idx)[i];
+      if (feat < 0 || (size_t)feat >= F) return MODEL_IMAGE_E_SIZE;
+    }
+  }
+  return MODEL_IMAGE_OK;
+}
+
+static uint8_t* read_file(const char* path, size_t* len)
+{
+  FILE* f = fopen(path, "rb");
+  if (!f) return NULL;
+  uint8_t* buf = NULL;
+  if (fseek(f, 0, SEEK_END) == 0){
+    const long n = ftell(f);
+    if (n > 0 && fseek(f, 0, SEEK_SET) == 0 && (buf = malloc((size_t)n))){
+      if (fread(buf, 1, (size_t)n, f) != (size_t)n){ free(buf); buf = NULL; }
+      else *len = (size_t)n;
+    }
+  }
+  fclose(f);
+  return buf;
+}
+
+int model_image_load_file(const char* path, model_image_t* m)
+{
+  size_t len = 0;
+  uint8_t* buf = read_file(path, &len);        /* malloc: suitably aligned */
+  if (!buf) return MODEL_IMAGE_E_IO;
+  const int rc = model_image_parse(buf, len, m);
+  if (rc != MODEL_IMAGE_OK){ free(buf); return rc; }
+  m->owned = buf;
+  return MODEL_IMAGE_OK;
+}
+
+void model_image_free(model_image_t* m)
+{
+  free(m->owned);
+  memset(m, 0, sizeof(*m));
+}
+
+int model_image_apply_delta(const uint8_t* base, size_t base_len,
+                            const uint8_t* delta, size_t delta_len,
+                            uint8_t** out, size_t* out_len)
+{
+  if (delta_len < 24 || memcmp(delta, "PSDLT1\0\0", 8) != 0) return MODEL_IMAGE_E_MAGIC;
+  if (model_image_crc32(0, base, base_len) != rd32(delta + 8)) return MODEL_IMAGE_E_BASE;
+  const size_t n_out = rd32(delta + 12);
+  const uint32_t n_ops = rd32(delta + 20);
+
+  uint8_t* dst = malloc(n_out ? n_out : 1);
+  if (!dst) return MODEL_IMAGE_E_IO;
+  size_t pos = 24, w = 0;
+  for (uint32_t k=0; k<n_ops; ++k){
+    if (pos + 5 > delta_len) goto bad;
+    const uint8_t tag = delta[pos];
+    if (tag == 'C'){
+      if (pos + 9 > delta_len) goto bad;
+      const size_t off = rd32(delta + pos + 1), n = rd32(delta + pos + 5);
+      if (off > base_len || n > base_len - off || n > n_out - w) goto bad;
+      memcpy(dst + w, base + off, n);
+      w += n; pos += 9;
+    } else if (tag == 'I'){
+      const size_t n = rd32(delta + pos + 1);
+      pos += 5;
+      if (n > delta_len - pos || n > n_out - w) goto bad;
+      memcpy(dst + w, delta + pos, n);
+      w += n; pos += n;
+    } else goto bad;
+  }
+  if (w != n_out || model_image_crc32(0, dst, n_out) != rd32(delta + 16)) goto bad;
+  *out = dst; *out_len = n_out;
+  return MODEL_IMAGE_OK;
+bad:
+  free(dst);
+  return MODEL_IMAGE_E_SIZE;
+}
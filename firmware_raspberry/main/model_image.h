@@ -0,0 +1,60 @@
+#pragma once
+#include <stdint.h>
+#include <stddef.h>
+
+/*
+ * Runtime-loadable Isolation Forest image (layout in src/model_image.py).
+ * Same Q15 arrays and scales as ml/model_iforest.h, packed little-endian with a CRC-32,
+ * so a retrained model can be swapped without recompiling the firmware.
+ */
+
+#define MODEL_IMAGE_FORMAT    1
+#define MODEL_IMAGE_HDR_SIZE  80
+
+/* Layout flags (src/forest_opt.py), stored in the image header */
+#define MODEL_LAYOUT_TREE_LOCAL  1u   /* child indices relative to the tree's first node */
+#define MODEL_LAYOUT_ADJACENT    2u   /* right child = left child + 1, no children_right */
+#define MODEL_LAYOUT_NARROW      4u   /* int16 children, int8 features_idx */
+
+enum {
+  MODEL_IMAGE_OK = 0,
+  MODEL_IMAGE_E_IO = -1,        /* file missing / short read / out of memory */
+  MODEL_IMAGE_E_MAGIC = -2,
+  MODEL_IMAGE_E_FORMAT = -3,
+  MODEL_IMAGE_E_SIZE = -4,      /* truncated, or sizes disagree with the header */
+  MODEL_IMAGE_E_CRC = -5,
+  MODEL_IMAGE_E_BASE = -6,      /* delta made against another base image */
+};
+
+typedef struct {
+  uint32_t flags;
+  uint32_t num_trees, num_features, num_nodes, max_samples;
+  float    scale_mean, scale_scale, scale_thresholds, scale_decision_th, c_maxsamples;
+  int16_t  model_threshold_q15;
+  char     version[17];
+
+  /* views into the image buffer; features_idx / children_* element types follow `flags` */
+  const int16_t *scaler_mean_q15, *scaler_scale_q15;
+  const int16_t *thresholds_q15, *node_samples;
+  const int32_t *tree_offsets;
+  const void    *features_idx, *children_left, *children_right;   /* children_right NULL if adjacent */
+
+  uint8_t* owned;               /* buffer freed by model_image_free(), NULL if borrowed */
+} model_image_t;
+
+uint32_t model_image_crc32(uint32_t crc, const uint8_t* p, size_t n);
+
+/* Validate `buf` (4-byte aligned, kept alive by the caller) and point `m` into it. */
+int  model_image_parse(const uint8_t* buf, size_t len, model_image_t* m);
+
+/* children_left/right[i] as int32, whatever the stored width. */
+int32_t model_image_child(const model_image_t* m, const void* children, size_t i);
+
+/* Read + validate a whole image file; `m` owns the buffer on success. */
+int  model_image_load_file(const char* path, model_image_t* m);
+void model_image_free(model_image_t* m);
+
+/* Rebuild a target image from `base` + delta; *out is malloc'ed on success. */
+int  model_image_apply_delta(const uint8_t* base, size_t base_len,
+                             const uint8_t* delta, size_t delta_len,
+                             uint8_t** out, size_t* out_len);
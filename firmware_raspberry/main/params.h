@@ -27,3 +27,9 @@
 
 // ===== IF threshold fallback (only used if not exported by model_iforest.h) =====
 #define IF_THRESHOLD_F_FALLBACK   0.56f
+
+// ===== Model source =====
+#ifndef MODEL_RUNTIME_IMAGE
+#define MODEL_RUNTIME_IMAGE 0       // 1 = load the forest from MODEL_IMAGE_PATH at start-up (SIGHUP reloads)
+#endif
+#define MODEL_IMAGE_PATH    "ml/model_iforest.bin"   // image from src/model_image.py
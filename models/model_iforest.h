@@ -33,8 +33,8 @@ static const int16_t features_idx[NUM_NODES] = {0, 0, 1, 3, 1, -2, 1, -2, -2, 3,
 /* threshold per node (Q15, dequant with SCALE_THRESHOLDS) */
 static const int16_t thresholds_q15[NUM_NODES] = {2302, -1296, -12984, -1530, -14089, -17300, -13658, -17300, -17300, 2347, -22212, -17300, -17300, -13888, -17300, -17300, -7310, -5455, -6546, -3168, -16377, -17300, -17300, -6512, -17300, -17300, -17300, -11067, -20198, -17300, 18175, -17300, -17300, 2420, 11976, -17300, -17300, -8713, -17300, -17300, 1420, 5671, -5591, -1242, -17300, -17300, 7189, -17300, -17300, -539, 3926, -17300, -17300, -12813, -17300, -17300, 14535, 2414, -5763, -17300, -17300, 4849, -17300, -17300, 21639, 2391, -17300, -17300, -17300, -991, -3449, -7357, -4386, -17300, -17300, -17300, 1553, -11655, -858, -17300, -17300, -6599, -17300, 1227, -17300, -17300, 19, -891, -17300, -17300, -17300, 9621, 17817, -1301, -17300, 8227, 7669, -17300, -17300, 1294, -17300, -17300, -17300, 3998, -9644, -17300, 14660, 13040, -17300, -17300, -17300, -6367, 10796, -17300, -17300, -17300, 126, -2610, -7406, -3349, -6121, 17838, -12942, -17300, -17300, -17300, 14203, 2478, -17300, -17300, -17300, 12204, -4639, -17300, -17300, -17300, 10027, -7812, -17300, -3952, -5568, -17300, -17300, -17300, -2563, -5516, -17300, -17300, -17300, 2584, -17300, -6916, -10292, -11778, 7548, -17300, -17300, -12803, -17300, -17300, -9634, -17300, -9241, -17300, -17300, 7473, 13643, 17465, -17300, -17300, -17300, 15296, 7083, -17300, -17300, 18953, -17300, -17300, 12128, 4585, -7690, -17300, 3596, 8329, 1890, -17300, -17300, 11250, -17300, -17300, 4054, 4062, -17300, -17300, -17300, -5652, -6584, -17300, -17300, 8264, 9473, 3734, -17300, -17300, 12188, -17300, -17300, -2224, -17300, -17300, 15740, 8293, 14112, 4271, -2334, -17300, -17300, -17300, -17300, 14916, -17300, -17300, 7068, -17300, -17300, 2738, -7798, -17899, -1598, -9219, -17300, -2678, -17300, -17300, -24516, -17300, -313, -17300, -17300, 4123, -6078, -12723, -15712, -17300, -17300, 300, -11349, -17300, -17300, -17300, -8044, -12241, -17300, -9098, -17300, -17300, 1568, -3554, -17300, -17300, -17300, 6598, 14456, -10433, -17300, 7028, -17300, -17300, -17300, -17300, -25866, -17300, -10097, -11270, -14591, -17300, 979, -17300, -17300, 763, -10885, -16085, -17300, -17300, -17300, 9866, -17300, -17300, 7301, -2466, 8203, -14986, -17300, -17300, -4778, -17300, -17300, 878, -15162, -17300, -17300, 2192, -17300, -17300, -2142, 17658, 5695, -17300, -17300, -17300, 10296, 1736, -17300, -17300, -17300, 16822, 14869, 7112, 11120, 7301, 3385, 2350, -17300, -17300, 4292, -17300, -17300, 18586, 522, -17300, -17300, -1945, -17300, -17300, -17300, 6297, 9515, 8503, 7776, -17300, -17300, -17300, 11912, -2824, -17300, -17300, 13649, -17300, -17300, -17300, 5079, -17300, 4435, -17300, -17300, -17300, 670, -21568, -17300, -13975, -17029, 11736, -17300, -17300, -16012, -17300, -8649, -17300, -17300, -22298, -2555, -17300, -17300, -15910, -17300, -1184, -16417, -17300, -9678, -17300, -17300, -1895, -5375, -17300, -17300, 1863, -17300, -17300, -8445, -13252, 13370, -5977, -17300, 11976, -16711, -1922, -17300, -17300, 6870, -17300, -17300, -20211, -17300, -17300, -17300, 2739, -9967, -17300, -17300, -5094, -17300, 9685, 3175, 7146, -17300, -17300, -17300, -8822, -17300, -17300, 11504, 8937, -3446, -5415, -8069, -397, -17300, -17300, 6228, -17300, -17300, -3798, 967, -17300, -17300, 4721, -17300, -17300, -11679, 8042, 3502, -17300, -17300, -17300, 6634, 4370, -17300, -17300, 4937, -17300, -17300, 19581, 25751, 15666, 12445, -17300, -17300, 16388, -17300, -17300, -17300, -17300, 7056, 1742, 9918, -2712, -85, -17300, -17300, -17300, 12710, -2940, -17300, -17300, -17300, 7063, -17300, -17300, 6956, -17300, -17300, -9840, -7630, -19127, -17300, -15131, -17300, -14337, -17300, -17300, 15637, -25561, -17300, 495, 9205, -3465, -1864, -17300, -17300, 2046, -17300, -17300, -4742, -17300, 10955, -17300, -17300, 6322, 3507, -4567, -17300, -17300, -10825, -17300, -17300, -17300, -17300, 18587, -1597, 1215, 19374, -12674, -16972, -81, -17300, -17300, -15133, -17300, -17300, 12992, 2623, -17300, -17300, -7784, -17300, -17300, 19861, -17300, -17300, 6711, 4374, -7895, -19749, -17300, -17300, 5054, -17300, -17300, 5283, 3014, -17300, -17300, -611, -17300, -17300, 8066, -17300, 6461, 6668, -17300, -17300, 8453, -17300, -17300, 10432, 23184, -19181, -17300, 853, -5321, -17300, -17300, 14120, -17300, -17300, -17300, -5552, 12408, 12238, -7616, -17300, -17300, -17300, -15789, -17300, -7984, -17300, -17300, 7802, -3708, -1716, -17300, -17300, 150, -17300, -17300, -3810, -17300, 10726, -17300, -17300, -17300, -8904, 6188, -13346, -9660, -17300, -17300, 4044, 15195, -18453, -4194, -17300, 282, -17300, -17300, -13985, -4008, -17300, -17300, -11730, -17300, -17300, -17300, 16433, 10149, -12817, 3780, -17300, -17300, -17300, 2830, -15591, -17300, -17300, 1727, -17300, -17300, -3642, -17300, -17300, 8101, -6911, -17300, -2534, -17300, -17300, -17300, 10930, 4391, -3050, -1954, -10489, -7715, -4384, -17300, -17300, -17300, -2051, -2700, -17300, -17300, -17300, -10418, 1529, -8698, -17300, -17300, -12574, -17300, -17300, 876, -4021, -17300, -17300, 14412, -17300, -17300, 8845, -12625, 3391, -18804, -17300, -17300, -15253, -17300, -17300, -13952, -17300, -3209, -17300, -17300, 16839, 10465, -17300, 9198, -17300, -17300, 21294, -17300, -17300, 14594, 8625, 20083, -12655, 7055, -17300, -17300, -9214, -17300, -17300, -17300, 9836, -17300, -17300, 16434, 6924, -17300, -17300, -17300, 6979, -955, -2895, -5520, -17300, 3329, -17300, -17300, 830, -1704, -17300, 7827, -17300, -17300, -17300, 4202, -14430, -17300, -17300, 14729, 30802, 12058, -17300, -17300, -17300, -17300, 15006, 20767, -11183, -11285, -17300, -17300, 12338, -17300, 16470, -17300, -17300, -17300, 21507, 16346, -17300, -17300, -17300, 15650, -16542, 9576, 10008, -815, -17300, 4016, -17300, -17300, -17300, 10349, -17300, -17300, 18621, 4271, 9195, -15178, -18265, -19063, -17300, -17300, 3865, -17300, -17300, -12422, -13332, -17300, -17300, 2489, -17300, -17300, 3036, 22414, 5258, -17300, -17300, -17300, -17300, -9251, -11972, -12887, 13106, -17300, -17300, -17300, -10741, -17300, -17300, 6732, 14584, -2328, -17300, -17300, -17300, 16877, 11329, -17300, -17300, 3448, -17300, -17300, -17300, 3085, 20556, -3454, 17770, -17071, -17300, -17300, -17300, -17300, -12642, -17300, 27499, -17300, -17300, 10078, 4633, 17005, -9835, -17300, -17300, 18368, -17300, -17300, -17300, -17300, -13770, 6613, -17220, -17300, -3499, -17300, -4232, -17300, -17300, -17300, 17593, -20781, -1332, -17300, 1483, -17300, -17300, -2124, -10387, -8221, -14728, -17300, -11307, -17300, -17300, -3821, -5591, -17300, -17300, -4782, -17300, -17300, -2671, -5136, 6754, -17300, -17300, -6046, -17300, -17300, 5266, -15955, -17300, -17300, 9985, -17300, -17300, -7337, -17300, -12863, 8584, -840, -17300, -17300, 8819, -17300, -17300, 5613, 15076, -17300, -17300, 23816, -17300, -17300, 6654, 12042, -17300, -17300, 9651, -17300, -17300, -3413, -5921, -19341, -17300, -16186, 4280, -17300, -17300, -11282, -7874, -17300, -17300, -2223, -8208, -6505, -17300, -17300, -5494, -17300, -17300, -6982, -17300, -17300, -16694, -17300, 17214, 13547, -22552, -17300, -14850, -8281, -17300, -17300, 9990, -17300, -17300, 4830, -11815, -17300, -17300, -17300, -17300, -11138, 8049, 10254, -8954, -17300, 1331, -17300, 492, 4625, -17300, -17300, -3397, -17300, -17300, -17300, -17056, -17300, -9705, -11994, -17300, -17300, -17300, 8928, 14743, 9818, -21302, -17300, -11795, -1041, -17300, -17300, -272, -17300, -17300, 2170, 24775, 1048, -17300, -17300, -17300, 12788, 10439, -17300, -17300, -17300, -9533, -6182, -17300, -14736, -17300, -17300, -1884, 2956, -1348, -17300, -17300, -17300, 1104, 24949, -17300, -17300, 4138, -17300, -17300, -1647, -3767, 13336, 3290, -14122, -17300, -17300, -17300, -17300, -17300, 7458, 1972, -17300, 9664, 3584, -17300, -17300, 3943, -17300, -17300, 8646, -17300, -1562, -3706, -17300, -17300, 10031, -17300, -17300, -19762, -20889, -23305, -17300, -17300, 158, -17300, -17300, 9080, -4819, 288, -7320, -6636, -17300, -12368, -17300, -6153, -17300, -17300, -9425, -9379, -10670, -17300, -17300, -4923, -17300, -17300, 2385, -7880, -17300, -17300, -4081, -17300, -17300, -8687, -8055, -17300, -3969, 3821, -17300, -17300, -9936, -17300, -17300, -9822, 756, -17300, -6722, -17300, -17300, 3850, -3517, -17300, -17300, -5847, -17300, -17300, 779, 8074, -19691, 414, -17300, -17300, -9577, 3283, -17300, -17300, -4110, -17300, -17300, 20336, -15206, -17300, -7599, -17300, -17300, -17300, -25304, -17300, 10089, -8324, -16078, -17300, -17300, -10879, -17300, -17300, 20036, 7263, -17300, -17300, -17300, -14398, -20538, -17300, -13807, -14914, 7678, -17300, -17300, -17300, -10865, -14645, -17300, -17300, -17300, 14303, 4798, 12616, 5256, -2907, -17300, -17300, -3004, -17300, -17300, 2550, 14183, -17300, -17300, 9694, -17300, -17300, 256, -6537, -17300, -17300, 11096, 13164, -17300, -17300, -17300, 5163, 19127, 17346, -17300, -17300, -17300, 19521, 10925, -17300, -17300, -17300, 10516, 17752, 2633, 5173, -10989, 2115, 4104, -14631, -17300, -17300, 6141, -17300, -17300, 5077, -17300, -17300, 17645, -7955, -5822, -17300, -17300, -9853, -17300, -17300, -17300, -10572, -16398, -17835, -17300, -17300, -17300, 1358, -22153, -17300, -12029, -17300, -17300, 3149, 6824, -17300, -17300, -17300, -1174, -2898, 7997, -6658, -17300, 5093, -17300, -17300, -2752, 8551, -17300, -17300, 7884, -17300, -17300, -10275, -9360, 5231, -17300, -17300, 7887, -17300, -17300, -7029, -8428, -17300, -17300, 10709, -17300, -17300, 4910, 568, -17300, 1248, -17300, -60, -17300, -17300, 12235, 13099, 9449, -17300, -17300, -1646, -17300, -17300, 5973, -410, -17300, -17300, 8395, -17300, -17300, 17013, 3296, 12979, -17300, -17300, 5564, -17300, -1054, -17300, -17300, 23171, 18904, -17300, -17300, -17300, -20837, -17300, 474, -6297, 18139, 12461, 11175, -17300, -17300, 706, -10216, -17300, -17300, 11302, -17300, -17300, -17300, 21210, -3028, -651, 12760, -17300, -17300, -17300, 4135, -17300, -17300, -17300, -9574, -17300, 16888, 11259, 11644, -17300, -17300, -6493, -17300, -7238, -17300, -17300, -17300, -21091, -17300, -2157, 8963, -3957, 14579, -10803, 3206, -16697, -17300, -17300, -6170, -17300, -17300, -13161, -4459, -17300, -17300, -2655, -17300, -17300, -17300, -5734, 6739, -16782, -17300, -8024, -17300, -17300, -9681, -17300, -6299, -17300, -17300, 18378, -14601, -7932, -17300, -17300, 1613, -17300, -17300, 20898, -17300, -6017, -17300, -17300, 1711, 9338, -2589, -17300, -17300, -9326, -17300, -17300, 3446, -13, -17300, -17300, 19986, -17300, -17300, 25018, 16055, 17071, 14803, 6121, -12933, -17300, -17300, 7932, -17300, -17300, 15617, -17300, 13726, -17300, -17300, 18087, -17300, -17300, 18940, 8031, -17300, -17300, -17300, -9610, -17300, -17300, -1009, -3799, -15824, -18148, 4083, -17938, -17300, -17300, -17300, -17300, -13635, -12134, 8352, -17300, 11543, -17300, -17300, -17300, 216, -5249, -9490, -10082, -17300, -17300, 22956, -17300, -17300, -2647, -5997, -17300, -17300, -1664, -17300, -17300, 6960, 7342, -6730, -17300, -17300, -17300, -17300, -8733, -728, 3747, -17300, -3477, -4024, -17300, -17300, -7858, -17300, -17300, -17300, -7517, 12389, -5455, -17300, -17300, -17300, 5161, -40, -2984, -2600, -17300, -17300, 3630, -17300, -17300, -1847, -2829, -17300, -17300, -17300, 6835, -17300, 509, -17300, -3153, -17300, -17300, -12385, 2818, -2331, -17300, -17300, 1104, 8841, -17300, -14352, 1282, -17300, -17300, -13424, -17300, -17300, -17300, 17993, -4293, -387, -17300, 8881, 15828, 12676, -17300, -17300, -17300, -11823, -17300, 15573, -17300, -17300, 24085, 18403, 495, -445, -17300, -17300, 10553, -17300, -17300, 19093, -17300, -17300, -17300, 10292, 2546, -17300, -17300, -17300, 394, 4648, 8304, -3585, -12960, -17300, -9595, -2598, -8157, -17300, -17300, -2178, -17300, -17300, -18823, -17300, 7096, -17300, -17300, 16575, -8154, -13111, -10233, -17300, -17300, 948, -17300, -17300, -3066, -2236, -17300, -17300, 5372, -17300, -17300, -17369, -17300, -17300, -8997, -11745, -17300, -17300, -3135, 1398, -5460, -17300, 14433, -17300, -17300, -17300, 12439, 10909, -6277, -17300, -17300, -17300, 2171, -4775, -17300, -17300, -17300, -16406, -17300, 1179, 17596, 16988, -2975, 6218, -17300, -17300, -6940, -17300, -17300, -17300, 126, -17300, -10607, -17300, -17300, 10171, -17300, -129, -17300, -17300, 19728, 1463, 12335, 22495, -20674, 9308, 9339, -17300, -17300, -17300, 3985, 1506, -17300, -17300, 9191, -17300, -17300, -17300, 7544, -17300, -3136, -14574, -17300, -974, -17300, -17300, -5069, -17300, -1637, -17300, -17300, 5043, 13513, -14250, -17300, 4810, 4879, -17300, -17300, -5160, -17300, -17300, 23086, 3250, -3358, -17300, -17300, 15173, -17300, -17300, -17300, 17507, 10619, 11987, 11601, -17300, -17300, 3673, -17300, -17300, -9665, -17300, -17300, -17300, -2592, -17300, -17300, -18011, -7381, -17300, -21995, -17300, 8223, -3525, -17300, -17300, 2753, -17300, -17300, -9126, -11758, 1365, 6879, -8843, -17300, -13489, -17300, -14939, -17300, -17300, -6318, -17300, -3207, -17300, -17300, 1982, -17300, -11636, -15240, -2284, -17300, -17300, -5691, -17300, -17300, 14413, 10057, -17300, -17300, -17300, 3055, -10034, -6562, -17300, -10531, -128, -17300, -17300, -11317, -17300, -17300, -9307, -4388, -17300, -4953, -17300, -17300, -17300, -4444, -10246, 11513, -17300, -17300, -17300, -3639, -10089, -17300, -17300, 141, -17300, -17300, -14185, 2751, 14381, -3020, -5896, -17300, -17300, -17300, -17300, -4915, -17300, 11819, -17300, -17300, -8083, -9874, -17300, 4365, -3459, -2920, -17300, -17300, -17300, 9005, 582, -17300, -17300, -17300, -2043, -744, 9085, -10478, -17300, -17300, -6165, -17300, -17300, -6241, -13466, -17300, -17300, 13347, -17300, -17300, -6211, -13718, -17300, -7687, -17300, -17300, -8891, -14328, -17300, -17300, -1686, -17300, -17300, -13451, -1735, 13588, -7935, -14947, -17300, -17300, 14, -4269, -17300, -1618, -17300, -17300, -17300, -17300, -16940, 7105, -17300, -17300, 2687, -17300, 5065, 3199, -17300, -17300, -17300, 28261, -10367, 1275, 6998, -1155, -6811, -14002, -17300, -17300, -11668, -17300, -17300, 9045, 1295, -17300, -17300, -17300, -12016, -769, -17300, -17300, -11549, -17300, -17300, -11211, -17300, -17300, -9590, -13010, -6599, -11937, -17300, -17300, -4041, 2629, -17300, -17300, -12711, -17300, -17300, 12818, -1425, -12714, -17300, -17300, -9915, -17300, -17300, -17300, 11190, -13983, 2816, -519, -17300, -17300, 7857, -17300, -17300, 10908, -682, -17300, -17300, -7998, -17300, -17300, 17432, 1457, 19909, -17300, -17300, 14335, -17300, -17300, -17300, -17300, 13190, 7538, -23490, -17300, -8092, -15151, 3473, -17300, -20123, -17300, -17300, 4528, -17730, -17300, 727, -17300, -17300, 11649, -11521, -17300, -17300, -17300, -359, -4508, -8116, -9101, -17300, -17300, -8103, -17300, -17300, 10720, -6333, -17300, -17300, -17300, 9221, 803, -3372, -17300, -17300, 4556, -17300, -17300, 9899, -17300, -17300, -961, 11241, 12369, 9984, 8505, -17300, -17300, -17300, -17300, -12140, -17300, -15887, -17300, 2189, 1583, -17300, -17300, -9080, -17300, -17300, 10215, 8342, 2541, 9414, -17300, -17300, 12074, -17300, -17300, -2409, 9492, -8489, -17300, -17300, -17300, -307, 12854, -17300, -17300, 5086, -17300, -17300, 8749, -17300, -16533, -17300, -17300, 6642, -10627, -17300, 7499, 24313, -3973, 14408, -17300, -17300, 2775, -8267, -17300, -17300, 16342, -17300, -17300, 27584, -17300, -17300, -2335, -17300, -17300, -17300, -8359, 11211, -8998, -1890, -1146, -17300, -17300, -10028, -13211, -17300, -10680, -17300, -17300, -912, -17300, -17300, 18775, 12701, 9157, -18180, -17300, -7746, -17300, -17300, 10519, -17300, 5028, -17300, -17300, -17300, -11521, -17300, -17300, -20768, -17300, -4514, -17300, -12293, -17300, -17300, -383, 6459, -10780, -21206, -17300, -5525, -17842, -16500, -17300, -17300, -13882, -17300, -17300, 8705, -17022, -17300, -17300, -1130, -17300, -17300, 700, -11361, -6046, -7491, -17300, -17300, -2584, -17300, -17300, -6409, 23994, -17300, -17300, -6313, -17300, -17300, -3027, 1246, -17300, -17300, -2212, -17300, -7563, -17300, -17300, -5089, 7607, 413, -11025, -17300, -17300, 16514, -7668, -17300, -17300, -17300, 8749, -17300, -17300, 7486, -1416, -4849, -4714, -17300, -17300, -5659, -17300, -17300, -17300, -17300, 4441, -2311, 36, -17300, -17300, -14417, 8773, -17300, -17300, 27671, 2376, -16222, -17300, -17300, 12289, -17300, -17300, -17300, 9071, -3213, -17300, 24559, 11201, 11764, -17300, -17300, 15300, -17300, -17300, -17300, -8257, -17300, 10614, 7365, -17300, -17300, -17300, -17321, 1376, -2104, -10995, -17300, -17300, 339, -17300, -17300, -20712, -17300, 4453, -3624, -17300, -17300, -17300, 18988, 19418, 17527, 14123, -18825, 210, -17300, -17300, 6905, 6123, -17300, -17300, 10677, -17300, -17300, -7407, -17300, -2445, -6655, -17300, -17300, 16124, -17300, -17300, 20150, -17300, -3795, -17300, -17300, 14859, 1870, 21991, -17300, -17300, -17300, -17300, -9792, 7180, -17300, -17300, 6059, -17300, -17300, -12433, 1663, -7493, 980, -3846, -17300, -15132, -17300, -17300, -17300, -15028, -59, -19810, -17300, -16226, -17300, -17300, -17300, -14527, -17300, -17300, -2990, 10314, -17300, -17300, -17588, 1897, -17300, -17300, 2438, -17300, -14776, 7093, 3095, -17300, -17300, -17300, 20311, -17300, -17300, -16856, 8537, -21721, -17300, -17300, -17300, -17613, -3717, -3511, -17300, -17300, -17300, -19244, -25797, -17300, 5604, -6619, -17300, -17300, -14193, -17300, -17300, -6714, 13664, 3890, 12949, -17300, -17300, -11806, -17300, -17300, -9338, -17300, 14147, -17300, -17300, 12931, 22180, 11792, -17300, -17300, -17300, -4680, 4302, -17300, -17300, 13917, -17300, -17300, 21114, -3426, -7122, 6055, 1509, -12758, -5140, -17300, -19186, -17300, -17300, -9073, -14077, -17300, -17300, -2813, -17300, -17300, -13611, -17300, -10225, -20306, -17300, -17300, -8088, -17300, -17300, -17300, -2450, 10967, 3648, 3214, -17930, -17300, -17300, -2921, -17300, -17300, 11528, 4634, -17300, -17300, -13757, -17300, -17300, -5373, -11126, -17300, -17300, -17300, -8211, -13520, -17300, 1835, 9334, -17300, -17300, 3023, -17300, -17300, 14134, 14593, 11220, -17300, -17300, -12757, -17300, -17300, 8650, 4108, -17300, -17300, 3101, -17300, -17300, 8808, -14121, -5948, -17300, -13189, -17300, 7345, 1600, -17300, -17300, -17300, -4556, -6993, -17300, 9828, 4725, -17300, -17300, 1313, -17300, -17300, -3594, -9967, -7361, -17300, -17300, 6778, -17300, -17300, 15607, -14200, -17300, -17300, -3118, -17300, -17300, 1365, -72, 5194, 4395, -17300, -17300, 2319, 17416, -17300, -17300, -17300, 4640, -3050, -17300, 594, -17300, -17300, -17300, 7042, 4345, -17300, 2916, -17300, -17300, 8997, -7816, 4811, -17300, -17300, 14169, -17300, -17300, -17300, -11494, -17300, -7255, -17300, 11216, -17300, -17300, 10453, -11356, 3982, -7418, -11172, -17300, -17300, -13922, -1411, -7839, -12436, -17300, -17300, -7441, -17300, -17300, -15501, -39, -17300, -17300, -17300, 2951, -8465, -11774, -17300, -17300, -17300, -17300, 7423, -2354, -15651, -17496, -17300, -17300, -11778, -17300, -17300, 9608, -17300, -17300, -17728, -17300, -17300, -1143, -5402, 9825, 10897, -4945, -7660, -17300, -17300, 248, -17300, -17300, -17300, 11014, -17300, -17300, 11280, 4645, -461, -4731, -17300, -17300, 3225, -17300, -17300, 1225, 8850, -17300, -17300, 7249, -17300, -17300, 10280, -17300, 9531, 1925, -17300, -17300, -17300, -5053, -1213, 2612, -5501, -10375, -17300, -17300, -17300, -6933, -12088, -17300, -17300, -8866, -17300, -17300, -4819, 10289, 4791, -17300, -17300, -17300, -7764, 8438, -17300, -17300, 4799, -17300, -17300, -20062, -17300, 16871, -15474, -17300, 10021, -17300, -17300, -4298, -17300, 21790, -17300, -17300, 12646, -5117, -5253, 2201, -9525, -17300, -10304, -17300, -14137, -17300, -17300, -17300, -5386, -17300, -17300, -4001, -4569, -17300, 18971, -17300, 25816, -17300, -17300, 20472, -16509, -17300, 11422, 17730, -17300, -17300, -3981, -17300, -17300, -15699, -17300, -17300, 18050, 16317, -17300, -17300, -17300, -2878, -7259, -17105, 747, -5770, -17300, -3148, -17300, -17300, 2142, 1799, 1817, -17300, -17300, -17300, -17300, -11636, -11336, 3122, -17300, -3851, -17300, -17300, -17300, -8640, 2649, -315, -2551, -17300, -17300, -457, -17300, -17300, 5082, -17300, -17300, 13503, 3285, -7473, -17300, -17300, -10618, -17300, -17300, 3379, -17300, -17300, -12284, -17300, 1839, 9681, -3248, -4830, -4496, -17300, -17300, 1294, -17300, -17300, -2970, -17300, -17300, -17300, 3921, 365, -5307, -2789, -17300, -17300, -17300, -17300, -14699, -17300, -6948, 6568, -17300, -17300, 7210, -17300, -17300, 1839, 3048, -2307, -17300, -11311, -3937, -17300, -19617, -17300, -17285, -17300, -17300, 3437, 24663, 9966, -17300, -17300, -17300, 6935, 5208, -17300, -17300, -17300, 13901, -5739, -25, -11736, -17300, 8019, -17300, -17300, -8922, 2868, -17300, -17300, -10342, -17300, -17300, -5267, -5578, -17300, 1639, -17300, -17300, 5042, 3869, -17300, -17300, 6875, -17300, -17300, -9757, -17300, -7573, -17300, -3403, -17300, -17300, 17422, 11578, 12865, 11439, 8588, -14870, -17300, -17300, -17300, -17300, 5994, 5954, -17300, -17300, 23296, -17300, -17300, 1128, -9563, -17300, 15236, -17300, 2708, -17300, -17300, 18077, -17300, -17300, 12788, 21112, -17300, 13665, -17300, -17300, -17300, -14408, -10441, -11410, -17300, -4071, -17300, -16044, 3885, -17300, -20657, -17300, -17300, 1658, -801, -15098, -17300, -17300, -17300, -14991, -17300, -17300, -17300, 17997, -15267, -10190, -17300, -1752, -5528, -17300, -1235, -17300, -17300, -16988, 4760, -17300, -17300, -17300, 23937, 19664, 1475, -11957, 7695, -17300, -17300, -4794, -17300, -17300, -14762, 829, -17300, -17300, 14548, -17300, -17300, 20466, -17300, -811, -17300, -17300, -17300, -1902, -4425, -17300, -17300, 4400, -17300, 23471, -17300, -17300, -13691, 5084, 1509, -8899, -10804, -14754, -19610, -17300, -17300, -17300, -17300, -21901, -12959, -17300, -17300, -7741, -7220, 7662, -17300, -17300, -17300, 5004, -17300, -17300, 890, -17300, -17300, -19424, 7956, -17300, 11417, -17300, -17300, 18950, -16304, -17300, -17300, -17300, -16908, -2778, -17300, 11671, 461, -17300, -17300, -19310, -17300, -17300, -11179, -8836, -12076, -12187, -17300, -17300, -17300, 34, -13396, -17300, -422, -17300, -12058, -17300, -17300, -11252, -12383, 7202, -17300, -17300, -17300, -17300, 6208, 12955, -6892, -8095, -5068, -17300, -17300, 4175, -17300, -17300, -2590, 18477, -17300, -17300, 4000, -17300, -17300, 9303, 6933, 713, -17300, -17300, -17300, 13292, -17300, -17300, -926, -17300, 18582, 7528, 12805, -17300, -17300, -1316, -17300, -17300, -4607, 980, -17300, -17300, -1403, -17300, -17300, -15755, 4131, -6214, -9933, -17300, -17300, 1003, -17300, -17300, -3238, -17300, 7155, -17300, -22832, -17300, -17300, -17037, -19384, -21188, -17300, -17300, -17300, -11669, -9966, 435, -14999, -17300, -6163, -17300, -2902, -17300, -17300, -13731, 8711, -2203, -17300, -17300, -17300, 45, -17300, -17300, -11700, -17300, -17300, 14379, 2780, -5435, -4770, -12113, -17300, -17300, 819, -17300, -17300, 20501, 1533, -17300, -17300, -17300, -4208, 10350, -160, -17300, -17300, -17300, 5086, 3954, -17300, -17300, -7183, -17300, -17300, -2672, -7963, -8769, -17300, -17300, -8525, -17300, -17300, -5547, -10229, 3155, -17300, -17300, 12512, -17300, -17300, -7668, -17300, 18706, -17300, -17300, 17311, 2298, -10880, -9593, -10001, -17300, -15233, -17300, -14639, -17300, -10568, -17300, -17300, -17805, -17300, -17409, -17300, 16732, -7195, -17300, -17300, -17300, -5392, 3600, -2262, -16638, -17101, -17300, -17300, -12513, -17300, -17300, -5646, -17300, -17300, 14076, -5305, -7788, -17300, -17300, 2979, -17300, -17300, -5453, -17300, -17300, 14966, -9998, -13253, -1343, -17300, -17300, 3698, -17300, -17300, -6403, -1638, -17300, -17300, -3449, -17300, -17300, 18042, -17300, 8885, -17300, -17300, 15353, 13217, 10431, 9536, 14736, -4298, -17300, -17300, -8642, -17300, -17300, 10281, -9313, -17300, -17300, 10279, -17300, -17300, 16609, 9726, 6109, -17300, -17300, -4705, -17300, -17300, 16917, -1503, -17300, -17300, -17300, 4833, 16752, -17300, -17300, 15634, -4705, -17300, 6646, -17300, -17300, -7439, -17300, -17300, 23523, 9910, -17300, -17300, -17300, 6022, 3285, -5405, -17300, 2259, 54, -17300, -17300, -17300, 19468, -17300, -17300, 20727, -17300, -17300, 17556, -7678, 20524, 13528, 4983, -22582, -17300, -22956, -17300, -1404, -17300, -17300, 11464, 7724, 3069, -17300, -17300, -8768, -17300, -17300, -9606, -17300, -1836, -17300, -17300, 17285, -17300, -17300, -17300, 15676, 1586, -6181, -16420, -17300, 14751, -7807, -17300, -17300, 17300, -17300, -17300, 3721, 5396, 4308, -17300, -17300, 8882, -17300, -17300, 19269, 15387, -17300, -17300, -17300, 16130, 12975, 11332, 3149, -17300, -17300, 2119, -17300, -17300, 5413, 9250, -17300, -17300, 13391, -17300, -17300, -4165, -17300, -17300, -6264, 20244, 15703, -17300, 18242, -17300, -17300, -17300, 1769, 9275, 7235, -9765, -17300, -17300, -17300, -17300, -17300, -4222, -17300, 11744, -1388, -3718, -17300, -17300, -17300, -17300, -10067, 1463, -12488, -4600, -17300, -17300, 11367, -16477, -17300, -5111, 2031, -17300, -1534, -17300, -17300, -8441, -17300, -4579, -17300, -17300, -17300, 4425, -15549, -17300, 10220, -1733, -5528, -5701, -17300, -17300, -17300, -11967, -17300, -17300, -17300, 2661, 27154, 8869, 7952, 6202, -17300, -17300, -17300, 8167, -19430, -17300, -17300, -17300, -17300, 9360, 5764, 8919, -17300, 3380, -17300, -17300, -17300, 7427, -17300, -18968, -17300, 16537, -17300, -17300, -8354, -15815, -11770, -17300, -17300, -15374, -4310, -17300, -17300, 1454, 2782, -6356, 1973, -17300, -17300, -7691, -17300, -17300, -17300, -11701, 13727, 12085, -17300, -17300, -17300, -9954, 10415, -17300, -17300, -5617, -17300, -17300, -1030, 15151, 9585, -16173, 1961, -18674, -17300, -17300, 5926, -17300, -17300, -3681, 9381, -17300, -17300, 509, -17300, -17300, 16858, -2093, 15324, -17300, -17300, 14387, -17300, -17300, -6160, 2946, -17300, -17300, -17300, 2579, 18923, -16768, -17300, 17966, -17300, -17300, -1141, -17300, -17300, -17300, 1340, -14995, -17300, -849, -902, -17300, -17300, 1333, -3915, -17300, -17300, 5478, -17300, -17300, 11496, 5131, -2642, 4651, -17300, -17300, -8861, -17300, -17300, 9661, -2225, -17300, -17300, -1042, -17300, -17300, 6704, 6638, 21376, -17300, -17300, 14601, -17300, -17300, -17300, 8241, 15005, -14947, 3265, -991, -18006, -17300, -16783, -17300, -16021, -17300, -17300, -18903, -17300, -17300, -17300, 5, -4651, -17115, -17300, -1582, -13878, -17300, -17300, -17300, 18343, 1560, -2153, -17300, -17300, 15974, -17300, -17300, 13486, -17300, -17300, -5848, -2523, 3109, -17300, 7178, -17300, -17300, 4165, 7988, -17300, -17300, -11845, -17300, -17300, 8293, 5847, 21986, -17300, -17300, 17954, -17300, -17300, 11150, 2602, -17300, -17300, -1305, -17300, -17300, 10852, -17300, 352, -6072, -17300, 17656, -17300, 20833, -3645, -17300, -17300, -17300, 20750, 16927, 11740, -17300, -17300, -17300, -17300, 18665, -8039, -12235, -13983, -17300, -17300, 10533, -17300, -17300, 9354, -723, -3043, -6419, -17300, -17300, -17300, -17300, 18020, -5002, 13080, -12376, -17300, -17300, 3768, -17300, -17300, 12206, 751, -17300, -17300, -17300, -17300, 10848, 21026, 2895, -17300, -17300, -17300, 9478, -17300, -17300, 30296, 19409, -9252, -11740, 3363, -12434, -250, -2101, -17300, -17300, -14177, -17300, -17300, -17300, 5275, 4919, -17300, -15574, -17300, -17300, 9350, -17300, -17300, -9307, 11342, -3553, -11191, -17300, -17300, -10208, -17300, -17300, -17300, -17300, 21011, -17702, 5030, -17300, -17300, -10605, -13463, 4312, -17300, -17300, -9564, -17300, -17300, -2616, 13700, -17300, -17300, 9823, -17300, -17300, -17300, -6638, -17300, -17300, -17300, 14965, -21908, -17300, -4346, -6398, -4869, -11446, -17300, -11625, -17300, -10469, -17300, -17300, -17392, -17849, -11214, -17300, -17300, -17300, -14784, -4986, -17300, -17300, -4345, -17300, -17300, -11510, 8008, -2287, 350, -17300, -17300, 6222, -17300, -17300, 17406, 6923, -17300, -17300, -17300, -13903, -9632, -17300, -17300, -3938, -8055, -17300, -17300, -1663, -17300, -17300, -15387, -1124, -3374, -17300, -17300, -16517, -17300, -17300, 13806, -14899, 7757, -11887, -17300, -17300, -17936, -17300, -17300, 20937, -2099, -17300, -17300, -2514, -17300, -17300, 30988, 9884, 4365, -17300, -17300, 16769, -17300, -17300, -17300, -8411, 13264, 2036, -3488, -10032, -17300, -17300, -17300, -17300, -17300, 5041, 922, 17102, 14969, -4686, -7152, -17300, -17300, -17300, -17300, -17300, -17300, -19378, -17300, -11702, -17300, 6152, -17300, 6936, -17300, -17300, -18704, -6523, -17300, -17300, 14311, 12423, -14705, -5541, 137, -17300, -17300, -20839, 2345, -17300, -17300, -10776, -17300, 1617, -17300, -17300, -10831, 2486, 1609, -12413, -17300, -17300, -17300, -17300, -11758, -7451, -7991, -17300, -17300, -17300, -3870, 15016, -17300, -17300, 19752, -17300, -17300, 8987, 1267, -8143, -17300, -5756, -17300, -17300, -2756, 13277, -17300, -17300, -17300, -17300, -2434, -10922, 13868, -1338, -17300, -17300, 18713, -17300, -17300, 19330, -17300, 22198, 1373, -17300, -17300, -17300, 16610, 2076, 564, -17300, -17300, 15049, 6920, -17300, -17300, -17300, -17300, 14872, 3985, 3994, -2286, -13939, -15809, -7694, -17300, -17300, -17300, -6003, -9347, -9821, -17300, -17300, -7121, -17300, -17300, 18750, -16531, -17300, -17300, -17300, -4440, 1762, -749, -17300, 4539, -17300, -17300, 2934, -9734, -17300, -17300, 4256, -17300, -17300, -13729, -15800, -17300, -17300, 11870, -5019, -17300, -17300, 12887, -17300, -17300, 10987, -7938, -13879, -16979, -17300, -15676, -17300, -17300, -10472, -11121, -17300, -17300, 9940, -17300, -17300, -6396, 1422, 6980, -17300, -17300, -17300, 7737, -2255, -17300, -17300, 13828, -17300, -17300, 4750, -3014, 13200, -17300, -17300, -2328, -7111, -17300, -17300, -17300, 13546, -3560, -4508, -17300, -17300, -17300, -17300, 16394, 20392, 8146, 15351, -11737, -7457, -17300, -17300, -11423, -17300, -17300, 16508, -17300, 1037, -17300, -17300, 9853, 5180, 8177, -17300, -17300, 4806, -17300, -17300, -17300, -17300, -4277, -17300, -6486, -8910, -17300, -17300, 6840, -17300, -2281, -17300, -17300, 16454, 768, -17300, -17300, 1599, -7646, -679, -17300, -17300, -266, -17300, -17300, -17300, -158, -1521, -831, 15271, 10134, -19709, -17300, 292, -10123, -17300, -17300, -489, -17300, -17300, 14933, -17300, -17300, 10559, -17300, -17300, -15818, 12034, -17300, -17300, -9505, -15607, -17300, -7439, -13691, -17300, -17300, -17300, -237, -3941, -5612, -17300, -17300, 8104, -17300, -17300, 9755, 11531, -17300, -17300, -7971, -17300, -17300, -26014, -17300, 1524, -11564, 14224, 3971, -3041, -17300, -17300, -17300, -17300, 14282, -17318, -6104, -17300, -17300, -5845, -17300, -17300, -17300, 18458, -11966, 2176, -17300, -17300, -5862, 10104, -17300, -17300, -322, -17300, -17300, -17300, -2441, 17460, -8938, -2799, 4297, -17300, 3999, -17300, -17300, 3631, 6731, 3394, -17300, -17300, -17300, 4696, 448, -17300, -17300, -17300, -2927, -1266, -7069, -17300, -6627, -17300, -17300, 5368, 11599, -17300, -17300, -17300, -3735, 3890, -6458, -17300, -17300, -5433, -17300, -17300, 5925, -17300, -17300, -3688, -17300, -17300, 25505, 16482, 28238, 10705, 9123, -1501, -17300, -17300, 6924, -17300, -17300, 6243, 14807, -17300, -17300, 17119, -17300, -17300, -17300, 175, -17300, 6542, 2807, -17300, -17300, -17300, -17300, -3254, -6464, -4935, -7851, -9230, -18324, -17300, 9528, 7362, -17300, -17300, -17300, 774, -4533, -13113, -17300, -17300, -4369, -17300, -17300, 3258, -17300, -6147, -17300, -17300, 9823, -7628, -17300, -17300, -17300, -4177, -17300, 6238, -17300, -17300, -15172, 3179, -17321, -19405, -17300, -9735, -17300, -17300, 14929, -15574, -17300, -17300, -17300, 20916, 967, -17300, -17300, -17300, 17616, -9810, 8130, -16721, -17300, 428, -17300, -17300, -20602, -17300, -17300, 2240, -410, -4068, -17300, -17300, -6945, -17300, -17300, 6541, -17300, -17300, -12267, -17300, -17300, 7019, -18221, 5667, -17300, 10294, -17300, -17300, 9895, 7327, -1684, -6143, -8135, -17300, -17300, -2926, -17300, -17300, -1981, -12629, -17300, -17300, 1992, -17300, -17300, 3596, 5524, -6209, -17300, -17300, 8796, -17300, -17300, 9818, 4827, -17300, -17300, -17300, 10024, 1413, -2078, 18328, -17300, -17300, -3308, -17300, -17300, -856, -2420, -17300, -17300, 333, -17300, -17300, -1548, -17300, 2985, -17300, 14008, -17300, -17300, -13334, 17045, -16106, -14307, -17300, -17300, -17300, -17300, 7518, 8505, 7139, -17300, -17300, -17300, 21016, -9779, 3384, -17300, -17300, 18468, -10597, -17300, -17300, -3261, -17300, -17300, 21022, -17300, -17300, 8226, 13294, 10186, -7953, 14995, 8105, -5162, -2298, -17300, -17300, -2843, -17300, -17300, -13583, -13761, -17300, -17300, 1577, -17300, -17300, 22769, -17300, -17300, -3101, -14074, 621, -17300, -4229, -17300, -17300, -6082, -13604, -17300, -17300, 1208, -17300, -17300, 6900, -21621, -17300, -878, -17300, -17300, 9208, 8261, -17300, -17300, 11900, -17300, -17300, -6443, 3304, -718, -17300, -52, -17300, -17300, -17300, 2929, -3179, -7853, -17300, -17300, 11617, 8258, -17300, -17300, -17300, 12988, 4932, 7948, -17300, -17300, -17300, 12140, -17300, -17300, -10493, -15747, -17300, 18380, -17300, -17300, 16274, 2297, 18590, 8889, -17300, -17300, -17300, -3061, -17300, -17300, 23838, -17300, -17300, -760, -1542, -11772, 1113, -17300, -17300, -11307, 4293, -17300, -1270, -17300, -17300, -2697, 3205, -8658, -17300, -17300, -3074, -17300, -17300, -35, -17300, 9173, -17300, -17300, -861, 10619, -17300, -17300, -17300, 20670, -1613, -2177, 5542, 3617, 4541, -17300, -17300, -11093, -17300, -17300, -6936, -15458, -17300, -17300, -17300, -17300, 5873, 2765, 10437, 10805, -17300, -17300, -17300, -17300, 11097, 6430, -17300, 12072, -17300, -17300, 12665, 15033, -17300, -17300, 13044, -17300, -17300, -17300, -13158, 1940, -9497, -17300, 10441, -3740, -7261, -17300, 2923, -14446, -17300, -17300, -17300, -14034, -17300, -17300, -17300, -17300, 7387, 14666, -9208, 11659, 7361, -9398, -11197, -17300, -17300, -12655, -17300, -17300, -4289, -17300, -412, -17300, -17300, -11474, 16339, -14232, -17300, -17300, -17300, -471, -17300, -17300, 7009, 5136, 718, -23913, -17300, -17300, -15848, -17300, -17300, 8094, 1938, -17300, -17300, 13807, -17300, -17300, -17994, -17300, 3653, 9548, -17300, -17300, 5437, -17300, -17300, 1486, -246, 18577, -17300, -17300, -17300, 1060, -1587, -17300, -9011, 3684, -17300, -17300, 5792, -17300, -17300, 29143, -17300, -17300, 11252, -11445, -14065, -15746, -17300, -17300, 7106, -17300, -17300, -7577, 14699, -10270, -17300, 1206, -17300, -17300, -17300, 13948, 17552, 7656, -17300, -17300, 26273, -17300, -17300, -17300, 12206, -17300, 12740, -17300, 3555, 10744, -17300, -17300, -17300, 9021, -15051, -15901, 4305, -6103, -6950, 1879, -17300, -17300, -17300, -20514, -17300, -17300, -17300, -17300, -2839, 6543, -4628, 1972, -5298, -4865, -17300, -17300, -5719, -17300, -17300, -11168, -17300, 9986, -17300, -17300, -885, -18249, -17300, -6716, -17300, -17300, 6224, 2312, -17300, -17300, 16271, -17300, -17300, -5119, 10796, -17300, -17300, -17300, 13679, 11762, -19269, -17300, -2318, -7657, -17300, -17300, 18591, -17300, -17300, -4227, -17300, 10915, 2048, -17300, -17300, 13136, -17300, -17300, 2649, 2999, -923, 2215, -17300, -17300, -17300, 19165, 7274, -17300, -17300, -17300, 30809, -17300, -17300, -16767, -17300, -6741, -7006, -17300, 6184, 12581, -16332, -17300, -17300, 19144, -5928, -17300, -17300, -17300, -17300, 11935, -8369, -17300, -5945, -17300, 10679, 8300, -17300, -17300, 11596, -17300, -17300, -7641, -17300, 4553, -230, 2930, -17300, -17300, 2157, -17300, -17300, 960, 7743, -17300, -17300, 13893, -17300, -17300, 13596, 14818, -7279, -2451, -21132, -17300, 2964, -7671, -3759, -17300, -17300, -17300, -9253, 3919, -17300, -17300, 4817, -17300, -17300, -3554, -14489, -8999, -17300, -17300, 1125, -17300, 2787, -17300, -17300, 3063, 11832, -1858, -17300, -17300, -1429, -17300, -17300, 4246, -17300, 10889, -17300, -17300, 6796, -7837, -4299, 9095, -3063, -17300, -17300, -18632, -17300, -17300, 9753, 4136, -17300, -17300, 923, -17300, -17300, 6786, -1112, -19319, -17300, -17300, -8257, -17300, -17300, 6178, 8188, -17300, -17300, 8004, -17300, -17300, 10994, 10652, 7397, 10444, -17300, -17300, 3626, -17300, -17300, 8657, 8089, -17300, -17300, -17300, 6801, 14934, -3458, -17300, -17300, 16717, -17300, -17300, 9907, -17300, -17300, 68, 18280, 1793, -11120, -17300, -17300, -17300, -17300, 6133, 15515, -17300, -17300, 13996, -17300, -17300, -9001, 5600, -4555, -17300, -17300, -17300, 19838, 14127, -3739, 16430, -17300, -4389, -17300, -17300, -778, -17300, 8927, -17300, -17300, 22846, -8684, -17300, -17300, 23225, -17300, -17300, 892, 22567, 3957, -17300, -17300, -17300, 607, -17300, -17300, 6941, 532, 17077, 8252, -22228, -17300, -14456, -3701, -17300, 2430, -17300, -17300, -11542, -2905, -17300, -17300, 673, -17300, -17300, 9793, -4921, 15709, -2475, -17300, -17300, -17300, -21170, -17300, 2501, -17300, -17300, 19416, -17300, -17300, -17300, 5492, 5483, -11458, -19825, -17300, -4393, -17300, -17300, -16281, -17300, 9353, 18120, -17300, -17300, 4020, -17300, -17300, 6774, -10580, -17300, -4617, -17300, 3484, -17300, -17300, -12284, -17300, 22359, -5799, -17300, -17300, -9642, -17300, -17300, 2132, -1381, -17300, 6637, -17300, -17300, 5772, -17300, -17300, 7309, 18349, -9023, -3668, -17300, 1698, -17300, -1279, 3080, -17300, -17300, -1750, -17300, -17300, 11663, -7675, -18368, -17300, -9414, -17300, -17300, 4771, 7430, -17300, -17300, 5632, -17300, -17300, -14649, 6720, 16127, -17300, -17300, -17300, 2099, 13718, -17300, -17300, 14377, -17300, -17300, 23919, 9077, -17300, -1429, -17300, -17300, -17300, 15038, 12725, 11797, 10684, -17300, 14044, -1896, -17300, -17300, -17300, -17300, -17300, -8083, -17300, -17300, -23675, -17300, -618, 335, -2614, -1038, -8104, -5900, -7739, -17300, -17300, -8136, -17300, -17300, -12065, -12668, -17300, -17300, 22792, -17300, -17300, 597, 15280, -17300, -17300, 1257, -17300, -17300, -22548, -17300, -9842, -17300, -3499, 9672, -17300, -17300, 2592, -17300, -17300, -13475, -2052, -4227, -6261, -17300, 13924, -17300, -17300, 4104, -17300, -17300, 11883, -15319, -17300, 6380, -17300, -17300, -17300, 1650, 536, -17300, 10942, -4513, -17300, -17300, -17300, -13207, -17300, 17089, -1440, -17300, -17300, -671, -17300, -17300, 22313, -19775, -18111, -17300, -17300, -16803, 3886, -3626, -17300, 17218, -17300, -17300, -17300, 7126, 5300, -143, -17300, -17300, 439, -17300, -17300, 16911, 16700, -17300, -17300, -4529, -17300, -17300, -17300, 1823, 23520, 14017, 10121, 15434, 3051, -2989, -14134, -17300, -17300, -700, -17300, -17300, 5380, -7903, -17300, -17300, 2108, -17300, -17300, -11841, -13825, -17300, -17300, -7831, -17300, 3129, -17300, -17300, -7699, 270, -5743, -17300, 571, -17300, -17300, -12227, -17300, -17300, 918, -4245, -8432, -17300, -17300, -2735, -17300, -17300, -6884, -17300, -561, -17300, -17300, 2233, -91, -17300, -17300, 4242, 2930, -17300, -17300, -17300, 24509, -17300, -17300, 1323, 20563, 280, -6637, -17300, -2154, 4127, -1087, -17300, -17300, -17300, 9148, -17300, -17300, 3597, -17300, -17300, -17300, 2533, 3759, -4946, 215, -17300, -17300, 1999, 8258, -17300, 7922, -17300, -17300, -17300, 7096, -17300, -17300, -6411, 11289, 11192, -10538, 8616, -17300, -17300, -10927, -17300, -17300, 15449, -7179, -17300, -17300, 34, -17300, -17300, 14301, 17155, -17300, -17300, -17300, -4567, 9371, 18480, 3956, -17300, -17300, -17300, 24169, -26419, -17300, -17300, -17300, 15957, 9256, -5629, -17300, -17300, -979, -17300, -17300, 1039, -17300, -17300, 4645, 20330, -1440, -6357, 6526, -9080, -13414, -435, -17300, -17300, -2427, -17300, -17300, -2057, -16481, -17300, -17300, 143, -17300, -17300, 11682, 32767, 17792, -17300, -17300, -17300, -17300, -1041, 6131, -14312, -17300, -8038, -17300, -17300, -3043, -5240, -17300, -17300, -3428, -17300, -17300, -7335, -8714, -17300, -11068, -17300, -17300, 3015, -669, -17300, -17300, -3696, -17300, -17300, -6907, -10385, -9478, -17300, 2192, 1080, -17300, -17300, -14511, -17300, -17300, 3793, -12711, -17300, -8738, -17300, -17300, 2876, -17300, -17300, 5623, 789, -15412, -409, -17300, -17300, -4802, -17300, -17300, 12137, 3130, -17300, -17300, -17300, -1336, -17300, 827, 1369, -17300, -17300, 1768, -17300, -17300, -17300, -1305, -5730, -10828, 388, -17300, 9699, -17300, 14603, -17300, -17300, -8115, -9617, -10132, -8230, -17300, -17300, -17300, 6311, -12321, -17300, -17300, -17300, -6506, -916, -7621, -17300, -17300, -17300, -6141, -17300, -17300, 19898, -55, 8832, -2335, -3123, -17300, -17300, -17300, -5416, 17012, -17300, -17300, -17300, -3087, 3049, -4338, -17300, -17300, -17300, -2503, -17300, -17300, -17300, 235, 14647, -5903, 6704, -17300, -9535, 6892, -17300, -17300, -17300, -9589, 12124, -11458, -17300, -17300, -17300, 3363, -2471, -17300, -17300, 10422, -17300, -17300, 3896, 2893, -17300, -17300, -17300, 14960, 16513, 7755, 5229, 5755, -17300, -17300, -17300, 12952, 77, -17300, -17300, 18363, -17300, -17300, -17300, 9990, -17300, 16269, -17300, -17300, 25150, 7744, -23245, -17300, 8107, 4856, -18114, 61, -18839, -17300, -17300, -17300, 8951, 4416, -17300, -17300, 4209, -17300, -17300, 15816, -13067, 3923, -17300, -17300, 5280, -17300, -17300, -2382, -14266, -17300, -17300, -17300, -10709, -6631, -17300, 11121, 3633, -17300, -17300, -17300, 11053, -5966, -17300, -5418, -17300, -17300, 8159, -4598, -17300, -17300, -17300, -2876, 13498, -1516, -21324, -17300, -17300, 8875, -10226, -17300, 3162, -17300, -17300, 9457, -17300, -17300, -6236, -5100, -17300, -17300, 7586, -2915, -3964, -17300, -17300, -1808, -17300, -17300, -11890, -17300, -17300, 13032, 2059, 10350, 8543, 4682, -17300, -17300, 8684, -17300, -17300, -10374, -17300, 566, -17300, -17300, 11625, 2151, -883, -17300, -17300, 6865, -17300, -17300, 12190, -17300, 14872, -17300, -17300, 9640, -17300, 8372, -17300, -17300, -17300, 27268, -6441, 2234, -6970, -12902, -7007, -17300, -17300, -9416, -4402, -5795, -17300, -17300, -517, -17300, -17300, 157, -5831, -17300, -17300, 8387, -17300, -17300, -2302, -4338, -17300, -9736, -10481, -17300, -17300, -8044, -17300, -17300, 10991, -3782, -17300, -15083, -17300, -17300, -793, -17300, -17300, 11359, -8182, -10217, -17300, -11915, -17300, 1835, -17300, -17300, -10723, -1288, -11003, -17300, -17300, -4548, -17300, -17300, 10127, 1654, -17300, -17300, 5628, -17300, -17300, 13248, -17300, -17300, 18196, -4176, -1921, -8506, 6725, -10590, -17300, -17300, -11054, -17300, -17300, -16226, -17300, -9420, -17300, -17300, -7615, -17300, 217, -17300, -17300, 19649, -7351, -7423, 5850, -17300, -17300, -17300, 15676, 18629, -17300, -17300, -220, -17300, -17300, -3158, -1903, -17300, -17300, 3774, 22152, -17300, -17300, 1218, -17300, -17300, 1864, 21082, 11299, -17300, -17300, 2170, -17300, 22159, -17300, -17300, 21820, -17300, -17300, -17300, 14514, 5675, -11855, -9961, -2828, -17300, 1125, -18130, -17300, 9947, -17300, -17300, -552, -17300, -13866, -17300, -17300, -5596, -17300, -17300, -10723, -11282, -11636, -17300, -17300, -17300, -7837, -14305, -17300, -6792, 12943, -17300, -17300, -6179, -17300, -17300, -5382, -6909, 2074, -17300, -17300, 12581, -17300, -17300, 5333, 14172, -17300, -17300, -7968, -17300, -17300, 1101, -578, -11309, -18919, -17300, -2779, -17300, -13255, -17300, -17300, -8781, 945, -17300, -10531, -17300, -17300, -1546, 790, -17300, -17300, 14725, -17300, -17300, 8288, 3056, -17300, 8025, -17300, -17300, 12683, 457, -17300, -17300, -17300, 9475, -8467, 20630, 8432, 8247, -17300, -17300, -17300, -17300, -6558, 5843, -17300, 8453, -17300, -17300, 6656, 6080, -17300, -17300, 10070, -17300, -17300, 17024, 10771, 4222, -17300, -17300, 23807, 15244, -17300, -17300, -17300, 6972, -17300, -17300, 3580, -3416, 23363, -8082, -17300, -7333, -17300, -17300, -9193, -17300, -17300, -7258, -17300, 19323, 15058, -17300, -17300, 13449, -17300, -17300, 16538, 14029, -17300, 14011, -17300, -17300, 18640, -17300, -17300, -16227, -13335, 8581, -19551, -17300, 6127, 645, -17300, -17300, -17300, 9735, -17300, -17300, -968, -17300, -17300, -2775, -10163, -18456, -6321, -17300, -17300, 3887, 3914, 535, -13747, -17300, -17300, -17300, -4530, -17300, -17300, -17708, -17300, -17300, 12673, -13266, -14286, -14669, 2093, -17300, -17300, -17300, -13099, -13254, -17300, -17300, -17300, -15955, 12162, -17300, -17300, -4737, -8857, -17300, -17300, 3145, -17300, -17300, -6840, -5052, -10758, -17300, -17300, -3049, -4727, -17300, -17300, -17300, -17300, 13984, 7185, -12017, 3907, -4715, -17300, 2094, -17300, -17300, 162, 11299, -17300, -17300, -17300, 5113, 7132, 5524, -17300, -17300, -11620, -17300, -17300, 3684, 1051, -17300, -17300, -8311, -17300, -17300, 7786, -15517, -18595, -17300, -2724, -17300, -17300, 9489, 1771, -17300, -17300, 17549, -17300, -17300, 10750, -218, -17300, -17300, 1779, -17300, 12773, -17300, -17300, -25754, -17300, 4205, -17300, -5690, 5536, -8047, -17300, -17300, -10290, -17300, -17300, 7474, 5622, -17300, -17300, -1432, -17300, -17300, -20742, 801, -17300, -25154, -17300, -17300, 9031, 2546, 25543, -12013, -1039, -13986, -9527, -17300, -17300, -17300, -17267, -17300, 1428, -17300, -17300, 1920, -14086, -4255, -17300, -17300, -3573, -17300, -17300, -2850, 6596, -17300, -17300, -4886, -17300, -17300, -17300, 4925, -448, -479, -3324, -17300, -17300, -16450, -17300, 6455, -17300, -17300, 4530, 7665, 802, -17300, -17300, 8597, -17300, -17300, 5586, -17300, 6796, -17300, -17300, 11198, -16477, -17300, 6264, 5304, -17300, -17300, 8039, -17300, -17300, 12606, -4142, -17300, 11205, -17300, -17300, -17300, 12192, -449, -16672, -17300, 2730, -13162, -17300, 11635, -17300, -17300, 9855, -17300, 10450, -17300, -17300, 2709, -17300, 10919, 8559, 3451, -17300, -17300, 9837, -17300, -17300, 11338, 5065, -17300, -17300, 490, -17300, -17300, 14472, 9972, -17300, 15031, -1433, -17300, 5176, -17300, -17300, -13199, -17300, -2564, -17300, -17300, -5343, 4588, 7162, -17300, -17300, -14376, 16188, -17300, -17300, -17300, 13002, -7780, -17300, 28839, -17300, -17300, 18664, 16051, -17300, -17300, -17300, -15607, 11605, -6970, -17300, 2452, 3347, 5929, -16834, -17300, 94, -17300, -17300, -17300, -17300, -17300, -17300, -9361, 8662, 5787, 5063, -11356, -12601, -14552, -17300, -17300, -12108, -17300, -17300, 11117, -17300, -17300, -17300, 6409, -17300, 1140, -17300, -17300, 7728, 2683, -17300, -17300, -17300, -591, -18527, -17300, 18126, 17046, -12653, 7236, -17300, -17300, -1385, -17300, -17300, 7701, -5371, -17300, -17300, -17300, 6558, -17300, -17300, 12576, -14400, -3231, -17300, -16584, 6100, -17300, -17300, -17300, -10287, -6549, -9175, -17300, -17300, -17300, 5174, -2437, -17300, -17300, 11369, -17300, -17300, -8997, -17300, 9899, 13095, 232, -17300, -17300, -17300, -17300, -2881, 10961, 5889, -8148, -14874, -17300, -7920, -8089, -10878, -17300, -17300, -17300, -10551, -5727, -17300, -17300, -6529, -17300, -17300, 9070, -15326, -17300, 6208, 2985, -17300, -17300, -3632, -17300, -17300, 162, -1655, -6460, -17300, -17300, -11305, -17300, -17300, 4316, -14420, -17300, -17300, -18010, -17300, -17300, -15274, -17300, 6311, -6222, -17300, 6915, -17300, -2126, -17300, -17300, -17300, 17384, -1471, -17300, 11223, -4216, -17300, -9429, -17300, -17300, -17300, -5247, -9482, -17300, -17300, -17300, 20679, 20752, 148, 19031, 12489, 482, -16362, -17300, -17300, 19350, -17300, -17300, -8607, 8699, -17300, -17300, -7589, -17300, -17300, 3972, 21917, -17300, -17300, -17300, 7582, 11922, -22309, 714, -17300, -17300, -2774, -17300, -17300, 7497, 14566, -17300, -17300, -17300, -998, -9457, -17300, 5519, -17300, -17300, 7774, 14461, -17300, -17300, 7283, -17300, -17300, 14372, -17300, -17300, 25751, -17300, -7011, -17300, -17300};
 /* children indices per node (-1 for none) */
-static const int32_t children_left[NUM_NODES]  = {1, 2, 3, 4, 5, -1, 7, -1, -1, 10, 11, -1, -1, 14, -1, -1, 17, 18, 19, 20, 21, -1, -1, 24, -1, -1, -1, 28, 29, -1, 31, -1, -1, 34, 35, -1, -1, 38, -1, -1, 41, 42, 43, 44, -1, -1, 47, -1, -1, 50, 51, -1, -1, 54, -1, -1, 57, 58, 59, -1, -1, 62, -1, -1, 65, 66, -1, -1, -1, 70, 71, 72, 73, -1, -1, -1, 77, 78, 79, -1, -1, 82, -1, 84, -1, -1, 87, 88, -1, -1, -1, 92, 93, 94, -1, 96, 97, -1, -1, 100, -1, -1, -1, 104, 105, -1, 107, 108, -1, -1, -1, 112, 113, -1, -1, -1, 117, 118, 119, 120, 121, 122, 123, -1, -1, -1, 127, 128, -1, -1, -1, 132, 133, -1, -1, -1, 137, 138, -1, 140, 141, -1, -1, -1, 145, 146, -1, -1, -1, 150, -1, 152, 153, 154, 155, -1, -1, 158, -1, -1, 161, -1, 163, -1, -1, 166, 167, 168, -1, -1, -1, 172, 173, -1, -1, 176, -1, -1, 179, 180, 181, -1, 183, 184, 185, -1, -1, 188, -1, -1, 191, 192, -1, -1, -1, 196, 197, -1, -1, 200, 201, 202, -1, -1, 205, -1, -1, 208, -1, -1, 211, 212, 213, 214, 215, -1, -1, -1, -1, 220, -1, -1, 223, -1, -1, 1, 2, 3, 4, 5, -1, 7, -1, -1, 10, -1, 12, -1, -1, 15, 16, 17, 18, -1, -1, 21, 22, -1, -1, -1, 26, 27, -1, 29, -1, -1, 32, 33, -1, -1, -1, 37, 38, 39, -1, 41, -1, -1, -1, -1, 46, -1, 48, 49, 50, -1, 52, -1, -1, 55, 56, 57, -1, -1, -1, 61, -1, -1, 64, 65, 66, 67, -1, -1, 70, -1, -1, 73, 74, -1, -1, 77, -1, -1, 80, 81, 82, -1, -1, -1, 86, 87, -1, -1, -1, 91, 92, 93, 94, 95, 96, 97, -1, -1, 100, -1, -1, 103, 104, -1, -1, 107, -1, -1, -1, 111, 112, 113, 114, -1, -1, -1, 118, 119, -1, -1, 122, -1, -1, -1, 126, -1, 128, -1, -1, -1, 1, 2, -1, 4, 5, 6, -1, -1, 9, -1, 11, -1, -1, 14, 15, -1, -1, 18, -1, 20, 21, -1, 23, -1, -1, 26, 27, -1, -1, 30, -1, -1, 33, 34, 35, 36, -1, 38, 39, 40, -1, -1, 43, -1, -1, 46, -1, -1, -1, 50, 51, -1, -1, 54, -1, 56, 57, 58, -1, -1, -1, 62, -1, -1, 65, 66, 67, 68, 69, 70, -1, -1, 73, -1, -1, 76, 77, -1, -1, 80, -1, -1, 83, 84, 85, -1, -1, -1, 89, 90, -1, -1, 93, -1, -1, 96, 97, 98, 99, -1, -1, 102, -1, -1, -1, -1, 107, 108, 109, 110, 111, -1, -1, -1, 115, 116, -1, -1, -1, 120, -1, -1, 123, -1, -1, 1, 2, 3, -1, 5, -1, 7, -1, -1, 10, 11, -1, 13, 14, 15, 16, -1, -1, 19, -1, -1, 22, -1, 24, -1, -1, 27, 28, 29, -1, -1, 32, -1, -1, -1, -1, 37, 38, 39, 40, 41, 42, 43, -1, -1, 46, -1, -1, 49, 50, -1, -1, 53, -1, -1, 56, -1, -1, 59, 60, 61, 62, -1, -1, 65, -1, -1, 68, 69, -1, -1, 72, -1, -1, 75, -1, 77, 78, -1, -1, 81, -1, -1, 84, 85, 86, -1, 88, 89, -1, -1, 92, -1, -1, -1, 96, 97, 98, 99, -1, -1, -1, 103, -1, 105, -1, -1, 108, 109, 110, -1, -1, 113, -1, -1, 116, -1, 118, -1, -1, -1, 1, 2, 3, 4, -1, -1, 7, 8, 9, 10, -1, 12, -1, -1, 15, 16, -1, -1, 19, -1, -1, -1, 23, 24, 25, 26, -1, -1, -1, 30, 31, -1, -1, 34, -1, -1, 37, -1, -1, 40, 41, -1, 43, -1, -1, -1, 47, 48, 49, 50, 51, 52, 53, -1, -1, -1, 57, 58, -1, -1, -1, 62, 63, 64, -1, -1, 67, -1, -1, 70, 71, -1, -1, 74, -1, -1, 77, 78, 79, 80, -1, -1, 83, -1, -1, 86, -1, 88, -1, -1, 91, 92, -1, 94, -1, -1, 97, -1, -1, 100, 101, 102, 103, 104, -1, -1, 107, -1, -1, -1, 111, -1, -1, 114, 115, -1, -1, -1, 119, 120, 121, 122, -1, 124, -1, -1, 127, 128, -1, 130, -1, -1, -1, 134, 135, -1, -1, 138, 139, 140, -1, -1, -1, -1, 145, 146, 147, 148, -1, -1, 151, -1, 153, -1, -1, -1, 157, 158, -1, -1, -1, 1, 2, 3, 4, 5, -1, 7, -1, -1, -1, 11, -1, -1, 14, 15, 16, 17, 18, 19, -1, -1, 22, -1, -1, 25, 26, -1, -1, 29, -1, -1, 32, 33, 34, -1, -1, -1, -1, 39, 40, 41, 42, -1, -1, -1, 46, -1, -1, 49, 50, 51, -1, -1, -1, 55, 56, -1, -1, 59, -1, -1, -1, 63, 64, 65, 66, 67, -1, -1, -1, -1, 72, -1, 74, -1, -1, 77, 78, 79, 80, -1, -1, 83, -1, -1, -1, -1, 1, 2, 3, -1, 5, -1, 7, -1, -1, -1, 11, 12, 13, -1, 15, -1, -1, 18, 19, 20, 21, -1, 23, -1, -1, 26, 27, -1, -1, 30, -1, -1, 33, 34, 35, -1, -1, 38, -1, -1, 41, 42, -1, -1, 45, -1, -1, 48, -1, 50, 51, 52, -1, -1, 55, -1, -1, 58, 59, -1, -1, 62, -1, -1, 65, 66, -1, -1, 69, -1, -1, 1, 2, 3, -1, 5, 6, -1, -1, 9, 10, -1, -1, 13, 14, 15, -1, -1, 18, -1, -1, 21, -1, -1, 24, -1, 26, 27, 28, -1, 30, 31, -1, -1, 34, -1, -1, 37, 38, -1, -1, -1, -1, 43, 44, 45, 46, -1, 48, -1, 50, 51, -1, -1, 54, -1, -1, -1, 58, -1, 60, 61, -1, -1, -1, 65, 66, 67, 68, -1, 70, 71, -1, -1, 74, -1, -1, 77, 78, 79, -1, -1, -1, 83, 84, -1, -1, -1, 88, 89, -1, 91, -1, -1, 94, 95, 96, -1, -1, -1, 100, 101, -1, -1, 104, -1, -1, 107, 108, 109, 110, 111, -1, -1, -1, -1, -1, 117, 118, -1, 120, 121, -1, -1, 124, -1, -1, 127, -1, 129, 130, -1, -1, 133, -1, -1, 1, 2, 3, -1, -1, 6, -1, -1, 9, 10, 11, 12, 13, -1, 15, -1, 17, -1, -1, 20, 21, 22, -1, -1, 25, -1, -1, 28, 29, -1, -1, 32, -1, -1, 35, 36, -1, 38, 39, -1, -1, 42, -1, -1, 45, 46, -1, 48, -1, -1, 51, 52, -1, -1, 55, -1, -1, 58, 59, 60, 61, -1, -1, 64, 65, -1, -1, 68, -1, -1, 71, 72, -1, 74, -1, -1, -1, 78, -1, 80, 81, 82, -1, -1, 85, -1, -1, 88, 89, -1, -1, -1, 93, 94, -1, 96, 97, 98, -1, -1, -1, 102, 103, -1, -1, -1, 107, 108, 109, 110, 111, -1, -1, 114, -1, -1, 117, 118, -1, -1, 121, -1, -1, 124, 125, -1, -1, 128, 129, -1, -1, -1, 133, 134, 135, -1, -1, -1, 139, 140, -1, -1, -1, 1, 2, 3, 4, 5, 6, 7, 8, -1, -1, 11, -1, -1, 14, -1, -1, 17, 18, 19, -1, -1, 22, -1, -1, -1, 26, 27, 28, -1, -1, -1, 32, 33, -1, 35, -1, -1, 38, 39, -1, -1, -1, 43, 44, 45, 46, -1, 48, -1, -1, 51, 52, -1, -1, 55, -1, -1, 58, 59, 60, -1, -1, 63, -1, -1, 66, 67, -1, -1, 70, -1, -1, 73, 74, -1, 76, -1, 78, -1, -1, 81, 82, 83, -1, -1, 86, -1, -1, 89, 90, -1, -1, 93, -1, -1, 96, 97, 98, -1, -1, 101, -1, 103, -1, -1, 106, 107, -1, -1, -1, 111, -1, 113, 114, 115, 116, 117, -1, -1, 120, 121, -1, -1, 124, -1, -1, -1, 128, 129, 130, 131, -1, -1, -1, 135, -1, -1, -1, 139, -1, 141, 142, 143, -1, -1, 146, -1, 148, -1, -1, -1, 1, -1, 3, 4, 5, 6, 7, 8, 9, -1, -1, 12, -1, -1, 15, 16, -1, -1, 19, -1, -1, -1, 23, 24, 25, -1, 27, -1, -1, 30, -1, 32, -1, -1, 35, 36, 37, -1, -1, 40, -1, -1, 43, -1, 45, -1, -1, 48, 49, 50, -1, -1, 53, -1, -1, 56, 57, -1, -1, 60, -1, -1, 63, 64, 65, 66, 67, 68, -1, -1, 71, -1, -1, 74, -1, 76, -1, -1, 79, -1, -1, 82, 83, -1, -1, -1, 87, -1, -1, 1, 2, 3, 4, 5, 6, -1, -1, -1, -1, 11, 12, 13, -1, 15, -1, -1, -1, 19, 20, 21, 22, -1, -1, 25, -1, -1, 28, 29, -1, -1, 32, -1, -1, 35, 36, 37, -1, -1, -1, -1, 42, 43, 44, -1, 46, 47, -1, -1, 50, -1, -1, -1, 54, 55, 56, -1, -1, -1, 60, 61, 62, 63, -1, -1, 66, -1, -1, 69, 70, -1, -1, -1, 74, -1, 76, -1, 78, -1, -1, 81, 82, 83, -1, -1, 86, 87, -1, 89, 90, -1, -1, 93, -1, -1, -1, 97, 98, 99, -1, 101, 102, 103, -1, -1, -1, 107, -1, 109, -1, -1, 112, 113, 114, 115, -1, -1, 118, -1, -1, 121, -1, -1, -1, 125, 126, -1, -1, -1, 1, 2, 3, 4, 5, -1, 7, 8, 9, -1, -1, 12, -1, -1, 15, -1, 17, -1, -1, 20, 21, 22, 23, -1, -1, 26, -1, -1, 29, 30, -1, -1, 33, -1, -1, 36, -1, -1, 39, 40, -1, -1, 43, 44, 45, -1, 47, -1, -1, -1, 51, 52, 53, -1, -1, -1, 57, 58, -1, -1, -1, 62, -1, 64, 65, 66, 67, 68, -1, -1, 71, -1, -1, -1, 75, -1, 77, -1, -1, 80, -1, 82, -1, -1, 85, 86, 87, 88, 89, 90, 91, -1, -1, -1, 95, 96, -1, -1, 99, -1, -1, -1, 103, -1, 105, 106, -1, 108, -1, -1, 111, -1, 113, -1, -1, 116, 117, 118, -1, 120, 121, -1, -1, 124, -1, -1, 127, 128, 129, -1, -1, 132, -1, -1, -1, 136, 137, 138, 139, -1, -1, 142, -1, -1, 145, -1, -1, -1, 149, -1, -1, 1, 2, -1, 4, -1, 6, 7, -1, -1, 10, -1, -1, 13, 14, 15, 16, 17, -1, 19, -1, 21, -1, -1, 24, -1, 26, -1, -1, 29, -1, 31, 32, 33, -1, -1, 36, -1, -1, 39, 40, -1, -1, -1, 44, 45, 46, -1, 48, 49, -1, -1, 52, -1, -1, 55, 56, -1, 58, -1, -1, -1, 62, 63, 64, -1, -1, -1, 68, 69, -1, -1, 72, -1, -1, 75, 76, 77, 78, 79, -1, -1, -1, -1, 84, -1, 86, -1, -1, 89, 90, -1, 92, 93, 94, -1, -1, -1, 98, 99, -1, -1, -1, 103, 104, 105, 106, -1, -1, 109, -1, -1, 112, 113, -1, -1, 116, -1, -1, 119, 120, -1, 122, -1, -1, 125, 126, -1, -1, 129, -1, -1, 1, 2, 3, 4, 5, -1, -1, 8, 9, -1, 11, -1, -1, -1, -1, 16, 17, -1, -1, 20, -1, 22, 23, -1, -1, -1, 27, 28, 29, 30, 31, 32, 33, -1, -1, 36, -1, -1, 39, 40, -1, -1, -1, 44, 45, -1, -1, 48, -1, -1, 51, -1, -1, 54, 55, 56, 57, -1, -1, 60, 61, -1, -1, 64, -1, -1, 67, 68, 69, -1, -1, 72, -1, -1, -1, 76, 77, 78, 79, -1, -1, 82, -1, -1, 85, 86, -1, -1, 89, -1, -1, 92, 93, 94, -1, -1, 97, -1, -1, -1, -1, 1, 2, 3, -1, 5, 6, 7, -1, 9, -1, -1, 12, 13, -1, 15, -1, -1, 18, 19, -1, -1, -1, 23, 24, 25, 26, -1, -1, 29, -1, -1, 32, 33, -1, -1, -1, 37, 38, 39, -1, -1, 42, -1, -1, 45, -1, -1, 48, 49, 50, 51, 52, -1, -1, -1, -1, 57, -1, 59, -1, 61, 62, -1, -1, 65, -1, -1, 68, 69, 70, 71, -1, -1, 74, -1, -1, 77, 78, 79, -1, -1, -1, 83, 84, -1, -1, 87, -1, -1, 90, -1, 92, -1, -1, 95, 96, -1, 98, 99, 100, 101, -1, -1, 104, 105, -1, -1, 108, -1, -1, 111, -1, -1, 114, -1, -1, -1, 1, 2, 3, 4, 5, -1, -1, 8, 9, -1, 11, -1, -1, 14, -1, -1, 17, 18, 19, 20, -1, 22, -1, -1, 25, -1, 27, -1, -1, -1, 31, -1, -1, 34, -1, 36, -1, 38, -1, -1, 41, 42, 43, 44, -1, 46, 47, 48, -1, -1, 51, -1, -1, 54, 55, -1, -1, 58, -1, -1, 61, 62, 63, 64, -1, -1, 67, -1, -1, 70, 71, -1, -1, 74, -1, -1, 77, 78, -1, -1, 81, -1, 83, -1, -1, 86, 87, 88, 89, -1, -1, 92, 93, -1, -1, -1, 97, -1, -1, 100, 101, 102, 103, -1, -1, 106, -1, -1, -1, -1, 111, 112, 113, -1, -1, 116, 117, -1, -1, 120, 121, 122, -1, -1, 125, -1, -1, -1, 129, 130, -1, 132, 133, 134, -1, -1, 137, -1, -1, -1, 141, -1, 143, 144, -1, -1, -1, 1, 2, 3, 4, -1, -1, 7, -1, -1, 10, -1, 12, 13, -1, -1, -1, 17, 18, 19, 20, 21, 22, -1, -1, 25, 26, -1, -1, 29, -1, -1, 32, -1, 34, 35, -1, -1, 38, -1, -1, 41, -1, 43, -1, -1, 46, 47, 48, -1, -1, -1, -1, 53, 54, -1, -1, 57, -1, -1, 1, 2, 3, 4, 5, -1, 7, -1, -1, -1, 11, 12, 13, -1, 15, -1, -1, -1, 19, -1, -1, 22, 23, -1, -1, 26, 27, -1, -1, 30, -1, 32, 33, 34, -1, -1, -1, 38, -1, -1, 41, 42, 43, -1, -1, -1, 47, 48, 49, -1, -1, -1, 53, 54, -1, 56, 57, -1, -1, 60, -1, -1, 63, 64, 65, 66, -1, -1, 69, -1, -1, 72, -1, 74, -1, -1, 77, 78, 79, -1, -1, -1, 83, 84, -1, -1, 87, -1, -1, 1, 2, 3, 4, 5, 6, 7, -1, 9, -1, -1, 12, 13, -1, -1, 16, -1, -1, 19, -1, 21, 22, -1, -1, 25, -1, -1, -1, 29, 30, 31, 32, 33, -1, -1, 36, -1, -1, 39, 40, -1, -1, 43, -1, -1, 46, 47, -1, -1, -1, 51, 52, -1, 54, 55, -1, -1, 58, -1, -1, 61, 62, 63, -1, -1, 66, -1, -1, 69, 70, -1, -1, 73, -1, -1, 76, 77, 78, -1, 80, -1, 82, 83, -1, -1, -1, 87, 88, -1, 90, 91, -1, -1, 94, -1, -1, 97, 98, 99, -1, -1, 102, -1, -1, 105, 106, -1, -1, 109, -1, -1, 112, 113, 114, 115, -1, -1, 118, 119, -1, -1, -1, 123, 124, -1, 126, -1, -1, -1, 130, 131, -1, 133, -1, -1, 136, 137, 138, -1, -1, 141, -1, -1, -1, 145, -1, 147, -1, 149, -1, -1, 1, 2, 3, 4, 5, -1, -1, 8, 9, 10, 11, -1, -1, 14, -1, -1, 17, 18, -1, -1, -1, 22, 23, 24, -1, -1, -1, -1, 29, 30, 31, 32, -1, -1, 35, -1, -1, 38, -1, -1, 41, -1, -1, 44, 45, 46, 47, 48, 49, -1, -1, 52, -1, -1, -1, 56, -1, -1, 59, 60, 61, 62, -1, -1, 65, -1, -1, 68, 69, -1, -1, 72, -1, -1, 75, -1, 77, 78, -1, -1, -1, 82, 83, 84, 85, 86, -1, -1, -1, 90, 91, -1, -1, 94, -1, -1, 97, 98, 99, -1, -1, -1, 103, 104, -1, -1, 107, -1, -1, 110, -1, 112, 113, -1, 115, -1, -1, 118, -1, 120, -1, -1, 123, 124, 125, 126, 127, -1, 129, -1, 131, -1, -1, -1, 135, -1, -1, 138, 139, -1, 141, -1, 143, -1, -1, 146, 147, -1, 149, 150, -1, -1, 153, -1, -1, 156, -1, -1, 159, 160, -1, -1, -1, 1, 2, 3, 4, 5, -1, 7, -1, -1, 10, 11, 12, -1, -1, -1, -1, 17, 18, 19, -1, 21, -1, -1, -1, 25, 26, 27, 28, -1, -1, 31, -1, -1, 34, -1, -1, 37, 38, 39, -1, -1, 42, -1, -1, 45, -1, -1, 48, -1, 50, 51, 52, 53, 54, -1, -1, 57, -1, -1, 60, -1, -1, -1, 64, 65, 66, 67, -1, -1, -1, -1, 72, -1, 74, 75, -1, -1, 78, -1, -1, 81, 82, 83, -1, 85, 86, -1, 88, -1, 90, -1, -1, 93, 94, 95, -1, -1, -1, 99, 100, -1, -1, -1, 104, 105, 106, 107, -1, 109, -1, -1, 112, 113, -1, -1, 116, -1, -1, 119, 120, -1, 122, -1, -1, 125, 126, -1, -1, 129, -1, -1, 132, -1, 134, -1, 136, -1, -1, 139, 140, 141, 142, 143, 144, -1, -1, -1, -1, 149, 150, -1, -1, 153, -1, -1, 156, 157, -1, 159, -1, 161, -1, -1, 164, -1, -1, 167, 168, -1, 170, -1, -1, -1, 1, 2, 3, -1, 5, -1, 7, 8, -1, 10, -1, -1, 13, 14, 15, -1, -1, -1, 19, -1, -1, -1, 23, 24, 25, -1, 27, 28, -1, 30, -1, -1, 33, 34, -1, -1, -1, 38, 39, 40, 41, 42, -1, -1, 45, -1, -1, 48, 49, -1, -1, 52, -1, -1, 55, -1, 57, -1, -1, -1, 61, 62, -1, -1, 65, -1, 67, -1, -1, 1, 2, 3, 4, 5, 6, 7, -1, -1, -1, -1, 12, 13, -1, -1, 16, 17, 18, -1, -1, -1, 22, -1, -1, 25, -1, -1, 28, 29, -1, 31, -1, -1, 34, 35, -1, -1, -1, 39, 40, -1, 42, 43, -1, -1, 46, -1, -1, 49, 50, 51, 52, -1, -1, -1, 56, 57, -1, 59, -1, 61, -1, -1, 64, 65, 66, -1, -1, -1, -1, 71, 72, 73, 74, 75, -1, -1, 78, -1, -1, 81, 82, -1, -1, 85, -1, -1, 88, 89, 90, -1, -1, -1, 94, -1, -1, 97, -1, 99, 100, 101, -1, -1, 104, -1, -1, 107, 108, -1, -1, 111, -1, -1, 1, 2, 3, 4, -1, -1, 7, -1, -1, 10, -1, 12, -1, 14, -1, -1, 17, 18, 19, -1, -1, -1, 23, 24, 25, 26, -1, 28, -1, 30, -1, -1, 33, 34, 35, -1, -1, -1, 39, -1, -1, 42, -1, -1, 45, 46, 47, 48, 49, -1, -1, 52, -1, -1, 55, 56, -1, -1, -1, 60, 61, 62, -1, -1, -1, 66, 67, -1, -1, 70, -1, -1, 73, 74, 75, -1, -1, 78, -1, -1, 81, 82, 83, -1, -1, 86, -1, -1, 89, -1, 91, -1, -1, 1, 2, 3, 4, 5, -1, 7, -1, 9, -1, 11, -1, -1, 14, -1, 16, -1, 18, 19, -1, -1, -1, 23, 24, 25, 26, 27, -1, -1, 30, -1, -1, 33, -1, -1, 36, 37, 38, -1, -1, 41, -1, -1, 44, -1, -1, 47, 48, 49, 50, -1, -1, 53, -1, -1, 56, 57, -1, -1, 60, -1, -1, 63, -1, 65, -1, -1, 68, 69, 70, 71, 72, 73, -1, -1, 76, -1, -1, 79, 80, -1, -1, 83, -1, -1, 86, 87, 88, -1, -1, 91, -1, -1, 94, 95, -1, -1, -1, 99, 100, -1, -1, 103, 104, -1, 106, -1, -1, 109, -1, -1, 112, 113, -1, -1, -1, 117, 118, 119, -1, 121, 122, -1, -1, -1, 126, -1, -1, 129, -1, -1, 1, 2, 3, 4, 5, 6, -1, 8, -1, 10, -1, -1, 13, 14, 15, -1, -1, 18, -1, -1, 21, -1, 23, -1, -1, 26, -1, -1, -1, 30, 31, 32, 33, -1, 35, 36, -1, -1, 39, -1, -1, 42, 43, 44, -1, -1, 47, -1, -1, 50, 51, -1, -1, -1, 55, 56, 57, 58, -1, -1, 61, -1, -1, 64, 65, -1, -1, 68, -1, -1, 71, -1, -1, 74, 75, 76, -1, 78, -1, -1, -1, 82, 83, 84, 85, -1, -1, -1, -1, -1, 91, -1, 93, 94, 95, -1, -1, -1, -1, 1, 2, 3, 4, -1, -1, 7, 8, -1, 10, 11, -1, 13, -1, -1, 16, -1, 18, -1, -1, -1, 22, 23, -1, 25, 26, 27, 28, -1, -1, -1, 32, -1, -1, -1, 36, 37, 38, 39, 40, -1, -1, -1, 44, 45, -1, -1, -1, -1, 50, 51, 52, -1, 54, -1, -1, -1, 58, -1, 60, -1, 62, -1, -1, 65, 66, 67, -1, -1, 70, 71, -1, -1, 74, 75, 76, 77, -1, -1, 80, -1, -1, -1, 84, 85, 86, -1, -1, -1, 90, 91, -1, -1, 94, -1, -1, 97, 98, 99, 100, 101, 102, -1, -1, 105, -1, -1, 108, 109, -1, -1, 112, -1, -1, 115, 116, 117, -1, -1, 120, -1, -1, 123, 124, -1, -1, -1, 128, 129, 130, -1, 132, -1, -1, 135, -1, -1, -1, 139, 140, -1, 142, 143, -1, -1, 146, 147, -1, -1, 150, -1, -1, 153, 154, 155, 156, -1, -1, 159, -1, -1, 162, 163, -1, -1, 166, -1, -1, 169, 170, 171, -1, -1, 174, -1, -1, -1, 1, 2, 3, 4, 5, 6, -1, 8, -1, 10, -1, -1, 13, -1, -1, -1, 17, 18, 19, -1, 21, 22, -1, -1, -1, 26, 27, 28, -1, -1, 31, -1, -1, 34, -1, -1, 37, 38, 39, -1, 41, -1, -1, 44, 45, -1, -1, 48, -1, -1, 51, 52, 53, -1, -1, 56, -1, -1, 59, 60, -1, -1, 63, -1, -1, 66, -1, 68, 69, -1, 71, -1, 73, 74, -1, -1, -1, 78, 79, 80, -1, -1, -1, -1, 85, 86, 87, 88, -1, -1, 91, -1, -1, 94, 95, 96, 97, -1, -1, -1, -1, 102, 103, 104, 105, -1, -1, 108, -1, -1, 111, 112, -1, -1, -1, -1, 117, 118, 119, -1, -1, -1, 123, -1, -1, 1, 2, 3, 4, 5, 6, 7, 8, -1, -1, 11, -1, -1, -1, 15, 16, -1, 18, -1, -1, 21, -1, -1, 24, 25, 26, 27, -1, -1, 30, -1, -1, -1, -1, 35, 36, 37, -1, -1, 40, 41, 42, -1, -1, 45, -1, -1, 48, 49, -1, -1, 52, -1, -1, -1, 56, -1, -1, -1, 1, 2, -1, 4, 5, 6, 7, -1, 9, -1, 11, -1, -1, 14, 15, 16, -1, -1, -1, 20, 21, -1, -1, 24, -1, -1, 27, 28, 29, 30, -1, -1, 33, -1, -1, 36, 37, -1, -1, -1, 41, 42, -1, -1, 45, 46, -1, -1, 49, -1, -1, 52, 53, 54, -1, -1, 57, -1, -1, 60, 61, 62, 63, -1, -1, 66, -1, -1, 69, 70, -1, -1, 73, -1, -1, 76, 77, 78, -1, -1, 81, -1, -1, -1, 85, 86, 87, 88, 89, -1, -1, -1, -1, -1, 95, 96, 97, 98, 99, 100, -1, -1, -1, -1, -1, -1, 107, -1, 109, -1, 111, -1, 113, -1, -1, 1, 2, -1, -1, 5, 6, 7, 8, 9, -1, -1, 12, 13, -1, -1, 16, -1, 18, -1, -1, 21, 22, 23, 24, -1, -1, -1, -1, 29, 30, 31, -1, -1, -1, 35, 36, -1, -1, 39, -1, -1, 42, 43, 44, -1, 46, -1, -1, 49, 50, -1, -1, -1, -1, 55, 56, 57, 58, -1, -1, 61, -1, -1, 64, -1, 66, 67, -1, -1, -1, 71, 72, 73, -1, -1, 76, 77, -1, -1, -1, -1, 1, 2, 3, 4, 5, 6, 7, -1, -1, -1, 11, 12, 13, -1, -1, 16, -1, -1, 19, 20, -1, -1, -1, 24, 25, 26, -1, 28, -1, -1, 31, 32, -1, -1, 35, -1, -1, 38, 39, -1, -1, 42, 43, -1, -1, 46, -1, -1, 49, 50, 51, 52, -1, 54, -1, -1, 57, 58, -1, -1, 61, -1, -1, 64, 65, 66, -1, -1, -1, 70, 71, -1, -1, 74, -1, -1, 77, 78, 79, -1, -1, 82, 83, -1, -1, -1, 87, 88, 89, -1, -1, -1, -1, 94, 95, 96, 97, 98, 99, -1, -1, 102, -1, -1, 105, -1, 107, -1, -1, 110, 111, 112, -1, -1, 115, -1, -1, -1, -1, 120, -1, 122, 123, -1, -1, 126, -1, 128, -1, -1, 131, 132, -1, -1, 135, 136, 137, -1, -1, 140, -1, -1, -1, 1, 2, 3, 4, 5, 6, -1, 8, 9, -1, -1, 12, -1, -1, 15, -1, -1, 18, -1, -1, 21, 22, -1, -1, 25, 26, -1, 28, 29, -1, -1, -1, 33, 34, 35, -1, -1, 38, -1, -1, 41, 42, -1, -1, 45, -1, -1, 48, -1, 50, 51, 52, 53, 54, -1, -1, -1, -1, 59, 60, 61, -1, -1, 64, -1, -1, -1, 68, 69, 70, -1, -1, 73, 74, -1, -1, 77, -1, -1, -1, 81, 82, 83, 84, 85, -1, 87, -1, -1, 90, 91, 92, -1, -1, -1, 96, 97, -1, -1, -1, 101, 102, 103, -1, 105, -1, -1, 108, 109, -1, -1, -1, 113, 114, 115, -1, -1, 118, -1, -1, 121, -1, -1, 124, -1, -1, 127, 128, 129, 130, 131, 132, -1, -1, 135, -1, -1, 138, 139, -1, -1, 142, -1, -1, -1, 146, -1, 148, 149, -1, -1, -1, -1, 1, 2, 3, 4, 5, 6, -1, 8, 9, -1, -1, -1, 13, 14, 15, -1, -1, 18, -1, -1, 21, -1, 23, -1, -1, 26, 27, -1, -1, -1, 31, -1, 33, -1, -1, 36, 37, 38, 39, -1, 41, -1, -1, 44, 45, -1, -1, -1, 49, 50, -1, -1, -1, 54, 55, 56, 57, -1, 59, -1, -1, 62, -1, -1, 65, 66, 67, -1, -1, 70, -1, -1, 73, -1, -1, 76, -1, -1, 79, 80, 81, -1, 83, -1, -1, 86, 87, 88, 89, 90, -1, -1, 93, -1, -1, 96, 97, -1, -1, 100, -1, -1, 103, 104, 105, -1, -1, 108, -1, -1, 111, 112, -1, -1, -1, 116, 117, 118, 119, -1, -1, 122, -1, -1, 125, 126, -1, -1, 129, -1, -1, 132, -1, 134, -1, 136, -1, -1, 139, 140, 141, 142, -1, -1, -1, -1, 147, 148, 149, -1, -1, -1, 153, 154, 155, -1, -1, 158, 159, -1, -1, 162, -1, -1, 165, -1, -1, 1, 2, 3, 4, 5, 6, 7, 8, -1, -1, 11, -1, -1, 14, 15, -1, -1, 18, -1, -1, 21, -1, -1, 24, 25, 26, -1, 28, -1, -1, 31, 32, -1, -1, 35, -1, -1, 38, 39, -1, 41, -1, -1, 44, 45, -1, -1, 48, -1, -1, 51, 52, 53, -1, 55, -1, -1, -1, 59, 60, 61, -1, -1, 64, 65, -1, -1, -1, 69, 70, 71, -1, -1, -1, 75, -1, -1, 78, 79, -1, 81, -1, -1, 84, 85, 86, 87, -1, -1, -1, 91, -1, -1, 94, -1, -1, 97, 98, 99, 100, -1, -1, 103, 104, -1, 106, -1, -1, 109, 110, 111, -1, -1, 114, -1, -1, 117, -1, 119, -1, -1, 122, 123, -1, -1, -1, 127, 128, 129, 130, 131, 132, -1, -1, 135, -1, -1, 138, 139, -1, -1, -1, -1, 144, 145, 146, 147, -1, -1, -1, -1, 152, 153, -1, 155, -1, -1, 158, 159, -1, -1, 162, -1, -1, -1, 1, 2, 3, -1, 5, 6, 7, -1, 9, 10, -1, -1, -1, 14, -1, -1, -1, -1, 19, 20, 21, 22, 23, 24, 25, -1, -1, 28, -1, -1, 31, -1, 33, -1, -1, 36, 37, 38, -1, -1, -1, 42, -1, -1, 45, 46, 47, 48, -1, -1, 51, -1, -1, 54, 55, -1, -1, 58, -1, -1, 61, -1, 63, 64, -1, -1, 67, -1, -1, 70, 71, 72, -1, -1, -1, 76, 77, -1, 79, 80, -1, -1, 83, -1, -1, 86, -1, -1, 89, 90, 91, 92, -1, -1, 95, -1, -1, 98, 99, 100, -1, 102, -1, -1, -1, 106, 107, 108, -1, -1, 111, -1, -1, -1, 115, -1, 117, -1, 119, 120, -1, -1, -1, 1, 2, 3, 4, 5, 6, 7, -1, -1, -1, 11, -1, -1, -1, -1, 16, 17, 18, 19, 20, 21, -1, -1, 24, -1, -1, 27, -1, 29, -1, -1, 32, 33, -1, 35, -1, -1, 38, 39, -1, -1, 42, -1, -1, 45, 46, -1, -1, -1, 50, 51, 52, -1, 54, 55, -1, -1, 58, -1, -1, 61, -1, 63, 64, -1, -1, 67, -1, -1, 70, 71, 72, 73, -1, -1, -1, 77, 78, -1, -1, -1, 82, -1, -1, 85, -1, 87, 88, -1, 90, 91, 92, -1, -1, 95, 96, -1, -1, -1, -1, 101, 102, -1, 104, -1, 106, 107, -1, -1, 110, -1, -1, 113, -1, 115, 116, 117, -1, -1, 120, -1, -1, 123, 124, -1, -1, 127, -1, -1, 1, 2, 3, 4, 5, -1, 7, 8, 9, -1, -1, -1, 13, 14, -1, -1, 17, -1, -1, 20, 21, 22, -1, -1, 25, -1, 27, -1, -1, 30, 31, 32, -1, -1, 35, -1, -1, 38, -1, 40, -1, -1, 43, 44, 45, 46, 47, -1, -1, 50, -1, -1, 53, 54, -1, -1, 57, -1, -1, 60, 61, 62, -1, -1, 65, -1, -1, 68, 69, -1, -1, 72, -1, -1, 75, 76, 77, 78, -1, -1, 81, -1, -1, 84, 85, -1, -1, -1, 89, 90, 91, -1, -1, 94, -1, -1, 97, -1, -1, 100, 101, 102, 103, -1, -1, -1, -1, 108, 109, -1, -1, 112, -1, -1, 115, 116, 117, -1, -1, -1, 121, 122, 123, 124, -1, 126, -1, -1, 129, -1, 131, -1, -1, 134, 135, -1, -1, 138, -1, -1, 141, 142, 143, -1, -1, -1, 147, -1, -1, 1, 2, 3, 4, 5, -1, 7, 8, -1, 10, -1, -1, 13, 14, -1, -1, 17, -1, -1, 20, 21, 22, 23, -1, -1, -1, 27, -1, 29, -1, -1, 32, -1, -1, -1, 36, 37, 38, 39, -1, 41, -1, -1, 44, -1, 46, 47, -1, -1, 50, -1, -1, 53, 54, -1, 56, -1, 58, -1, -1, 61, -1, 63, 64, -1, -1, 67, -1, -1, 70, 71, -1, 73, -1, -1, 76, -1, -1, 79, 80, 81, 82, -1, 84, -1, 86, 87, -1, -1, 90, -1, -1, 93, 94, 95, -1, 97, -1, -1, 100, 101, -1, -1, 104, -1, -1, 107, 108, 109, -1, -1, -1, 113, 114, -1, -1, 117, -1, -1, 120, 121, -1, 123, -1, -1, -1, 127, 128, 129, 130, -1, 132, 133, -1, -1, -1, -1, -1, 139, -1, -1, 1, -1, 3, 4, 5, 6, 7, 8, 9, -1, -1, 12, -1, -1, 15, 16, -1, -1, 19, -1, -1, 22, 23, -1, -1, 26, -1, -1, 29, -1, 31, -1, 33, 34, -1, -1, 37, -1, -1, 40, 41, 42, 43, -1, 45, -1, -1, 48, -1, -1, 51, 52, -1, 54, -1, -1, -1, 58, 59, -1, 61, 62, -1, -1, -1, 66, -1, 68, 69, -1, -1, 72, -1, -1, 75, 76, 77, -1, -1, 80, 81, 82, -1, 84, -1, -1, -1, 88, 89, 90, -1, -1, 93, -1, -1, 96, 97, -1, -1, 100, -1, -1, -1, 1, 2, 3, 4, 5, 6, 7, 8, -1, -1, 11, -1, -1, 14, 15, -1, -1, 18, -1, -1, 21, 22, -1, -1, 25, -1, 27, -1, -1, 30, 31, 32, -1, 34, -1, -1, 37, -1, -1, 40, 41, 42, -1, -1, 45, -1, -1, 48, -1, 50, -1, -1, 53, 54, -1, -1, 57, 58, -1, -1, -1, 62, -1, -1, 65, 66, 67, 68, -1, 70, 71, 72, -1, -1, -1, 76, -1, -1, 79, -1, -1, -1, 83, 84, 85, 86, -1, -1, 89, 90, -1, 92, -1, -1, -1, 96, -1, -1, 99, 100, 101, 102, 103, -1, -1, 106, -1, -1, 109, 110, -1, -1, 113, -1, -1, 116, 117, -1, -1, -1, 121, 122, 123, 124, -1, -1, -1, 128, 129, -1, -1, -1, 133, 134, 135, -1, -1, 138, -1, -1, 141, -1, -1, 1, 2, 3, 4, 5, 6, 7, 8, -1, -1, 11, -1, -1, 14, 15, -1, -1, 18, -1, -1, 21, 22, 23, -1, -1, -1, -1, 28, 29, 30, -1, 32, -1, -1, 35, 36, -1, -1, 39, -1, -1, 42, 43, -1, 45, -1, -1, 48, 49, -1, -1, 52, -1, -1, 55, 56, 57, -1, 59, 60, -1, -1, 63, -1, -1, 66, 67, -1, 69, -1, -1, 72, -1, -1, 75, 76, 77, 78, -1, -1, 81, -1, -1, 84, 85, -1, -1, -1, 89, -1, 91, 92, -1, -1, 95, -1, -1, -1, 99, 100, 101, 102, -1, 104, -1, 106, -1, -1, 109, 110, 111, 112, -1, -1, -1, 116, 117, -1, -1, -1, 121, 122, 123, -1, -1, -1, 127, -1, -1, 130, 131, 132, 133, 134, -1, -1, -1, 138, 139, -1, -1, -1, 143, 144, 145, -1, -1, -1, 149, -1, -1, -1, 153, 154, 155, 156, -1, 158, 159, -1, -1, -1, 163, 164, 165, -1, -1, -1, 169, 170, -1, -1, 173, -1, -1, 176, 177, -1, -1, -1, 181, 182, 183, 184, 185, -1, -1, -1, 189, 190, -1, -1, 193, -1, -1, -1, 197, -1, 199, -1, -1, 1, 2, 3, -1, 5, 6, 7, 8, 9, -1, -1, -1, 13, 14, -1, -1, 17, -1, -1, 20, 21, 22, -1, -1, 25, -1, -1, 28, 29, -1, -1, -1, 33, 34, -1, 36, 37, -1, -1, -1, 41, 42, -1, 44, -1, -1, 47, 48, -1, -1, -1, 52, 53, 54, 55, -1, -1, 58, 59, -1, 61, -1, -1, 64, -1, -1, 67, 68, -1, -1, 71, 72, 73, -1, -1, 76, -1, -1, 79, -1, -1, 82, 83, 84, 85, 86, -1, -1, 89, -1, -1, 92, -1, 94, -1, -1, 97, 98, 99, -1, -1, 102, -1, -1, 105, -1, 107, -1, -1, 110, -1, 112, -1, -1, -1, 1, 2, 3, 4, 5, 6, -1, -1, 9, 10, 11, -1, -1, 14, -1, -1, 17, 18, -1, -1, 21, -1, -1, 24, 25, -1, 27, 28, -1, -1, 31, -1, -1, 34, 35, -1, 37, -1, -1, 40, -1, -1, 43, 44, 45, -1, 47, -1, 49, -1, -1, 52, 53, 54, -1, -1, 57, -1, -1, 60, 61, -1, -1, 64, -1, -1, 67, -1, -1, 70, 71, 72, 73, 74, 75, -1, -1, 78, -1, -1, 81, -1, 83, -1, -1, 86, -1, 88, -1, -1, 91, 92, 93, 94, -1, -1, -1, 98, 99, -1, -1, 102, -1, -1, 105, 106, -1, -1, 109, 110, -1, -1, 113, -1, -1, 116, 117, 118, -1, -1, 121, -1, 123, -1, -1, 126, -1, -1, -1, 1, 2, 3, 4, 5, -1, 7, 8, -1, 10, -1, -1, 13, -1, 15, -1, -1, 18, -1, -1, 21, 22, 23, -1, -1, -1, 27, 28, -1, 30, 31, -1, -1, 34, -1, -1, 37, 38, 39, -1, -1, 42, -1, -1, 45, 46, -1, -1, 49, -1, -1, 52, 53, 54, 55, -1, 57, -1, 59, -1, -1, 62, 63, -1, 65, -1, -1, 68, 69, -1, -1, 72, -1, -1, 75, 76, -1, 78, -1, -1, 81, 82, -1, -1, -1, 86, 87, 88, 89, 90, -1, -1, -1, -1, 95, 96, -1, 98, -1, -1, 101, 102, -1, -1, 105, -1, -1, 108, 109, 110, -1, -1, 113, 114, -1, -1, -1, 118, -1, -1, 121, 122, 123, 124, -1, 126, -1, -1, 129, -1, -1, 132, -1, 134, 135, -1, -1, 138, -1, -1, 141, 142, -1, 144, -1, -1, 147, -1, -1, 1, 2, 3, 4, -1, 6, 7, -1, -1, -1, 11, -1, -1, 14, -1, -1, 17, 18, 19, 20, -1, -1, 23, 24, 25, 26, -1, -1, -1, 30, -1, -1, 33, -1, -1, 36, 37, 38, 39, 40, -1, -1, -1, 44, 45, -1, -1, -1, 49, 50, -1, -1, 53, 54, -1, -1, 57, -1, -1, 60, 61, 62, -1, -1, 65, 66, -1, -1, -1, -1, 71, 72, 73, 74, 75, -1, 77, -1, -1, 80, 81, -1, -1, -1, 85, 86, 87, -1, -1, 90, -1, -1, 93, 94, -1, -1, 97, -1, -1, 100, 101, 102, -1, 104, -1, -1, 107, 108, -1, -1, 111, -1, -1, 114, 115, -1, -1, 118, -1, 120, -1, -1, 123, -1, 125, -1, 127, 128, 129, -1, -1, 132, -1, -1, 135, 136, -1, -1, 139, -1, -1, 1, 2, -1, 4, -1, -1, 7, 8, 9, 10, 11, 12, 13, -1, -1, -1, 17, -1, 19, -1, -1, 22, 23, 24, -1, -1, 27, -1, -1, 30, 31, -1, -1, 34, -1, -1, -1, 38, 39, 40, 41, -1, -1, 44, -1, 46, -1, -1, 49, 50, 51, -1, -1, 54, -1, -1, 57, -1, 59, -1, -1, 62, 63, -1, 65, 66, -1, -1, 69, -1, -1, 72, 73, -1, 75, -1, -1, -1, 79, 80, 81, -1, 83, 84, -1, 86, -1, -1, 89, -1, 91, -1, -1, 94, -1, 96, 97, 98, -1, -1, 101, -1, -1, 104, 105, -1, -1, 108, -1, -1, 111, 112, -1, 114, 115, -1, 117, -1, -1, 120, -1, 122, -1, -1, 125, 126, 127, -1, -1, 130, 131, -1, -1, -1, 135, 136, -1, 138, -1, -1, 141, 142, -1, -1, -1, 1, 2, 3, -1, 5, 6, 7, 8, -1, 10, -1, -1, -1, -1, -1, -1, 17, 18, 19, 20, 21, 22, 23, -1, -1, 26, -1, -1, 29, -1, -1, -1, 33, -1, 35, -1, -1, 38, 39, -1, -1, -1, 43, 44, -1, 46, 47, 48, 49, -1, -1, 52, -1, -1, 55, 56, -1, -1, -1, 60, -1, -1, 63, 64, 65, -1, 67, 68, -1, -1, -1, 72, 73, 74, -1, -1, -1, 78, 79, -1, -1, 82, -1, -1, 85, -1, 87, 88, 89, -1, -1, -1, -1, 1, 2, 3, 4, 5, -1, 7, 8, 9, -1, -1, -1, 13, 14, -1, -1, 17, -1, -1, 20, 21, -1, 23, 24, -1, -1, 27, -1, -1, 30, 31, 32, -1, -1, 35, -1, -1, 38, 39, -1, -1, 42, -1, -1, 45, -1, 47, 48, -1, 50, -1, 52, -1, -1, -1, 56, 57, -1, 59, 60, -1, 62, -1, -1, -1, 66, 67, -1, -1, -1, 71, 72, 73, 74, 75, 76, 77, -1, -1, 80, -1, -1, 83, 84, -1, -1, 87, -1, -1, 90, 91, -1, -1, -1, 95, 96, 97, 98, -1, -1, 101, -1, -1, 104, 105, -1, -1, -1, 109, 110, -1, 112, -1, -1, 115, 116, -1, -1, 119, -1, -1, 122, -1, -1, 125, -1, 127, -1, -1};
-static const int32_t children_right[NUM_NODES] = {116, 69, 16, 9, 6, -1, 8, -1, -1, 13, 12, -1, -1, 15, -1, -1, 40, 27, 26, 23, 22, -1, -1, 25, -1, -1, -1, 33, 30, -1, 32, -1, -1, 37, 36, -1, -1, 39, -1, -1, 56, 49, 46, 45, -1, -1, 48, -1, -1, 53, 52, -1, -1, 55, -1, -1, 64, 61, 60, -1, -1, 63, -1, -1, 68, 67, -1, -1, -1, 91, 76, 75, 74, -1, -1, -1, 86, 81, 80, -1, -1, 83, -1, 85, -1, -1, 90, 89, -1, -1, -1, 103, 102, 95, -1, 99, 98, -1, -1, 101, -1, -1, -1, 111, 106, -1, 110, 109, -1, -1, -1, 115, 114, -1, -1, -1, 178, 149, 136, 131, 126, 125, 124, -1, -1, -1, 130, 129, -1, -1, -1, 135, 134, -1, -1, -1, 144, 139, -1, 143, 142, -1, -1, -1, 148, 147, -1, -1, -1, 151, -1, 165, 160, 157, 156, -1, -1, 159, -1, -1, 162, -1, 164, -1, -1, 171, 170, 169, -1, -1, -1, 175, 174, -1, -1, 177, -1, -1, 210, 195, 182, -1, 190, 187, 186, -1, -1, 189, -1, -1, 194, 193, -1, -1, -1, 199, 198, -1, -1, 207, 204, 203, -1, -1, 206, -1, -1, 209, -1, -1, 222, 219, 218, 217, 216, -1, -1, -1, -1, 221, -1, -1, 224, -1, -1, 90, 45, 14, 9, 6, -1, 8, -1, -1, 11, -1, 13, -1, -1, 36, 25, 20, 19, -1, -1, 24, 23, -1, -1, -1, 31, 28, -1, 30, -1, -1, 35, 34, -1, -1, -1, 44, 43, 40, -1, 42, -1, -1, -1, -1, 47, -1, 63, 54, 51, -1, 53, -1, -1, 60, 59, 58, -1, -1, -1, 62, -1, -1, 79, 72, 69, 68, -1, -1, 71, -1, -1, 76, 75, -1, -1, 78, -1, -1, 85, 84, 83, -1, -1, -1, 89, 88, -1, -1, -1, 130, 125, 110, 109, 102, 99, 98, -1, -1, 101, -1, -1, 106, 105, -1, -1, 108, -1, -1, -1, 124, 117, 116, 115, -1, -1, -1, 121, 120, -1, -1, 123, -1, -1, -1, 127, -1, 129, -1, -1, -1, 32, 3, -1, 13, 8, 7, -1, -1, 10, -1, 12, -1, -1, 17, 16, -1, -1, 19, -1, 25, 22, -1, 24, -1, -1, 29, 28, -1, -1, 31, -1, -1, 64, 49, 48, 37, -1, 45, 42, 41, -1, -1, 44, -1, -1, 47, -1, -1, -1, 53, 52, -1, -1, 55, -1, 61, 60, 59, -1, -1, -1, 63, -1, -1, 106, 95, 82, 75, 72, 71, -1, -1, 74, -1, -1, 79, 78, -1, -1, 81, -1, -1, 88, 87, 86, -1, -1, -1, 92, 91, -1, -1, 94, -1, -1, 105, 104, 101, 100, -1, -1, 103, -1, -1, -1, -1, 122, 119, 114, 113, 112, -1, -1, -1, 118, 117, -1, -1, -1, 121, -1, -1, 124, -1, -1, 36, 9, 4, -1, 6, -1, 8, -1, -1, 35, 12, -1, 26, 21, 18, 17, -1, -1, 20, -1, -1, 23, -1, 25, -1, -1, 34, 31, 30, -1, -1, 33, -1, -1, -1, -1, 120, 83, 58, 55, 48, 45, 44, -1, -1, 47, -1, -1, 52, 51, -1, -1, 54, -1, -1, 57, -1, -1, 74, 67, 64, 63, -1, -1, 66, -1, -1, 71, 70, -1, -1, 73, -1, -1, 76, -1, 80, 79, -1, -1, 82, -1, -1, 95, 94, 87, -1, 91, 90, -1, -1, 93, -1, -1, -1, 107, 102, 101, 100, -1, -1, -1, 104, -1, 106, -1, -1, 115, 112, 111, -1, -1, 114, -1, -1, 117, -1, 119, -1, -1, -1, 46, 39, 6, 5, -1, -1, 22, 21, 14, 11, -1, 13, -1, -1, 18, 17, -1, -1, 20, -1, -1, -1, 36, 29, 28, 27, -1, -1, -1, 33, 32, -1, -1, 35, -1, -1, 38, -1, -1, 45, 42, -1, 44, -1, -1, -1, 118, 99, 76, 61, 56, 55, 54, -1, -1, -1, 60, 59, -1, -1, -1, 69, 66, 65, -1, -1, 68, -1, -1, 73, 72, -1, -1, 75, -1, -1, 90, 85, 82, 81, -1, -1, 84, -1, -1, 87, -1, 89, -1, -1, 96, 93, -1, 95, -1, -1, 98, -1, -1, 113, 110, 109, 106, 105, -1, -1, 108, -1, -1, -1, 112, -1, -1, 117, 116, -1, -1, -1, 144, 133, 126, 123, -1, 125, -1, -1, 132, 129, -1, 131, -1, -1, -1, 137, 136, -1, -1, 143, 142, 141, -1, -1, -1, -1, 156, 155, 150, 149, -1, -1, 152, -1, 154, -1, -1, -1, 160, 159, -1, -1, -1, 62, 13, 10, 9, 6, -1, 8, -1, -1, -1, 12, -1, -1, 61, 38, 31, 24, 21, 20, -1, -1, 23, -1, -1, 28, 27, -1, -1, 30, -1, -1, 37, 36, 35, -1, -1, -1, -1, 48, 45, 44, 43, -1, -1, -1, 47, -1, -1, 54, 53, 52, -1, -1, -1, 58, 57, -1, -1, 60, -1, -1, -1, 76, 71, 70, 69, 68, -1, -1, -1, -1, 73, -1, 75, -1, -1, 86, 85, 82, 81, -1, -1, 84, -1, -1, -1, -1, 10, 9, 4, -1, 6, -1, 8, -1, -1, -1, 64, 17, 14, -1, 16, -1, -1, 47, 32, 25, 22, -1, 24, -1, -1, 29, 28, -1, -1, 31, -1, -1, 40, 37, 36, -1, -1, 39, -1, -1, 44, 43, -1, -1, 46, -1, -1, 49, -1, 57, 54, 53, -1, -1, 56, -1, -1, 61, 60, -1, -1, 63, -1, -1, 68, 67, -1, -1, 70, -1, -1, 42, 23, 4, -1, 8, 7, -1, -1, 12, 11, -1, -1, 20, 17, 16, -1, -1, 19, -1, -1, 22, -1, -1, 25, -1, 41, 36, 29, -1, 33, 32, -1, -1, 35, -1, -1, 40, 39, -1, -1, -1, -1, 64, 57, 56, 47, -1, 49, -1, 53, 52, -1, -1, 55, -1, -1, -1, 59, -1, 63, 62, -1, -1, -1, 106, 87, 76, 69, -1, 73, 72, -1, -1, 75, -1, -1, 82, 81, 80, -1, -1, -1, 86, 85, -1, -1, -1, 93, 90, -1, 92, -1, -1, 99, 98, 97, -1, -1, -1, 103, 102, -1, -1, 105, -1, -1, 116, 115, 114, 113, 112, -1, -1, -1, -1, -1, 126, 119, -1, 123, 122, -1, -1, 125, -1, -1, 128, -1, 132, 131, -1, -1, 134, -1, -1, 8, 5, 4, -1, -1, 7, -1, -1, 92, 57, 34, 19, 14, -1, 16, -1, 18, -1, -1, 27, 24, 23, -1, -1, 26, -1, -1, 31, 30, -1, -1, 33, -1, -1, 44, 37, -1, 41, 40, -1, -1, 43, -1, -1, 50, 47, -1, 49, -1, -1, 54, 53, -1, -1, 56, -1, -1, 77, 70, 63, 62, -1, -1, 67, 66, -1, -1, 69, -1, -1, 76, 73, -1, 75, -1, -1, -1, 79, -1, 87, 84, 83, -1, -1, 86, -1, -1, 91, 90, -1, -1, -1, 106, 95, -1, 101, 100, 99, -1, -1, -1, 105, 104, -1, -1, -1, 132, 123, 116, 113, 112, -1, -1, 115, -1, -1, 120, 119, -1, -1, 122, -1, -1, 127, 126, -1, -1, 131, 130, -1, -1, -1, 138, 137, 136, -1, -1, -1, 142, 141, -1, -1, -1, 110, 95, 42, 25, 16, 13, 10, 9, -1, -1, 12, -1, -1, 15, -1, -1, 24, 21, 20, -1, -1, 23, -1, -1, -1, 31, 30, 29, -1, -1, -1, 37, 34, -1, 36, -1, -1, 41, 40, -1, -1, -1, 72, 57, 50, 47, -1, 49, -1, -1, 54, 53, -1, -1, 56, -1, -1, 65, 62, 61, -1, -1, 64, -1, -1, 69, 68, -1, -1, 71, -1, -1, 80, 75, -1, 77, -1, 79, -1, -1, 88, 85, 84, -1, -1, 87, -1, -1, 92, 91, -1, -1, 94, -1, -1, 105, 100, 99, -1, -1, 102, -1, 104, -1, -1, 109, 108, -1, -1, -1, 112, -1, 138, 127, 126, 119, 118, -1, -1, 123, 122, -1, -1, 125, -1, -1, -1, 137, 134, 133, 132, -1, -1, -1, 136, -1, -1, -1, 140, -1, 150, 145, 144, -1, -1, 147, -1, 149, -1, -1, -1, 2, -1, 62, 47, 22, 21, 14, 11, 10, -1, -1, 13, -1, -1, 18, 17, -1, -1, 20, -1, -1, -1, 34, 29, 26, -1, 28, -1, -1, 31, -1, 33, -1, -1, 42, 39, 38, -1, -1, 41, -1, -1, 44, -1, 46, -1, -1, 55, 52, 51, -1, -1, 54, -1, -1, 59, 58, -1, -1, 61, -1, -1, 86, 81, 78, 73, 70, 69, -1, -1, 72, -1, -1, 75, -1, 77, -1, -1, 80, -1, -1, 85, 84, -1, -1, -1, 88, -1, -1, 80, 41, 10, 9, 8, 7, -1, -1, -1, -1, 18, 17, 14, -1, 16, -1, -1, -1, 34, 27, 24, 23, -1, -1, 26, -1, -1, 31, 30, -1, -1, 33, -1, -1, 40, 39, 38, -1, -1, -1, -1, 53, 52, 45, -1, 49, 48, -1, -1, 51, -1, -1, -1, 59, 58, 57, -1, -1, -1, 73, 68, 65, 64, -1, -1, 67, -1, -1, 72, 71, -1, -1, -1, 75, -1, 77, -1, 79, -1, -1, 96, 85, 84, -1, -1, 95, 88, -1, 92, 91, -1, -1, 94, -1, -1, -1, 124, 111, 100, -1, 106, 105, 104, -1, -1, -1, 108, -1, 110, -1, -1, 123, 120, 117, 116, -1, -1, 119, -1, -1, 122, -1, -1, -1, 128, 127, -1, -1, -1, 84, 61, 38, 19, 6, -1, 14, 11, 10, -1, -1, 13, -1, -1, 16, -1, 18, -1, -1, 35, 28, 25, 24, -1, -1, 27, -1, -1, 32, 31, -1, -1, 34, -1, -1, 37, -1, -1, 42, 41, -1, -1, 50, 49, 46, -1, 48, -1, -1, -1, 56, 55, 54, -1, -1, -1, 60, 59, -1, -1, -1, 63, -1, 79, 74, 73, 70, 69, -1, -1, 72, -1, -1, -1, 76, -1, 78, -1, -1, 81, -1, 83, -1, -1, 148, 115, 102, 101, 94, 93, 92, -1, -1, -1, 98, 97, -1, -1, 100, -1, -1, -1, 104, -1, 110, 107, -1, 109, -1, -1, 112, -1, 114, -1, -1, 135, 126, 119, -1, 123, 122, -1, -1, 125, -1, -1, 134, 131, 130, -1, -1, 133, -1, -1, -1, 147, 144, 141, 140, -1, -1, 143, -1, -1, 146, -1, -1, -1, 150, -1, -1, 12, 3, -1, 5, -1, 9, 8, -1, -1, 11, -1, -1, 74, 43, 28, 23, 18, -1, 20, -1, 22, -1, -1, 25, -1, 27, -1, -1, 30, -1, 38, 35, 34, -1, -1, 37, -1, -1, 42, 41, -1, -1, -1, 61, 54, 47, -1, 51, 50, -1, -1, 53, -1, -1, 60, 57, -1, 59, -1, -1, -1, 67, 66, 65, -1, -1, -1, 71, 70, -1, -1, 73, -1, -1, 88, 83, 82, 81, 80, -1, -1, -1, -1, 85, -1, 87, -1, -1, 102, 91, -1, 97, 96, 95, -1, -1, -1, 101, 100, -1, -1, -1, 118, 111, 108, 107, -1, -1, 110, -1, -1, 115, 114, -1, -1, 117, -1, -1, 124, 121, -1, 123, -1, -1, 128, 127, -1, -1, 130, -1, -1, 26, 15, 14, 7, 6, -1, -1, 13, 10, -1, 12, -1, -1, -1, -1, 19, 18, -1, -1, 21, -1, 25, 24, -1, -1, -1, 100, 53, 50, 43, 38, 35, 34, -1, -1, 37, -1, -1, 42, 41, -1, -1, -1, 47, 46, -1, -1, 49, -1, -1, 52, -1, -1, 75, 66, 59, 58, -1, -1, 63, 62, -1, -1, 65, -1, -1, 74, 71, 70, -1, -1, 73, -1, -1, -1, 91, 84, 81, 80, -1, -1, 83, -1, -1, 88, 87, -1, -1, 90, -1, -1, 99, 96, 95, -1, -1, 98, -1, -1, -1, -1, 94, 47, 4, -1, 22, 11, 8, -1, 10, -1, -1, 17, 14, -1, 16, -1, -1, 21, 20, -1, -1, -1, 36, 31, 28, 27, -1, -1, 30, -1, -1, 35, 34, -1, -1, -1, 44, 41, 40, -1, -1, 43, -1, -1, 46, -1, -1, 67, 56, 55, 54, 53, -1, -1, -1, -1, 58, -1, 60, -1, 64, 63, -1, -1, 66, -1, -1, 89, 76, 73, 72, -1, -1, 75, -1, -1, 82, 81, 80, -1, -1, -1, 86, 85, -1, -1, 88, -1, -1, 91, -1, 93, -1, -1, 116, 97, -1, 113, 110, 103, 102, -1, -1, 107, 106, -1, -1, 109, -1, -1, 112, -1, -1, 115, -1, -1, -1, 40, 33, 16, 7, 6, -1, -1, 13, 10, -1, 12, -1, -1, 15, -1, -1, 30, 29, 24, 21, -1, 23, -1, -1, 26, -1, 28, -1, -1, -1, 32, -1, -1, 35, -1, 37, -1, 39, -1, -1, 110, 85, 60, 45, -1, 53, 50, 49, -1, -1, 52, -1, -1, 57, 56, -1, -1, 59, -1, -1, 76, 69, 66, 65, -1, -1, 68, -1, -1, 73, 72, -1, -1, 75, -1, -1, 80, 79, -1, -1, 82, -1, 84, -1, -1, 99, 96, 91, 90, -1, -1, 95, 94, -1, -1, -1, 98, -1, -1, 109, 108, 105, 104, -1, -1, 107, -1, -1, -1, -1, 128, 115, 114, -1, -1, 119, 118, -1, -1, 127, 124, 123, -1, -1, 126, -1, -1, -1, 140, 131, -1, 139, 136, 135, -1, -1, 138, -1, -1, -1, 142, -1, 146, 145, -1, -1, -1, 16, 9, 6, 5, -1, -1, 8, -1, -1, 11, -1, 15, 14, -1, -1, -1, 52, 45, 40, 31, 24, 23, -1, -1, 28, 27, -1, -1, 30, -1, -1, 33, -1, 37, 36, -1, -1, 39, -1, -1, 42, -1, 44, -1, -1, 51, 50, 49, -1, -1, -1, -1, 56, 55, -1, -1, 58, -1, -1, 40, 21, 10, 9, 6, -1, 8, -1, -1, -1, 18, 17, 14, -1, 16, -1, -1, -1, 20, -1, -1, 25, 24, -1, -1, 29, 28, -1, -1, 31, -1, 37, 36, 35, -1, -1, -1, 39, -1, -1, 46, 45, 44, -1, -1, -1, 52, 51, 50, -1, -1, -1, 62, 55, -1, 59, 58, -1, -1, 61, -1, -1, 76, 71, 68, 67, -1, -1, 70, -1, -1, 73, -1, 75, -1, -1, 82, 81, 80, -1, -1, -1, 86, 85, -1, -1, 88, -1, -1, 144, 75, 28, 27, 18, 11, 8, -1, 10, -1, -1, 15, 14, -1, -1, 17, -1, -1, 20, -1, 24, 23, -1, -1, 26, -1, -1, -1, 50, 45, 38, 35, 34, -1, -1, 37, -1, -1, 42, 41, -1, -1, 44, -1, -1, 49, 48, -1, -1, -1, 60, 53, -1, 57, 56, -1, -1, 59, -1, -1, 68, 65, 64, -1, -1, 67, -1, -1, 72, 71, -1, -1, 74, -1, -1, 111, 86, 79, -1, 81, -1, 85, 84, -1, -1, -1, 96, 89, -1, 93, 92, -1, -1, 95, -1, -1, 104, 101, 100, -1, -1, 103, -1, -1, 108, 107, -1, -1, 110, -1, -1, 129, 122, 117, 116, -1, -1, 121, 120, -1, -1, -1, 128, 125, -1, 127, -1, -1, -1, 135, 132, -1, 134, -1, -1, 143, 140, 139, -1, -1, 142, -1, -1, -1, 146, -1, 148, -1, 150, -1, -1, 122, 43, 28, 7, 6, -1, -1, 21, 16, 13, 12, -1, -1, 15, -1, -1, 20, 19, -1, -1, -1, 27, 26, 25, -1, -1, -1, -1, 40, 37, 34, 33, -1, -1, 36, -1, -1, 39, -1, -1, 42, -1, -1, 81, 58, 55, 54, 51, 50, -1, -1, 53, -1, -1, -1, 57, -1, -1, 74, 67, 64, 63, -1, -1, 66, -1, -1, 71, 70, -1, -1, 73, -1, -1, 76, -1, 80, 79, -1, -1, -1, 109, 96, 89, 88, 87, -1, -1, -1, 93, 92, -1, -1, 95, -1, -1, 102, 101, 100, -1, -1, -1, 106, 105, -1, -1, 108, -1, -1, 111, -1, 117, 114, -1, 116, -1, -1, 119, -1, 121, -1, -1, 158, 137, 134, 133, 128, -1, 130, -1, 132, -1, -1, -1, 136, -1, -1, 145, 140, -1, 142, -1, 144, -1, -1, 155, 148, -1, 152, 151, -1, -1, 154, -1, -1, 157, -1, -1, 162, 161, -1, -1, -1, 80, 47, 16, 9, 6, -1, 8, -1, -1, 15, 14, 13, -1, -1, -1, -1, 24, 23, 20, -1, 22, -1, -1, -1, 36, 33, 30, 29, -1, -1, 32, -1, -1, 35, -1, -1, 44, 41, 40, -1, -1, 43, -1, -1, 46, -1, -1, 49, -1, 63, 62, 59, 56, 55, -1, -1, 58, -1, -1, 61, -1, -1, -1, 71, 70, 69, 68, -1, -1, -1, -1, 73, -1, 77, 76, -1, -1, 79, -1, -1, 138, 103, 84, -1, 92, 87, -1, 89, -1, 91, -1, -1, 98, 97, 96, -1, -1, -1, 102, 101, -1, -1, -1, 131, 118, 111, 108, -1, 110, -1, -1, 115, 114, -1, -1, 117, -1, -1, 124, 121, -1, 123, -1, -1, 128, 127, -1, -1, 130, -1, -1, 133, -1, 135, -1, 137, -1, -1, 166, 155, 148, 147, 146, 145, -1, -1, -1, -1, 152, 151, -1, -1, 154, -1, -1, 163, 158, -1, 160, -1, 162, -1, -1, 165, -1, -1, 172, 169, -1, 171, -1, -1, -1, 22, 21, 4, -1, 6, -1, 12, 9, -1, 11, -1, -1, 18, 17, 16, -1, -1, -1, 20, -1, -1, -1, 60, 37, 26, -1, 32, 29, -1, 31, -1, -1, 36, 35, -1, -1, -1, 59, 54, 47, 44, 43, -1, -1, 46, -1, -1, 51, 50, -1, -1, 53, -1, -1, 56, -1, 58, -1, -1, -1, 64, 63, -1, -1, 66, -1, 68, -1, -1, 38, 27, 24, 11, 10, 9, 8, -1, -1, -1, -1, 15, 14, -1, -1, 21, 20, 19, -1, -1, -1, 23, -1, -1, 26, -1, -1, 33, 30, -1, 32, -1, -1, 37, 36, -1, -1, -1, 48, 41, -1, 45, 44, -1, -1, 47, -1, -1, 70, 55, 54, 53, -1, -1, -1, 63, 58, -1, 60, -1, 62, -1, -1, 69, 68, 67, -1, -1, -1, -1, 96, 87, 80, 77, 76, -1, -1, 79, -1, -1, 84, 83, -1, -1, 86, -1, -1, 93, 92, 91, -1, -1, -1, 95, -1, -1, 98, -1, 106, 103, 102, -1, -1, 105, -1, -1, 110, 109, -1, -1, 112, -1, -1, 16, 9, 6, 5, -1, -1, 8, -1, -1, 11, -1, 13, -1, 15, -1, -1, 22, 21, 20, -1, -1, -1, 44, 41, 32, 27, -1, 29, -1, 31, -1, -1, 38, 37, 36, -1, -1, -1, 40, -1, -1, 43, -1, -1, 72, 59, 54, 51, 50, -1, -1, 53, -1, -1, 58, 57, -1, -1, -1, 65, 64, 63, -1, -1, -1, 69, 68, -1, -1, 71, -1, -1, 80, 77, 76, -1, -1, 79, -1, -1, 88, 85, 84, -1, -1, 87, -1, -1, 90, -1, 92, -1, -1, 116, 67, 22, 13, 6, -1, 8, -1, 10, -1, 12, -1, -1, 15, -1, 17, -1, 21, 20, -1, -1, -1, 46, 35, 32, 29, 28, -1, -1, 31, -1, -1, 34, -1, -1, 43, 40, 39, -1, -1, 42, -1, -1, 45, -1, -1, 62, 55, 52, 51, -1, -1, 54, -1, -1, 59, 58, -1, -1, 61, -1, -1, 64, -1, 66, -1, -1, 111, 98, 85, 78, 75, 74, -1, -1, 77, -1, -1, 82, 81, -1, -1, 84, -1, -1, 93, 90, 89, -1, -1, 92, -1, -1, 97, 96, -1, -1, -1, 102, 101, -1, -1, 108, 105, -1, 107, -1, -1, 110, -1, -1, 115, 114, -1, -1, -1, 128, 125, 120, -1, 124, 123, -1, -1, -1, 127, -1, -1, 130, -1, -1, 90, 29, 28, 25, 12, 7, -1, 9, -1, 11, -1, -1, 20, 17, 16, -1, -1, 19, -1, -1, 22, -1, 24, -1, -1, 27, -1, -1, -1, 73, 54, 41, 34, -1, 38, 37, -1, -1, 40, -1, -1, 49, 46, 45, -1, -1, 48, -1, -1, 53, 52, -1, -1, -1, 70, 63, 60, 59, -1, -1, 62, -1, -1, 67, 66, -1, -1, 69, -1, -1, 72, -1, -1, 81, 80, 77, -1, 79, -1, -1, -1, 89, 88, 87, 86, -1, -1, -1, -1, -1, 92, -1, 98, 97, 96, -1, -1, -1, -1, 64, 21, 6, 5, -1, -1, 20, 9, -1, 15, 12, -1, 14, -1, -1, 17, -1, 19, -1, -1, -1, 35, 24, -1, 34, 31, 30, 29, -1, -1, -1, 33, -1, -1, -1, 49, 48, 43, 42, 41, -1, -1, -1, 47, 46, -1, -1, -1, -1, 57, 56, 53, -1, 55, -1, -1, -1, 59, -1, 61, -1, 63, -1, -1, 96, 69, 68, -1, -1, 73, 72, -1, -1, 83, 82, 79, 78, -1, -1, 81, -1, -1, -1, 89, 88, 87, -1, -1, -1, 93, 92, -1, -1, 95, -1, -1, 138, 127, 114, 107, 104, 103, -1, -1, 106, -1, -1, 111, 110, -1, -1, 113, -1, -1, 122, 119, 118, -1, -1, 121, -1, -1, 126, 125, -1, -1, -1, 137, 134, 131, -1, 133, -1, -1, 136, -1, -1, -1, 152, 141, -1, 145, 144, -1, -1, 149, 148, -1, -1, 151, -1, -1, 168, 161, 158, 157, -1, -1, 160, -1, -1, 165, 164, -1, -1, 167, -1, -1, 176, 173, 172, -1, -1, 175, -1, -1, -1, 84, 65, 16, 15, 12, 7, -1, 9, -1, 11, -1, -1, 14, -1, -1, -1, 36, 25, 20, -1, 24, 23, -1, -1, -1, 33, 30, 29, -1, -1, 32, -1, -1, 35, -1, -1, 50, 43, 40, -1, 42, -1, -1, 47, 46, -1, -1, 49, -1, -1, 58, 55, 54, -1, -1, 57, -1, -1, 62, 61, -1, -1, 64, -1, -1, 67, -1, 77, 70, -1, 72, -1, 76, 75, -1, -1, -1, 83, 82, 81, -1, -1, -1, -1, 116, 93, 90, 89, -1, -1, 92, -1, -1, 101, 100, 99, 98, -1, -1, -1, -1, 115, 110, 107, 106, -1, -1, 109, -1, -1, 114, 113, -1, -1, -1, -1, 122, 121, 120, -1, -1, -1, 124, -1, -1, 58, 55, 34, 23, 14, 13, 10, 9, -1, -1, 12, -1, -1, -1, 20, 17, -1, 19, -1, -1, 22, -1, -1, 33, 32, 29, 28, -1, -1, 31, -1, -1, -1, -1, 54, 39, 38, -1, -1, 47, 44, 43, -1, -1, 46, -1, -1, 51, 50, -1, -1, 53, -1, -1, -1, 57, -1, -1, -1, 84, 3, -1, 51, 26, 13, 8, -1, 10, -1, 12, -1, -1, 19, 18, 17, -1, -1, -1, 23, 22, -1, -1, 25, -1, -1, 40, 35, 32, 31, -1, -1, 34, -1, -1, 39, 38, -1, -1, -1, 44, 43, -1, -1, 48, 47, -1, -1, 50, -1, -1, 59, 56, 55, -1, -1, 58, -1, -1, 75, 68, 65, 64, -1, -1, 67, -1, -1, 72, 71, -1, -1, 74, -1, -1, 83, 80, 79, -1, -1, 82, -1, -1, -1, 94, 93, 92, 91, 90, -1, -1, -1, -1, -1, 106, 105, 104, 103, 102, 101, -1, -1, -1, -1, -1, -1, 108, -1, 110, -1, 112, -1, 114, -1, -1, 4, 3, -1, -1, 54, 41, 20, 11, 10, -1, -1, 15, 14, -1, -1, 17, -1, 19, -1, -1, 28, 27, 26, 25, -1, -1, -1, -1, 34, 33, 32, -1, -1, -1, 38, 37, -1, -1, 40, -1, -1, 53, 48, 45, -1, 47, -1, -1, 52, 51, -1, -1, -1, -1, 70, 63, 60, 59, -1, -1, 62, -1, -1, 65, -1, 69, 68, -1, -1, -1, 80, 75, 74, -1, -1, 79, 78, -1, -1, -1, -1, 130, 93, 48, 23, 10, 9, 8, -1, -1, -1, 18, 15, 14, -1, -1, 17, -1, -1, 22, 21, -1, -1, -1, 37, 30, 27, -1, 29, -1, -1, 34, 33, -1, -1, 36, -1, -1, 41, 40, -1, -1, 45, 44, -1, -1, 47, -1, -1, 76, 63, 56, 53, -1, 55, -1, -1, 60, 59, -1, -1, 62, -1, -1, 69, 68, 67, -1, -1, -1, 73, 72, -1, -1, 75, -1, -1, 86, 81, 80, -1, -1, 85, 84, -1, -1, -1, 92, 91, 90, -1, -1, -1, -1, 119, 118, 109, 104, 101, 100, -1, -1, 103, -1, -1, 106, -1, 108, -1, -1, 117, 114, 113, -1, -1, 116, -1, -1, -1, -1, 121, -1, 125, 124, -1, -1, 127, -1, 129, -1, -1, 134, 133, -1, -1, 142, 139, 138, -1, -1, 141, -1, -1, -1, 80, 47, 20, 17, 14, 7, -1, 11, 10, -1, -1, 13, -1, -1, 16, -1, -1, 19, -1, -1, 24, 23, -1, -1, 32, 27, -1, 31, 30, -1, -1, -1, 40, 37, 36, -1, -1, 39, -1, -1, 44, 43, -1, -1, 46, -1, -1, 49, -1, 67, 58, 57, 56, 55, -1, -1, -1, -1, 66, 63, 62, -1, -1, 65, -1, -1, -1, 79, 72, 71, -1, -1, 76, 75, -1, -1, 78, -1, -1, -1, 126, 123, 100, 89, 86, -1, 88, -1, -1, 95, 94, 93, -1, -1, -1, 99, 98, -1, -1, -1, 112, 107, 104, -1, 106, -1, -1, 111, 110, -1, -1, -1, 120, 117, 116, -1, -1, 119, -1, -1, 122, -1, -1, 125, -1, -1, 152, 145, 144, 137, 134, 133, -1, -1, 136, -1, -1, 141, 140, -1, -1, 143, -1, -1, -1, 147, -1, 151, 150, -1, -1, -1, -1, 78, 35, 30, 25, 12, 7, -1, 11, 10, -1, -1, -1, 20, 17, 16, -1, -1, 19, -1, -1, 22, -1, 24, -1, -1, 29, 28, -1, -1, -1, 32, -1, 34, -1, -1, 53, 48, 43, 40, -1, 42, -1, -1, 47, 46, -1, -1, -1, 52, 51, -1, -1, -1, 75, 64, 61, 58, -1, 60, -1, -1, 63, -1, -1, 72, 69, 68, -1, -1, 71, -1, -1, 74, -1, -1, 77, -1, -1, 138, 85, 82, -1, 84, -1, -1, 115, 102, 95, 92, 91, -1, -1, 94, -1, -1, 99, 98, -1, -1, 101, -1, -1, 110, 107, 106, -1, -1, 109, -1, -1, 114, 113, -1, -1, -1, 131, 124, 121, 120, -1, -1, 123, -1, -1, 128, 127, -1, -1, 130, -1, -1, 133, -1, 135, -1, 137, -1, -1, 146, 145, 144, 143, -1, -1, -1, -1, 152, 151, 150, -1, -1, -1, 164, 157, 156, -1, -1, 161, 160, -1, -1, 163, -1, -1, 166, -1, -1, 96, 77, 50, 23, 20, 13, 10, 9, -1, -1, 12, -1, -1, 17, 16, -1, -1, 19, -1, -1, 22, -1, -1, 37, 30, 27, -1, 29, -1, -1, 34, 33, -1, -1, 36, -1, -1, 43, 40, -1, 42, -1, -1, 47, 46, -1, -1, 49, -1, -1, 58, 57, 54, -1, 56, -1, -1, -1, 68, 63, 62, -1, -1, 67, 66, -1, -1, -1, 74, 73, 72, -1, -1, -1, 76, -1, -1, 83, 80, -1, 82, -1, -1, 93, 90, 89, 88, -1, -1, -1, 92, -1, -1, 95, -1, -1, 126, 121, 102, 101, -1, -1, 108, 105, -1, 107, -1, -1, 116, 113, 112, -1, -1, 115, -1, -1, 118, -1, 120, -1, -1, 125, 124, -1, -1, -1, 164, 143, 142, 137, 134, 133, -1, -1, 136, -1, -1, 141, 140, -1, -1, -1, -1, 151, 150, 149, 148, -1, -1, -1, -1, 157, 154, -1, 156, -1, -1, 161, 160, -1, -1, 163, -1, -1, -1, 18, 17, 4, -1, 16, 13, 8, -1, 12, 11, -1, -1, -1, 15, -1, -1, -1, -1, 88, 69, 44, 35, 30, 27, 26, -1, -1, 29, -1, -1, 32, -1, 34, -1, -1, 41, 40, 39, -1, -1, -1, 43, -1, -1, 60, 53, 50, 49, -1, -1, 52, -1, -1, 57, 56, -1, -1, 59, -1, -1, 62, -1, 66, 65, -1, -1, 68, -1, -1, 75, 74, 73, -1, -1, -1, 85, 78, -1, 82, 81, -1, -1, 84, -1, -1, 87, -1, -1, 114, 97, 94, 93, -1, -1, 96, -1, -1, 105, 104, 101, -1, 103, -1, -1, -1, 113, 110, 109, -1, -1, 112, -1, -1, -1, 116, -1, 118, -1, 122, 121, -1, -1, -1, 84, 15, 14, 13, 10, 9, 8, -1, -1, -1, 12, -1, -1, -1, -1, 49, 44, 31, 26, 23, 22, -1, -1, 25, -1, -1, 28, -1, 30, -1, -1, 37, 34, -1, 36, -1, -1, 41, 40, -1, -1, 43, -1, -1, 48, 47, -1, -1, -1, 69, 60, 53, -1, 57, 56, -1, -1, 59, -1, -1, 62, -1, 66, 65, -1, -1, 68, -1, -1, 81, 76, 75, 74, -1, -1, -1, 80, 79, -1, -1, -1, 83, -1, -1, 86, -1, 100, 89, -1, 99, 94, 93, -1, -1, 98, 97, -1, -1, -1, -1, 112, 103, -1, 105, -1, 109, 108, -1, -1, 111, -1, -1, 114, -1, 122, 119, 118, -1, -1, 121, -1, -1, 126, 125, -1, -1, 128, -1, -1, 114, 99, 42, 19, 6, -1, 12, 11, 10, -1, -1, -1, 16, 15, -1, -1, 18, -1, -1, 29, 24, 23, -1, -1, 26, -1, 28, -1, -1, 37, 34, 33, -1, -1, 36, -1, -1, 39, -1, 41, -1, -1, 74, 59, 52, 49, 48, -1, -1, 51, -1, -1, 56, 55, -1, -1, 58, -1, -1, 67, 64, 63, -1, -1, 66, -1, -1, 71, 70, -1, -1, 73, -1, -1, 88, 83, 80, 79, -1, -1, 82, -1, -1, 87, 86, -1, -1, -1, 96, 93, 92, -1, -1, 95, -1, -1, 98, -1, -1, 107, 106, 105, 104, -1, -1, -1, -1, 111, 110, -1, -1, 113, -1, -1, 120, 119, 118, -1, -1, -1, 140, 133, 128, 125, -1, 127, -1, -1, 130, -1, 132, -1, -1, 137, 136, -1, -1, 139, -1, -1, 146, 145, 144, -1, -1, -1, 148, -1, -1, 78, 35, 34, 19, 6, -1, 12, 9, -1, 11, -1, -1, 16, 15, -1, -1, 18, -1, -1, 31, 26, 25, 24, -1, -1, -1, 28, -1, 30, -1, -1, 33, -1, -1, -1, 69, 52, 43, 40, -1, 42, -1, -1, 45, -1, 49, 48, -1, -1, 51, -1, -1, 60, 55, -1, 57, -1, 59, -1, -1, 62, -1, 66, 65, -1, -1, 68, -1, -1, 75, 72, -1, 74, -1, -1, 77, -1, -1, 126, 119, 92, 83, -1, 85, -1, 89, 88, -1, -1, 91, -1, -1, 106, 99, 96, -1, 98, -1, -1, 103, 102, -1, -1, 105, -1, -1, 112, 111, 110, -1, -1, -1, 116, 115, -1, -1, 118, -1, -1, 125, 122, -1, 124, -1, -1, -1, 138, 137, 136, 131, -1, 135, 134, -1, -1, -1, -1, -1, 140, -1, -1, 2, -1, 74, 39, 28, 21, 14, 11, 10, -1, -1, 13, -1, -1, 18, 17, -1, -1, 20, -1, -1, 25, 24, -1, -1, 27, -1, -1, 30, -1, 32, -1, 36, 35, -1, -1, 38, -1, -1, 57, 50, 47, 44, -1, 46, -1, -1, 49, -1, -1, 56, 53, -1, 55, -1, -1, -1, 65, 60, -1, 64, 63, -1, -1, -1, 67, -1, 71, 70, -1, -1, 73, -1, -1, 102, 79, 78, -1, -1, 87, 86, 83, -1, 85, -1, -1, -1, 95, 92, 91, -1, -1, 94, -1, -1, 99, 98, -1, -1, 101, -1, -1, -1, 64, 61, 52, 29, 20, 13, 10, 9, -1, -1, 12, -1, -1, 17, 16, -1, -1, 19, -1, -1, 24, 23, -1, -1, 26, -1, 28, -1, -1, 39, 36, 33, -1, 35, -1, -1, 38, -1, -1, 47, 44, 43, -1, -1, 46, -1, -1, 49, -1, 51, -1, -1, 56, 55, -1, -1, 60, 59, -1, -1, -1, 63, -1, -1, 82, 81, 78, 69, -1, 75, 74, 73, -1, -1, -1, 77, -1, -1, 80, -1, -1, -1, 98, 95, 88, 87, -1, -1, 94, 91, -1, 93, -1, -1, -1, 97, -1, -1, 120, 115, 108, 105, 104, -1, -1, 107, -1, -1, 112, 111, -1, -1, 114, -1, -1, 119, 118, -1, -1, -1, 132, 127, 126, 125, -1, -1, -1, 131, 130, -1, -1, -1, 140, 137, 136, -1, -1, 139, -1, -1, 142, -1, -1, 98, 97, 54, 27, 20, 13, 10, 9, -1, -1, 12, -1, -1, 17, 16, -1, -1, 19, -1, -1, 26, 25, 24, -1, -1, -1, -1, 41, 34, 31, -1, 33, -1, -1, 38, 37, -1, -1, 40, -1, -1, 47, 44, -1, 46, -1, -1, 51, 50, -1, -1, 53, -1, -1, 74, 65, 58, -1, 62, 61, -1, -1, 64, -1, -1, 71, 68, -1, 70, -1, -1, 73, -1, -1, 88, 83, 80, 79, -1, -1, 82, -1, -1, 87, 86, -1, -1, -1, 90, -1, 94, 93, -1, -1, 96, -1, -1, -1, 152, 129, 108, 103, -1, 105, -1, 107, -1, -1, 120, 115, 114, 113, -1, -1, -1, 119, 118, -1, -1, -1, 126, 125, 124, -1, -1, -1, 128, -1, -1, 151, 142, 137, 136, 135, -1, -1, -1, 141, 140, -1, -1, -1, 148, 147, 146, -1, -1, -1, 150, -1, -1, -1, 180, 175, 162, 157, -1, 161, 160, -1, -1, -1, 168, 167, 166, -1, -1, -1, 172, 171, -1, -1, 174, -1, -1, 179, 178, -1, -1, -1, 196, 195, 188, 187, 186, -1, -1, -1, 192, 191, -1, -1, 194, -1, -1, -1, 198, -1, 200, -1, -1, 114, 51, 4, -1, 32, 19, 12, 11, 10, -1, -1, -1, 16, 15, -1, -1, 18, -1, -1, 27, 24, 23, -1, -1, 26, -1, -1, 31, 30, -1, -1, -1, 40, 35, -1, 39, 38, -1, -1, -1, 46, 43, -1, 45, -1, -1, 50, 49, -1, -1, -1, 81, 66, 57, 56, -1, -1, 63, 60, -1, 62, -1, -1, 65, -1, -1, 70, 69, -1, -1, 78, 75, 74, -1, -1, 77, -1, -1, 80, -1, -1, 109, 96, 91, 88, 87, -1, -1, 90, -1, -1, 93, -1, 95, -1, -1, 104, 101, 100, -1, -1, 103, -1, -1, 106, -1, 108, -1, -1, 111, -1, 113, -1, -1, -1, 128, 69, 42, 23, 8, 7, -1, -1, 16, 13, 12, -1, -1, 15, -1, -1, 20, 19, -1, -1, 22, -1, -1, 33, 26, -1, 30, 29, -1, -1, 32, -1, -1, 39, 36, -1, 38, -1, -1, 41, -1, -1, 66, 51, 46, -1, 48, -1, 50, -1, -1, 59, 56, 55, -1, -1, 58, -1, -1, 63, 62, -1, -1, 65, -1, -1, 68, -1, -1, 115, 90, 85, 80, 77, 76, -1, -1, 79, -1, -1, 82, -1, 84, -1, -1, 87, -1, 89, -1, -1, 104, 97, 96, 95, -1, -1, -1, 101, 100, -1, -1, 103, -1, -1, 108, 107, -1, -1, 112, 111, -1, -1, 114, -1, -1, 125, 120, 119, -1, -1, 122, -1, 124, -1, -1, 127, -1, -1, -1, 120, 51, 20, 17, 6, -1, 12, 9, -1, 11, -1, -1, 14, -1, 16, -1, -1, 19, -1, -1, 26, 25, 24, -1, -1, -1, 36, 29, -1, 33, 32, -1, -1, 35, -1, -1, 44, 41, 40, -1, -1, 43, -1, -1, 48, 47, -1, -1, 50, -1, -1, 85, 74, 61, 56, -1, 58, -1, 60, -1, -1, 67, 64, -1, 66, -1, -1, 71, 70, -1, -1, 73, -1, -1, 80, 77, -1, 79, -1, -1, 84, 83, -1, -1, -1, 107, 94, 93, 92, 91, -1, -1, -1, -1, 100, 97, -1, 99, -1, -1, 104, 103, -1, -1, 106, -1, -1, 117, 112, 111, -1, -1, 116, 115, -1, -1, -1, 119, -1, -1, 140, 131, 128, 125, -1, 127, -1, -1, 130, -1, -1, 133, -1, 137, 136, -1, -1, 139, -1, -1, 146, 143, -1, 145, -1, -1, 148, -1, -1, 16, 13, 10, 5, -1, 9, 8, -1, -1, -1, 12, -1, -1, 15, -1, -1, 70, 35, 22, 21, -1, -1, 32, 29, 28, 27, -1, -1, -1, 31, -1, -1, 34, -1, -1, 59, 48, 43, 42, 41, -1, -1, -1, 47, 46, -1, -1, -1, 52, 51, -1, -1, 56, 55, -1, -1, 58, -1, -1, 69, 64, 63, -1, -1, 68, 67, -1, -1, -1, -1, 122, 99, 84, 79, 76, -1, 78, -1, -1, 83, 82, -1, -1, -1, 92, 89, 88, -1, -1, 91, -1, -1, 96, 95, -1, -1, 98, -1, -1, 113, 106, 103, -1, 105, -1, -1, 110, 109, -1, -1, 112, -1, -1, 117, 116, -1, -1, 119, -1, 121, -1, -1, 124, -1, 126, -1, 134, 131, 130, -1, -1, 133, -1, -1, 138, 137, -1, -1, 140, -1, -1, 6, 3, -1, 5, -1, -1, 78, 37, 36, 21, 16, 15, 14, -1, -1, -1, 18, -1, 20, -1, -1, 29, 26, 25, -1, -1, 28, -1, -1, 33, 32, -1, -1, 35, -1, -1, -1, 61, 48, 43, 42, -1, -1, 45, -1, 47, -1, -1, 56, 53, 52, -1, -1, 55, -1, -1, 58, -1, 60, -1, -1, 71, 64, -1, 68, 67, -1, -1, 70, -1, -1, 77, 74, -1, 76, -1, -1, -1, 110, 93, 82, -1, 88, 85, -1, 87, -1, -1, 90, -1, 92, -1, -1, 95, -1, 103, 100, 99, -1, -1, 102, -1, -1, 107, 106, -1, -1, 109, -1, -1, 124, 113, -1, 119, 116, -1, 118, -1, -1, 121, -1, 123, -1, -1, 134, 129, 128, -1, -1, 133, 132, -1, -1, -1, 140, 137, -1, 139, -1, -1, 144, 143, -1, -1, -1, 16, 15, 4, -1, 14, 13, 12, 9, -1, 11, -1, -1, -1, -1, -1, -1, 42, 37, 32, 31, 28, 25, 24, -1, -1, 27, -1, -1, 30, -1, -1, -1, 34, -1, 36, -1, -1, 41, 40, -1, -1, -1, 62, 45, -1, 59, 54, 51, 50, -1, -1, 53, -1, -1, 58, 57, -1, -1, -1, 61, -1, -1, 84, 71, 66, -1, 70, 69, -1, -1, -1, 77, 76, 75, -1, -1, -1, 81, 80, -1, -1, 83, -1, -1, 86, -1, 92, 91, 90, -1, -1, -1, -1, 70, 55, 44, 19, 6, -1, 12, 11, 10, -1, -1, -1, 16, 15, -1, -1, 18, -1, -1, 29, 22, -1, 26, 25, -1, -1, 28, -1, -1, 37, 34, 33, -1, -1, 36, -1, -1, 41, 40, -1, -1, 43, -1, -1, 46, -1, 54, 49, -1, 51, -1, 53, -1, -1, -1, 65, 58, -1, 64, 61, -1, 63, -1, -1, -1, 69, 68, -1, -1, -1, 124, 121, 94, 89, 82, 79, 78, -1, -1, 81, -1, -1, 86, 85, -1, -1, 88, -1, -1, 93, 92, -1, -1, -1, 108, 103, 100, 99, -1, -1, 102, -1, -1, 107, 106, -1, -1, -1, 114, 111, -1, 113, -1, -1, 118, 117, -1, -1, 120, -1, -1, 123, -1, -1, 126, -1, 128, -1, -1};
+static const int32_t children_left[NUM_NODES]  = {1, 2, 3, 4, 5, -1, 7, -1, -1, 10, 11, -1, -1, 14, -1, -1, 17, 18, 19, 20, 21, -1, -1, 24, -1, -1, -1, 28, 29, -1, 31, -1, -1, 34, 35, -1, -1, 38, -1, -1, 41, 42, 43, 44, -1, -1, 47, -1, -1, 50, 51, -1, -1, 54, -1, -1, 57, 58, 59, -1, -1, 62, -1, -1, 65, 66, -1, -1, -1, 70, 71, 72, 73, -1, -1, -1, 77, 78, 79, -1, -1, 82, -1, 84, -1, -1, 87, 88, -1, -1, -1, 92, 93, 94, -1, 96, 97, -1, -1, 100, -1, -1, -1, 104, 105, -1, 107, 108, -1, -1, -1, 112, 113, -1, -1, -1, 117, 118, 119, 120, 121, 122, 123, -1, -1, -1, 127, 128, -1, -1, -1, 132, 133, -1, -1, -1, 137, 138, -1, 140, 141, -1, -1, -1, 145, 146, -1, -1, -1, 150, -1, 152, 153, 154, 155, -1, -1, 158, -1, -1, 161, -1, 163, -1, -1, 166, 167, 168, -1, -1, -1, 172, 173, -1, -1, 176, -1, -1, 179, 180, 181, -1, 183, 184, 185, -1, -1, 188, -1, -1, 191, 192, -1, -1, -1, 196, 197, -1, -1, 200, 201, 202, -1, -1, 205, -1, -1, 208, -1, -1, 211, 212, 213, 214, 215, -1, -1, -1, -1, 220, -1, -1, 223, -1, -1, 226, 227, 228, 229, 230, -1, 232, -1, -1, 235, -1, 237, -1, -1, 240, 241, 242, 243, -1, -1, 246, 247, -1, -1, -1, 251, 252, -1, 254, -1, -1, 257, 258, -1, -1, -1, 262, 263, 264, -1, 266, -1, -1, -1, -1, 271, -1, 273, 274, 275, -1, 277, -1, -1, 280, 281, 282, -1, -1, -1, 286, -1, -1, 289, 290, 291, 292, -1, -1, 295, -1, -1, 298, 299, -1, -1, 302, -1, -1, 305, 306, 307, -1, -1, -1, 311, 312, -1, -1, -1, 316, 317, 318, 319, 320, 321, 322, -1, -1, 325, -1, -1, 328, 329, -1, -1, 332, -1, -1, -1, 336, 337, 338, 339, -1, -1, -1, 343, 344, -1, -1, 347, -1, -1, -1, 351, -1, 353, -1, -1, -1, 357, 358, -1, 360, 361, 362, -1, -1, 365, -1, 367, -1, -1, 370, 371, -1, -1, 374, -1, 376, 377, -1, 379, -1, -1, 382, 383, -1, -1, 386, -1, -1, 389, 390, 391, 392, -1, 394, 395, 396, -1, -1, 399, -1, -1, 402, -1, -1, -1, 406, 407, -1, -1, 410, -1, 412, 413, 414, -1, -1, -1, 418, -1, -1, 421, 422, 423, 424, 425, 426, -1, -1, 429, -1, -1, 432, 433, -1, -1, 436, -1, -1, 439, 440, 441, -1, -1, -1, 445, 446, -1, -1, 449, -1, -1, 452, 453, 454, 455, -1, -1, 458, -1, -1, -1, -1, 463, 464, 465, 466, 467, -1, -1, -1, 471, 472, -1, -1, -1, 476, -1, -1, 479, -1, -1, 482, 483, 484, -1, 486, -1, 488, -1, -1, 491, 492, -1, 494, 495, 496, 497, -1, -1, 500, -1, -1, 503, -1, 505, -1, -1, 508, 509, 510, -1, -1, 513, -1, -1, -1, -1, 518, 519, 520, 521, 522, 523, 524, -1, -1, 527, -1, -1, 530, 531, -1, -1, 534, -1, -1, 537, -1, -1, 540, 541, 542, 543, -1, -1, 546, -1, -1, 549, 550, -1, -1, 553, -1, -1, 556, -1, 558, 559, -1, -1, 562, -1, -1, 565, 566, 567, -1, 569, 570, -1, -1, 573, -1, -1, -1, 577, 578, 579, 580, -1, -1, -1, 584, -1, 586, -1, -1, 589, 590, 591, -1, -1, 594, -1, -1, 597, -1, 599, -1, -1, -1, 603, 604, 605, 606, -1, -1, 609, 610, 611, 612, -1, 614, -1, -1, 617, 618, -1, -1, 621, -1, -1, -1, 625, 626, 627, 628, -1, -1, -1, 632, 633, -1, -1, 636, -1, -1, 639, -1, -1, 642, 643, -1, 645, -1, -1, -1, 649, 650, 651, 652, 653, 654, 655, -1, -1, -1, 659, 660, -1, -1, -1, 664, 665, 666, -1, -1, 669, -1, -1, 672, 673, -1, -1, 676, -1, -1, 679, 680, 681, 682, -1, -1, 685, -1, -1, 688, -1, 690, -1, -1, 693, 694, -1, 696, -1, -1, 699, -1, -1, 702, 703, 704, 705, 706, -1, -1, 709, -1, -1, -1, 713, -1, -1, 716, 717, -1, -1, -1, 721, 722, 723, 724, -1, 726, -1, -1, 729, 730, -1, 732, -1, -1, -1, 736, 737, -1, -1, 740, 741, 742, -1, -1, -1, -1, 747, 748, 749, 750, -1, -1, 753, -1, 755, -1, -1, -1, 759, 760, -1, -1, -1, 764, 765, 766, 767, 768, -1, 770, -1, -1, -1, 774, -1, -1, 777, 778, 779, 780, 781, 782, -1, -1, 785, -1, -1, 788, 789, -1, -1, 792, -1, -1, 795, 796, 797, -1, -1, -1, -1, 802, 803, 804, 805, -1, -1, -1, 809, -1, -1, 812, 813, 814, -1, -1, -1, 818, 819, -1, -1, 822, -1, -1, -1, 826, 827, 828, 829, 830, -1, -1, -1, -1, 835, -1, 837, -1, -1, 840, 841, 842, 843, -1, -1, 846, -1, -1, -1, -1, 851, 852, 853, -1, 855, -1, 857, -1, -1, -1, 861, 862, 863, -1, 865, -1, -1, 868, 869, 870, 871, -1, 873, -1, -1, 876, 877, -1, -1, 880, -1, -1, 883, 884, 885, -1, -1, 888, -1, -1, 891, 892, -1, -1, 895, -1, -1, 898, -1, 900, 901, 902, -1, -1, 905, -1, -1, 908, 909, -1, -1, 912, -1, -1, 915, 916, -1, -1, 919, -1, -1, 922, 923, 924, -1, 926, 927, -1, -1, 930, 931, -1, -1, 934, 935, 936, -1, -1, 939, -1, -1, 942, -1, -1, 945, -1, 947, 948, 949, -1, 951, 952, -1, -1, 955, -1, -1, 958, 959, -1, -1, -1, -1, 964, 965, 966, 967, -1, 969, -1, 971, 972, -1, -1, 975, -1, -1, -1, 979, -1, 981, 982, -1, -1, -1, 986, 987, 988, 989, -1, 991, 992, -1, -1, 995, -1, -1, 998, 999, 1000, -1, -1, -1, 1004, 1005, -1, -1, -1, 1009, 1010, -1, 1012, -1, -1, 1015, 1016, 1017, -1, -1, -1, 1021, 1022, -1, -1, 1025, -1, -1, 1028, 1029, 1030, 1031, 1032, -1, -1, -1, -1, -1, 1038, 1039, -1, 1041, 1042, -1, -1, 1045, -1, -1, 1048, -1, 1050, 1051, -1, -1, 1054, -1, -1, 1057, 1058, 1059, -1, -1, 1062, -1, -1, 1065, 1066, 1067, 1068, 1069, -1, 1071, -1, 1073, -1, -1, 1076, 1077, 1078, -1, -1, 1081, -1, -1, 1084, 1085, -1, -1, 1088, -1, -1, 1091, 1092, -1, 1094, 1095, -1, -1, 1098, -1, -1, 1101, 1102, -1, 1104, -1, -1, 1107, 1108, -1, -1, 1111, -1, -1, 1114, 1115, 1116, 1117, -1, -1, 1120, 1121, -1, -1, 1124, -1, -1, 1127, 1128, -1, 1130, -1, -1, -1, 1134, -1, 1136, 1137, 1138, -1, -1, 1141, -1, -1, 1144, 1145, -1, -1, -1, 1149, 1150, -1, 1152, 1153, 1154, -1, -1, -1, 1158, 1159, -1, -1, -1, 1163, 1164, 1165, 1166, 1167, -1, -1, 1170, -1, -1, 1173, 1174, -1, -1, 1177, -1, -1, 1180, 1181, -1, -1, 1184, 1185, -1, -1, -1, 1189, 1190, 1191, -1, -1, -1, 1195, 1196, -1, -1, -1, 1200, 1201, 1202, 1203, 1204, 1205, 1206, 1207, -1, -1, 1210, -1, -1, 1213, -1, -1, 1216, 1217, 1218, -1, -1, 1221, -1, -1, -1, 1225, 1226, 1227, -1, -1, -1, 1231, 1232, -1, 1234, -1, -1, 1237, 1238, -1, -1, -1, 1242, 1243, 1244, 1245, -1, 1247, -1, -1, 1250, 1251, -1, -1, 1254, -1, -1, 1257, 1258, 1259, -1, -1, 1262, -1, -1, 1265, 1266, -1, -1, 1269, -1, -1, 1272, 1273, -1, 1275, -1, 1277, -1, -1, 1280, 1281, 1282, -1, -1, 1285, -1, -1, 1288, 1289, -1, -1, 1292, -1, -1, 1295, 1296, 1297, -1, -1, 1300, -1, 1302, -1, -1, 1305, 1306, -1, -1, -1, 1310, -1, 1312, 1313, 1314, 1315, 1316, -1, -1, 1319, 1320, -1, -1, 1323, -1, -1, -1, 1327, 1328, 1329, 1330, -1, -1, -1, 1334, -1, -1, -1, 1338, -1, 1340, 1341, 1342, -1, -1, 1345, -1, 1347, -1, -1, -1, 1351, -1, 1353, 1354, 1355, 1356, 1357, 1358, 1359, -1, -1, 1362, -1, -1, 1365, 1366, -1, -1, 1369, -1, -1, -1, 1373, 1374, 1375, -1, 1377, -1, -1, 1380, -1, 1382, -1, -1, 1385, 1386, 1387, -1, -1, 1390, -1, -1, 1393, -1, 1395, -1, -1, 1398, 1399, 1400, -1, -1, 1403, -1, -1, 1406, 1407, -1, -1, 1410, -1, -1, 1413, 1414, 1415, 1416, 1417, 1418, -1, -1, 1421, -1, -1, 1424, -1, 1426, -1, -1, 1429, -1, -1, 1432, 1433, -1, -1, -1, 1437, -1, -1, 1440, 1441, 1442, 1443, 1444, 1445, -1, -1, -1, -1, 1450, 1451, 1452, -1, 1454, -1, -1, -1, 1458, 1459, 1460, 1461, -1, -1, 1464, -1, -1, 1467, 1468, -1, -1, 1471, -1, -1, 1474, 1475, 1476, -1, -1, -1, -1, 1481, 1482, 1483, -1, 1485, 1486, -1, -1, 1489, -1, -1, -1, 1493, 1494, 1495, -1, -1, -1, 1499, 1500, 1501, 1502, -1, -1, 1505, -1, -1, 1508, 1509, -1, -1, -1, 1513, -1, 1515, -1, 1517, -1, -1, 1520, 1521, 1522, -1, -1, 1525, 1526, -1, 1528, 1529, -1, -1, 1532, -1, -1, -1, 1536, 1537, 1538, -1, 1540, 1541, 1542, -1, -1, -1, 1546, -1, 1548, -1, -1, 1551, 1552, 1553, 1554, -1, -1, 1557, -1, -1, 1560, -1, -1, -1, 1564, 1565, -1, -1, -1, 1569, 1570, 1571, 1572, 1573, -1, 1575, 1576, 1577, -1, -1, 1580, -1, -1, 1583, -1, 1585, -1, -1, 1588, 1589, 1590, 1591, -1, -1, 1594, -1, -1, 1597, 1598, -1, -1, 1601, -1, -1, 1604, -1, -1, 1607, 1608, -1, -1, 1611, 1612, 1613, -1, 1615, -1, -1, -1, 1619, 1620, 1621, -1, -1, -1, 1625, 1626, -1, -1, -1, 1630, -1, 1632, 1633, 1634, 1635, 1636, -1, -1, 1639, -1, -1, -1, 1643, -1, 1645, -1, -1, 1648, -1, 1650, -1, -1, 1653, 1654, 1655, 1656, 1657, 1658, 1659, -1, -1, -1, 1663, 1664, -1, -1, 1667, -1, -1, -1, 1671, -1, 1673, 1674, -1, 1676, -1, -1, 1679, -1, 1681, -1, -1, 1684, 1685, 1686, -1, 1688, 1689, -1, -1, 1692, -1, -1, 1695, 1696, 1697, -1, -1, 1700, -1, -1, -1, 1704, 1705, 1706, 1707, -1, -1, 1710, -1, -1, 1713, -1, -1, -1, 1717, -1, -1, 1720, 1721, -1, 1723, -1, 1725, 1726, -1, -1, 1729, -1, -1, 1732, 1733, 1734, 1735, 1736, -1, 1738, -1, 1740, -1, -1, 1743, -1, 1745, -1, -1, 1748, -1, 1750, 1751, 1752, -1, -1, 1755, -1, -1, 1758, 1759, -1, -1, -1, 1763, 1764, 1765, -1, 1767, 1768, -1, -1, 1771, -1, -1, 1774, 1775, -1, 1777, -1, -1, -1, 1781, 1782, 1783, -1, -1, -1, 1787, 1788, -1, -1, 1791, -1, -1, 1794, 1795, 1796, 1797, 1798, -1, -1, -1, -1, 1803, -1, 1805, -1, -1, 1808, 1809, -1, 1811, 1812, 1813, -1, -1, -1, 1817, 1818, -1, -1, -1, 1822, 1823, 1824, 1825, -1, -1, 1828, -1, -1, 1831, 1832, -1, -1, 1835, -1, -1, 1838, 1839, -1, 1841, -1, -1, 1844, 1845, -1, -1, 1848, -1, -1, 1851, 1852, 1853, 1854, 1855, -1, -1, 1858, 1859, -1, 1861, -1, -1, -1, -1, 1866, 1867, -1, -1, 1870, -1, 1872, 1873, -1, -1, -1, 1877, 1878, 1879, 1880, 1881, 1882, 1883, -1, -1, 1886, -1, -1, 1889, 1890, -1, -1, -1, 1894, 1895, -1, -1, 1898, -1, -1, 1901, -1, -1, 1904, 1905, 1906, 1907, -1, -1, 1910, 1911, -1, -1, 1914, -1, -1, 1917, 1918, 1919, -1, -1, 1922, -1, -1, -1, 1926, 1927, 1928, 1929, -1, -1, 1932, -1, -1, 1935, 1936, -1, -1, 1939, -1, -1, 1942, 1943, 1944, -1, -1, 1947, -1, -1, -1, -1, 1952, 1953, 1954, -1, 1956, 1957, 1958, -1, 1960, -1, -1, 1963, 1964, -1, 1966, -1, -1, 1969, 1970, -1, -1, -1, 1974, 1975, 1976, 1977, -1, -1, 1980, -1, -1, 1983, 1984, -1, -1, -1, 1988, 1989, 1990, -1, -1, 1993, -1, -1, 1996, -1, -1, 1999, 2000, 2001, 2002, 2003, -1, -1, -1, -1, 2008, -1, 2010, -1, 2012, 2013, -1, -1, 2016, -1, -1, 2019, 2020, 2021, 2022, -1, -1, 2025, -1, -1, 2028, 2029, 2030, -1, -1, -1, 2034, 2035, -1, -1, 2038, -1, -1, 2041, -1, 2043, -1, -1, 2046, 2047, -1, 2049, 2050, 2051, 2052, -1, -1, 2055, 2056, -1, -1, 2059, -1, -1, 2062, -1, -1, 2065, -1, -1, -1, 2069, 2070, 2071, 2072, 2073, -1, -1, 2076, 2077, -1, 2079, -1, -1, 2082, -1, -1, 2085, 2086, 2087, 2088, -1, 2090, -1, -1, 2093, -1, 2095, -1, -1, -1, 2099, -1, -1, 2102, -1, 2104, -1, 2106, -1, -1, 2109, 2110, 2111, 2112, -1, 2114, 2115, 2116, -1, -1, 2119, -1, -1, 2122, 2123, -1, -1, 2126, -1, -1, 2129, 2130, 2131, 2132, -1, -1, 2135, -1, -1, 2138, 2139, -1, -1, 2142, -1, -1, 2145, 2146, -1, -1, 2149, -1, 2151, -1, -1, 2154, 2155, 2156, 2157, -1, -1, 2160, 2161, -1, -1, -1, 2165, -1, -1, 2168, 2169, 2170, 2171, -1, -1, 2174, -1, -1, -1, -1, 2179, 2180, 2181, -1, -1, 2184, 2185, -1, -1, 2188, 2189, 2190, -1, -1, 2193, -1, -1, -1, 2197, 2198, -1, 2200, 2201, 2202, -1, -1, 2205, -1, -1, -1, 2209, -1, 2211, 2212, -1, -1, -1, 2216, 2217, 2218, 2219, -1, -1, 2222, -1, -1, 2225, -1, 2227, 2228, -1, -1, -1, 2232, 2233, 2234, 2235, 2236, 2237, -1, -1, 2240, 2241, -1, -1, 2244, -1, -1, 2247, -1, 2249, 2250, -1, -1, 2253, -1, -1, 2256, -1, 2258, -1, -1, 2261, 2262, 2263, -1, -1, -1, -1, 2268, 2269, -1, -1, 2272, -1, -1, 2275, 2276, 2277, 2278, 2279, -1, 2281, -1, -1, -1, 2285, 2286, 2287, -1, 2289, -1, -1, -1, 2293, -1, -1, 2296, 2297, -1, -1, 2300, 2301, -1, -1, 2304, -1, 2306, 2307, 2308, -1, -1, -1, 2312, -1, -1, 2315, 2316, 2317, -1, -1, -1, 2321, 2322, 2323, -1, -1, -1, 2327, 2328, -1, 2330, 2331, -1, -1, 2334, -1, -1, 2337, 2338, 2339, 2340, -1, -1, 2343, -1, -1, 2346, -1, 2348, -1, -1, 2351, 2352, 2353, -1, -1, -1, 2357, 2358, -1, -1, 2361, -1, -1, 2364, 2365, 2366, 2367, 2368, 2369, 2370, -1, 2372, -1, -1, 2375, 2376, -1, -1, 2379, -1, -1, 2382, -1, 2384, 2385, -1, -1, 2388, -1, -1, -1, 2392, 2393, 2394, 2395, 2396, -1, -1, 2399, -1, -1, 2402, 2403, -1, -1, 2406, -1, -1, 2409, 2410, -1, -1, -1, 2414, 2415, -1, 2417, 2418, -1, -1, 2421, -1, -1, 2424, 2425, 2426, -1, -1, 2429, -1, -1, 2432, 2433, -1, -1, 2436, -1, -1, 2439, 2440, 2441, -1, 2443, -1, 2445, 2446, -1, -1, -1, 2450, 2451, -1, 2453, 2454, -1, -1, 2457, -1, -1, 2460, 2461, 2462, -1, -1, 2465, -1, -1, 2468, 2469, -1, -1, 2472, -1, -1, 2475, 2476, 2477, 2478, -1, -1, 2481, 2482, -1, -1, -1, 2486, 2487, -1, 2489, -1, -1, -1, 2493, 2494, -1, 2496, -1, -1, 2499, 2500, 2501, -1, -1, 2504, -1, -1, -1, 2508, -1, 2510, -1, 2512, -1, -1, 2515, 2516, 2517, 2518, 2519, -1, -1, 2522, 2523, 2524, 2525, -1, -1, 2528, -1, -1, 2531, 2532, -1, -1, -1, 2536, 2537, 2538, -1, -1, -1, -1, 2543, 2544, 2545, 2546, -1, -1, 2549, -1, -1, 2552, -1, -1, 2555, -1, -1, 2558, 2559, 2560, 2561, 2562, 2563, -1, -1, 2566, -1, -1, -1, 2570, -1, -1, 2573, 2574, 2575, 2576, -1, -1, 2579, -1, -1, 2582, 2583, -1, -1, 2586, -1, -1, 2589, -1, 2591, 2592, -1, -1, -1, 2596, 2597, 2598, 2599, 2600, -1, -1, -1, 2604, 2605, -1, -1, 2608, -1, -1, 2611, 2612, 2613, -1, -1, -1, 2617, 2618, -1, -1, 2621, -1, -1, 2624, -1, 2626, 2627, -1, 2629, -1, -1, 2632, -1, 2634, -1, -1, 2637, 2638, 2639, 2640, 2641, -1, 2643, -1, 2645, -1, -1, -1, 2649, -1, -1, 2652, 2653, -1, 2655, -1, 2657, -1, -1, 2660, 2661, -1, 2663, 2664, -1, -1, 2667, -1, -1, 2670, -1, -1, 2673, 2674, -1, -1, -1, 2678, 2679, 2680, 2681, 2682, -1, 2684, -1, -1, 2687, 2688, 2689, -1, -1, -1, -1, 2694, 2695, 2696, -1, 2698, -1, -1, -1, 2702, 2703, 2704, 2705, -1, -1, 2708, -1, -1, 2711, -1, -1, 2714, 2715, 2716, -1, -1, 2719, -1, -1, 2722, -1, -1, 2725, -1, 2727, 2728, 2729, 2730, 2731, -1, -1, 2734, -1, -1, 2737, -1, -1, -1, 2741, 2742, 2743, 2744, -1, -1, -1, -1, 2749, -1, 2751, 2752, -1, -1, 2755, -1, -1, 2758, 2759, 2760, -1, 2762, 2763, -1, 2765, -1, 2767, -1, -1, 2770, 2771, 2772, -1, -1, -1, 2776, 2777, -1, -1, -1, 2781, 2782, 2783, 2784, -1, 2786, -1, -1, 2789, 2790, -1, -1, 2793, -1, -1, 2796, 2797, -1, 2799, -1, -1, 2802, 2803, -1, -1, 2806, -1, -1, 2809, -1, 2811, -1, 2813, -1, -1, 2816, 2817, 2818, 2819, 2820, 2821, -1, -1, -1, -1, 2826, 2827, -1, -1, 2830, -1, -1, 2833, 2834, -1, 2836, -1, 2838, -1, -1, 2841, -1, -1, 2844, 2845, -1, 2847, -1, -1, -1, 2851, 2852, 2853, -1, 2855, -1, 2857, 2858, -1, 2860, -1, -1, 2863, 2864, 2865, -1, -1, -1, 2869, -1, -1, -1, 2873, 2874, 2875, -1, 2877, 2878, -1, 2880, -1, -1, 2883, 2884, -1, -1, -1, 2888, 2889, 2890, 2891, 2892, -1, -1, 2895, -1, -1, 2898, 2899, -1, -1, 2902, -1, -1, 2905, -1, 2907, -1, -1, -1, 2911, 2912, -1, -1, 2915, -1, 2917, -1, -1, 2920, 2921, 2922, 2923, 2924, 2925, 2926, -1, -1, -1, -1, 2931, 2932, -1, -1, 2935, 2936, 2937, -1, -1, -1, 2941, -1, -1, 2944, -1, -1, 2947, 2948, -1, 2950, -1, -1, 2953, 2954, -1, -1, -1, 2958, 2959, -1, 2961, 2962, -1, -1, 2965, -1, -1, 2968, 2969, 2970, 2971, -1, -1, -1, 2975, 2976, -1, 2978, -1, 2980, -1, -1, 2983, 2984, 2985, -1, -1, -1, -1, 2990, 2991, 2992, 2993, 2994, -1, -1, 2997, -1, -1, 3000, 3001, -1, -1, 3004, -1, -1, 3007, 3008, 3009, -1, -1, -1, 3013, -1, -1, 3016, -1, 3018, 3019, 3020, -1, -1, 3023, -1, -1, 3026, 3027, -1, -1, 3030, -1, -1, 3033, 3034, 3035, 3036, -1, -1, 3039, -1, -1, 3042, -1, 3044, -1, 3046, -1, -1, 3049, 3050, 3051, -1, -1, -1, 3055, 3056, 3057, 3058, -1, 3060, -1, 3062, -1, -1, 3065, 3066, 3067, -1, -1, -1, 3071, -1, -1, 3074, -1, -1, 3077, 3078, 3079, 3080, 3081, -1, -1, 3084, -1, -1, 3087, 3088, -1, -1, -1, 3092, 3093, 3094, -1, -1, -1, 3098, 3099, -1, -1, 3102, -1, -1, 3105, 3106, 3107, -1, -1, 3110, -1, -1, 3113, 3114, 3115, -1, -1, 3118, -1, -1, 3121, -1, 3123, -1, -1, 3126, 3127, 3128, 3129, 3130, -1, 3132, -1, 3134, -1, 3136, -1, -1, 3139, -1, 3141, -1, 3143, 3144, -1, -1, -1, 3148, 3149, 3150, 3151, 3152, -1, -1, 3155, -1, -1, 3158, -1, -1, 3161, 3162, 3163, -1, -1, 3166, -1, -1, 3169, -1, -1, 3172, 3173, 3174, 3175, -1, -1, 3178, -1, -1, 3181, 3182, -1, -1, 3185, -1, -1, 3188, -1, 3190, -1, -1, 3193, 3194, 3195, 3196, 3197, 3198, -1, -1, 3201, -1, -1, 3204, 3205, -1, -1, 3208, -1, -1, 3211, 3212, 3213, -1, -1, 3216, -1, -1, 3219, 3220, -1, -1, -1, 3224, 3225, -1, -1, 3228, 3229, -1, 3231, -1, -1, 3234, -1, -1, 3237, 3238, -1, -1, -1, 3242, 3243, 3244, -1, 3246, 3247, -1, -1, -1, 3251, -1, -1, 3254, -1, -1, 3257, 3258, 3259, 3260, 3261, 3262, -1, 3264, -1, 3266, -1, -1, 3269, 3270, 3271, -1, -1, 3274, -1, -1, 3277, -1, 3279, -1, -1, 3282, -1, -1, -1, 3286, 3287, 3288, 3289, -1, 3291, 3292, -1, -1, 3295, -1, -1, 3298, 3299, 3300, -1, -1, 3303, -1, -1, 3306, 3307, -1, -1, -1, 3311, 3312, 3313, 3314, -1, -1, 3317, -1, -1, 3320, 3321, -1, -1, 3324, -1, -1, 3327, -1, -1, 3330, 3331, 3332, -1, 3334, -1, -1, -1, 3338, 3339, 3340, 3341, -1, -1, -1, -1, -1, 3347, -1, 3349, 3350, 3351, -1, -1, -1, -1, 3356, 3357, 3358, 3359, -1, -1, 3362, 3363, -1, 3365, 3366, -1, 3368, -1, -1, 3371, -1, 3373, -1, -1, -1, 3377, 3378, -1, 3380, 3381, 3382, 3383, -1, -1, -1, 3387, -1, -1, -1, 3391, 3392, 3393, 3394, 3395, -1, -1, -1, 3399, 3400, -1, -1, -1, -1, 3405, 3406, 3407, -1, 3409, -1, -1, -1, 3413, -1, 3415, -1, 3417, -1, -1, 3420, 3421, 3422, -1, -1, 3425, 3426, -1, -1, 3429, 3430, 3431, 3432, -1, -1, 3435, -1, -1, -1, 3439, 3440, 3441, -1, -1, -1, 3445, 3446, -1, -1, 3449, -1, -1, 3452, 3453, 3454, 3455, 3456, 3457, -1, -1, 3460, -1, -1, 3463, 3464, -1, -1, 3467, -1, -1, 3470, 3471, 3472, -1, -1, 3475, -1, -1, 3478, 3479, -1, -1, -1, 3483, 3484, 3485, -1, 3487, -1, -1, 3490, -1, -1, -1, 3494, 3495, -1, 3497, 3498, -1, -1, 3501, 3502, -1, -1, 3505, -1, -1, 3508, 3509, 3510, 3511, -1, -1, 3514, -1, -1, 3517, 3518, -1, -1, 3521, -1, -1, 3524, 3525, 3526, -1, -1, 3529, -1, -1, -1, 3533, 3534, 3535, 3536, 3537, 3538, -1, 3540, -1, 3542, -1, -1, 3545, -1, -1, -1, 3549, 3550, 3551, -1, 3553, 3554, -1, -1, -1, 3558, 3559, 3560, -1, -1, 3563, -1, -1, 3566, -1, -1, 3569, 3570, 3571, -1, 3573, -1, -1, 3576, 3577, -1, -1, 3580, -1, -1, 3583, 3584, 3585, -1, -1, 3588, -1, -1, 3591, 3592, -1, -1, 3595, -1, -1, 3598, -1, 3600, 3601, -1, 3603, -1, 3605, 3606, -1, -1, -1, 3610, 3611, 3612, -1, -1, -1, -1, 3617, 3618, 3619, 3620, -1, -1, 3623, -1, -1, 3626, 3627, 3628, 3629, -1, -1, -1, -1, 3634, 3635, 3636, 3637, -1, -1, 3640, -1, -1, 3643, 3644, -1, -1, -1, -1, 3649, 3650, 3651, -1, -1, -1, 3655, -1, -1, 3658, 3659, 3660, 3661, 3662, 3663, 3664, 3665, -1, -1, 3668, -1, -1, -1, 3672, 3673, -1, 3675, -1, -1, 3678, -1, -1, 3681, 3682, 3683, 3684, -1, -1, 3687, -1, -1, -1, -1, 3692, 3693, 3694, -1, -1, 3697, 3698, 3699, -1, -1, 3702, -1, -1, 3705, 3706, -1, -1, 3709, -1, -1, -1, 3713, -1, -1, -1, 3717, 3718, -1, 3720, 3721, 3722, 3723, -1, 3725, -1, 3727, -1, -1, 3730, 3731, 3732, -1, -1, -1, 3736, 3737, -1, -1, 3740, -1, -1, 3743, 3744, 3745, 3746, -1, -1, 3749, -1, -1, 3752, 3753, -1, -1, -1, 3757, 3758, -1, -1, 3761, 3762, -1, -1, 3765, -1, -1, 3768, 3769, 3770, -1, -1, 3773, -1, -1, 3776, 3777, 3778, 3779, -1, -1, 3782, -1, -1, 3785, 3786, -1, -1, 3789, -1, -1, 3792, 3793, 3794, -1, -1, 3797, -1, -1, -1, 3801, 3802, 3803, 3804, 3805, -1, -1, -1, -1, -1, 3811, 3812, 3813, 3814, 3815, 3816, -1, -1, -1, -1, -1, -1, 3823, -1, 3825, -1, 3827, -1, 3829, -1, -1, 3832, 3833, -1, -1, 3836, 3837, 3838, 3839, 3840, -1, -1, 3843, 3844, -1, -1, 3847, -1, 3849, -1, -1, 3852, 3853, 3854, 3855, -1, -1, -1, -1, 3860, 3861, 3862, -1, -1, -1, 3866, 3867, -1, -1, 3870, -1, -1, 3873, 3874, 3875, -1, 3877, -1, -1, 3880, 3881, -1, -1, -1, -1, 3886, 3887, 3888, 3889, -1, -1, 3892, -1, -1, 3895, -1, 3897, 3898, -1, -1, -1, 3902, 3903, 3904, -1, -1, 3907, 3908, -1, -1, -1, -1, 3913, 3914, 3915, 3916, 3917, 3918, 3919, -1, -1, -1, 3923, 3924, 3925, -1, -1, 3928, -1, -1, 3931, 3932, -1, -1, -1, 3936, 3937, 3938, -1, 3940, -1, -1, 3943, 3944, -1, -1, 3947, -1, -1, 3950, 3951, -1, -1, 3954, 3955, -1, -1, 3958, -1, -1, 3961, 3962, 3963, 3964, -1, 3966, -1, -1, 3969, 3970, -1, -1, 3973, -1, -1, 3976, 3977, 3978, -1, -1, -1, 3982, 3983, -1, -1, 3986, -1, -1, 3989, 3990, 3991, -1, -1, 3994, 3995, -1, -1, -1, 3999, 4000, 4001, -1, -1, -1, -1, 4006, 4007, 4008, 4009, 4010, 4011, -1, -1, 4014, -1, -1, 4017, -1, 4019, -1, -1, 4022, 4023, 4024, -1, -1, 4027, -1, -1, -1, -1, 4032, -1, 4034, 4035, -1, -1, 4038, -1, 4040, -1, -1, 4043, 4044, -1, -1, 4047, 4048, 4049, -1, -1, 4052, -1, -1, -1, 4056, 4057, 4058, 4059, 4060, 4061, -1, 4063, 4064, -1, -1, 4067, -1, -1, 4070, -1, -1, 4073, -1, -1, 4076, 4077, -1, -1, 4080, 4081, -1, 4083, 4084, -1, -1, -1, 4088, 4089, 4090, -1, -1, 4093, -1, -1, 4096, 4097, -1, -1, 4100, -1, -1, 4103, -1, 4105, 4106, 4107, 4108, 4109, -1, -1, -1, -1, 4114, 4115, 4116, -1, -1, 4119, -1, -1, -1, 4123, 4124, 4125, -1, -1, 4128, 4129, -1, -1, 4132, -1, -1, -1, 4136, 4137, 4138, 4139, 4140, -1, 4142, -1, -1, 4145, 4146, 4147, -1, -1, -1, 4151, 4152, -1, -1, -1, 4156, 4157, 4158, -1, 4160, -1, -1, 4163, 4164, -1, -1, -1, 4168, 4169, 4170, -1, -1, 4173, -1, -1, 4176, -1, -1, 4179, -1, -1, 4182, 4183, 4184, 4185, 4186, 4187, -1, -1, 4190, -1, -1, 4193, 4194, -1, -1, 4197, -1, -1, -1, 4201, -1, 4203, 4204, -1, -1, -1, -1, 4209, 4210, 4211, 4212, 4213, 4214, -1, 4216, 4217, -1, -1, -1, 4221, 4222, 4223, -1, -1, 4226, -1, -1, 4229, -1, 4231, -1, -1, 4234, 4235, -1, -1, -1, 4239, -1, 4241, -1, -1, 4244, 4245, 4246, 4247, -1, 4249, -1, -1, 4252, 4253, -1, -1, -1, 4257, 4258, -1, -1, -1, 4262, 4263, 4264, 4265, -1, 4267, -1, -1, 4270, -1, -1, 4273, 4274, 4275, -1, -1, 4278, -1, -1, 4281, -1, -1, 4284, -1, -1, 4287, 4288, 4289, -1, 4291, -1, -1, 4294, 4295, 4296, 4297, 4298, -1, -1, 4301, -1, -1, 4304, 4305, -1, -1, 4308, -1, -1, 4311, 4312, 4313, -1, -1, 4316, -1, -1, 4319, 4320, -1, -1, -1, 4324, 4325, 4326, 4327, -1, -1, 4330, -1, -1, 4333, 4334, -1, -1, 4337, -1, -1, 4340, -1, 4342, -1, 4344, -1, -1, 4347, 4348, 4349, 4350, -1, -1, -1, -1, 4355, 4356, 4357, -1, -1, -1, 4361, 4362, 4363, -1, -1, 4366, 4367, -1, -1, 4370, -1, -1, 4373, -1, -1, 4376, 4377, 4378, 4379, 4380, 4381, 4382, 4383, -1, -1, 4386, -1, -1, 4389, 4390, -1, -1, 4393, -1, -1, 4396, -1, -1, 4399, 4400, 4401, -1, 4403, -1, -1, 4406, 4407, -1, -1, 4410, -1, -1, 4413, 4414, -1, 4416, -1, -1, 4419, 4420, -1, -1, 4423, -1, -1, 4426, 4427, 4428, -1, 4430, -1, -1, -1, 4434, 4435, 4436, -1, -1, 4439, 4440, -1, -1, -1, 4444, 4445, 4446, -1, -1, -1, 4450, -1, -1, 4453, 4454, -1, 4456, -1, -1, 4459, 4460, 4461, 4462, -1, -1, -1, 4466, -1, -1, 4469, -1, -1, 4472, 4473, 4474, 4475, -1, -1, 4478, 4479, -1, 4481, -1, -1, 4484, 4485, 4486, -1, -1, 4489, -1, -1, 4492, -1, 4494, -1, -1, 4497, 4498, -1, -1, -1, 4502, 4503, 4504, 4505, 4506, 4507, -1, -1, 4510, -1, -1, 4513, 4514, -1, -1, -1, -1, 4519, 4520, 4521, 4522, -1, -1, -1, -1, 4527, 4528, -1, 4530, -1, -1, 4533, 4534, -1, -1, 4537, -1, -1, -1, 4541, 4542, 4543, -1, 4545, 4546, 4547, -1, 4549, 4550, -1, -1, -1, 4554, -1, -1, -1, -1, 4559, 4560, 4561, 4562, 4563, 4564, 4565, -1, -1, 4568, -1, -1, 4571, -1, 4573, -1, -1, 4576, 4577, 4578, -1, -1, -1, 4582, -1, -1, 4585, 4586, 4587, 4588, -1, -1, 4591, -1, -1, 4594, 4595, -1, -1, 4598, -1, -1, 4601, -1, 4603, 4604, -1, -1, 4607, -1, -1, 4610, 4611, 4612, -1, -1, -1, 4616, 4617, -1, 4619, 4620, -1, -1, 4623, -1, -1, 4626, -1, -1, 4629, 4630, 4631, 4632, -1, -1, 4635, -1, -1, 4638, 4639, 4640, -1, 4642, -1, -1, -1, 4646, 4647, 4648, -1, -1, 4651, -1, -1, -1, 4655, -1, 4657, -1, 4659, 4660, -1, -1, -1, 4664, 4665, 4666, 4667, 4668, 4669, 4670, -1, -1, -1, 4674, -1, -1, -1, -1, 4679, 4680, 4681, 4682, 4683, 4684, -1, -1, 4687, -1, -1, 4690, -1, 4692, -1, -1, 4695, 4696, -1, 4698, -1, -1, 4701, 4702, -1, -1, 4705, -1, -1, 4708, 4709, -1, -1, -1, 4713, 4714, 4715, -1, 4717, 4718, -1, -1, 4721, -1, -1, 4724, -1, 4726, 4727, -1, -1, 4730, -1, -1, 4733, 4734, 4735, 4736, -1, -1, -1, 4740, 4741, -1, -1, -1, 4745, -1, -1, 4748, -1, 4750, 4751, -1, 4753, 4754, 4755, -1, -1, 4758, 4759, -1, -1, -1, -1, 4764, 4765, -1, 4767, -1, 4769, 4770, -1, -1, 4773, -1, -1, 4776, -1, 4778, 4779, 4780, -1, -1, 4783, -1, -1, 4786, 4787, -1, -1, 4790, -1, -1, 4793, 4794, 4795, 4796, 4797, -1, 4799, 4800, 4801, -1, -1, -1, 4805, 4806, -1, -1, 4809, -1, -1, 4812, 4813, 4814, -1, -1, 4817, -1, 4819, -1, -1, 4822, 4823, 4824, -1, -1, 4827, -1, -1, 4830, -1, 4832, -1, -1, 4835, 4836, 4837, 4838, 4839, -1, -1, 4842, -1, -1, 4845, 4846, -1, -1, 4849, -1, -1, 4852, 4853, 4854, -1, -1, 4857, -1, -1, 4860, 4861, -1, -1, 4864, -1, -1, 4867, 4868, 4869, 4870, -1, -1, 4873, -1, -1, 4876, 4877, -1, -1, -1, 4881, 4882, 4883, -1, -1, 4886, -1, -1, 4889, -1, -1, 4892, 4893, 4894, 4895, -1, -1, -1, -1, 4900, 4901, -1, -1, 4904, -1, -1, 4907, 4908, 4909, -1, -1, -1, 4913, 4914, 4915, 4916, -1, 4918, -1, -1, 4921, -1, 4923, -1, -1, 4926, 4927, -1, -1, 4930, -1, -1, 4933, 4934, 4935, -1, -1, -1, 4939, -1, -1, 4942, 4943, 4944, 4945, 4946, -1, 4948, 4949, -1, 4951, -1, -1, 4954, 4955, -1, -1, 4958, -1, -1, 4961, 4962, 4963, 4964, -1, -1, -1, 4968, -1, 4970, -1, -1, 4973, -1, -1, -1, 4977, 4978, 4979, 4980, -1, 4982, -1, -1, 4985, -1, 4987, 4988, -1, -1, 4991, -1, -1, 4994, 4995, -1, 4997, -1, 4999, -1, -1, 5002, -1, 5004, 5005, -1, -1, 5008, -1, -1, 5011, 5012, -1, 5014, -1, -1, 5017, -1, -1, 5020, 5021, 5022, 5023, -1, 5025, -1, 5027, 5028, -1, -1, 5031, -1, -1, 5034, 5035, 5036, -1, 5038, -1, -1, 5041, 5042, -1, -1, 5045, -1, -1, 5048, 5049, 5050, -1, -1, -1, 5054, 5055, -1, -1, 5058, -1, -1, 5061, 5062, -1, 5064, -1, -1, -1, 5068, 5069, 5070, 5071, -1, 5073, 5074, -1, -1, -1, -1, -1, 5080, -1, -1, 5083, -1, 5085, 5086, 5087, 5088, 5089, 5090, 5091, -1, -1, 5094, -1, -1, 5097, 5098, -1, -1, 5101, -1, -1, 5104, 5105, -1, -1, 5108, -1, -1, 5111, -1, 5113, -1, 5115, 5116, -1, -1, 5119, -1, -1, 5122, 5123, 5124, 5125, -1, 5127, -1, -1, 5130, -1, -1, 5133, 5134, -1, 5136, -1, -1, -1, 5140, 5141, -1, 5143, 5144, -1, -1, -1, 5148, -1, 5150, 5151, -1, -1, 5154, -1, -1, 5157, 5158, 5159, -1, -1, 5162, 5163, 5164, -1, 5166, -1, -1, -1, 5170, 5171, 5172, -1, -1, 5175, -1, -1, 5178, 5179, -1, -1, 5182, -1, -1, -1, 5186, 5187, 5188, 5189, 5190, 5191, 5192, 5193, -1, -1, 5196, -1, -1, 5199, 5200, -1, -1, 5203, -1, -1, 5206, 5207, -1, -1, 5210, -1, 5212, -1, -1, 5215, 5216, 5217, -1, 5219, -1, -1, 5222, -1, -1, 5225, 5226, 5227, -1, -1, 5230, -1, -1, 5233, -1, 5235, -1, -1, 5238, 5239, -1, -1, 5242, 5243, -1, -1, -1, 5247, -1, -1, 5250, 5251, 5252, 5253, -1, 5255, 5256, 5257, -1, -1, -1, 5261, -1, -1, 5264, -1, -1, -1, 5268, 5269, 5270, 5271, -1, -1, 5274, 5275, -1, 5277, -1, -1, -1, 5281, -1, -1, 5284, 5285, 5286, 5287, 5288, -1, -1, 5291, -1, -1, 5294, 5295, -1, -1, 5298, -1, -1, 5301, 5302, -1, -1, -1, 5306, 5307, 5308, 5309, -1, -1, -1, 5313, 5314, -1, -1, -1, 5318, 5319, 5320, -1, -1, 5323, -1, -1, 5326, -1, -1, 5329, 5330, 5331, 5332, 5333, 5334, 5335, 5336, -1, -1, 5339, -1, -1, 5342, 5343, -1, -1, 5346, -1, -1, 5349, 5350, 5351, -1, -1, -1, -1, 5356, 5357, 5358, -1, 5360, -1, -1, 5363, 5364, -1, -1, 5367, -1, -1, 5370, 5371, -1, 5373, -1, -1, 5376, 5377, -1, -1, 5380, -1, -1, 5383, 5384, 5385, -1, 5387, 5388, -1, -1, 5391, -1, -1, 5394, 5395, -1, 5397, -1, -1, 5400, -1, -1, 5403, 5404, 5405, 5406, -1, -1, 5409, -1, -1, 5412, 5413, -1, -1, -1, 5417, -1, 5419, 5420, -1, -1, 5423, -1, -1, -1, 5427, 5428, 5429, 5430, -1, 5432, -1, 5434, -1, -1, 5437, 5438, 5439, 5440, -1, -1, -1, 5444, 5445, -1, -1, -1, 5449, 5450, 5451, -1, -1, -1, 5455, -1, -1, 5458, 5459, 5460, 5461, 5462, -1, -1, -1, 5466, 5467, -1, -1, -1, 5471, 5472, 5473, -1, -1, -1, 5477, -1, -1, -1, 5481, 5482, 5483, 5484, -1, 5486, 5487, -1, -1, -1, 5491, 5492, 5493, -1, -1, -1, 5497, 5498, -1, -1, 5501, -1, -1, 5504, 5505, -1, -1, -1, 5509, 5510, 5511, 5512, 5513, -1, -1, -1, 5517, 5518, -1, -1, 5521, -1, -1, -1, 5525, -1, 5527, -1, -1, 5530, 5531, 5532, -1, 5534, 5535, 5536, 5537, 5538, -1, -1, -1, 5542, 5543, -1, -1, 5546, -1, -1, 5549, 5550, 5551, -1, -1, 5554, -1, -1, 5557, 5558, -1, -1, -1, 5562, 5563, -1, 5565, 5566, -1, -1, -1, 5570, 5571, -1, 5573, -1, -1, 5576, 5577, -1, -1, -1, 5581, 5582, 5583, 5584, -1, -1, 5587, 5588, -1, 5590, -1, -1, 5593, -1, -1, 5596, 5597, -1, -1, 5600, 5601, 5602, -1, -1, 5605, -1, -1, 5608, -1, -1, 5611, 5612, 5613, 5614, 5615, -1, -1, 5618, -1, -1, 5621, -1, 5623, -1, -1, 5626, 5627, 5628, -1, -1, 5631, -1, -1, 5634, -1, 5636, -1, -1, 5639, -1, 5641, -1, -1, -1, 5645, 5646, 5647, 5648, 5649, 5650, -1, -1, 5653, 5654, 5655, -1, -1, 5658, -1, -1, 5661, 5662, -1, -1, 5665, -1, -1, 5668, 5669, -1, 5671, 5672, -1, -1, 5675, -1, -1, 5678, 5679, -1, 5681, -1, -1, 5684, -1, -1, 5687, 5688, 5689, -1, 5691, -1, 5693, -1, -1, 5696, 5697, 5698, -1, -1, 5701, -1, -1, 5704, 5705, -1, -1, 5708, -1, -1, 5711, -1, -1, 5714, 5715, 5716, 5717, 5718, 5719, -1, -1, 5722, -1, -1, 5725, -1, 5727, -1, -1, 5730, -1, 5732, -1, -1, 5735, 5736, 5737, 5738, -1, -1, -1, 5742, 5743, -1, -1, 5746, -1, -1, 5749, 5750, -1, -1, 5753, 5754, -1, -1, 5757, -1, -1, 5760, 5761, 5762, -1, -1, 5765, -1, 5767, -1, -1, 5770, -1, -1, -1, 5774, 5775, 5776, 5777, 5778, -1, 5780, 5781, -1, 5783, -1, -1, 5786, -1, 5788, -1, -1, 5791, -1, -1, 5794, 5795, 5796, -1, -1, -1, 5800, 5801, -1, 5803, 5804, -1, -1, 5807, -1, -1, 5810, 5811, 5812, -1, -1, 5815, -1, -1, 5818, 5819, -1, -1, 5822, -1, -1, 5825, 5826, 5827, 5828, -1, 5830, -1, 5832, -1, -1, 5835, 5836, -1, 5838, -1, -1, 5841, 5842, -1, -1, 5845, -1, -1, 5848, 5849, -1, 5851, -1, -1, 5854, 5855, -1, -1, -1, 5859, 5860, 5861, 5862, 5863, -1, -1, -1, -1, 5868, 5869, -1, 5871, -1, -1, 5874, 5875, -1, -1, 5878, -1, -1, 5881, 5882, 5883, -1, -1, 5886, 5887, -1, -1, -1, 5891, -1, -1, 5894, 5895, 5896, 5897, -1, 5899, -1, -1, 5902, -1, -1, 5905, -1, 5907, 5908, -1, -1, 5911, -1, -1, 5914, 5915, -1, 5917, -1, -1, 5920, -1, -1, 5923, 5924, 5925, 5926, -1, 5928, 5929, -1, -1, -1, 5933, -1, -1, 5936, -1, -1, 5939, 5940, 5941, 5942, -1, -1, 5945, 5946, 5947, 5948, -1, -1, -1, 5952, -1, -1, 5955, -1, -1, 5958, 5959, 5960, 5961, 5962, -1, -1, -1, 5966, 5967, -1, -1, -1, 5971, 5972, -1, -1, 5975, 5976, -1, -1, 5979, -1, -1, 5982, 5983, 5984, -1, -1, 5987, 5988, -1, -1, -1, -1, 5993, 5994, 5995, 5996, 5997, -1, 5999, -1, -1, 6002, 6003, -1, -1, -1, 6007, 6008, 6009, -1, -1, 6012, -1, -1, 6015, 6016, -1, -1, 6019, -1, -1, 6022, 6023, 6024, -1, 6026, -1, -1, 6029, 6030, -1, -1, 6033, -1, -1, 6036, 6037, -1, -1, 6040, -1, 6042, -1, -1, 6045, -1, 6047, -1, 6049, 6050, 6051, -1, -1, 6054, -1, -1, 6057, 6058, -1, -1, 6061, -1, -1, 6064, 6065, -1, 6067, -1, -1, 6070, 6071, 6072, 6073, 6074, 6075, 6076, -1, -1, -1, 6080, -1, 6082, -1, -1, 6085, 6086, 6087, -1, -1, 6090, -1, -1, 6093, 6094, -1, -1, 6097, -1, -1, -1, 6101, 6102, 6103, 6104, -1, -1, 6107, -1, 6109, -1, -1, 6112, 6113, 6114, -1, -1, 6117, -1, -1, 6120, -1, 6122, -1, -1, 6125, 6126, -1, 6128, 6129, -1, -1, 6132, -1, -1, 6135, 6136, -1, 6138, -1, -1, -1, 6142, 6143, 6144, -1, 6146, 6147, -1, 6149, -1, -1, 6152, -1, 6154, -1, -1, 6157, -1, 6159, 6160, 6161, -1, -1, 6164, -1, -1, 6167, 6168, -1, -1, 6171, -1, -1, 6174, 6175, -1, 6177, 6178, -1, 6180, -1, -1, 6183, -1, 6185, -1, -1, 6188, 6189, 6190, -1, -1, 6193, 6194, -1, -1, -1, 6198, 6199, -1, 6201, -1, -1, 6204, 6205, -1, -1, -1, 6209, 6210, 6211, -1, 6213, 6214, 6215, 6216, -1, 6218, -1, -1, -1, -1, -1, -1, 6225, 6226, 6227, 6228, 6229, 6230, 6231, -1, -1, 6234, -1, -1, 6237, -1, -1, -1, 6241, -1, 6243, -1, -1, 6246, 6247, -1, -1, -1, 6251, 6252, -1, 6254, 6255, 6256, 6257, -1, -1, 6260, -1, -1, 6263, 6264, -1, -1, -1, 6268, -1, -1, 6271, 6272, 6273, -1, 6275, 6276, -1, -1, -1, 6280, 6281, 6282, -1, -1, -1, 6286, 6287, -1, -1, 6290, -1, -1, 6293, -1, 6295, 6296, 6297, -1, -1, -1, -1, 6302, 6303, 6304, 6305, 6306, -1, 6308, 6309, 6310, -1, -1, -1, 6314, 6315, -1, -1, 6318, -1, -1, 6321, 6322, -1, 6324, 6325, -1, -1, 6328, -1, -1, 6331, 6332, 6333, -1, -1, 6336, -1, -1, 6339, 6340, -1, -1, 6343, -1, -1, 6346, -1, 6348, 6349, -1, 6351, -1, 6353, -1, -1, -1, 6357, 6358, -1, 6360, 6361, -1, 6363, -1, -1, -1, 6367, 6368, -1, -1, -1, 6372, 6373, 6374, 6375, 6376, 6377, 6378, -1, -1, 6381, -1, -1, 6384, 6385, -1, -1, 6388, -1, -1, 6391, 6392, -1, -1, -1, 6396, 6397, 6398, 6399, -1, -1, 6402, -1, -1, 6405, 6406, -1, -1, -1, 6410, 6411, -1, 6413, -1, -1, 6416, 6417, -1, -1, 6420, -1, -1, 6423, -1, -1, 6426, -1, 6428, -1, -1};
+static const int32_t children_right[NUM_NODES] = {116, 69, 16, 9, 6, -1, 8, -1, -1, 13, 12, -1, -1, 15, -1, -1, 40, 27, 26, 23, 22, -1, -1, 25, -1, -1, -1, 33, 30, -1, 32, -1, -1, 37, 36, -1, -1, 39, -1, -1, 56, 49, 46, 45, -1, -1, 48, -1, -1, 53, 52, -1, -1, 55, -1, -1, 64, 61, 60, -1, -1, 63, -1, -1, 68, 67, -1, -1, -1, 91, 76, 75, 74, -1, -1, -1, 86, 81, 80, -1, -1, 83, -1, 85, -1, -1, 90, 89, -1, -1, -1, 103, 102, 95, -1, 99, 98, -1, -1, 101, -1, -1, -1, 111, 106, -1, 110, 109, -1, -1, -1, 115, 114, -1, -1, -1, 178, 149, 136, 131, 126, 125, 124, -1, -1, -1, 130, 129, -1, -1, -1, 135, 134, -1, -1, -1, 144, 139, -1, 143, 142, -1, -1, -1, 148, 147, -1, -1, -1, 151, -1, 165, 160, 157, 156, -1, -1, 159, -1, -1, 162, -1, 164, -1, -1, 171, 170, 169, -1, -1, -1, 175, 174, -1, -1, 177, -1, -1, 210, 195, 182, -1, 190, 187, 186, -1, -1, 189, -1, -1, 194, 193, -1, -1, -1, 199, 198, -1, -1, 207, 204, 203, -1, -1, 206, -1, -1, 209, -1, -1, 222, 219, 218, 217, 216, -1, -1, -1, -1, 221, -1, -1, 224, -1, -1, 315, 270, 239, 234, 231, -1, 233, -1, -1, 236, -1, 238, -1, -1, 261, 250, 245, 244, -1, -1, 249, 248, -1, -1, -1, 256, 253, -1, 255, -1, -1, 260, 259, -1, -1, -1, 269, 268, 265, -1, 267, -1, -1, -1, -1, 272, -1, 288, 279, 276, -1, 278, -1, -1, 285, 284, 283, -1, -1, -1, 287, -1, -1, 304, 297, 294, 293, -1, -1, 296, -1, -1, 301, 300, -1, -1, 303, -1, -1, 310, 309, 308, -1, -1, -1, 314, 313, -1, -1, -1, 355, 350, 335, 334, 327, 324, 323, -1, -1, 326, -1, -1, 331, 330, -1, -1, 333, -1, -1, -1, 349, 342, 341, 340, -1, -1, -1, 346, 345, -1, -1, 348, -1, -1, -1, 352, -1, 354, -1, -1, -1, 388, 359, -1, 369, 364, 363, -1, -1, 366, -1, 368, -1, -1, 373, 372, -1, -1, 375, -1, 381, 378, -1, 380, -1, -1, 385, 384, -1, -1, 387, -1, -1, 420, 405, 404, 393, -1, 401, 398, 397, -1, -1, 400, -1, -1, 403, -1, -1, -1, 409, 408, -1, -1, 411, -1, 417, 416, 415, -1, -1, -1, 419, -1, -1, 462, 451, 438, 431, 428, 427, -1, -1, 430, -1, -1, 435, 434, -1, -1, 437, -1, -1, 444, 443, 442, -1, -1, -1, 448, 447, -1, -1, 450, -1, -1, 461, 460, 457, 456, -1, -1, 459, -1, -1, -1, -1, 478, 475, 470, 469, 468, -1, -1, -1, 474, 473, -1, -1, -1, 477, -1, -1, 480, -1, -1, 517, 490, 485, -1, 487, -1, 489, -1, -1, 516, 493, -1, 507, 502, 499, 498, -1, -1, 501, -1, -1, 504, -1, 506, -1, -1, 515, 512, 511, -1, -1, 514, -1, -1, -1, -1, 601, 564, 539, 536, 529, 526, 525, -1, -1, 528, -1, -1, 533, 532, -1, -1, 535, -1, -1, 538, -1, -1, 555, 548, 545, 544, -1, -1, 547, -1, -1, 552, 551, -1, -1, 554, -1, -1, 557, -1, 561, 560, -1, -1, 563, -1, -1, 576, 575, 568, -1, 572, 571, -1, -1, 574, -1, -1, -1, 588, 583, 582, 581, -1, -1, -1, 585, -1, 587, -1, -1, 596, 593, 592, -1, -1, 595, -1, -1, 598, -1, 600, -1, -1, -1, 648, 641, 608, 607, -1, -1, 624, 623, 616, 613, -1, 615, -1, -1, 620, 619, -1, -1, 622, -1, -1, -1, 638, 631, 630, 629, -1, -1, -1, 635, 634, -1, -1, 637, -1, -1, 640, -1, -1, 647, 644, -1, 646, -1, -1, -1, 720, 701, 678, 663, 658, 657, 656, -1, -1, -1, 662, 661, -1, -1, -1, 671, 668, 667, -1, -1, 670, -1, -1, 675, 674, -1, -1, 677, -1, -1, 692, 687, 684, 683, -1, -1, 686, -1, -1, 689, -1, 691, -1, -1, 698, 695, -1, 697, -1, -1, 700, -1, -1, 715, 712, 711, 708, 707, -1, -1, 710, -1, -1, -1, 714, -1, -1, 719, 718, -1, -1, -1, 746, 735, 728, 725, -1, 727, -1, -1, 734, 731, -1, 733, -1, -1, -1, 739, 738, -1, -1, 745, 744, 743, -1, -1, -1, -1, 758, 757, 752, 751, -1, -1, 754, -1, 756, -1, -1, -1, 762, 761, -1, -1, -1, 825, 776, 773, 772, 769, -1, 771, -1, -1, -1, 775, -1, -1, 824, 801, 794, 787, 784, 783, -1, -1, 786, -1, -1, 791, 790, -1, -1, 793, -1, -1, 800, 799, 798, -1, -1, -1, -1, 811, 808, 807, 806, -1, -1, -1, 810, -1, -1, 817, 816, 815, -1, -1, -1, 821, 820, -1, -1, 823, -1, -1, -1, 839, 834, 833, 832, 831, -1, -1, -1, -1, 836, -1, 838, -1, -1, 849, 848, 845, 844, -1, -1, 847, -1, -1, -1, -1, 860, 859, 854, -1, 856, -1, 858, -1, -1, -1, 914, 867, 864, -1, 866, -1, -1, 897, 882, 875, 872, -1, 874, -1, -1, 879, 878, -1, -1, 881, -1, -1, 890, 887, 886, -1, -1, 889, -1, -1, 894, 893, -1, -1, 896, -1, -1, 899, -1, 907, 904, 903, -1, -1, 906, -1, -1, 911, 910, -1, -1, 913, -1, -1, 918, 917, -1, -1, 920, -1, -1, 963, 944, 925, -1, 929, 928, -1, -1, 933, 932, -1, -1, 941, 938, 937, -1, -1, 940, -1, -1, 943, -1, -1, 946, -1, 962, 957, 950, -1, 954, 953, -1, -1, 956, -1, -1, 961, 960, -1, -1, -1, -1, 985, 978, 977, 968, -1, 970, -1, 974, 973, -1, -1, 976, -1, -1, -1, 980, -1, 984, 983, -1, -1, -1, 1027, 1008, 997, 990, -1, 994, 993, -1, -1, 996, -1, -1, 1003, 1002, 1001, -1, -1, -1, 1007, 1006, -1, -1, -1, 1014, 1011, -1, 1013, -1, -1, 1020, 1019, 1018, -1, -1, -1, 1024, 1023, -1, -1, 1026, -1, -1, 1037, 1036, 1035, 1034, 1033, -1, -1, -1, -1, -1, 1047, 1040, -1, 1044, 1043, -1, -1, 1046, -1, -1, 1049, -1, 1053, 1052, -1, -1, 1055, -1, -1, 1064, 1061, 1060, -1, -1, 1063, -1, -1, 1148, 1113, 1090, 1075, 1070, -1, 1072, -1, 1074, -1, -1, 1083, 1080, 1079, -1, -1, 1082, -1, -1, 1087, 1086, -1, -1, 1089, -1, -1, 1100, 1093, -1, 1097, 1096, -1, -1, 1099, -1, -1, 1106, 1103, -1, 1105, -1, -1, 1110, 1109, -1, -1, 1112, -1, -1, 1133, 1126, 1119, 1118, -1, -1, 1123, 1122, -1, -1, 1125, -1, -1, 1132, 1129, -1, 1131, -1, -1, -1, 1135, -1, 1143, 1140, 1139, -1, -1, 1142, -1, -1, 1147, 1146, -1, -1, -1, 1162, 1151, -1, 1157, 1156, 1155, -1, -1, -1, 1161, 1160, -1, -1, -1, 1188, 1179, 1172, 1169, 1168, -1, -1, 1171, -1, -1, 1176, 1175, -1, -1, 1178, -1, -1, 1183, 1182, -1, -1, 1187, 1186, -1, -1, -1, 1194, 1193, 1192, -1, -1, -1, 1198, 1197, -1, -1, -1, 1309, 1294, 1241, 1224, 1215, 1212, 1209, 1208, -1, -1, 1211, -1, -1, 1214, -1, -1, 1223, 1220, 1219, -1, -1, 1222, -1, -1, -1, 1230, 1229, 1228, -1, -1, -1, 1236, 1233, -1, 1235, -1, -1, 1240, 1239, -1, -1, -1, 1271, 1256, 1249, 1246, -1, 1248, -1, -1, 1253, 1252, -1, -1, 1255, -1, -1, 1264, 1261, 1260, -1, -1, 1263, -1, -1, 1268, 1267, -1, -1, 1270, -1, -1, 1279, 1274, -1, 1276, -1, 1278, -1, -1, 1287, 1284, 1283, -1, -1, 1286, -1, -1, 1291, 1290, -1, -1, 1293, -1, -1, 1304, 1299, 1298, -1, -1, 1301, -1, 1303, -1, -1, 1308, 1307, -1, -1, -1, 1311, -1, 1337, 1326, 1325, 1318, 1317, -1, -1, 1322, 1321, -1, -1, 1324, -1, -1, -1, 1336, 1333, 1332, 1331, -1, -1, -1, 1335, -1, -1, -1, 1339, -1, 1349, 1344, 1343, -1, -1, 1346, -1, 1348, -1, -1, -1, 1352, -1, 1412, 1397, 1372, 1371, 1364, 1361, 1360, -1, -1, 1363, -1, -1, 1368, 1367, -1, -1, 1370, -1, -1, -1, 1384, 1379, 1376, -1, 1378, -1, -1, 1381, -1, 1383, -1, -1, 1392, 1389, 1388, -1, -1, 1391, -1, -1, 1394, -1, 1396, -1, -1, 1405, 1402, 1401, -1, -1, 1404, -1, -1, 1409, 1408, -1, -1, 1411, -1, -1, 1436, 1431, 1428, 1423, 1420, 1419, -1, -1, 1422, -1, -1, 1425, -1, 1427, -1, -1, 1430, -1, -1, 1435, 1434, -1, -1, -1, 1438, -1, -1, 1519, 1480, 1449, 1448, 1447, 1446, -1, -1, -1, -1, 1457, 1456, 1453, -1, 1455, -1, -1, -1, 1473, 1466, 1463, 1462, -1, -1, 1465, -1, -1, 1470, 1469, -1, -1, 1472, -1, -1, 1479, 1478, 1477, -1, -1, -1, -1, 1492, 1491, 1484, -1, 1488, 1487, -1, -1, 1490, -1, -1, -1, 1498, 1497, 1496, -1, -1, -1, 1512, 1507, 1504, 1503, -1, -1, 1506, -1, -1, 1511, 1510, -1, -1, -1, 1514, -1, 1516, -1, 1518, -1, -1, 1535, 1524, 1523, -1, -1, 1534, 1527, -1, 1531, 1530, -1, -1, 1533, -1, -1, -1, 1563, 1550, 1539, -1, 1545, 1544, 1543, -1, -1, -1, 1547, -1, 1549, -1, -1, 1562, 1559, 1556, 1555, -1, -1, 1558, -1, -1, 1561, -1, -1, -1, 1567, 1566, -1, -1, -1, 1652, 1629, 1606, 1587, 1574, -1, 1582, 1579, 1578, -1, -1, 1581, -1, -1, 1584, -1, 1586, -1, -1, 1603, 1596, 1593, 1592, -1, -1, 1595, -1, -1, 1600, 1599, -1, -1, 1602, -1, -1, 1605, -1, -1, 1610, 1609, -1, -1, 1618, 1617, 1614, -1, 1616, -1, -1, -1, 1624, 1623, 1622, -1, -1, -1, 1628, 1627, -1, -1, -1, 1631, -1, 1647, 1642, 1641, 1638, 1637, -1, -1, 1640, -1, -1, -1, 1644, -1, 1646, -1, -1, 1649, -1, 1651, -1, -1, 1716, 1683, 1670, 1669, 1662, 1661, 1660, -1, -1, -1, 1666, 1665, -1, -1, 1668, -1, -1, -1, 1672, -1, 1678, 1675, -1, 1677, -1, -1, 1680, -1, 1682, -1, -1, 1703, 1694, 1687, -1, 1691, 1690, -1, -1, 1693, -1, -1, 1702, 1699, 1698, -1, -1, 1701, -1, -1, -1, 1715, 1712, 1709, 1708, -1, -1, 1711, -1, -1, 1714, -1, -1, -1, 1718, -1, -1, 1731, 1722, -1, 1724, -1, 1728, 1727, -1, -1, 1730, -1, -1, 1793, 1762, 1747, 1742, 1737, -1, 1739, -1, 1741, -1, -1, 1744, -1, 1746, -1, -1, 1749, -1, 1757, 1754, 1753, -1, -1, 1756, -1, -1, 1761, 1760, -1, -1, -1, 1780, 1773, 1766, -1, 1770, 1769, -1, -1, 1772, -1, -1, 1779, 1776, -1, 1778, -1, -1, -1, 1786, 1785, 1784, -1, -1, -1, 1790, 1789, -1, -1, 1792, -1, -1, 1807, 1802, 1801, 1800, 1799, -1, -1, -1, -1, 1804, -1, 1806, -1, -1, 1821, 1810, -1, 1816, 1815, 1814, -1, -1, -1, 1820, 1819, -1, -1, -1, 1837, 1830, 1827, 1826, -1, -1, 1829, -1, -1, 1834, 1833, -1, -1, 1836, -1, -1, 1843, 1840, -1, 1842, -1, -1, 1847, 1846, -1, -1, 1849, -1, -1, 1876, 1865, 1864, 1857, 1856, -1, -1, 1863, 1860, -1, 1862, -1, -1, -1, -1, 1869, 1868, -1, -1, 1871, -1, 1875, 1874, -1, -1, -1, 1950, 1903, 1900, 1893, 1888, 1885, 1884, -1, -1, 1887, -1, -1, 1892, 1891, -1, -1, -1, 1897, 1896, -1, -1, 1899, -1, -1, 1902, -1, -1, 1925, 1916, 1909, 1908, -1, -1, 1913, 1912, -1, -1, 1915, -1, -1, 1924, 1921, 1920, -1, -1, 1923, -1, -1, -1, 1941, 1934, 1931, 1930, -1, -1, 1933, -1, -1, 1938, 1937, -1, -1, 1940, -1, -1, 1949, 1946, 1945, -1, -1, 1948, -1, -1, -1, -1, 2045, 1998, 1955, -1, 1973, 1962, 1959, -1, 1961, -1, -1, 1968, 1965, -1, 1967, -1, -1, 1972, 1971, -1, -1, -1, 1987, 1982, 1979, 1978, -1, -1, 1981, -1, -1, 1986, 1985, -1, -1, -1, 1995, 1992, 1991, -1, -1, 1994, -1, -1, 1997, -1, -1, 2018, 2007, 2006, 2005, 2004, -1, -1, -1, -1, 2009, -1, 2011, -1, 2015, 2014, -1, -1, 2017, -1, -1, 2040, 2027, 2024, 2023, -1, -1, 2026, -1, -1, 2033, 2032, 2031, -1, -1, -1, 2037, 2036, -1, -1, 2039, -1, -1, 2042, -1, 2044, -1, -1, 2067, 2048, -1, 2064, 2061, 2054, 2053, -1, -1, 2058, 2057, -1, -1, 2060, -1, -1, 2063, -1, -1, 2066, -1, -1, -1, 2108, 2101, 2084, 2075, 2074, -1, -1, 2081, 2078, -1, 2080, -1, -1, 2083, -1, -1, 2098, 2097, 2092, 2089, -1, 2091, -1, -1, 2094, -1, 2096, -1, -1, -1, 2100, -1, -1, 2103, -1, 2105, -1, 2107, -1, -1, 2178, 2153, 2128, 2113, -1, 2121, 2118, 2117, -1, -1, 2120, -1, -1, 2125, 2124, -1, -1, 2127, -1, -1, 2144, 2137, 2134, 2133, -1, -1, 2136, -1, -1, 2141, 2140, -1, -1, 2143, -1, -1, 2148, 2147, -1, -1, 2150, -1, 2152, -1, -1, 2167, 2164, 2159, 2158, -1, -1, 2163, 2162, -1, -1, -1, 2166, -1, -1, 2177, 2176, 2173, 2172, -1, -1, 2175, -1, -1, -1, -1, 2196, 2183, 2182, -1, -1, 2187, 2186, -1, -1, 2195, 2192, 2191, -1, -1, 2194, -1, -1, -1, 2208, 2199, -1, 2207, 2204, 2203, -1, -1, 2206, -1, -1, -1, 2210, -1, 2214, 2213, -1, -1, -1, 2231, 2224, 2221, 2220, -1, -1, 2223, -1, -1, 2226, -1, 2230, 2229, -1, -1, -1, 2267, 2260, 2255, 2246, 2239, 2238, -1, -1, 2243, 2242, -1, -1, 2245, -1, -1, 2248, -1, 2252, 2251, -1, -1, 2254, -1, -1, 2257, -1, 2259, -1, -1, 2266, 2265, 2264, -1, -1, -1, -1, 2271, 2270, -1, -1, 2273, -1, -1, 2314, 2295, 2284, 2283, 2280, -1, 2282, -1, -1, -1, 2292, 2291, 2288, -1, 2290, -1, -1, -1, 2294, -1, -1, 2299, 2298, -1, -1, 2303, 2302, -1, -1, 2305, -1, 2311, 2310, 2309, -1, -1, -1, 2313, -1, -1, 2320, 2319, 2318, -1, -1, -1, 2326, 2325, 2324, -1, -1, -1, 2336, 2329, -1, 2333, 2332, -1, -1, 2335, -1, -1, 2350, 2345, 2342, 2341, -1, -1, 2344, -1, -1, 2347, -1, 2349, -1, -1, 2356, 2355, 2354, -1, -1, -1, 2360, 2359, -1, -1, 2362, -1, -1, 2507, 2438, 2391, 2390, 2381, 2374, 2371, -1, 2373, -1, -1, 2378, 2377, -1, -1, 2380, -1, -1, 2383, -1, 2387, 2386, -1, -1, 2389, -1, -1, -1, 2413, 2408, 2401, 2398, 2397, -1, -1, 2400, -1, -1, 2405, 2404, -1, -1, 2407, -1, -1, 2412, 2411, -1, -1, -1, 2423, 2416, -1, 2420, 2419, -1, -1, 2422, -1, -1, 2431, 2428, 2427, -1, -1, 2430, -1, -1, 2435, 2434, -1, -1, 2437, -1, -1, 2474, 2449, 2442, -1, 2444, -1, 2448, 2447, -1, -1, -1, 2459, 2452, -1, 2456, 2455, -1, -1, 2458, -1, -1, 2467, 2464, 2463, -1, -1, 2466, -1, -1, 2471, 2470, -1, -1, 2473, -1, -1, 2492, 2485, 2480, 2479, -1, -1, 2484, 2483, -1, -1, -1, 2491, 2488, -1, 2490, -1, -1, -1, 2498, 2495, -1, 2497, -1, -1, 2506, 2503, 2502, -1, -1, 2505, -1, -1, -1, 2509, -1, 2511, -1, 2513, -1, -1, 2636, 2557, 2542, 2521, 2520, -1, -1, 2535, 2530, 2527, 2526, -1, -1, 2529, -1, -1, 2534, 2533, -1, -1, -1, 2541, 2540, 2539, -1, -1, -1, -1, 2554, 2551, 2548, 2547, -1, -1, 2550, -1, -1, 2553, -1, -1, 2556, -1, -1, 2595, 2572, 2569, 2568, 2565, 2564, -1, -1, 2567, -1, -1, -1, 2571, -1, -1, 2588, 2581, 2578, 2577, -1, -1, 2580, -1, -1, 2585, 2584, -1, -1, 2587, -1, -1, 2590, -1, 2594, 2593, -1, -1, -1, 2623, 2610, 2603, 2602, 2601, -1, -1, -1, 2607, 2606, -1, -1, 2609, -1, -1, 2616, 2615, 2614, -1, -1, -1, 2620, 2619, -1, -1, 2622, -1, -1, 2625, -1, 2631, 2628, -1, 2630, -1, -1, 2633, -1, 2635, -1, -1, 2672, 2651, 2648, 2647, 2642, -1, 2644, -1, 2646, -1, -1, -1, 2650, -1, -1, 2659, 2654, -1, 2656, -1, 2658, -1, -1, 2669, 2662, -1, 2666, 2665, -1, -1, 2668, -1, -1, 2671, -1, -1, 2676, 2675, -1, -1, -1, 2757, 2724, 2693, 2686, 2683, -1, 2685, -1, -1, 2692, 2691, 2690, -1, -1, -1, -1, 2701, 2700, 2697, -1, 2699, -1, -1, -1, 2713, 2710, 2707, 2706, -1, -1, 2709, -1, -1, 2712, -1, -1, 2721, 2718, 2717, -1, -1, 2720, -1, -1, 2723, -1, -1, 2726, -1, 2740, 2739, 2736, 2733, 2732, -1, -1, 2735, -1, -1, 2738, -1, -1, -1, 2748, 2747, 2746, 2745, -1, -1, -1, -1, 2750, -1, 2754, 2753, -1, -1, 2756, -1, -1, 2815, 2780, 2761, -1, 2769, 2764, -1, 2766, -1, 2768, -1, -1, 2775, 2774, 2773, -1, -1, -1, 2779, 2778, -1, -1, -1, 2808, 2795, 2788, 2785, -1, 2787, -1, -1, 2792, 2791, -1, -1, 2794, -1, -1, 2801, 2798, -1, 2800, -1, -1, 2805, 2804, -1, -1, 2807, -1, -1, 2810, -1, 2812, -1, 2814, -1, -1, 2843, 2832, 2825, 2824, 2823, 2822, -1, -1, -1, -1, 2829, 2828, -1, -1, 2831, -1, -1, 2840, 2835, -1, 2837, -1, 2839, -1, -1, 2842, -1, -1, 2849, 2846, -1, 2848, -1, -1, -1, 2872, 2871, 2854, -1, 2856, -1, 2862, 2859, -1, 2861, -1, -1, 2868, 2867, 2866, -1, -1, -1, 2870, -1, -1, -1, 2910, 2887, 2876, -1, 2882, 2879, -1, 2881, -1, -1, 2886, 2885, -1, -1, -1, 2909, 2904, 2897, 2894, 2893, -1, -1, 2896, -1, -1, 2901, 2900, -1, -1, 2903, -1, -1, 2906, -1, 2908, -1, -1, -1, 2914, 2913, -1, -1, 2916, -1, 2918, -1, -1, 2957, 2946, 2943, 2930, 2929, 2928, 2927, -1, -1, -1, -1, 2934, 2933, -1, -1, 2940, 2939, 2938, -1, -1, -1, 2942, -1, -1, 2945, -1, -1, 2952, 2949, -1, 2951, -1, -1, 2956, 2955, -1, -1, -1, 2967, 2960, -1, 2964, 2963, -1, -1, 2966, -1, -1, 2989, 2974, 2973, 2972, -1, -1, -1, 2982, 2977, -1, 2979, -1, 2981, -1, -1, 2988, 2987, 2986, -1, -1, -1, -1, 3015, 3006, 2999, 2996, 2995, -1, -1, 2998, -1, -1, 3003, 3002, -1, -1, 3005, -1, -1, 3012, 3011, 3010, -1, -1, -1, 3014, -1, -1, 3017, -1, 3025, 3022, 3021, -1, -1, 3024, -1, -1, 3029, 3028, -1, -1, 3031, -1, -1, 3048, 3041, 3038, 3037, -1, -1, 3040, -1, -1, 3043, -1, 3045, -1, 3047, -1, -1, 3054, 3053, 3052, -1, -1, -1, 3076, 3073, 3064, 3059, -1, 3061, -1, 3063, -1, -1, 3070, 3069, 3068, -1, -1, -1, 3072, -1, -1, 3075, -1, -1, 3104, 3091, 3086, 3083, 3082, -1, -1, 3085, -1, -1, 3090, 3089, -1, -1, -1, 3097, 3096, 3095, -1, -1, -1, 3101, 3100, -1, -1, 3103, -1, -1, 3112, 3109, 3108, -1, -1, 3111, -1, -1, 3120, 3117, 3116, -1, -1, 3119, -1, -1, 3122, -1, 3124, -1, -1, 3241, 3192, 3147, 3138, 3131, -1, 3133, -1, 3135, -1, 3137, -1, -1, 3140, -1, 3142, -1, 3146, 3145, -1, -1, -1, 3171, 3160, 3157, 3154, 3153, -1, -1, 3156, -1, -1, 3159, -1, -1, 3168, 3165, 3164, -1, -1, 3167, -1, -1, 3170, -1, -1, 3187, 3180, 3177, 3176, -1, -1, 3179, -1, -1, 3184, 3183, -1, -1, 3186, -1, -1, 3189, -1, 3191, -1, -1, 3236, 3223, 3210, 3203, 3200, 3199, -1, -1, 3202, -1, -1, 3207, 3206, -1, -1, 3209, -1, -1, 3218, 3215, 3214, -1, -1, 3217, -1, -1, 3222, 3221, -1, -1, -1, 3227, 3226, -1, -1, 3233, 3230, -1, 3232, -1, -1, 3235, -1, -1, 3240, 3239, -1, -1, -1, 3253, 3250, 3245, -1, 3249, 3248, -1, -1, -1, 3252, -1, -1, 3255, -1, -1, 3346, 3285, 3284, 3281, 3268, 3263, -1, 3265, -1, 3267, -1, -1, 3276, 3273, 3272, -1, -1, 3275, -1, -1, 3278, -1, 3280, -1, -1, 3283, -1, -1, -1, 3329, 3310, 3297, 3290, -1, 3294, 3293, -1, -1, 3296, -1, -1, 3305, 3302, 3301, -1, -1, 3304, -1, -1, 3309, 3308, -1, -1, -1, 3326, 3319, 3316, 3315, -1, -1, 3318, -1, -1, 3323, 3322, -1, -1, 3325, -1, -1, 3328, -1, -1, 3337, 3336, 3333, -1, 3335, -1, -1, -1, 3345, 3344, 3343, 3342, -1, -1, -1, -1, -1, 3348, -1, 3354, 3353, 3352, -1, -1, -1, -1, 3419, 3376, 3361, 3360, -1, -1, 3375, 3364, -1, 3370, 3367, -1, 3369, -1, -1, 3372, -1, 3374, -1, -1, -1, 3390, 3379, -1, 3389, 3386, 3385, 3384, -1, -1, -1, 3388, -1, -1, -1, 3404, 3403, 3398, 3397, 3396, -1, -1, -1, 3402, 3401, -1, -1, -1, -1, 3412, 3411, 3408, -1, 3410, -1, -1, -1, 3414, -1, 3416, -1, 3418, -1, -1, 3451, 3424, 3423, -1, -1, 3428, 3427, -1, -1, 3438, 3437, 3434, 3433, -1, -1, 3436, -1, -1, -1, 3444, 3443, 3442, -1, -1, -1, 3448, 3447, -1, -1, 3450, -1, -1, 3493, 3482, 3469, 3462, 3459, 3458, -1, -1, 3461, -1, -1, 3466, 3465, -1, -1, 3468, -1, -1, 3477, 3474, 3473, -1, -1, 3476, -1, -1, 3481, 3480, -1, -1, -1, 3492, 3489, 3486, -1, 3488, -1, -1, 3491, -1, -1, -1, 3507, 3496, -1, 3500, 3499, -1, -1, 3504, 3503, -1, -1, 3506, -1, -1, 3523, 3516, 3513, 3512, -1, -1, 3515, -1, -1, 3520, 3519, -1, -1, 3522, -1, -1, 3531, 3528, 3527, -1, -1, 3530, -1, -1, -1, 3616, 3597, 3548, 3547, 3544, 3539, -1, 3541, -1, 3543, -1, -1, 3546, -1, -1, -1, 3568, 3557, 3552, -1, 3556, 3555, -1, -1, -1, 3565, 3562, 3561, -1, -1, 3564, -1, -1, 3567, -1, -1, 3582, 3575, 3572, -1, 3574, -1, -1, 3579, 3578, -1, -1, 3581, -1, -1, 3590, 3587, 3586, -1, -1, 3589, -1, -1, 3594, 3593, -1, -1, 3596, -1, -1, 3599, -1, 3609, 3602, -1, 3604, -1, 3608, 3607, -1, -1, -1, 3615, 3614, 3613, -1, -1, -1, -1, 3648, 3625, 3622, 3621, -1, -1, 3624, -1, -1, 3633, 3632, 3631, 3630, -1, -1, -1, -1, 3647, 3642, 3639, 3638, -1, -1, 3641, -1, -1, 3646, 3645, -1, -1, -1, -1, 3654, 3653, 3652, -1, -1, -1, 3656, -1, -1, 3715, 3712, 3691, 3680, 3671, 3670, 3667, 3666, -1, -1, 3669, -1, -1, -1, 3677, 3674, -1, 3676, -1, -1, 3679, -1, -1, 3690, 3689, 3686, 3685, -1, -1, 3688, -1, -1, -1, -1, 3711, 3696, 3695, -1, -1, 3704, 3701, 3700, -1, -1, 3703, -1, -1, 3708, 3707, -1, -1, 3710, -1, -1, -1, 3714, -1, -1, -1, 3800, 3719, -1, 3767, 3742, 3729, 3724, -1, 3726, -1, 3728, -1, -1, 3735, 3734, 3733, -1, -1, -1, 3739, 3738, -1, -1, 3741, -1, -1, 3756, 3751, 3748, 3747, -1, -1, 3750, -1, -1, 3755, 3754, -1, -1, -1, 3760, 3759, -1, -1, 3764, 3763, -1, -1, 3766, -1, -1, 3775, 3772, 3771, -1, -1, 3774, -1, -1, 3791, 3784, 3781, 3780, -1, -1, 3783, -1, -1, 3788, 3787, -1, -1, 3790, -1, -1, 3799, 3796, 3795, -1, -1, 3798, -1, -1, -1, 3810, 3809, 3808, 3807, 3806, -1, -1, -1, -1, -1, 3822, 3821, 3820, 3819, 3818, 3817, -1, -1, -1, -1, -1, -1, 3824, -1, 3826, -1, 3828, -1, 3830, -1, -1, 3835, 3834, -1, -1, 3885, 3872, 3851, 3842, 3841, -1, -1, 3846, 3845, -1, -1, 3848, -1, 3850, -1, -1, 3859, 3858, 3857, 3856, -1, -1, -1, -1, 3865, 3864, 3863, -1, -1, -1, 3869, 3868, -1, -1, 3871, -1, -1, 3884, 3879, 3876, -1, 3878, -1, -1, 3883, 3882, -1, -1, -1, -1, 3901, 3894, 3891, 3890, -1, -1, 3893, -1, -1, 3896, -1, 3900, 3899, -1, -1, -1, 3911, 3906, 3905, -1, -1, 3910, 3909, -1, -1, -1, -1, 4042, 4005, 3960, 3935, 3922, 3921, 3920, -1, -1, -1, 3930, 3927, 3926, -1, -1, 3929, -1, -1, 3934, 3933, -1, -1, -1, 3949, 3942, 3939, -1, 3941, -1, -1, 3946, 3945, -1, -1, 3948, -1, -1, 3953, 3952, -1, -1, 3957, 3956, -1, -1, 3959, -1, -1, 3988, 3975, 3968, 3965, -1, 3967, -1, -1, 3972, 3971, -1, -1, 3974, -1, -1, 3981, 3980, 3979, -1, -1, -1, 3985, 3984, -1, -1, 3987, -1, -1, 3998, 3993, 3992, -1, -1, 3997, 3996, -1, -1, -1, 4004, 4003, 4002, -1, -1, -1, -1, 4031, 4030, 4021, 4016, 4013, 4012, -1, -1, 4015, -1, -1, 4018, -1, 4020, -1, -1, 4029, 4026, 4025, -1, -1, 4028, -1, -1, -1, -1, 4033, -1, 4037, 4036, -1, -1, 4039, -1, 4041, -1, -1, 4046, 4045, -1, -1, 4054, 4051, 4050, -1, -1, 4053, -1, -1, -1, 4135, 4102, 4075, 4072, 4069, 4062, -1, 4066, 4065, -1, -1, 4068, -1, -1, 4071, -1, -1, 4074, -1, -1, 4079, 4078, -1, -1, 4087, 4082, -1, 4086, 4085, -1, -1, -1, 4095, 4092, 4091, -1, -1, 4094, -1, -1, 4099, 4098, -1, -1, 4101, -1, -1, 4104, -1, 4122, 4113, 4112, 4111, 4110, -1, -1, -1, -1, 4121, 4118, 4117, -1, -1, 4120, -1, -1, -1, 4134, 4127, 4126, -1, -1, 4131, 4130, -1, -1, 4133, -1, -1, -1, 4181, 4178, 4155, 4144, 4141, -1, 4143, -1, -1, 4150, 4149, 4148, -1, -1, -1, 4154, 4153, -1, -1, -1, 4167, 4162, 4159, -1, 4161, -1, -1, 4166, 4165, -1, -1, -1, 4175, 4172, 4171, -1, -1, 4174, -1, -1, 4177, -1, -1, 4180, -1, -1, 4207, 4200, 4199, 4192, 4189, 4188, -1, -1, 4191, -1, -1, 4196, 4195, -1, -1, 4198, -1, -1, -1, 4202, -1, 4206, 4205, -1, -1, -1, -1, 4286, 4243, 4238, 4233, 4220, 4215, -1, 4219, 4218, -1, -1, -1, 4228, 4225, 4224, -1, -1, 4227, -1, -1, 4230, -1, 4232, -1, -1, 4237, 4236, -1, -1, -1, 4240, -1, 4242, -1, -1, 4261, 4256, 4251, 4248, -1, 4250, -1, -1, 4255, 4254, -1, -1, -1, 4260, 4259, -1, -1, -1, 4283, 4272, 4269, 4266, -1, 4268, -1, -1, 4271, -1, -1, 4280, 4277, 4276, -1, -1, 4279, -1, -1, 4282, -1, -1, 4285, -1, -1, 4346, 4293, 4290, -1, 4292, -1, -1, 4323, 4310, 4303, 4300, 4299, -1, -1, 4302, -1, -1, 4307, 4306, -1, -1, 4309, -1, -1, 4318, 4315, 4314, -1, -1, 4317, -1, -1, 4322, 4321, -1, -1, -1, 4339, 4332, 4329, 4328, -1, -1, 4331, -1, -1, 4336, 4335, -1, -1, 4338, -1, -1, 4341, -1, 4343, -1, 4345, -1, -1, 4354, 4353, 4352, 4351, -1, -1, -1, -1, 4360, 4359, 4358, -1, -1, -1, 4372, 4365, 4364, -1, -1, 4369, 4368, -1, -1, 4371, -1, -1, 4374, -1, -1, 4471, 4452, 4425, 4398, 4395, 4388, 4385, 4384, -1, -1, 4387, -1, -1, 4392, 4391, -1, -1, 4394, -1, -1, 4397, -1, -1, 4412, 4405, 4402, -1, 4404, -1, -1, 4409, 4408, -1, -1, 4411, -1, -1, 4418, 4415, -1, 4417, -1, -1, 4422, 4421, -1, -1, 4424, -1, -1, 4433, 4432, 4429, -1, 4431, -1, -1, -1, 4443, 4438, 4437, -1, -1, 4442, 4441, -1, -1, -1, 4449, 4448, 4447, -1, -1, -1, 4451, -1, -1, 4458, 4455, -1, 4457, -1, -1, 4468, 4465, 4464, 4463, -1, -1, -1, 4467, -1, -1, 4470, -1, -1, 4501, 4496, 4477, 4476, -1, -1, 4483, 4480, -1, 4482, -1, -1, 4491, 4488, 4487, -1, -1, 4490, -1, -1, 4493, -1, 4495, -1, -1, 4500, 4499, -1, -1, -1, 4539, 4518, 4517, 4512, 4509, 4508, -1, -1, 4511, -1, -1, 4516, 4515, -1, -1, -1, -1, 4526, 4525, 4524, 4523, -1, -1, -1, -1, 4532, 4529, -1, 4531, -1, -1, 4536, 4535, -1, -1, 4538, -1, -1, -1, 4558, 4557, 4544, -1, 4556, 4553, 4548, -1, 4552, 4551, -1, -1, -1, 4555, -1, -1, -1, -1, 4628, 4609, 4584, 4575, 4570, 4567, 4566, -1, -1, 4569, -1, -1, 4572, -1, 4574, -1, -1, 4581, 4580, 4579, -1, -1, -1, 4583, -1, -1, 4600, 4593, 4590, 4589, -1, -1, 4592, -1, -1, 4597, 4596, -1, -1, 4599, -1, -1, 4602, -1, 4606, 4605, -1, -1, 4608, -1, -1, 4615, 4614, 4613, -1, -1, -1, 4625, 4618, -1, 4622, 4621, -1, -1, 4624, -1, -1, 4627, -1, -1, 4654, 4637, 4634, 4633, -1, -1, 4636, -1, -1, 4645, 4644, 4641, -1, 4643, -1, -1, -1, 4653, 4650, 4649, -1, -1, 4652, -1, -1, -1, 4656, -1, 4658, -1, 4662, 4661, -1, -1, -1, 4747, 4678, 4677, 4676, 4673, 4672, 4671, -1, -1, -1, 4675, -1, -1, -1, -1, 4712, 4707, 4694, 4689, 4686, 4685, -1, -1, 4688, -1, -1, 4691, -1, 4693, -1, -1, 4700, 4697, -1, 4699, -1, -1, 4704, 4703, -1, -1, 4706, -1, -1, 4711, 4710, -1, -1, -1, 4732, 4723, 4716, -1, 4720, 4719, -1, -1, 4722, -1, -1, 4725, -1, 4729, 4728, -1, -1, 4731, -1, -1, 4744, 4739, 4738, 4737, -1, -1, -1, 4743, 4742, -1, -1, -1, 4746, -1, -1, 4749, -1, 4763, 4752, -1, 4762, 4757, 4756, -1, -1, 4761, 4760, -1, -1, -1, -1, 4775, 4766, -1, 4768, -1, 4772, 4771, -1, -1, 4774, -1, -1, 4777, -1, 4785, 4782, 4781, -1, -1, 4784, -1, -1, 4789, 4788, -1, -1, 4791, -1, -1, 4906, 4891, 4834, 4811, 4798, -1, 4804, 4803, 4802, -1, -1, -1, 4808, 4807, -1, -1, 4810, -1, -1, 4821, 4816, 4815, -1, -1, 4818, -1, 4820, -1, -1, 4829, 4826, 4825, -1, -1, 4828, -1, -1, 4831, -1, 4833, -1, -1, 4866, 4851, 4844, 4841, 4840, -1, -1, 4843, -1, -1, 4848, 4847, -1, -1, 4850, -1, -1, 4859, 4856, 4855, -1, -1, 4858, -1, -1, 4863, 4862, -1, -1, 4865, -1, -1, 4880, 4875, 4872, 4871, -1, -1, 4874, -1, -1, 4879, 4878, -1, -1, -1, 4888, 4885, 4884, -1, -1, 4887, -1, -1, 4890, -1, -1, 4899, 4898, 4897, 4896, -1, -1, -1, -1, 4903, 4902, -1, -1, 4905, -1, -1, 4912, 4911, 4910, -1, -1, -1, 4932, 4925, 4920, 4917, -1, 4919, -1, -1, 4922, -1, 4924, -1, -1, 4929, 4928, -1, -1, 4931, -1, -1, 4938, 4937, 4936, -1, -1, -1, 4940, -1, -1, 5019, 4976, 4975, 4960, 4947, -1, 4953, 4950, -1, 4952, -1, -1, 4957, 4956, -1, -1, 4959, -1, -1, 4972, 4967, 4966, 4965, -1, -1, -1, 4969, -1, 4971, -1, -1, 4974, -1, -1, -1, 5010, 4993, 4984, 4981, -1, 4983, -1, -1, 4986, -1, 4990, 4989, -1, -1, 4992, -1, -1, 5001, 4996, -1, 4998, -1, 5000, -1, -1, 5003, -1, 5007, 5006, -1, -1, 5009, -1, -1, 5016, 5013, -1, 5015, -1, -1, 5018, -1, -1, 5067, 5060, 5033, 5024, -1, 5026, -1, 5030, 5029, -1, -1, 5032, -1, -1, 5047, 5040, 5037, -1, 5039, -1, -1, 5044, 5043, -1, -1, 5046, -1, -1, 5053, 5052, 5051, -1, -1, -1, 5057, 5056, -1, -1, 5059, -1, -1, 5066, 5063, -1, 5065, -1, -1, -1, 5079, 5078, 5077, 5072, -1, 5076, 5075, -1, -1, -1, -1, -1, 5081, -1, -1, 5084, -1, 5156, 5121, 5110, 5103, 5096, 5093, 5092, -1, -1, 5095, -1, -1, 5100, 5099, -1, -1, 5102, -1, -1, 5107, 5106, -1, -1, 5109, -1, -1, 5112, -1, 5114, -1, 5118, 5117, -1, -1, 5120, -1, -1, 5139, 5132, 5129, 5126, -1, 5128, -1, -1, 5131, -1, -1, 5138, 5135, -1, 5137, -1, -1, -1, 5147, 5142, -1, 5146, 5145, -1, -1, -1, 5149, -1, 5153, 5152, -1, -1, 5155, -1, -1, 5184, 5161, 5160, -1, -1, 5169, 5168, 5165, -1, 5167, -1, -1, -1, 5177, 5174, 5173, -1, -1, 5176, -1, -1, 5181, 5180, -1, -1, 5183, -1, -1, -1, 5249, 5246, 5237, 5214, 5205, 5198, 5195, 5194, -1, -1, 5197, -1, -1, 5202, 5201, -1, -1, 5204, -1, -1, 5209, 5208, -1, -1, 5211, -1, 5213, -1, -1, 5224, 5221, 5218, -1, 5220, -1, -1, 5223, -1, -1, 5232, 5229, 5228, -1, -1, 5231, -1, -1, 5234, -1, 5236, -1, -1, 5241, 5240, -1, -1, 5245, 5244, -1, -1, -1, 5248, -1, -1, 5267, 5266, 5263, 5254, -1, 5260, 5259, 5258, -1, -1, -1, 5262, -1, -1, 5265, -1, -1, -1, 5283, 5280, 5273, 5272, -1, -1, 5279, 5276, -1, 5278, -1, -1, -1, 5282, -1, -1, 5305, 5300, 5293, 5290, 5289, -1, -1, 5292, -1, -1, 5297, 5296, -1, -1, 5299, -1, -1, 5304, 5303, -1, -1, -1, 5317, 5312, 5311, 5310, -1, -1, -1, 5316, 5315, -1, -1, -1, 5325, 5322, 5321, -1, -1, 5324, -1, -1, 5327, -1, -1, 5426, 5425, 5382, 5355, 5348, 5341, 5338, 5337, -1, -1, 5340, -1, -1, 5345, 5344, -1, -1, 5347, -1, -1, 5354, 5353, 5352, -1, -1, -1, -1, 5369, 5362, 5359, -1, 5361, -1, -1, 5366, 5365, -1, -1, 5368, -1, -1, 5375, 5372, -1, 5374, -1, -1, 5379, 5378, -1, -1, 5381, -1, -1, 5402, 5393, 5386, -1, 5390, 5389, -1, -1, 5392, -1, -1, 5399, 5396, -1, 5398, -1, -1, 5401, -1, -1, 5416, 5411, 5408, 5407, -1, -1, 5410, -1, -1, 5415, 5414, -1, -1, -1, 5418, -1, 5422, 5421, -1, -1, 5424, -1, -1, -1, 5480, 5457, 5436, 5431, -1, 5433, -1, 5435, -1, -1, 5448, 5443, 5442, 5441, -1, -1, -1, 5447, 5446, -1, -1, -1, 5454, 5453, 5452, -1, -1, -1, 5456, -1, -1, 5479, 5470, 5465, 5464, 5463, -1, -1, -1, 5469, 5468, -1, -1, -1, 5476, 5475, 5474, -1, -1, -1, 5478, -1, -1, -1, 5508, 5503, 5490, 5485, -1, 5489, 5488, -1, -1, -1, 5496, 5495, 5494, -1, -1, -1, 5500, 5499, -1, -1, 5502, -1, -1, 5507, 5506, -1, -1, -1, 5524, 5523, 5516, 5515, 5514, -1, -1, -1, 5520, 5519, -1, -1, 5522, -1, -1, -1, 5526, -1, 5528, -1, -1, 5643, 5580, 5533, -1, 5561, 5548, 5541, 5540, 5539, -1, -1, -1, 5545, 5544, -1, -1, 5547, -1, -1, 5556, 5553, 5552, -1, -1, 5555, -1, -1, 5560, 5559, -1, -1, -1, 5569, 5564, -1, 5568, 5567, -1, -1, -1, 5575, 5572, -1, 5574, -1, -1, 5579, 5578, -1, -1, -1, 5610, 5595, 5586, 5585, -1, -1, 5592, 5589, -1, 5591, -1, -1, 5594, -1, -1, 5599, 5598, -1, -1, 5607, 5604, 5603, -1, -1, 5606, -1, -1, 5609, -1, -1, 5638, 5625, 5620, 5617, 5616, -1, -1, 5619, -1, -1, 5622, -1, 5624, -1, -1, 5633, 5630, 5629, -1, -1, 5632, -1, -1, 5635, -1, 5637, -1, -1, 5640, -1, 5642, -1, -1, -1, 5772, 5713, 5686, 5667, 5652, 5651, -1, -1, 5660, 5657, 5656, -1, -1, 5659, -1, -1, 5664, 5663, -1, -1, 5666, -1, -1, 5677, 5670, -1, 5674, 5673, -1, -1, 5676, -1, -1, 5683, 5680, -1, 5682, -1, -1, 5685, -1, -1, 5710, 5695, 5690, -1, 5692, -1, 5694, -1, -1, 5703, 5700, 5699, -1, -1, 5702, -1, -1, 5707, 5706, -1, -1, 5709, -1, -1, 5712, -1, -1, 5759, 5734, 5729, 5724, 5721, 5720, -1, -1, 5723, -1, -1, 5726, -1, 5728, -1, -1, 5731, -1, 5733, -1, -1, 5748, 5741, 5740, 5739, -1, -1, -1, 5745, 5744, -1, -1, 5747, -1, -1, 5752, 5751, -1, -1, 5756, 5755, -1, -1, 5758, -1, -1, 5769, 5764, 5763, -1, -1, 5766, -1, 5768, -1, -1, 5771, -1, -1, -1, 5893, 5824, 5793, 5790, 5779, -1, 5785, 5782, -1, 5784, -1, -1, 5787, -1, 5789, -1, -1, 5792, -1, -1, 5799, 5798, 5797, -1, -1, -1, 5809, 5802, -1, 5806, 5805, -1, -1, 5808, -1, -1, 5817, 5814, 5813, -1, -1, 5816, -1, -1, 5821, 5820, -1, -1, 5823, -1, -1, 5858, 5847, 5834, 5829, -1, 5831, -1, 5833, -1, -1, 5840, 5837, -1, 5839, -1, -1, 5844, 5843, -1, -1, 5846, -1, -1, 5853, 5850, -1, 5852, -1, -1, 5857, 5856, -1, -1, -1, 5880, 5867, 5866, 5865, 5864, -1, -1, -1, -1, 5873, 5870, -1, 5872, -1, -1, 5877, 5876, -1, -1, 5879, -1, -1, 5890, 5885, 5884, -1, -1, 5889, 5888, -1, -1, -1, 5892, -1, -1, 5913, 5904, 5901, 5898, -1, 5900, -1, -1, 5903, -1, -1, 5906, -1, 5910, 5909, -1, -1, 5912, -1, -1, 5919, 5916, -1, 5918, -1, -1, 5921, -1, -1, 5938, 5935, 5932, 5927, -1, 5931, 5930, -1, -1, -1, 5934, -1, -1, 5937, -1, -1, 5992, 5957, 5944, 5943, -1, -1, 5954, 5951, 5950, 5949, -1, -1, -1, 5953, -1, -1, 5956, -1, -1, 5981, 5970, 5965, 5964, 5963, -1, -1, -1, 5969, 5968, -1, -1, -1, 5974, 5973, -1, -1, 5978, 5977, -1, -1, 5980, -1, -1, 5991, 5986, 5985, -1, -1, 5990, 5989, -1, -1, -1, -1, 6044, 6021, 6006, 6001, 5998, -1, 6000, -1, -1, 6005, 6004, -1, -1, -1, 6014, 6011, 6010, -1, -1, 6013, -1, -1, 6018, 6017, -1, -1, 6020, -1, -1, 6035, 6028, 6025, -1, 6027, -1, -1, 6032, 6031, -1, -1, 6034, -1, -1, 6039, 6038, -1, -1, 6041, -1, 6043, -1, -1, 6046, -1, 6048, -1, 6056, 6053, 6052, -1, -1, 6055, -1, -1, 6060, 6059, -1, -1, 6062, -1, -1, 6069, 6066, -1, 6068, -1, -1, 6141, 6100, 6099, 6084, 6079, 6078, 6077, -1, -1, -1, 6081, -1, 6083, -1, -1, 6092, 6089, 6088, -1, -1, 6091, -1, -1, 6096, 6095, -1, -1, 6098, -1, -1, -1, 6124, 6111, 6106, 6105, -1, -1, 6108, -1, 6110, -1, -1, 6119, 6116, 6115, -1, -1, 6118, -1, -1, 6121, -1, 6123, -1, -1, 6134, 6127, -1, 6131, 6130, -1, -1, 6133, -1, -1, 6140, 6137, -1, 6139, -1, -1, -1, 6173, 6156, 6145, -1, 6151, 6148, -1, 6150, -1, -1, 6153, -1, 6155, -1, -1, 6158, -1, 6166, 6163, 6162, -1, -1, 6165, -1, -1, 6170, 6169, -1, -1, 6172, -1, -1, 6187, 6176, -1, 6182, 6179, -1, 6181, -1, -1, 6184, -1, 6186, -1, -1, 6197, 6192, 6191, -1, -1, 6196, 6195, -1, -1, -1, 6203, 6200, -1, 6202, -1, -1, 6207, 6206, -1, -1, -1, 6224, 6223, 6212, -1, 6222, 6221, 6220, 6217, -1, 6219, -1, -1, -1, -1, -1, -1, 6250, 6245, 6240, 6239, 6236, 6233, 6232, -1, -1, 6235, -1, -1, 6238, -1, -1, -1, 6242, -1, 6244, -1, -1, 6249, 6248, -1, -1, -1, 6270, 6253, -1, 6267, 6262, 6259, 6258, -1, -1, 6261, -1, -1, 6266, 6265, -1, -1, -1, 6269, -1, -1, 6292, 6279, 6274, -1, 6278, 6277, -1, -1, -1, 6285, 6284, 6283, -1, -1, -1, 6289, 6288, -1, -1, 6291, -1, -1, 6294, -1, 6300, 6299, 6298, -1, -1, -1, -1, 6371, 6356, 6345, 6320, 6307, -1, 6313, 6312, 6311, -1, -1, -1, 6317, 6316, -1, -1, 6319, -1, -1, 6330, 6323, -1, 6327, 6326, -1, -1, 6329, -1, -1, 6338, 6335, 6334, -1, -1, 6337, -1, -1, 6342, 6341, -1, -1, 6344, -1, -1, 6347, -1, 6355, 6350, -1, 6352, -1, 6354, -1, -1, -1, 6366, 6359, -1, 6365, 6362, -1, 6364, -1, -1, -1, 6370, 6369, -1, -1, -1, 6425, 6422, 6395, 6390, 6383, 6380, 6379, -1, -1, 6382, -1, -1, 6387, 6386, -1, -1, 6389, -1, -1, 6394, 6393, -1, -1, -1, 6409, 6404, 6401, 6400, -1, -1, 6403, -1, -1, 6408, 6407, -1, -1, -1, 6415, 6412, -1, 6414, -1, -1, 6419, 6418, -1, -1, 6421, -1, -1, 6424, -1, -1, 6427, -1, 6429, -1, -1};
 /* samples per node (int) for c(n) correction at leaves) */
 static const int16_t node_samples[NUM_NODES] = {256, 153, 119, 7, 3, 1, 2, 1, 1, 4, 2, 1, 1, 2, 1, 1, 112, 49, 11, 10, 5, 1, 4, 5, 1, 4, 1, 38, 18, 1, 17, 16, 1, 20, 11, 10, 1, 9, 5, 4, 63, 37, 31, 11, 6, 5, 20, 19, 1, 6, 3, 1, 2, 3, 1, 2, 26, 23, 4, 1, 3, 19, 15, 4, 3, 2, 1, 1, 1, 34, 14, 3, 2, 1, 1, 1, 11, 8, 2, 1, 1, 6, 1, 5, 3, 2, 3, 2, 1, 1, 1, 20, 13, 12, 1, 11, 5, 4, 1, 6, 3, 3, 1, 7, 4, 1, 3, 2, 1, 1, 1, 3, 2, 1, 1, 1, 103, 57, 21, 11, 8, 5, 4, 1, 3, 1, 3, 2, 1, 1, 1, 3, 2, 1, 1, 1, 10, 7, 1, 6, 5, 4, 1, 1, 3, 2, 1, 1, 1, 36, 1, 35, 15, 11, 3, 1, 2, 8, 1, 7, 4, 1, 3, 1, 2, 20, 13, 12, 10, 2, 1, 7, 5, 1, 4, 2, 1, 1, 46, 36, 21, 1, 20, 17, 15, 10, 5, 2, 1, 1, 3, 2, 1, 1, 1, 15, 2, 1, 1, 13, 11, 4, 1, 3, 7, 2, 5, 2, 1, 1, 10, 8, 6, 5, 4, 2, 2, 1, 1, 2, 1, 1, 2, 1, 1, 256, 162, 26, 6, 3, 1, 2, 1, 1, 3, 1, 2, 1, 1, 20, 13, 5, 2, 1, 1, 3, 2, 1, 1, 1, 8, 3, 1, 2, 1, 1, 5, 4, 3, 1, 1, 7, 6, 5, 1, 4, 2, 2, 1, 1, 136, 1, 135, 20, 3, 1, 2, 1, 1, 17, 15, 14, 4, 10, 1, 2, 1, 1, 115, 94, 67, 52, 4, 48, 15, 1, 14, 27, 7, 1, 6, 20, 19, 1, 21, 14, 13, 9, 4, 1, 7, 6, 3, 3, 1, 94, 93, 90, 81, 80, 37, 3, 1, 2, 34, 6, 28, 43, 39, 28, 11, 4, 2, 2, 1, 9, 8, 3, 2, 1, 1, 1, 5, 3, 1, 2, 2, 1, 1, 1, 3, 1, 2, 1, 1, 1, 256, 153, 1, 152, 5, 2, 1, 1, 3, 1, 2, 1, 1, 147, 2, 1, 1, 145, 1, 144, 56, 1, 55, 4, 51, 88, 36, 26, 10, 52, 10, 42, 103, 18, 9, 8, 1, 7, 5, 3, 1, 2, 2, 1, 1, 2, 1, 1, 1, 9, 2, 1, 1, 7, 1, 6, 4, 3, 1, 2, 1, 2, 1, 1, 85, 75, 55, 15, 9, 2, 1, 1, 7, 5, 2, 6, 2, 1, 1, 4, 3, 1, 40, 3, 2, 1, 1, 1, 37, 20, 13, 7, 17, 13, 4, 20, 19, 18, 13, 7, 6, 5, 4, 1, 1, 1, 10, 8, 6, 3, 2, 1, 1, 1, 3, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1, 256, 33, 4, 1, 3, 1, 2, 1, 1, 29, 28, 1, 27, 17, 14, 5, 2, 3, 9, 8, 1, 3, 1, 2, 1, 1, 10, 9, 7, 2, 5, 2, 1, 1, 1, 1, 223, 222, 88, 45, 43, 6, 2, 1, 1, 4, 3, 1, 37, 35, 19, 16, 2, 1, 1, 2, 1, 1, 43, 31, 27, 13, 1, 12, 14, 11, 3, 4, 2, 1, 1, 2, 1, 1, 12, 1, 11, 3, 1, 2, 8, 2, 6, 134, 104, 103, 1, 102, 58, 19, 39, 44, 37, 7, 1, 30, 10, 4, 3, 2, 1, 1, 6, 1, 5, 4, 1, 20, 17, 2, 1, 1, 15, 6, 9, 3, 1, 2, 1, 1, 1, 256, 34, 30, 2, 1, 1, 28, 17, 16, 4, 1, 3, 1, 2, 12, 3, 2, 1, 9, 1, 8, 1, 11, 9, 3, 2, 1, 1, 1, 6, 4, 1, 3, 2, 1, 1, 2, 1, 1, 4, 3, 1, 2, 1, 1, 1, 222, 198, 146, 64, 27, 7, 6, 3, 3, 1, 20, 19, 18, 1, 1, 37, 10, 7, 6, 1, 3, 2, 1, 27, 19, 13, 6, 8, 7, 1, 82, 66, 7, 4, 1, 3, 3, 1, 2, 59, 1, 58, 6, 52, 16, 14, 1, 13, 11, 2, 2, 1, 1, 52, 49, 47, 46, 2, 1, 1, 44, 6, 38, 1, 2, 1, 1, 3, 2, 1, 1, 1, 24, 15, 7, 3, 1, 2, 1, 1, 4, 3, 1, 2, 1, 1, 1, 8, 2, 1, 1, 6, 5, 4, 1, 3, 1, 1, 9, 6, 5, 2, 1, 1, 3, 1, 2, 1, 1, 1, 3, 2, 1, 1, 1, 256, 243, 6, 4, 3, 1, 2, 1, 1, 1, 2, 1, 1, 237, 236, 170, 152, 6, 2, 1, 1, 4, 2, 2, 146, 8, 3, 5, 138, 87, 51, 18, 17, 16, 12, 4, 1, 1, 66, 8, 6, 5, 4, 1, 1, 2, 1, 1, 58, 40, 39, 15, 24, 1, 18, 15, 13, 2, 3, 2, 1, 1, 13, 7, 4, 3, 2, 1, 1, 1, 1, 3, 1, 2, 1, 1, 6, 5, 4, 2, 1, 1, 2, 1, 1, 1, 1, 256, 5, 4, 1, 3, 1, 2, 1, 1, 1, 251, 247, 3, 1, 2, 1, 1, 244, 96, 9, 4, 1, 3, 1, 2, 5, 3, 2, 1, 2, 1, 1, 87, 35, 25, 17, 8, 10, 8, 2, 52, 38, 2, 36, 14, 13, 1, 148, 1, 147, 11, 9, 1, 8, 2, 1, 1, 136, 101, 93, 8, 35, 34, 1, 4, 2, 1, 1, 2, 1, 1, 256, 91, 15, 1, 14, 2, 1, 1, 12, 2, 1, 1, 10, 8, 5, 2, 3, 3, 2, 1, 2, 1, 1, 76, 1, 75, 74, 71, 1, 70, 3, 2, 1, 67, 54, 13, 3, 2, 1, 1, 1, 1, 165, 13, 9, 8, 1, 7, 1, 6, 2, 1, 1, 4, 1, 3, 1, 4, 1, 3, 2, 1, 1, 1, 152, 131, 121, 102, 1, 101, 17, 8, 9, 84, 26, 58, 19, 8, 7, 3, 4, 1, 11, 10, 1, 9, 1, 10, 3, 1, 2, 1, 1, 7, 3, 2, 1, 1, 1, 4, 2, 1, 1, 2, 1, 1, 21, 5, 4, 3, 2, 1, 1, 1, 1, 1, 16, 9, 1, 8, 3, 2, 1, 5, 3, 2, 7, 1, 6, 3, 1, 2, 3, 1, 2, 256, 4, 2, 1, 1, 2, 1, 1, 252, 205, 51, 26, 5, 1, 4, 1, 3, 2, 1, 21, 7, 5, 3, 2, 2, 1, 1, 14, 9, 4, 5, 5, 2, 3, 25, 14, 1, 13, 2, 1, 1, 11, 8, 3, 11, 3, 1, 2, 1, 1, 8, 5, 4, 1, 3, 1, 2, 154, 107, 80, 2, 1, 1, 78, 7, 4, 3, 71, 44, 27, 27, 26, 1, 25, 6, 19, 1, 47, 1, 46, 36, 6, 1, 5, 30, 2, 28, 10, 9, 2, 7, 1, 47, 7, 1, 6, 3, 2, 1, 1, 1, 3, 2, 1, 1, 1, 40, 34, 21, 12, 7, 2, 5, 5, 3, 2, 9, 7, 1, 6, 2, 1, 1, 13, 2, 1, 1, 11, 10, 2, 8, 1, 6, 3, 2, 1, 1, 1, 3, 2, 1, 1, 1, 256, 227, 219, 138, 117, 10, 8, 6, 3, 3, 2, 1, 1, 2, 1, 1, 107, 106, 29, 3, 26, 77, 8, 69, 1, 21, 3, 2, 1, 1, 1, 18, 15, 1, 14, 1, 13, 3, 2, 1, 1, 1, 81, 44, 15, 5, 1, 4, 2, 2, 10, 7, 1, 6, 3, 1, 2, 29, 7, 2, 1, 1, 5, 3, 2, 22, 4, 3, 1, 18, 15, 3, 37, 8, 1, 7, 1, 6, 4, 2, 29, 20, 18, 14, 4, 2, 1, 1, 9, 5, 4, 1, 4, 2, 2, 8, 5, 2, 1, 1, 3, 1, 2, 1, 1, 3, 2, 1, 1, 1, 29, 1, 28, 15, 8, 7, 2, 1, 1, 5, 3, 2, 1, 2, 1, 1, 1, 7, 6, 4, 3, 2, 1, 1, 2, 1, 1, 1, 13, 1, 12, 11, 2, 1, 1, 9, 1, 8, 1, 7, 1, 256, 1, 255, 108, 100, 33, 32, 10, 7, 2, 5, 3, 1, 2, 22, 2, 1, 1, 20, 17, 3, 1, 67, 21, 15, 1, 14, 5, 9, 6, 1, 5, 2, 3, 46, 43, 5, 1, 4, 38, 22, 16, 3, 1, 2, 1, 1, 8, 4, 2, 1, 1, 2, 1, 1, 4, 2, 1, 1, 2, 1, 1, 147, 145, 142, 140, 137, 103, 4, 99, 34, 24, 10, 3, 1, 2, 1, 1, 2, 1, 1, 3, 2, 1, 1, 1, 2, 1, 1, 256, 114, 89, 4, 3, 2, 1, 1, 1, 1, 85, 4, 3, 1, 2, 1, 1, 1, 81, 77, 60, 8, 2, 6, 52, 51, 1, 17, 5, 2, 3, 12, 8, 4, 4, 3, 2, 1, 1, 1, 1, 25, 6, 5, 1, 4, 2, 1, 1, 2, 1, 1, 1, 19, 3, 2, 1, 1, 1, 16, 12, 6, 3, 1, 2, 3, 2, 1, 6, 5, 4, 1, 1, 4, 1, 3, 1, 2, 1, 1, 142, 8, 2, 1, 1, 6, 5, 1, 4, 2, 1, 1, 2, 1, 1, 1, 134, 131, 32, 1, 31, 20, 19, 17, 2, 1, 11, 1, 10, 8, 2, 99, 98, 96, 15, 7, 8, 81, 66, 15, 2, 1, 1, 1, 3, 2, 1, 1, 1, 256, 124, 93, 80, 49, 1, 48, 9, 7, 2, 5, 2, 1, 1, 39, 1, 38, 30, 8, 31, 29, 11, 6, 1, 5, 5, 3, 2, 18, 9, 6, 3, 9, 6, 3, 2, 1, 1, 13, 2, 1, 1, 11, 4, 3, 1, 2, 1, 1, 1, 7, 4, 3, 2, 1, 1, 3, 2, 1, 1, 1, 31, 1, 30, 27, 24, 23, 5, 1, 4, 18, 4, 14, 1, 3, 1, 2, 1, 1, 3, 1, 2, 1, 1, 132, 130, 65, 53, 52, 3, 2, 1, 1, 1, 49, 16, 5, 11, 33, 24, 9, 1, 12, 1, 11, 6, 1, 5, 2, 3, 5, 1, 4, 3, 1, 65, 48, 43, 1, 42, 22, 18, 4, 20, 9, 11, 5, 4, 2, 1, 1, 2, 1, 1, 1, 17, 16, 14, 11, 8, 3, 3, 1, 2, 2, 1, 1, 1, 2, 1, 1, 256, 6, 1, 5, 1, 4, 2, 1, 1, 2, 1, 1, 250, 37, 18, 8, 5, 1, 4, 1, 3, 1, 2, 3, 1, 2, 1, 1, 10, 1, 9, 5, 2, 1, 1, 3, 1, 2, 4, 3, 2, 1, 1, 19, 12, 6, 1, 5, 3, 2, 1, 2, 1, 1, 6, 5, 1, 4, 1, 3, 1, 7, 3, 2, 1, 1, 1, 4, 2, 1, 1, 2, 1, 1, 213, 7, 4, 3, 2, 1, 1, 1, 1, 3, 1, 2, 1, 1, 206, 10, 1, 9, 5, 4, 3, 1, 1, 4, 3, 1, 2, 1, 196, 74, 31, 24, 4, 20, 7, 2, 5, 43, 6, 1, 5, 37, 33, 4, 122, 8, 1, 7, 1, 6, 114, 13, 4, 9, 101, 23, 78, 256, 13, 7, 6, 2, 1, 1, 4, 3, 1, 2, 1, 1, 1, 1, 6, 2, 1, 1, 4, 1, 3, 2, 1, 1, 1, 243, 242, 14, 12, 8, 5, 3, 1, 2, 2, 1, 1, 3, 2, 1, 1, 1, 4, 2, 1, 1, 2, 1, 1, 2, 1, 1, 228, 27, 13, 2, 1, 1, 11, 3, 2, 1, 8, 6, 2, 14, 13, 6, 1, 5, 7, 6, 1, 1, 201, 178, 8, 5, 3, 2, 3, 2, 1, 170, 156, 73, 83, 14, 3, 11, 23, 22, 16, 14, 2, 6, 5, 1, 1, 1, 256, 236, 204, 1, 203, 30, 3, 1, 2, 1, 1, 27, 21, 1, 20, 17, 3, 6, 5, 1, 4, 1, 173, 63, 23, 6, 5, 1, 17, 10, 7, 40, 39, 9, 30, 1, 110, 108, 12, 1, 11, 96, 33, 63, 2, 1, 1, 32, 13, 4, 3, 2, 1, 1, 1, 1, 9, 1, 8, 1, 7, 5, 3, 2, 2, 1, 1, 19, 16, 4, 2, 1, 1, 2, 1, 1, 12, 6, 5, 1, 4, 1, 6, 2, 1, 1, 4, 3, 1, 3, 1, 2, 1, 1, 20, 19, 1, 18, 16, 14, 2, 1, 1, 12, 10, 1, 9, 2, 1, 1, 2, 1, 1, 2, 1, 1, 1, 256, 45, 41, 7, 2, 1, 1, 5, 3, 1, 2, 1, 1, 2, 1, 1, 34, 32, 31, 24, 1, 23, 4, 19, 7, 1, 6, 5, 1, 1, 2, 1, 1, 4, 1, 3, 1, 2, 1, 1, 211, 98, 74, 17, 1, 16, 5, 2, 1, 1, 3, 1, 2, 11, 9, 1, 8, 2, 1, 1, 57, 51, 6, 3, 1, 2, 3, 1, 2, 45, 19, 18, 1, 26, 1, 25, 6, 2, 1, 1, 4, 1, 3, 1, 2, 24, 8, 6, 2, 1, 1, 4, 3, 1, 2, 1, 2, 1, 1, 16, 15, 14, 5, 1, 4, 9, 2, 7, 1, 1, 113, 84, 2, 1, 1, 82, 2, 1, 1, 80, 79, 68, 1, 67, 11, 9, 2, 1, 29, 25, 1, 24, 23, 20, 16, 4, 3, 2, 1, 1, 4, 1, 3, 2, 1, 1, 1, 256, 8, 4, 2, 1, 1, 2, 1, 1, 4, 1, 3, 2, 1, 1, 1, 248, 244, 240, 237, 228, 2, 1, 1, 226, 188, 143, 45, 38, 24, 14, 9, 1, 8, 2, 1, 1, 6, 2, 4, 3, 1, 2, 1, 1, 4, 3, 2, 1, 1, 1, 1, 4, 2, 1, 1, 2, 1, 1, 256, 20, 10, 4, 3, 1, 2, 1, 1, 1, 6, 4, 3, 1, 2, 1, 1, 1, 2, 1, 1, 10, 2, 1, 1, 8, 2, 1, 1, 6, 1, 5, 3, 2, 1, 1, 1, 2, 1, 1, 236, 3, 2, 1, 1, 1, 233, 3, 2, 1, 1, 1, 230, 5, 1, 4, 2, 1, 1, 2, 1, 1, 225, 31, 28, 18, 17, 1, 10, 1, 9, 3, 1, 2, 1, 1, 194, 184, 183, 166, 17, 1, 10, 2, 1, 1, 8, 3, 5, 256, 252, 81, 25, 24, 12, 3, 1, 2, 1, 1, 9, 5, 1, 4, 4, 3, 1, 12, 1, 11, 7, 1, 6, 4, 3, 1, 1, 56, 15, 12, 7, 4, 1, 3, 3, 1, 2, 5, 3, 1, 2, 2, 1, 1, 3, 2, 1, 1, 1, 41, 6, 1, 5, 2, 1, 1, 3, 1, 2, 35, 30, 28, 22, 6, 2, 1, 1, 5, 3, 2, 1, 2, 1, 1, 171, 138, 5, 1, 4, 1, 3, 2, 1, 1, 1, 133, 32, 1, 31, 23, 12, 11, 8, 4, 4, 101, 8, 3, 1, 2, 5, 4, 1, 93, 90, 4, 86, 3, 2, 1, 33, 15, 10, 2, 1, 1, 8, 7, 5, 2, 1, 5, 4, 1, 3, 2, 1, 1, 18, 3, 1, 2, 1, 1, 15, 14, 5, 1, 4, 9, 7, 2, 1, 4, 1, 3, 1, 2, 1, 1, 256, 227, 26, 18, 2, 1, 1, 16, 11, 7, 3, 1, 2, 4, 3, 1, 4, 3, 1, 2, 1, 5, 4, 3, 1, 2, 1, 1, 8, 6, 4, 2, 1, 1, 2, 1, 1, 2, 1, 1, 2, 1, 1, 201, 94, 26, 24, 23, 2, 1, 1, 21, 8, 13, 1, 2, 1, 1, 68, 61, 47, 23, 3, 20, 24, 16, 8, 14, 7, 6, 1, 7, 6, 1, 7, 1, 6, 5, 4, 1, 1, 107, 28, 12, 4, 3, 1, 2, 1, 8, 4, 2, 2, 4, 1, 3, 16, 10, 9, 5, 4, 1, 6, 2, 1, 1, 4, 3, 1, 79, 1, 78, 75, 1, 74, 67, 7, 3, 1, 2, 1, 1, 29, 26, 7, 5, 4, 1, 3, 1, 2, 1, 1, 1, 2, 1, 1, 19, 4, 1, 3, 1, 2, 1, 1, 15, 13, 1, 12, 10, 8, 2, 2, 1, 1, 2, 1, 1, 3, 2, 1, 1, 1, 256, 100, 52, 7, 3, 1, 2, 1, 1, 4, 3, 2, 1, 1, 1, 1, 45, 4, 3, 1, 2, 1, 1, 1, 41, 6, 4, 2, 1, 1, 2, 1, 1, 2, 1, 1, 35, 33, 23, 3, 20, 10, 7, 3, 2, 1, 1, 48, 1, 47, 23, 22, 20, 13, 5, 8, 7, 6, 1, 2, 1, 1, 1, 24, 5, 4, 3, 2, 1, 1, 1, 19, 1, 18, 2, 1, 1, 16, 6, 10, 156, 105, 74, 1, 73, 6, 1, 5, 1, 4, 1, 3, 67, 61, 60, 48, 12, 1, 6, 5, 4, 1, 1, 31, 27, 10, 3, 1, 2, 1, 1, 7, 2, 1, 1, 5, 4, 1, 17, 3, 1, 2, 1, 1, 14, 4, 3, 1, 10, 4, 6, 4, 1, 3, 1, 2, 1, 1, 51, 47, 38, 34, 33, 32, 1, 31, 1, 1, 4, 2, 1, 1, 2, 1, 1, 9, 7, 1, 6, 1, 5, 2, 3, 2, 1, 1, 4, 3, 1, 2, 1, 1, 1, 256, 11, 10, 1, 9, 1, 8, 3, 1, 2, 1, 1, 5, 3, 2, 1, 1, 1, 2, 1, 1, 1, 245, 240, 7, 1, 6, 3, 1, 2, 1, 1, 3, 2, 1, 1, 1, 233, 232, 229, 123, 10, 9, 1, 113, 51, 62, 106, 3, 1, 2, 103, 98, 5, 3, 1, 2, 1, 1, 1, 5, 2, 1, 1, 3, 1, 2, 1, 1, 256, 20, 14, 12, 4, 3, 2, 1, 1, 1, 1, 8, 2, 1, 1, 6, 4, 3, 2, 1, 1, 2, 1, 1, 2, 1, 1, 6, 3, 1, 2, 1, 1, 3, 2, 1, 1, 1, 236, 5, 1, 4, 2, 1, 1, 2, 1, 1, 231, 11, 3, 2, 1, 1, 1, 8, 4, 1, 3, 1, 2, 1, 1, 4, 3, 2, 1, 1, 1, 1, 220, 173, 164, 39, 8, 4, 4, 31, 24, 7, 125, 68, 67, 1, 57, 43, 14, 9, 7, 6, 3, 3, 1, 2, 1, 1, 47, 1, 46, 40, 11, 8, 3, 29, 11, 18, 6, 4, 2, 2, 2, 1, 1, 256, 8, 4, 2, 1, 1, 2, 1, 1, 4, 1, 3, 1, 2, 1, 1, 248, 3, 2, 1, 1, 1, 245, 16, 14, 8, 1, 7, 1, 6, 4, 2, 6, 4, 3, 1, 2, 1, 2, 1, 1, 2, 1, 1, 229, 215, 150, 40, 13, 1, 12, 27, 12, 15, 110, 109, 101, 8, 1, 65, 14, 13, 6, 7, 1, 51, 17, 8, 9, 34, 5, 29, 14, 4, 2, 1, 1, 2, 1, 1, 10, 5, 2, 1, 1, 3, 2, 1, 5, 1, 4, 2, 2, 256, 248, 155, 23, 5, 1, 4, 1, 3, 1, 2, 1, 1, 18, 1, 17, 1, 16, 15, 6, 9, 1, 132, 58, 35, 33, 3, 2, 1, 30, 8, 22, 2, 1, 1, 23, 21, 16, 12, 4, 5, 4, 1, 2, 1, 1, 74, 71, 5, 2, 1, 1, 3, 1, 2, 66, 10, 5, 5, 56, 11, 45, 3, 1, 2, 1, 1, 93, 90, 82, 58, 52, 50, 18, 32, 2, 1, 1, 6, 4, 1, 3, 2, 1, 1, 24, 21, 8, 1, 7, 13, 3, 10, 3, 2, 1, 1, 1, 8, 2, 1, 1, 6, 4, 1, 3, 1, 2, 2, 1, 1, 3, 2, 1, 1, 1, 8, 6, 4, 1, 3, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1, 256, 251, 49, 48, 46, 32, 1, 31, 1, 30, 22, 8, 14, 10, 6, 3, 3, 4, 1, 3, 4, 1, 3, 2, 1, 2, 1, 1, 1, 202, 192, 117, 27, 1, 26, 24, 17, 7, 2, 1, 1, 90, 64, 45, 43, 2, 19, 8, 11, 26, 25, 24, 1, 1, 75, 73, 69, 63, 44, 19, 6, 4, 2, 4, 2, 1, 1, 2, 1, 1, 2, 1, 1, 10, 4, 3, 1, 2, 1, 1, 1, 6, 5, 4, 3, 2, 1, 1, 1, 1, 5, 1, 4, 3, 2, 1, 1, 1, 1, 256, 35, 13, 2, 1, 1, 11, 10, 1, 9, 4, 1, 3, 1, 2, 5, 1, 4, 1, 3, 1, 22, 7, 1, 6, 5, 3, 2, 1, 1, 1, 2, 1, 1, 1, 15, 7, 6, 3, 2, 1, 1, 1, 3, 2, 1, 1, 1, 1, 8, 4, 3, 1, 2, 1, 1, 1, 4, 1, 3, 1, 2, 1, 1, 221, 26, 2, 1, 1, 24, 2, 1, 1, 22, 7, 6, 2, 1, 1, 4, 3, 1, 1, 15, 6, 5, 3, 2, 1, 9, 4, 3, 1, 5, 4, 1, 195, 87, 81, 69, 4, 2, 1, 1, 2, 1, 1, 65, 21, 16, 5, 44, 19, 25, 12, 9, 3, 2, 1, 6, 3, 3, 3, 2, 1, 1, 1, 6, 5, 3, 1, 2, 1, 1, 2, 1, 1, 1, 108, 24, 1, 23, 2, 1, 1, 21, 9, 3, 6, 12, 6, 6, 84, 78, 48, 22, 8, 14, 26, 5, 21, 30, 14, 6, 8, 16, 9, 7, 6, 5, 2, 1, 1, 3, 1, 2, 1, 256, 209, 199, 9, 8, 6, 1, 5, 1, 4, 3, 1, 2, 1, 1, 1, 190, 110, 34, 1, 33, 32, 4, 28, 1, 76, 74, 30, 15, 15, 44, 39, 5, 2, 1, 1, 80, 12, 4, 1, 3, 1, 2, 8, 5, 4, 1, 3, 1, 2, 68, 60, 45, 44, 1, 15, 14, 1, 8, 5, 1, 4, 3, 1, 2, 10, 1, 9, 5, 1, 4, 1, 3, 2, 1, 1, 1, 4, 3, 2, 1, 1, 1, 1, 47, 42, 4, 2, 1, 1, 2, 1, 1, 38, 4, 3, 2, 1, 1, 1, 1, 34, 33, 8, 6, 2, 4, 2, 1, 1, 25, 24, 18, 6, 1, 1, 5, 3, 2, 1, 1, 1, 2, 1, 1, 256, 255, 253, 34, 19, 8, 7, 4, 3, 1, 3, 1, 2, 1, 11, 9, 1, 8, 1, 7, 2, 1, 1, 15, 14, 13, 4, 2, 2, 9, 5, 4, 1, 1, 219, 218, 2, 1, 1, 216, 18, 3, 2, 1, 15, 11, 4, 198, 83, 77, 6, 115, 97, 18, 1, 2, 1, 1, 1, 256, 240, 1, 239, 61, 14, 4, 1, 3, 1, 2, 1, 1, 10, 3, 2, 1, 1, 1, 7, 2, 1, 1, 5, 3, 2, 47, 21, 14, 2, 1, 1, 12, 9, 3, 7, 6, 2, 4, 1, 26, 2, 1, 1, 24, 4, 2, 2, 20, 6, 14, 178, 4, 2, 1, 1, 2, 1, 1, 174, 160, 6, 4, 1, 3, 2, 1, 1, 154, 151, 73, 78, 3, 1, 2, 14, 13, 2, 1, 1, 11, 5, 6, 1, 16, 5, 4, 3, 2, 1, 1, 1, 1, 1, 11, 6, 5, 4, 3, 2, 1, 1, 1, 1, 1, 1, 5, 1, 4, 1, 3, 1, 2, 1, 1, 256, 2, 1, 1, 254, 240, 233, 7, 2, 1, 1, 5, 2, 1, 1, 3, 1, 2, 1, 1, 226, 16, 15, 14, 7, 7, 1, 1, 210, 23, 22, 2, 20, 1, 187, 70, 69, 1, 117, 113, 4, 7, 6, 3, 1, 2, 1, 1, 3, 2, 1, 1, 1, 1, 14, 8, 4, 2, 1, 1, 2, 1, 1, 4, 1, 3, 2, 1, 1, 1, 6, 5, 2, 1, 1, 3, 2, 1, 1, 1, 1, 256, 249, 168, 116, 71, 3, 2, 1, 1, 1, 68, 18, 5, 1, 4, 13, 2, 11, 50, 49, 5, 44, 1, 45, 14, 7, 1, 6, 3, 3, 7, 3, 2, 1, 4, 2, 2, 31, 2, 1, 1, 29, 24, 8, 16, 5, 4, 1, 52, 41, 11, 4, 1, 3, 1, 2, 7, 2, 1, 1, 5, 3, 2, 30, 4, 3, 2, 1, 1, 26, 21, 7, 14, 5, 4, 1, 11, 7, 2, 1, 1, 5, 4, 1, 3, 1, 4, 3, 2, 1, 1, 1, 1, 81, 75, 74, 64, 60, 5, 2, 3, 55, 6, 49, 4, 1, 3, 1, 2, 10, 9, 7, 4, 3, 2, 1, 1, 1, 1, 6, 1, 5, 2, 1, 1, 3, 1, 2, 1, 1, 7, 2, 1, 1, 5, 4, 2, 1, 1, 2, 1, 1, 1, 256, 137, 61, 32, 30, 28, 1, 27, 12, 4, 8, 15, 2, 13, 2, 1, 1, 2, 1, 1, 29, 2, 1, 1, 27, 5, 1, 4, 3, 1, 2, 1, 22, 14, 7, 4, 3, 7, 6, 1, 8, 5, 4, 1, 3, 2, 1, 76, 1, 75, 44, 4, 3, 2, 1, 1, 1, 1, 40, 39, 3, 1, 2, 36, 15, 21, 1, 31, 30, 2, 1, 1, 28, 12, 9, 3, 16, 14, 2, 1, 119, 36, 34, 13, 3, 1, 2, 1, 1, 10, 5, 4, 3, 1, 1, 5, 4, 1, 3, 1, 21, 13, 9, 1, 8, 1, 7, 4, 3, 2, 1, 1, 8, 6, 3, 1, 2, 3, 1, 2, 2, 1, 1, 2, 1, 1, 83, 82, 78, 77, 52, 45, 21, 24, 7, 3, 4, 25, 16, 11, 5, 9, 8, 1, 1, 4, 1, 3, 2, 1, 1, 1, 1, 256, 94, 17, 14, 11, 4, 1, 3, 2, 1, 1, 1, 7, 4, 2, 1, 1, 2, 1, 1, 3, 1, 2, 1, 1, 3, 2, 1, 1, 1, 3, 1, 2, 1, 1, 77, 9, 6, 3, 1, 2, 1, 1, 3, 2, 1, 1, 1, 3, 2, 1, 1, 1, 68, 66, 18, 16, 1, 15, 11, 4, 2, 1, 1, 48, 46, 25, 22, 3, 21, 6, 15, 2, 1, 1, 2, 1, 1, 162, 109, 3, 1, 2, 1, 1, 106, 78, 68, 14, 5, 1, 4, 9, 3, 6, 54, 10, 2, 8, 44, 19, 25, 10, 7, 4, 2, 2, 3, 2, 1, 3, 2, 1, 1, 1, 28, 23, 9, 2, 1, 1, 7, 3, 4, 14, 5, 3, 2, 9, 1, 8, 5, 1, 4, 1, 3, 2, 1, 53, 4, 3, 2, 1, 1, 1, 1, 49, 3, 2, 1, 1, 1, 46, 44, 2, 1, 1, 42, 39, 4, 35, 3, 2, 1, 2, 1, 1, 256, 202, 192, 175, 35, 33, 27, 5, 4, 1, 22, 10, 12, 6, 2, 1, 1, 4, 3, 1, 2, 1, 1, 140, 64, 3, 1, 2, 1, 1, 61, 35, 3, 32, 26, 12, 14, 76, 63, 1, 62, 27, 35, 13, 11, 10, 1, 2, 1, 1, 17, 4, 3, 1, 2, 1, 1, 1, 13, 7, 2, 1, 1, 5, 4, 2, 2, 1, 6, 4, 3, 2, 1, 1, 2, 1, 1, 10, 3, 1, 2, 1, 1, 7, 5, 3, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1, 54, 25, 22, 2, 1, 1, 20, 3, 1, 2, 1, 1, 17, 6, 4, 2, 2, 2, 1, 1, 11, 1, 10, 7, 3, 3, 2, 1, 1, 1, 29, 28, 14, 13, 10, 7, 2, 5, 3, 1, 2, 3, 2, 1, 1, 1, 1, 14, 4, 3, 2, 1, 1, 1, 1, 10, 4, 1, 3, 2, 1, 6, 3, 2, 1, 3, 2, 1, 1, 256, 10, 9, 1, 8, 7, 5, 1, 4, 3, 1, 2, 1, 2, 1, 1, 1, 1, 246, 203, 192, 32, 27, 23, 21, 12, 9, 2, 1, 1, 4, 1, 3, 1, 2, 5, 3, 2, 1, 1, 1, 2, 1, 1, 160, 118, 93, 76, 1, 75, 17, 1, 16, 25, 11, 1, 10, 14, 13, 1, 42, 1, 41, 34, 32, 2, 7, 5, 2, 11, 3, 2, 1, 1, 1, 8, 6, 1, 5, 2, 1, 1, 3, 2, 1, 2, 1, 1, 43, 38, 4, 2, 1, 1, 2, 1, 1, 34, 4, 3, 1, 2, 1, 1, 1, 30, 29, 22, 1, 21, 7, 6, 1, 1, 5, 1, 4, 1, 3, 2, 1, 1, 1, 256, 225, 7, 6, 5, 3, 2, 1, 1, 1, 2, 1, 1, 1, 1, 218, 69, 66, 19, 15, 12, 2, 10, 3, 1, 2, 4, 1, 3, 2, 1, 47, 18, 1, 17, 6, 11, 29, 19, 17, 2, 10, 9, 1, 3, 2, 1, 1, 1, 149, 141, 135, 1, 134, 49, 12, 37, 85, 81, 4, 6, 1, 5, 3, 1, 2, 2, 1, 1, 8, 6, 3, 2, 1, 1, 1, 3, 2, 1, 1, 1, 2, 1, 1, 31, 1, 30, 7, 1, 6, 5, 2, 1, 1, 3, 2, 1, 1, 1, 1, 23, 7, 1, 6, 1, 5, 3, 2, 1, 2, 1, 1, 16, 1, 15, 10, 4, 2, 2, 6, 4, 2, 5, 3, 1, 2, 2, 1, 1, 256, 238, 230, 40, 18, 1, 17, 13, 12, 7, 5, 1, 4, 2, 1, 1, 2, 1, 1, 22, 6, 2, 1, 1, 4, 1, 3, 2, 1, 16, 11, 8, 2, 6, 3, 1, 2, 5, 1, 4, 3, 1, 190, 150, 41, 9, 7, 5, 2, 2, 1, 1, 32, 29, 21, 8, 3, 2, 1, 109, 105, 43, 4, 39, 62, 5, 57, 4, 2, 1, 1, 2, 1, 1, 40, 24, 15, 10, 8, 2, 5, 4, 1, 9, 8, 2, 6, 1, 16, 14, 11, 4, 7, 3, 2, 1, 2, 1, 1, 8, 4, 3, 2, 1, 1, 1, 1, 4, 2, 1, 1, 2, 1, 1, 18, 3, 2, 1, 1, 1, 15, 10, 6, 3, 1, 2, 1, 1, 3, 1, 2, 1, 1, 4, 2, 1, 1, 2, 1, 1, 5, 3, 2, 1, 1, 1, 2, 1, 1, 256, 195, 114, 113, 97, 1, 96, 7, 1, 6, 3, 3, 89, 13, 8, 5, 76, 35, 41, 16, 14, 6, 5, 2, 3, 1, 8, 1, 7, 5, 2, 2, 1, 1, 1, 81, 76, 40, 3, 1, 2, 1, 1, 37, 1, 36, 30, 29, 1, 6, 3, 3, 36, 8, 1, 7, 1, 6, 5, 1, 28, 1, 27, 25, 9, 16, 2, 1, 1, 5, 3, 1, 2, 1, 1, 2, 1, 1, 61, 53, 49, 6, 1, 5, 1, 4, 2, 1, 1, 2, 1, 1, 43, 27, 8, 1, 7, 4, 3, 19, 14, 2, 12, 5, 3, 2, 16, 3, 2, 1, 1, 1, 13, 10, 4, 6, 3, 2, 1, 4, 3, 1, 2, 1, 1, 1, 8, 6, 5, 4, 1, 3, 2, 1, 1, 1, 1, 1, 2, 1, 1, 256, 1, 255, 124, 60, 45, 41, 6, 2, 1, 1, 4, 3, 1, 35, 7, 1, 6, 28, 27, 1, 4, 2, 1, 1, 2, 1, 1, 15, 1, 14, 1, 13, 6, 5, 1, 7, 6, 1, 64, 9, 5, 3, 1, 2, 1, 1, 2, 1, 1, 4, 3, 1, 2, 1, 1, 1, 55, 8, 1, 7, 6, 5, 1, 1, 47, 1, 46, 43, 3, 40, 3, 2, 1, 131, 130, 2, 1, 1, 128, 5, 4, 1, 3, 2, 1, 1, 123, 108, 83, 1, 82, 25, 14, 11, 15, 12, 11, 1, 3, 1, 2, 1, 256, 163, 161, 156, 141, 135, 126, 86, 3, 83, 40, 25, 15, 9, 7, 3, 4, 2, 1, 1, 6, 2, 1, 1, 4, 1, 3, 2, 1, 15, 5, 3, 1, 2, 1, 1, 2, 1, 1, 10, 5, 3, 1, 2, 2, 1, 1, 5, 1, 4, 1, 3, 5, 2, 1, 1, 3, 2, 1, 1, 1, 2, 1, 1, 93, 10, 9, 7, 1, 6, 4, 3, 2, 1, 1, 2, 1, 1, 2, 1, 1, 1, 83, 8, 6, 2, 1, 1, 4, 3, 1, 2, 1, 1, 1, 2, 1, 1, 75, 20, 17, 13, 3, 2, 1, 10, 1, 9, 4, 2, 1, 1, 2, 1, 1, 3, 2, 1, 1, 1, 55, 21, 10, 9, 1, 8, 1, 11, 10, 1, 9, 1, 34, 32, 17, 4, 13, 15, 5, 10, 2, 1, 1, 256, 185, 184, 106, 60, 46, 8, 2, 1, 1, 6, 4, 2, 38, 14, 1, 13, 24, 6, 18, 14, 13, 12, 11, 1, 1, 1, 46, 35, 27, 1, 26, 3, 23, 8, 5, 1, 4, 3, 2, 1, 11, 4, 1, 3, 1, 2, 7, 2, 1, 1, 5, 2, 3, 78, 17, 9, 1, 8, 5, 3, 2, 3, 1, 2, 8, 6, 1, 5, 3, 2, 2, 1, 1, 61, 44, 16, 2, 1, 1, 14, 1, 13, 28, 27, 18, 9, 1, 17, 1, 16, 4, 1, 3, 12, 6, 6, 1, 71, 32, 19, 4, 1, 3, 1, 2, 1, 1, 15, 9, 3, 2, 1, 1, 1, 6, 5, 1, 4, 1, 6, 4, 3, 1, 2, 1, 2, 1, 1, 13, 12, 7, 4, 3, 1, 2, 1, 3, 2, 1, 1, 1, 5, 3, 2, 1, 1, 1, 2, 1, 1, 1, 39, 22, 19, 4, 1, 3, 2, 1, 1, 1, 15, 3, 2, 1, 1, 1, 12, 5, 4, 1, 7, 3, 4, 3, 2, 1, 1, 1, 17, 14, 13, 4, 3, 2, 1, 1, 9, 6, 3, 3, 3, 2, 1, 1, 3, 1, 2, 1, 1, 256, 255, 206, 1, 205, 182, 142, 4, 3, 2, 1, 1, 138, 124, 93, 31, 14, 11, 3, 40, 37, 2, 1, 1, 35, 8, 27, 3, 2, 1, 1, 1, 23, 4, 1, 3, 2, 1, 1, 1, 19, 7, 1, 6, 1, 5, 12, 11, 1, 10, 1, 49, 16, 7, 2, 1, 1, 5, 3, 1, 2, 1, 1, 2, 1, 1, 9, 2, 1, 1, 7, 5, 2, 1, 1, 3, 1, 2, 2, 1, 1, 33, 30, 17, 9, 4, 2, 2, 5, 1, 4, 8, 1, 7, 6, 1, 13, 9, 3, 1, 2, 6, 4, 2, 4, 1, 3, 2, 1, 3, 1, 2, 1, 1, 1, 256, 255, 59, 33, 12, 2, 1, 1, 10, 6, 3, 2, 1, 3, 1, 2, 4, 2, 1, 1, 2, 1, 1, 21, 8, 1, 7, 5, 3, 2, 2, 1, 1, 13, 11, 1, 10, 3, 7, 2, 1, 1, 26, 24, 5, 1, 4, 1, 3, 2, 1, 19, 13, 7, 6, 1, 6, 1, 5, 6, 3, 1, 2, 3, 2, 1, 2, 1, 1, 196, 189, 62, 59, 23, 15, 1, 14, 8, 1, 7, 36, 1, 35, 5, 30, 3, 1, 2, 1, 1, 127, 121, 14, 13, 8, 5, 1, 107, 102, 100, 2, 5, 4, 1, 6, 2, 1, 1, 4, 2, 1, 1, 2, 1, 1, 7, 5, 2, 1, 1, 3, 1, 2, 1, 1, 2, 1, 1, 1, 256, 241, 182, 15, 13, 1, 12, 9, 1, 8, 7, 1, 3, 1, 2, 1, 1, 2, 1, 1, 167, 3, 2, 1, 1, 1, 164, 20, 1, 19, 14, 13, 1, 5, 1, 4, 144, 27, 10, 8, 2, 17, 16, 1, 117, 114, 109, 5, 3, 1, 2, 59, 33, 27, 4, 1, 3, 1, 2, 1, 1, 23, 5, 1, 4, 3, 1, 18, 16, 12, 4, 2, 1, 1, 6, 3, 1, 2, 1, 1, 3, 2, 1, 1, 1, 26, 17, 4, 3, 2, 1, 1, 1, 1, 13, 3, 1, 2, 1, 1, 10, 4, 3, 1, 6, 4, 2, 9, 7, 2, 1, 1, 5, 4, 3, 1, 1, 2, 1, 1, 15, 10, 5, 3, 1, 2, 1, 1, 2, 1, 1, 5, 1, 4, 2, 1, 1, 2, 1, 1, 5, 3, 1, 2, 1, 1, 2, 1, 1, 256, 8, 6, 4, 1, 3, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1, 248, 93, 11, 2, 1, 1, 9, 7, 5, 4, 1, 3, 1, 2, 1, 1, 2, 1, 1, 82, 76, 7, 4, 3, 1, 2, 1, 3, 2, 1, 1, 1, 69, 2, 1, 1, 67, 38, 1, 37, 29, 11, 18, 6, 5, 2, 1, 1, 3, 2, 1, 1, 1, 1, 155, 140, 114, 7, 3, 1, 2, 1, 1, 4, 3, 1, 2, 1, 107, 61, 48, 45, 3, 13, 1, 12, 46, 29, 16, 13, 17, 3, 14, 26, 20, 3, 1, 2, 1, 1, 17, 4, 2, 2, 13, 10, 3, 6, 2, 1, 1, 4, 1, 3, 1, 2, 15, 1, 14, 1, 13, 4, 2, 1, 1, 2, 1, 1, 9, 6, 5, 1, 3, 2, 1, 256, 3, 1, 2, 1, 1, 253, 210, 147, 146, 9, 6, 5, 1, 4, 1, 3, 1, 2, 1, 1, 137, 84, 5, 1, 4, 79, 41, 38, 53, 27, 22, 5, 26, 6, 20, 1, 63, 29, 7, 2, 1, 1, 5, 1, 4, 3, 1, 22, 18, 11, 5, 6, 7, 1, 6, 4, 1, 3, 1, 2, 34, 30, 1, 29, 8, 2, 6, 21, 17, 4, 4, 3, 1, 2, 1, 1, 1, 43, 21, 12, 1, 11, 7, 1, 6, 5, 1, 4, 1, 3, 1, 2, 9, 1, 8, 4, 2, 1, 1, 2, 1, 1, 4, 2, 1, 1, 2, 1, 1, 22, 7, 1, 6, 3, 1, 2, 1, 1, 3, 1, 2, 1, 1, 15, 5, 2, 1, 1, 3, 2, 1, 1, 1, 10, 7, 1, 6, 5, 1, 3, 2, 1, 1, 1, 256, 9, 8, 1, 7, 6, 5, 4, 1, 3, 2, 1, 1, 1, 1, 1, 247, 17, 14, 11, 10, 8, 5, 1, 4, 3, 2, 1, 2, 1, 1, 1, 3, 1, 2, 1, 1, 3, 2, 1, 1, 1, 230, 96, 1, 95, 93, 89, 6, 5, 1, 83, 31, 52, 4, 3, 1, 2, 1, 2, 1, 1, 134, 128, 4, 1, 3, 2, 1, 1, 1, 124, 15, 14, 12, 2, 1, 109, 50, 13, 37, 59, 56, 3, 6, 1, 5, 4, 3, 1, 2, 1, 1, 256, 90, 82, 72, 12, 1, 11, 4, 3, 2, 1, 1, 7, 4, 3, 1, 3, 1, 2, 60, 50, 1, 49, 45, 37, 8, 4, 1, 3, 10, 5, 3, 2, 1, 2, 1, 1, 5, 3, 1, 2, 2, 1, 1, 10, 1, 9, 8, 1, 7, 1, 6, 3, 3, 1, 8, 5, 1, 4, 3, 1, 2, 1, 1, 1, 3, 2, 1, 1, 1, 166, 163, 161, 85, 82, 74, 44, 1, 43, 30, 29, 1, 8, 2, 1, 1, 6, 3, 3, 3, 2, 1, 1, 1, 76, 64, 57, 3, 2, 1, 54, 17, 37, 7, 6, 2, 4, 1, 12, 4, 1, 3, 2, 1, 8, 5, 4, 1, 3, 2, 1, 2, 1, 1, 3, 1, 2, 1, 1};
 /* start index of each tree in the flattened arrays */
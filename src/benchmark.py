@@ -0,0 +1,463 @@
+# src/benchmark.py
+"""
+Reproducible throughput / latency benchmark of the PowerSense pipeline.
+
+Cases (each at every requested size = seconds of raw data at the given sample rate):
+  features         extract_features on 1 s raw blocks
+  inference        run_inference, one feature vector per call (capped at SINGLE_CALLS)
+  inference_batch  run_inference_batch on 1 s blocks of feature rows
+  ingest           Regulator.load_healthy_chunks over a buffer of .praw/.csv captures (FILE_S each)
+  retrain          Regulator.retrain on a healthy store filled with that many windows
+  online           OnlineIsolationForest.absorb of that many healthy windows in 1 s blocks
+  export           export_to_q15_header of the active model (size independent, run once)
+  event_encode     event_capture.encode_packets of EVENT_MS raw events cut from the data (storm scenario)
+  event_decode     event_capture.decode_packets of the same events, one packet stream per event
+                   (both also report ratio: float32 raw bytes / packet bytes)
+  startup          fresh interpreter: import inference (flat .npy model, memory-mapped) + first
+                   run_inference; also reports import_ms / first_score_ms (size independent)
+  startup_pickle   the same with POWERSENSE_FLAT_MODEL=0 (joblib + sklearn unpickling)
+
+Every (case, size, fs) runs in a fresh subprocess, so its peak RSS (ru_maxrss) is its own.
+Inputs are seeded (raw data from synth_telemetry.py, nominal scenario): two runs with the
+same arguments do the same work, and results saved with -o can be compared between commits.
+
+Run from the repository root (model paths are relative):
+  PYTHONPATH=src python src/benchmark.py --sizes 1,10,60 --fs 10000,20000 -o bench_new.json
+  PYTHONPATH=src python src/benchmark.py --compare bench_old.json bench_new.json
+"""
+import os, io, sys, json, time, shutil, itertools, platform, resource, tempfile, subprocess, contextlib
+import numpy as np
+
+from synth_telemetry import TelemetrySynth
+
+CASES = ["features", "inference", "inference_batch", "ingest", "retrain", "online", "export",
+         "event_encode", "event_decode", "startup", "startup_pickle"]
+SIZE_FREE = {"export", "startup", "startup_pickle"}    # run once, at the first size
+WINDOW_MS     = 2                   # extract_features default: step = WINDOW_MS/2 ms of samples
+BLOCK_S       = 1.0                 # seconds of data per timed call (features, inference_batch)
+MIN_CALLS     = 20                  # small sizes are repeated until this many calls are timed
+SINGLE_CALLS  = 2000                # run_inference calls per size
+FILE_S        = 10.0                # seconds of raw data per capture file (ingest)
+FILES_PER_SCAN = 30                 # captures written per load_healthy_chunks call
+RETRAIN_RUNS  = 3
+EXPORT_RUNS   = 20
+REFERENCE_CSV = "data/cubesat_features.csv"
+STARTUP_RUNS  = 7
+EVENT_MS      = 70.0                # pre + post window of one captured event
+TOLERANCE     = 0.10                # --compare: relative change reported as a regression
+
+
+# -------------------------------------------------
+# Seeded inputs
+# -------------------------------------------------
+def _raw_blocks(size_s, fs, seed, block_s=BLOCK_S):
+    """Consecutive blocks of synthetic telemetry covering `size_s` seconds (bounded memory)."""
+    return TelemetrySynth(size_s, fs, "nominal", seed).chunks(block_s)
+
+
+def n_windows(size_s, fs):
+    return int(size_s * fs) // max(1, int(WINDOW_MS / 2 * fs / 1000))
+
+
+def feature_rows(n, seed=0):
+    """`n` feature vectors resampled from the reference set (realistic tree depths)."""
+    import pandas as pd
+    from feature_engineering import FEATURE_COLS
+    ref = pd.read_csv(REFERENCE_CSV, usecols=FEATURE_COLS)[FEATURE_COLS].dropna().to_numpy()
+    idx = np.random.default_rng(seed).integers(0, len(ref), n)
+    return ref[idx]
+
+
+# -------------------------------------------------
+# Measurement helpers
+# -------------------------------------------------
+def _peak_rss_mb(who=resource.RUSAGE_SELF):
+    return resource.getrusage(who).ru_maxrss / 1024.0       # Linux: KiB
+
+def _summary(lat, samples, busy):
+    lat = np.asarray(lat) * 1e3
+    return {"samples": int(samples), "calls": len(lat), "seconds": busy,
+            "samples_per_s": samples / busy if busy > 0 else None,
+            "p50_ms": float(np.percentile(lat, 50)) if len(lat) else None,
+            "p99_ms": float(np.percentile(lat, 99)) if len(lat) else None}
+
+def _time_calls(fn, items, weights):
+    """Time fn(item) for every item; returns (latencies, total samples, busy seconds)."""
+    lat, samples = [], 0
+    for item, w in zip(items, weights):
+        t = time.perf_counter()
+        fn(item)
+        lat.append(time.perf_counter() - t)
+        samples += w
+    return lat, samples, float(np.sum(lat))
+
+def _repeat_passes(make_items, n_items):
+    """Enough passes over the same items that at least MIN_CALLS calls are timed."""
+    passes = max(1, -(-MIN_CALLS // max(1, n_items)))
+    return [item for _ in range(passes) for item in make_items()]
+
+
+# -------------------------------------------------
+# Cases (run inside the worker subprocess)
+# -------------------------------------------------
+def bench_features(size_s, fs, seed):
+    from feature_engineering import extract_features
+    blocks = _repeat_passes(lambda: list(_raw_blocks(size_s, fs, seed)), int(np.ceil(size_s / BLOCK_S)))
+    return _time_calls(lambda b: extract_features(b, WINDOW_MS, fs), blocks, [len(b["time_s"]) for b in blocks])
+
+
+def bench_inference(size_s, fs, seed):
+    from inference import run_inference
+    X = feature_rows(min(n_windows(size_s, fs), SINGLE_CALLS), seed)
+    return _time_calls(run_inference, X, [1] * len(X))
+
+
+def bench_inference_batch(size_s, fs, seed):
+    from inference import run_inference_batch
+    per_block = n_windows(BLOCK_S, fs)
+    X = feature_rows(n_windows(size_s, fs), seed)
+    out_s, out_f = np.empty(per_block), np.empty(per_block, dtype=bool)
+    blocks = _repeat_passes(lambda: [X[i:i + per_block] for i in range(0, len(X), per_block)],
+                            -(-len(X) // per_block))
+    return _time_calls(lambda b: run_inference_batch(b, out_s, out_f), blocks, [len(b) for b in blocks])
+
+
+def _private_regulator(tmp, seed):
+    """A Regulator with its state, buffer and events under `tmp`, scoring with the active model of models/."""
+    from regulator import Regulator, STORE_CAPACITY
+    from healthy_store import HealthyStore, RunningStats
+    reg = Regulator(os.path.join(tmp, "models"), os.path.join(tmp, "buffer"), seed_dir="models/",
+                    event_dir=os.path.join(tmp, "events"))
+    reg.store = HealthyStore(os.path.join(reg.model_dir, "healthy_store.npz"), capacity=STORE_CAPACITY,
+                             stats=RunningStats.from_scaler(reg.scaler), seed=seed)
+    return reg
+
+
+def bench_ingest(size_s, fs, seed, fmt="praw"):
+    import regulator
+    from rawcap import RawCaptureWriter
+    import pandas as pd
+
+    per_file, inner = [], regulator.process_buffer_file
+    def timed_process(*a, **kw):
+        t = time.perf_counter()
+        res = inner(*a, **kw)
+        per_file.append(time.perf_counter() - t)
+        return res
+
+    tmp = tempfile.mkdtemp(prefix="bench-ingest-")
+    reg = _private_regulator(tmp, seed)         # files are deleted on checkpoint
+    regulator.process_buffer_file = timed_process
+    samples, busy = 0, 0.0
+    try:
+        files = enumerate(_raw_blocks(size_s, fs, seed, FILE_S))
+        while True:
+            batch = list(itertools.islice(files, FILES_PER_SCAN))     # bounded disk and memory
+            if not batch:
+                break
+            for k, raw in batch:
+                path = os.path.join(reg.buffer_dir, f"capture_{k:06d}.{fmt}")
+                if fmt == "csv":
+                    pd.DataFrame(raw).to_csv(path, index=False)
+                else:
+                    with RawCaptureWriter(path, fs=fs, t0=raw["time_s"][0]) as w:
+                        w.write(raw)
+                samples += len(raw["time_s"])
+            t = time.perf_counter()
+            reg.absorb([reg.load_healthy_chunks()])
+            reg.checkpoint()
+            busy += time.perf_counter() - t
+    finally:
+        regulator.process_buffer_file = inner
+        reg.journal.close()
+        shutil.rmtree(tmp, ignore_errors=True)
+    return per_file, samples, busy
+
+
+def bench_retrain(size_s, fs, seed):
+    tmp = tempfile.mkdtemp(prefix="bench-retrain-")
+    reg = _private_regulator(tmp, seed)
+    try:
+        n, chunk = n_windows(size_s, fs), 1 << 20
+        for i in range(0, n, chunk):
+            reg.store.add(feature_rows(min(chunk, n - i), seed + i))
+        rows = len(reg.store)
+        lat = []
+        for _ in range(RETRAIN_RUNS):
+            t = time.perf_counter()
+            if not reg.retrain():
+                raise RuntimeError("retrain did not publish a model")
+            lat.append(time.perf_counter() - t)
+    finally:
+        reg.journal.close()
+        shutil.rmtree(tmp, ignore_errors=True)
+    return lat, rows * len(lat), float(np.sum(lat))
+
+
+def bench_online(size_s, fs, seed):
+    from online_forest import OnlineIsolationForest
+    from model_registry import load_model
+    iso, scaler, _ = load_model()
+    online = OnlineIsolationForest(iso, seed=seed)
+    per_block = n_windows(BLOCK_S, fs)
+    blocks = [scaler.transform(feature_rows(per_block, seed + i))
+              for i in range(max(1, n_windows(size_s, fs) // per_block))]
+    return _time_calls(online.absorb, blocks, [len(b) for b in blocks])
+
+
+def bench_export(size_s, fs, seed):
+    from model_export import export_to_q15_header
+    from model_registry import load_model
+    iso, scaler, _ = load_model()
+    tmp = tempfile.mkdtemp(prefix="bench-export-")
+    try:
+        path = os.path.join(tmp, "model_iforest.h")
+        return _time_calls(lambda _: export_to_q15_header(iso, scaler, output_path=path),
+                           range(EXPORT_RUNS), [1] * EXPORT_RUNS)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _events(size_s, fs, seed):
+    """Consecutive EVENT_MS slices of storm-scenario telemetry as EventCapture-style events."""
+    from event_capture import event_id
+    from feature_engineering import extract_features_array
+    rows, events = int(EVENT_MS * fs / 1000), []
+    for block in TelemetrySynth(size_s, fs, "storm", seed).chunks(BLOCK_S):
+        cols = list(block)
+        raw = np.column_stack([np.asarray(block[c], dtype=np.float64) for c in cols])
+        X, times, _ = extract_features_array(block, WINDOW_MS, fs)
+        for i in range(0, len(raw) - rows + 1, rows):
+            t0, t1 = raw[i, 0], raw[i + rows - 1, 0]
+            w = (times >= t0) & (times <= t1)
+            events.append({"event_id": event_id(t0), "t_trigger": t0, "t_start": t0, "fs": fs, "score": 1.0,
+                           "threshold": 0.5, "hits": 1, "pre_rows": rows // 4, "columns": cols,
+                           "raw": raw[i:i + rows], "windows": (times[w], X[w], np.zeros(int(w.sum()))),
+                           "model_version": "bench", "flags": 0})
+    return events
+
+
+def _event_ratio(events, streams):
+    raw = sum(ev["raw"].size * 4 for ev in events)
+    return {"ratio": raw / max(1, sum(len(s) for s in streams))}
+
+
+def bench_event_encode(size_s, fs, seed):
+    from event_capture import encode_packets
+    events = _events(size_s, fs, seed)
+    lat, samples, busy = _time_calls(encode_packets, events, [len(ev["raw"]) for ev in events])
+    return lat, samples, busy, _event_ratio(events, [b"".join(encode_packets(ev)) for ev in events])
+
+
+def bench_event_decode(size_s, fs, seed):
+    from event_capture import encode_packets, decode_packets
+    events = _events(size_s, fs, seed)
+    streams = [b"".join(encode_packets(ev)) for ev in events]
+    lat, samples, busy = _time_calls(decode_packets, streams, [len(ev["raw"]) for ev in events])
+    return lat, samples, busy, _event_ratio(events, streams)
+
+
+_STARTUP_PROBE = """
+import json, time
+t0 = time.perf_counter()
+import inference
+t1 = time.perf_counter()
+inference.run_inference(inference.scaler.mean_)
+t2 = time.perf_counter()
+print(json.dumps({"import_s": t1 - t0, "first_score_s": t2 - t1, "model": type(inference.iso).__name__}))
+"""
+
+
+def _bench_startup(flat):
+    """Wall time of fresh `inference` processes on a copy of the active model (flat/ or pickles only)."""
+    import joblib
+    from model_registry import ModelRegistry, load_model, MODEL_FILE, SCALER_FILE
+    iso, scaler, _ = load_model()
+    tmp = tempfile.mkdtemp(prefix="bench-startup-")
+    try:
+        models = os.path.join(tmp, "models")
+        os.makedirs(models)
+        joblib.dump(iso, os.path.join(models, MODEL_FILE))
+        joblib.dump(scaler, os.path.join(models, SCALER_FILE))
+        if flat:
+            ModelRegistry(models).flatten()
+        env = dict(os.environ, POWERSENSE_FLAT_MODEL="1" if flat else "0",
+                   PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+        lat, probes = [], []
+        for _ in range(STARTUP_RUNS):
+            t = time.perf_counter()
+            p = subprocess.run([sys.executable, "-c", _STARTUP_PROBE], cwd=tmp, env=env,
+                               capture_output=True, text=True, check=True)
+            lat.append(time.perf_counter() - t)
+            probes.append(json.loads(p.stdout.strip().splitlines()[-1]))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    median = lambda k: float(np.median([r[k] for r in probes])) * 1e3
+    return lat, len(lat), float(np.sum(lat)), {"import_ms": median("import_s"),
+                                               "first_score_ms": median("first_score_s"),
+                                               "model": probes[-1]["model"]}
+
+
+def bench_startup(size_s, fs, seed):
+    return _bench_startup(flat=True)
+
+
+def bench_startup_pickle(size_s, fs, seed):
+    return _bench_startup(flat=False)
+
+
+def run_case(case, size_s, fs, seed=0, fmt="praw"):
+    """Run one case in this process; regulator.py / inference.py output is swallowed."""
+    fn = globals()[f"bench_{case}"]
+    with contextlib.redirect_stdout(io.StringIO()):
+        if case in ("ingest", "retrain"):
+            import regulator
+        elif case in ("inference", "inference_batch"):
+            import inference
+        base = _peak_rss_mb()
+        lat, samples, busy, *extra = fn(size_s, fs, seed, fmt) if case == "ingest" else fn(size_s, fs, seed)
+    return {"case": case, "size_s": None if case in SIZE_FREE else size_s, "fs": fs,
+            **_summary(lat, samples, busy), **(extra[0] if extra else {}),
+            "base_rss_mb": base, "peak_rss_mb": _peak_rss_mb(),
+            "children_rss_mb": _peak_rss_mb(resource.RUSAGE_CHILDREN)}
+
+
+# -------------------------------------------------
+# Driver
+# -------------------------------------------------
+def _run_isolated(case, size_s, fs, seed, fmt, timeout):
+    cmd = [sys.executable, os.path.abspath(__file__), "--worker", case, str(size_s), str(fs),
+           "--seed", str(seed), "--format", fmt]
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.path.dirname(os.path.abspath(__file__)),
+                                                       env.get("PYTHONPATH")]))
+    p = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, env=env)
+    if p.returncode != 0:
+        err = (p.stderr.strip().splitlines() or ["exit %d" % p.returncode])[-1]
+        return {"case": case, "size_s": size_s, "fs": fs, "error": err}
+    return json.loads(p.stdout.strip().splitlines()[-1])
+
+
+def _git(*args):
+    try:
+        return subprocess.run(["git", *args], capture_output=True, text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def environment():
+    import sklearn, pandas
+    return {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "commit": _git("rev-parse", "--short", "HEAD"),
+            "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+            "python": platform.python_version(), "numpy": np.__version__,
+            "pandas": pandas.__version__, "sklearn": sklearn.__version__,
+            "machine": platform.machine(), "cpus": os.cpu_count(), "host": platform.node()}
+
+
+def run_suite(cases=CASES, sizes=(1.0, 10.0, 60.0), rates=(10000,), seed=0, fmt="praw", timeout=None):
+    """Run every (case, size, rate) in its own subprocess; returns the JSON-ready report."""
+    results = []
+    for case in cases:
+        for fs in rates:
+            for size_s in (sizes[:1] if case in SIZE_FREE else sizes):
+                r = _run_isolated(case, size_s, fs, seed, fmt, timeout)
+                print(_format_row(r), flush=True)
+                results.append(r)
+            if case in SIZE_FREE:
+                break
+    return {"environment": environment(),
+            "config": {"seed": seed, "format": fmt, "window_ms": WINDOW_MS, "block_s": BLOCK_S,
+                       "file_s": FILE_S, "single_calls": SINGLE_CALLS},
+            "results": results}
+
+
+def _key(r):
+    return (r["case"], r["size_s"], r["fs"])
+
+def _fmt(v, spec):
+    return format(v, spec) if isinstance(v, (int, float)) else "-"
+
+def _label(r):
+    size = "-" if r["size_s"] is None else f"{r['size_s']:g}s"
+    return f"{r['case']:<16} {size:>7} {r['fs'] / 1000:>4g}kHz"
+
+def _format_row(r):
+    if "error" in r:
+        return f"{_label(r)}  ERROR: {r['error']}"
+    return (f"{_label(r)}  {_fmt(r['samples_per_s'], '>12,.0f')} samples/s  "
+            f"p50 {_fmt(r['p50_ms'], '>9.3f')} ms  p99 {_fmt(r['p99_ms'], '>9.3f')} ms  "
+            f"peak {r['peak_rss_mb']:>7.1f} MB" + (f"  ratio {r['ratio']:.2f}x" if "ratio" in r else "")
+            + (f"  import {r['import_ms']:.0f} ms, first score {r['first_score_ms']:.1f} ms ({r['model']})"
+               if "import_ms" in r else ""))
+
+
+def compare(old, new, tolerance=TOLERANCE):
+    """
+    Pair results by (case, size, fs) and flag throughput drops, p99 or peak RSS growth.
+
+    Returns:
+        list: (label, metric, old, new, relative change, is_regression)
+    """
+    before = {_key(r): r for r in old["results"] if "error" not in r}
+    rows = []
+    for r in new["results"]:
+        o = before.get(_key(r))
+        if o is None or "error" in r:
+            continue
+        for metric, worse in (("samples_per_s", -1), ("p99_ms", 1), ("peak_rss_mb", 1), ("ratio", -1),
+                              ("import_ms", 1), ("first_score_ms", 1)):
+            a, b = o.get(metric), r.get(metric)
+            if not a or b is None:
+                continue
+            change = (b - a) / a
+            rows.append((_label(r), metric, a, b, change, change * worse > tolerance))
+    return rows
+
+
+if __name__ == "__main__":
+    import argparse
+
+    def seconds(s):
+        unit = {"s": 1, "m": 60, "h": 3600}.get(s[-1:], None)
+        return float(s[:-1]) * unit if unit else float(s)
+
+    ap = argparse.ArgumentParser(description="Benchmark feature extraction, scoring, ingest, retrain and export")
+    ap.add_argument("--cases", default=",".join(CASES), help="comma-separated subset of: " + ", ".join(CASES))
+    ap.add_argument("--sizes", default="1,10,60", help="seconds of raw data, e.g. 1,60,10m,1h")
+    ap.add_argument("--fs", default="10000", help="sample rates in Hz, e.g. 10000,20000")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--format", choices=["praw", "csv"], default="praw", help="capture format for ingest")
+    ap.add_argument("--timeout", type=float, default=None, help="seconds per case")
+    ap.add_argument("-o", "--output", help="write the JSON report here")
+    ap.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two saved reports")
+    ap.add_argument("--tolerance", type=float, default=TOLERANCE)
+    ap.add_argument("--worker", nargs=3, metavar=("CASE", "SIZE", "FS"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.worker:
+        case, size_s, fs = args.worker
+        print(json.dumps(run_case(case, float(size_s), int(fs), args.seed, args.format)))
+        sys.exit(0)
+
+    if args.compare:
+        reports = []
+        for path in args.compare:
+            with open(path) as f:
+                reports.append(json.load(f))
+        rows = compare(*reports, tolerance=args.tolerance)
+        for label, metric, a, b, change, bad in rows:
+            print(f"{label}  {metric:<14} {a:>14,.3f} → {b:>14,.3f}  {change:+7.1%}{'  REGRESSION' if bad else ''}")
+        print(f"{sum(r[-1] for r in rows)} regression(s) worse than {args.tolerance:.0%} in {len(rows)} metrics "
+              f"({reports[0]['environment'].get('commit')} → {reports[1]['environment'].get('commit')})")
+        sys.exit(1 if any(r[-1] for r in rows) else 0)
+
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        ap.error(f"unknown case(s): {', '.join(sorted(unknown))}")
+    report = run_suite(cases, [seconds(s) for s in args.sizes.split(",")],
+                       [int(float(f)) for f in args.fs.split(",")], args.seed, args.format, args.timeout)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=1)
+        print(f"Saved {args.output}")
@@ -0,0 +1,377 @@
+# src/calibrate.py
+"""
+Calibrate the detection operating point: IF threshold, DWELL_HITS and the rule thresholds.
+
+A labelled dataset is scored once with the firmware's Q15 forest. The scores are cached
+under models/calibration/ and keyed by the model and the dataset. Then every combination
+of (threshold, DWELL_HITS, THR_DIDT_A_PER_MS, THR_DROOP_V) is evaluated. The firmware logic is:
+  hit  = score > threshold  OR  (dI_dt > THR_DIDT and Vout_droop > THR_DROOP)
+         [OR ripple_RMS > THR_RIPPLE_V with USE_RIPPLE]
+  trip = DWELL_HITS consecutive hits (fdir_step)
+For a block of thresholds at once, the run of hits ending at window i is i minus the index
+of the last miss. That is one maximum.accumulate over a (windows, thresholds) matrix.
+
+For each combination the sweep reports:
+  recall      labelled fault runs with an alarm (run >= DWELL_HITS) between their first
+              window and `grace` windows after their last one
+  delay       windows from the fault's first window to that alarm (mean / max); a run
+              of hits that began before the fault counts as delay 0
+  false trips runs reaching DWELL_HITS outside faults (and their grace), also per hour
+
+  PYTHONPATH=src python src/calibrate.py data/cubesat_features.csv
+  PYTHONPATH=src python src/calibrate.py --synth storm --duration 1h --max-false-per-h 1 --apply
+
+--apply writes models/operating_point.json (main.py and inference.py use its threshold). It
+also publishes and activates a model version exported with the new threshold, and rewrites
+DWELL_HITS / THR_DIDT_A_PER_MS / THR_DROOP_V in params.h.
+"""
+import os, re, json, hashlib, time
+import numpy as np
+import pandas as pd
+
+from feature_engineering import FEATURE_COLS
+from replay import (PARAMS_H, BLOCK_SAMPLES, FirmwareFeatures, read_params, load_scorer,
+                    model_source, capture_blocks, capture_rate)
+
+CACHE_DIR = "models/calibration/"
+BLOCK_CELLS = 1 << 24                 # windows x thresholds evaluated per step
+DWELLS = (1, 2, 3, 4, 5, 6)
+RULE_SCALES = (0.5, 0.75, 1.0, 1.25, 1.5, 2.0)
+N_THRESHOLDS = 200
+
+
+# -------------------------------------------------
+# Labelled windows, scored once
+# -------------------------------------------------
+def raw_windows(blocks, params):
+    """Firmware features (replay.FirmwareFeatures) for every hop; label = fault_label at the tick."""
+    feats = FirmwareFeatures(params)
+    xs, labels, times = [], [], []
+    for block in blocks:
+        n_new = len(block["time_s"])
+        tick_n, tick_t, X = feats.push(block)
+        xs.append(X); times.append(tick_t)
+        if "fault_label" in block:
+            at = tick_n - 1 - (feats.n_pushed - n_new)          # the tick's sample, in this block
+            labels.append(np.asarray(block["fault_label"])[at] > 0)
+        else:
+            labels.append(np.zeros(len(X), dtype=bool))
+    cat = lambda parts, shape: np.concatenate(parts) if parts else np.empty(shape)
+    return cat(xs, (0, 5)).astype(np.float32), cat(labels, 0).astype(bool), cat(times, 0)
+
+
+def load_windows(path, params):
+    """(X float32 [N, 5], label bool [N], time_s [N]) from a features CSV or a raw capture."""
+    if str(path).endswith(".csv"):
+        cols = pd.read_csv(path, nrows=0).columns
+        if set(FEATURE_COLS) <= set(cols):
+            df = pd.read_csv(path)
+            label = df["fault_label"].to_numpy() > 0 if "fault_label" in cols else np.zeros(len(df), bool)
+            t = df["time_s"].to_numpy() if "time_s" in cols else np.arange(len(df)) * params["HOP_MS"] / 1e3
+            return df[FEATURE_COLS].to_numpy(np.float32), label, t
+    params = dict(params, FS_HZ=int(capture_rate(path)))
+    return raw_windows(capture_blocks(path), params)
+
+
+def _cache_key(model, dataset):
+    h = hashlib.sha1()
+    with open(model, "rb") as f:
+        h.update(f.read())
+    h.update(json.dumps(dataset, sort_keys=True, default=str).encode())
+    return h.hexdigest()[:16]
+
+
+def scored_windows(source, params, model=None, cache_dir=CACHE_DIR, synth=None):
+    """
+    Windows of `source` (path) or of `synth` (TelemetrySynth kwargs) with their Q15 scores.
+
+    Returns:
+        dict: X, label, time_s, score (float32, as iforest_score returns it),
+              threshold (the model's own), cached (bool)
+    """
+    model = model_source(model)
+    if synth is not None:
+        dataset = {"synth": synth, "params": {k: params[k] for k in ("FS_HZ", "WIN_MS", "HOP_MS", "USE_RIPPLE")}}
+    else:
+        st = os.stat(source)
+        dataset = {"path": os.path.abspath(source), "size": st.st_size, "mtime": st.st_mtime_ns,
+                   "params": {k: params[k] for k in ("WIN_MS", "HOP_MS", "USE_RIPPLE")}}
+    path = os.path.join(cache_dir, f"scores_{_cache_key(model, dataset)}.npz")
+    scorer, thr = load_scorer(model)
+    if os.path.exists(path):
+        with np.load(path) as z:
+            return dict({k: z[k] for k in z.files}, threshold=float(thr), cached=True)
+
+    if synth is not None:
+        from synth_telemetry import TelemetrySynth
+        gen = TelemetrySynth(**synth)
+        X, label, t = raw_windows(gen.chunks(BLOCK_SAMPLES / gen.fs), dict(params, FS_HZ=gen.fs))
+    else:
+        X, label, t = load_windows(source, params)
+    finite = np.isfinite(X).all(axis=1)
+    X, label, t = X[finite], label[finite], t[finite]
+    out = {"X": X, "label": label, "time_s": t, "score": scorer.anomaly_score(X).astype(np.float32)}
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = f"{path}.tmp.npz"
+    np.savez(tmp, **out)
+    os.replace(tmp, path)
+    return dict(out, threshold=float(thr), cached=False)
+
+
+# -------------------------------------------------
+# Sweep
+# -------------------------------------------------
+def fault_events(label):
+    """(starts, ends) window indices of each run of labelled windows (ends inclusive)."""
+    d = np.diff(np.concatenate([[0], np.asarray(label, np.int8), [0]]))
+    return np.flatnonzero(d == 1), np.flatnonzero(d == -1) - 1
+
+
+def default_thresholds(score, n=N_THRESHOLDS, extra=()):
+    """Distinct float32 thresholds spread over the upper half of the score distribution."""
+    q = np.quantile(score, np.linspace(0.5, 1.0, n)) if len(score) else np.empty(0)
+    return np.unique(np.concatenate([q, np.asarray(extra, float)]).astype(np.float32))
+
+
+def sweep(score, X, label, thresholds, dwells=DWELLS, didt_grid=(np.inf,), droop_grid=(np.inf,),
+          ripple_thr=None, grace=1, hop_s=None):
+    """
+    Evaluate every (threshold, dwell, thr_didt, thr_droop) combination.
+
+    Returns:
+        DataFrame: one row per combination with threshold, dwell_hits, thr_didt, thr_droop,
+                   detected, recall, delay_mean, delay_max (windows), false_trips,
+                   false_per_h (None without hop_s)
+    """
+    score = np.asarray(score, np.float32)
+    X = np.asarray(X, np.float32)
+    thresholds = np.unique(np.asarray(thresholds, np.float32))
+    n, k = len(score), len(thresholds)
+    starts, ends = fault_events(label)
+    stops = np.minimum(np.append(starts[1:], n), ends + grace + 1)    # alarm window, exclusive
+    cover = np.zeros(n + 1, np.int32)
+    np.add.at(cover, starts, 1)
+    np.add.at(cover, stops, -1)
+    normal = np.cumsum(cover[:n]) == 0
+    normal_h = normal.sum() * hop_s / 3600.0 if hop_s else None
+
+    # window events, concatenated; `offset` keeps a prefix max from leaking across events
+    seg_len = stops - starts
+    seg_of = np.repeat(np.arange(len(starts)), seg_len)
+    seg_pos = np.arange(seg_len.sum()) - np.repeat(np.cumsum(seg_len) - seg_len, seg_len)
+    in_seg = starts[seg_of] + seg_pos
+    offset = seg_of.astype(np.int64) * (k + 1)
+    seg_end = np.cumsum(seg_len)
+    keys = (np.arange(len(starts)) * (k + 1))[:, None] + np.arange(k)[None, :]
+
+    r_score = np.searchsorted(thresholds, score, side="left").astype(np.int32)
+    ripple = X[:, 2] > np.float32(ripple_thr) if ripple_thr is not None else np.zeros(n, bool)
+    cols = {c: [] for c in ("threshold", "dwell_hits", "thr_didt", "thr_droop", "detected",
+                            "delay_mean", "delay_max", "false_trips")}
+    for a in didt_grid:
+        for b in droop_grid:
+            rule = ((X[:, 0] > np.float32(a)) & (X[:, 1] > np.float32(b))) | ripple
+            e = np.where(rule, np.int32(k), r_score)       # window hits threshold j  ⇔  e > j
+            m, d_prev = e.copy(), 1
+            for d in sorted(dwells):
+                for s in range(d_prev, min(d, n + 1)):     # m[i] = min(e[i-d+1 .. i])
+                    np.minimum(m[s:], e[:n - s], out=m[s:])
+                    m[s - 1] = -1
+                d_prev = max(d_prev, d)
+                # trip at i (run == d) for thresholds j with  e[i-d] <= j < m[i]
+                hi = m[d - 1:]
+                lo = np.concatenate([np.zeros(1, np.int32), e[:len(hi) - 1]])[:len(hi)]
+                sel = (hi > lo) & normal[d - 1:]
+                diff = (np.bincount(lo[sel], minlength=k + 1)[:k + 1] -
+                        np.bincount(hi[sel], minlength=k + 1)[:k + 1])
+                false = np.cumsum(diff)[:k]
+                # first alarm (m > j) in each event window
+                if len(starts):
+                    pm = np.maximum.accumulate(m[in_seg].astype(np.int64) + offset)
+                    first = np.searchsorted(pm, keys, side="right")
+                    hit = first < seg_end[:, None]
+                    delay = np.where(hit, first - (seg_end - seg_len)[:, None], 0)
+                    det = hit.sum(axis=0)
+                    mean = np.where(det > 0, delay.sum(axis=0) / np.maximum(det, 1), np.nan)
+                    worst = np.where(det > 0, np.where(hit, delay, -1).max(axis=0), -1)
+                else:
+                    det = np.zeros(k, int)
+                    mean, worst = np.full(k, np.nan), np.full(k, -1)
+                cols["threshold"].append(thresholds)
+                cols["dwell_hits"].append(np.full(k, d))
+                cols["thr_didt"].append(np.full(k, a, np.float32))
+                cols["thr_droop"].append(np.full(k, b, np.float32))
+                cols["detected"].append(det)
+                cols["delay_mean"].append(mean)
+                cols["delay_max"].append(worst)
+                cols["false_trips"].append(false)
+    table = pd.DataFrame({c: np.concatenate(v) if v else np.empty(0) for c, v in cols.items()})
+    table.insert(5, "recall", table["detected"] / len(starts) if len(starts) else np.nan)
+    table["false_per_h"] = table["false_trips"] / normal_h if normal_h else None
+    return table
+
+
+def rank(table, max_false_per_h=None, max_false=0):
+    """
+    Combinations within the false-trip budget, best first: highest recall, then the
+    shortest mean delay, then fewer false trips, then the most conservative threshold /
+    dwell / rules. When nothing meets the budget, those with the fewest false trips.
+    """
+    if max_false_per_h is not None and table["false_per_h"].notna().all():
+        ok = table["false_per_h"] <= max_false_per_h
+    else:
+        ok = table["false_trips"] <= max_false
+    pool = table[ok] if ok.any() else table[table["false_trips"] == table["false_trips"].min()]
+    order = pool.assign(_d=pool["delay_mean"].fillna(np.inf)).sort_values(
+        ["recall", "_d", "false_trips", "threshold", "dwell_hits", "thr_didt", "thr_droop"],
+        ascending=[False, True, True, False, False, False, False])
+    return order.drop(columns="_d")
+
+
+def choose(table, max_false_per_h=None, max_false=0):
+    """The operating point: first row of `rank`."""
+    return rank(table, max_false_per_h, max_false).iloc[0]
+
+
+# -------------------------------------------------
+# Write-back
+# -------------------------------------------------
+def write_params(path, values):
+    """
+    Rewrite `#define NAME value` lines of params.h in place, keeping their layout. The
+    comment is tagged with the value it replaced, since it may describe the old one.
+    """
+    with open(path) as f:
+        text = f.read()
+
+    def sub(m, lit):
+        prefix, old, gap, comment = m.groups()
+        was = re.search(r"\[calibrated, was (\S+)\]", comment)
+        was = was.group(1) if was else old
+        comment = re.sub(r"\s*\[calibrated, was \S+\]", "", comment)
+        comment = f"{comment} [calibrated, was {was}]" if comment else f"// calibrated, was {was}"
+        return prefix + lit + " " * max(1, len(old) + len(gap) - len(lit)) + comment
+
+    for name, v in values.items():
+        lit = str(int(v)) if isinstance(v, (int, np.integer)) else f"{float(v):.6g}f"
+        text, n = re.subn(rf"^(\s*#define\s+{name}\s+)(\S+)([ \t]*)(.*)$", lambda m: sub(m, lit),
+                          text, count=1, flags=re.M)
+        if n == 0:
+            raise KeyError(f"{name} is not defined in {path}")
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def apply_operating_point(op, model_dir="models/", params_path=PARAMS_H):
+    """
+    Write `op` to operating_point.json and publish + activate the active model re-exported
+    with op["threshold"]. Also set DWELL_HITS and the rule thresholds in params.h.
+
+    Returns:
+        str: the new model version ID
+    """
+    from model_registry import ModelRegistry, OPERATING_POINT_FILE
+    reg = ModelRegistry(model_dir)
+    iso, scaler, base = reg.load()
+    vid = reg.publish(iso, scaler, threshold=op["threshold"],
+                      meta={"calibrated_from": base, "operating_point": op})
+    reg.activate(vid)
+    op = dict(op, model_version=vid)
+    tmp = os.path.join(model_dir, OPERATING_POINT_FILE + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(op, f, indent=1)
+    os.replace(tmp, os.path.join(model_dir, OPERATING_POINT_FILE))
+    if params_path:
+        write_params(params_path, {"DWELL_HITS": int(op["dwell_hits"]),
+                                   "THR_DIDT_A_PER_MS": op["thr_didt"], "THR_DROOP_V": op["thr_droop"]})
+    return vid
+
+
+def print_table(table, n=10):
+    cols = ["threshold", "dwell_hits", "thr_didt", "thr_droop", "recall", "delay_mean", "delay_max",
+            "false_trips", "false_per_h"]
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(table[cols].head(n).to_string(index=False, float_format=lambda v: f"{v:.6g}"))
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Sweep threshold / dwell / rule thresholds on labelled data")
+    ap.add_argument("dataset", nargs="?", default="data/cubesat_features.csv",
+                    help="features CSV with fault_label, or a raw capture (.praw / CSV)")
+    ap.add_argument("--synth", metavar="SCENARIO", help="calibrate on synthetic telemetry instead")
+    ap.add_argument("--duration", default="15m")
+    ap.add_argument("--fs", type=int, help="synthetic sample rate (default: FS_HZ)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--model", help="model header (.h) or image (.bin); default: active version")
+    ap.add_argument("--rail", help="calibrate this rail (models/rails/<rail>/, see rails.py); params.h is left alone")
+    ap.add_argument("--params", default=PARAMS_H)
+    ap.add_argument("--thresholds", type=int, default=N_THRESHOLDS, help="number of IF thresholds")
+    ap.add_argument("--dwell", default=",".join(map(str, DWELLS)))
+    ap.add_argument("--rule-scale", default=",".join(map(str, RULE_SCALES)),
+                    help="multiples of THR_DIDT_A_PER_MS / THR_DROOP_V to try")
+    ap.add_argument("--max-false-per-h", type=float, help="false-trip budget (default: none allowed)")
+    ap.add_argument("--top", type=int, default=10)
+    ap.add_argument("--out", help="write the whole sweep to this CSV")
+    ap.add_argument("--apply", action="store_true", help="write the chosen point back (see module doc)")
+    args = ap.parse_args()
+
+    params = read_params(args.params)
+    model_dir = "models/"
+    if args.rail:
+        from rails import RAILS_DIR
+        from model_registry import ModelRegistry, HEADER_FILE
+        model_dir = os.path.join(RAILS_DIR, args.rail, "")
+        vid = ModelRegistry(model_dir).current()
+        if vid is None:
+            ap.error(f"rail {args.rail} has no published model yet")
+        args.model = args.model or ModelRegistry(model_dir).path(vid, HEADER_FILE)
+    synth = None
+    if args.synth:
+        from synth_telemetry import parse_duration
+        synth = {"duration_s": parse_duration(args.duration), "fs": args.fs or int(params["FS_HZ"]),
+                 "scenario": args.synth, "seed": args.seed}
+    start = time.perf_counter()
+    data = scored_windows(args.dataset, params, args.model, synth=synth)
+    n_events = len(fault_events(data["label"])[0])
+    print(f"{len(data['score'])} windows, {n_events} fault runs "
+          f"({'cached scores' if data['cached'] else 'scored'} in {time.perf_counter() - start:.2f} s)")
+
+    scales = [float(v) for v in args.rule_scale.split(",")]
+    thresholds = default_thresholds(data["score"], args.thresholds, extra=[data["threshold"]])
+    hop_s = float(np.median(np.diff(data["time_s"]))) if len(data["time_s"]) > 1 else None
+    start = time.perf_counter()
+    table = sweep(data["score"], data["X"], data["label"], thresholds,
+                  dwells=[int(v) for v in args.dwell.split(",")],
+                  didt_grid=[params["THR_DIDT_A_PER_MS"] * k for k in scales],
+                  droop_grid=[params["THR_DROOP_V"] * k for k in scales],
+                  ripple_thr=params["THR_RIPPLE_V"] if params.get("USE_RIPPLE", 0) else None,
+                  grace=max(1, int(params["WIN_MS"]) // int(params["HOP_MS"])), hop_s=hop_s)
+    print(f"Swept {len(table)} combinations in {time.perf_counter() - start:.2f} s")
+    if args.out:
+        table.to_csv(args.out, index=False)
+
+    ranked = rank(table, args.max_false_per_h)
+    best = ranked.iloc[0]
+    print_table(ranked, args.top)
+    current = table[(table["threshold"] == np.float32(data["threshold"])) &
+                    (table["dwell_hits"] == params["DWELL_HITS"]) &
+                    np.isclose(table["thr_didt"], params["THR_DIDT_A_PER_MS"]) &
+                    np.isclose(table["thr_droop"], params["THR_DROOP_V"])]
+    for name, row in [("Current", current.iloc[0] if len(current) else None), ("Chosen", best)]:
+        if row is not None:
+            print(f"{name}: threshold {row['threshold']:.6f}, DWELL_HITS {int(row['dwell_hits'])}, "
+                  f"THR_DIDT {row['thr_didt']:.4g}, THR_DROOP {row['thr_droop']:.4g} → recall {row['recall']:.3f}, "
+                  f"delay {row['delay_mean']:.2f} windows, {int(row['false_trips'])} false trips")
+
+    if args.apply:
+        op = {"threshold": float(best["threshold"]), "dwell_hits": int(best["dwell_hits"]),
+              "thr_didt": float(best["thr_didt"]), "thr_droop": float(best["thr_droop"]),
+              "recall": float(best["recall"]), "delay_mean_windows": float(best["delay_mean"]),
+              "false_trips": int(best["false_trips"]), "dataset": args.synth or args.dataset,
+              "created": time.time()}
+        vid = apply_operating_point(op, model_dir, params_path=None if args.rail else args.params)
+        print(f"Operating point written: model {vid} activated"
+              + ("" if args.rail else f", {args.params} updated"))
@@ -0,0 +1,372 @@
+# src/compiled_forest.py
+import os, json
+import ctypes
+import ctypes.util
+import numpy as np
+
+from model_export import (flatten_forest, quantize_model, read_q15_header,
+                          LAYOUT_TREE_LOCAL, LAYOUT_ADJACENT)
+
+EULER_GAMMA = 0.5772156649015329
+CHUNK_ROWS = 8192   # samples traversed together; bounds the (rows, trees) work arrays
+FLAT_FORMAT = 1
+FLAT_META = "flat.json"
+# float-mode arrays of a flat model directory, one .npy each (see CompiledForest.save_flat)
+FLAT_ARRAYS = ("feature", "threshold", "leaf_c", "left", "right", "_next_left", "_next_right", "tree_offsets")
+
+
+def _libm():
+    """libm's logf/powf, so Q15 mode uses the same transcendental functions as the firmware."""
+    try:
+        lib = ctypes.CDLL(ctypes.util.find_library("m") or "libm.so.6")
+        for name in ("logf", "powf"):
+            fn = getattr(lib, name)
+            fn.restype = ctypes.c_float
+            fn.argtypes = [ctypes.c_float] * (1 if name == "logf" else 2)
+        return lib
+    except (OSError, AttributeError):
+        return None
+
+_LIBM = _libm()
+
+
+def _logf(x):
+    if _LIBM is not None:
+        return np.float32(_LIBM.logf(float(x)))
+    return np.log(np.float32(x))
+
+
+def _powf_2(e):
+    """powf(2.0f, e) element-wise on a float32 array, evaluated once per distinct exponent."""
+    if _LIBM is None:
+        return np.power(np.float32(2.0), e)
+    u, inv = np.unique(e, return_inverse=True)
+    vals = np.array([_LIBM.powf(2.0, float(v)) for v in u], dtype=np.float32)
+    return vals[inv].reshape(e.shape)
+
+
+def _c_sklearn(n):
+    """sklearn's _average_path_length (c(2) == 1)."""
+    n = np.asarray(n).reshape(1, -1)
+    c = np.zeros(n.shape)
+    c[n == 2] = 1.0
+    m = n > 2
+    c[m] = 2.0 * (np.log(n[m] - 1.0) + np.euler_gamma) - 2.0 * (n[m] - 1.0) / n[m]
+    return c.ravel()
+
+
+def _c_firmware(ns):
+    """c_of((float)ns) from features_if.c in float32, for ns already clamped to >= 1."""
+    out = np.zeros(len(ns), dtype=np.float32)
+    two, one, gamma = np.float32(2.0), np.float32(1.0), np.float32(EULER_GAMMA)
+    for n in np.unique(ns):
+        if n <= 1:
+            continue
+        nf = np.float32(n)
+        out[ns == n] = two * (_logf(nf - one) + gamma) - (two * (nf - one) / nf)
+    return out
+
+
+class CompiledForest:
+    """
+    Vectorized Isolation Forest evaluator over the flattened export arrays.
+
+    All samples of a chunk advance one tree level per iteration with array gathers over a
+    (rows, trees) matrix of node indices, so there is no per-sample tree walk and no
+    sklearn dependency at scoring time.
+
+    Two modes:
+      - "float": inputs are scaled features; `score_samples`/`decision_function` match
+        `IsolationForest` exactly (float32 compares against float64 thresholds,
+        sklearn's c(n), sequential float64 depth accumulation).
+      - "q15": inputs are raw features; `anomaly_score` reproduces `iforest_score()` in
+        features_if.c in float32: Q15 dequantization, make_z, c_of and powf via libm.
+        Bit-exact against a build without FP contraction (-ffp-contract=off or x86-64).
+    """
+
+    def __init__(self, arrays, mode="float", offset=-0.5):
+        if mode not in ("float", "q15"):
+            raise ValueError(f"Unknown mode: {mode}")
+        self.mode = mode
+        self.offset_ = offset
+        self.feature = np.asarray(arrays.get("features_idx", arrays.get("feature")), dtype=np.int64)
+        self.tree_offsets = np.asarray(arrays["tree_offsets"], dtype=np.int64)
+        self.n_trees = len(self.tree_offsets)
+        self.left, self.right = self._global_children(arrays, self.tree_offsets)
+        self.is_leaf = (self.left == -1) & (self.right == -1)
+        self.feature = np.where(self.is_leaf, 0, self.feature)   # safe gather index at leaves
+        # traversal: leaves point at themselves, so every pair can take max_depth steps
+        idx = np.arange(len(self.left))
+        self._next_left = np.where(self.is_leaf, idx, self.left)
+        self._next_right = np.where(self.is_leaf, idx, self.right)
+        self.max_depth = self._max_depth()
+        ns = np.asarray(arrays["node_samples"], dtype=np.int64)
+
+        if mode == "float":
+            self.threshold = np.asarray(arrays["threshold"], dtype=np.float64)
+            # per tree, like sklearn: vectorized np.log rounding depends on the array layout
+            self.leaf_c = np.concatenate([_c_sklearn(seg) for seg in np.split(ns, self.tree_offsets[1:])])
+            self.c_max = float(_c_sklearn([arrays["max_samples"]])[0])
+        else:
+            f32 = np.float32
+            deq = lambda q, s: (q.astype(f32) / f32(32767.0)) * f32(s)
+            self.threshold = deq(np.asarray(arrays["thresholds_q15"]), arrays["scale_thresholds"])
+            self.mean = deq(np.asarray(arrays["scaler_mean_q15"]), arrays["scale_mean"])
+            sd = deq(np.asarray(arrays["scaler_scale_q15"]), arrays["scale_scale"])
+            self.sd = np.where(np.abs(sd) < f32(1e-12), f32(1.0), sd).astype(f32)
+            self.leaf_c = _c_firmware(np.where(ns <= 0, 1, ns))
+            cmax = f32(arrays["iforest_c_maxsamples"])
+            self.c_max = cmax if cmax > f32(1e-9) else f32(1.0)
+            self.n_features = len(self.mean)
+
+    @staticmethod
+    def _global_children(arrays, tree_offsets):
+        """Children as global node indices, whatever the export layout (see forest_opt.py)."""
+        layout = int(arrays.get("layout", 0))
+        left = np.asarray(arrays["children_left"], dtype=np.int64)
+        right = None if layout & LAYOUT_ADJACENT else np.asarray(arrays["children_right"], dtype=np.int64)
+        if layout & LAYOUT_TREE_LOCAL:
+            base = np.repeat(tree_offsets, np.diff(np.append(tree_offsets, len(left))))
+            left = np.where(left >= 0, left + base, -1)
+            right = None if right is None else np.where(right >= 0, right + base, -1)
+        if right is None:
+            right = np.where(left >= 0, left + 1, -1)
+        return left, right
+
+    def _max_depth(self):
+        frontier, d = self.tree_offsets, 0
+        while True:
+            frontier = frontier[~self.is_leaf[frontier]]
+            if not len(frontier):
+                return d
+            d += 1
+            frontier = np.concatenate([self.left[frontier], self.right[frontier]])
+
+    # ---------------- constructors ----------------
+    @classmethod
+    def from_estimator(cls, iso):
+        """Float mode from a fitted IsolationForest (or a `flatten_forest` dict)."""
+        flat = iso if isinstance(iso, dict) else flatten_forest(iso)
+        cf = cls(flat, "float", offset=getattr(iso, "offset_", -0.5))
+        if hasattr(iso, "_average_path_length_per_tree"):
+            # c(n) as computed at fit time (np.log rounding differs between machines)
+            cf.leaf_c = np.concatenate(iso._average_path_length_per_tree)
+        return cf
+
+    @classmethod
+    def from_q15(cls, source, scaler=None, threshold=0.56):
+        """
+        Q15 mode from a header path, a `quantize_model`/`read_q15_header` dict, or a fitted
+        IsolationForest plus its scaler (quantized exactly as the exporter would).
+        """
+        if isinstance(source, str):
+            q = read_q15_header(source)
+        elif isinstance(source, dict) and "thresholds_q15" in source:
+            q = source
+        else:
+            q = quantize_model(source, scaler, threshold)
+        return cls(q, "q15")
+
+    # ---------------- flat .npy directory ----------------
+    def save_flat(self, path, scaler=None, meta=None):
+        """
+        Write a float-mode forest (and its scaler's statistics) as one .npy file per array
+        plus flat.json (with `meta` merged in), for `load_flat`. Nothing in it needs sklearn
+        or pickle to read.
+        """
+        if self.mode != "float":
+            raise ValueError("only float-mode forests are saved flat")
+        os.makedirs(path, exist_ok=True)
+        arrays = {name.lstrip("_"): getattr(self, name) for name in FLAT_ARRAYS}
+        meta = {"format": FLAT_FORMAT, "offset": float(self.offset_), "c_max": float(self.c_max),
+                "max_depth": int(self.max_depth), "n_trees": int(self.n_trees), **(meta or {})}
+        if scaler is not None:
+            var = getattr(scaler, "var_", None)
+            arrays.update(scaler_mean=scaler.mean_, scaler_scale=scaler.scale_,
+                          scaler_var=np.asarray(scaler.scale_) ** 2 if var is None else var)
+            meta["scaler_n"] = int(np.max(scaler.n_samples_seen_))
+            names = getattr(scaler, "feature_names_in_", None)
+            meta["feature_names"] = None if names is None else [str(n) for n in names]
+        for name, a in arrays.items():
+            np.save(os.path.join(path, f"{name}.npy"), np.ascontiguousarray(a))
+        with open(os.path.join(path, FLAT_META), "w") as f:
+            json.dump(meta, f, indent=1)
+
+    @classmethod
+    def load_flat(cls, path, mmap_mode="r"):
+        """
+        Float-mode forest from a `save_flat` directory. The arrays are memory-mapped (read-only,
+        paged in on first use) and used as they are, so loading costs a few file opens.
+
+        Returns:
+            tuple: (CompiledForest, FlatScaler or None, flat.json contents)
+        """
+        with open(os.path.join(path, FLAT_META)) as f:
+            meta = json.load(f)
+        if meta.get("format") != FLAT_FORMAT:
+            raise ValueError(f"{path}: unsupported flat model format {meta.get('format')}")
+        load = lambda name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+        cf = cls.__new__(cls)
+        for name in FLAT_ARRAYS:
+            setattr(cf, name, load(name.lstrip("_")))
+        cf.mode, cf.offset_, cf.c_max = "float", meta["offset"], meta["c_max"]
+        cf.max_depth, cf.n_trees = meta["max_depth"], meta["n_trees"]
+        cf.is_leaf = (cf.left == -1) & (cf.right == -1)
+        scaler = None
+        if "scaler_n" in meta:
+            scaler = FlatScaler(load("scaler_mean"), load("scaler_scale"), load("scaler_var"),
+                                meta["scaler_n"], meta.get("feature_names"))
+        return cf, scaler, meta
+
+    # ---------------- traversal ----------------
+    def _walk(self, Z, roots=None):
+        """Leaf node and depth for every (sample, tree) pair of one chunk (from `roots`, (n, trees))."""
+        n = len(Z)
+        Zf = np.ascontiguousarray(Z).ravel()
+        row = np.repeat(np.arange(n) * Z.shape[1], self.n_trees)     # flat (sample, tree) pairs
+        node = np.tile(self.tree_offsets, n) if roots is None else roots.ravel()
+        depth = np.zeros(len(node), dtype=np.int64)
+        for _ in range(self.max_depth):
+            go_left = Zf[row + self.feature[node]] <= self.threshold[node]
+            nxt = np.where(go_left, self._next_left[node], self._next_right[node])
+            depth += nxt != node
+            node = nxt
+        return node.reshape(n, self.n_trees), depth.reshape(n, self.n_trees)
+
+    def _chunks(self, X):
+        X = np.asarray(X)
+        for i in range(0, len(X), CHUNK_ROWS):
+            yield X[i:i + CHUNK_ROWS]
+
+    def _h_float(self, Z):
+        node, depth = self._walk(Z.astype(np.float32))
+        return (depth + 1.0) + self.leaf_c[node] - 1.0
+
+    def _h_q15(self, X):
+        z = (X.astype(np.float32) - self.mean) / self.sd
+        node, depth = self._walk(z)
+        return depth.astype(np.float32) + self.leaf_c[node]
+
+    def _score_float(self, Z):
+        h = self._h_float(Z)
+        depths = np.zeros(len(Z))
+        for t in range(self.n_trees):   # same accumulation order as sklearn
+            depths += h[:, t]
+        return 2 ** (-(depths / (self.n_trees * self.c_max)))
+
+    def _score_q15(self, X):
+        h = self._h_q15(X)
+        sum_h = np.zeros(len(X), dtype=np.float32)
+        for t in range(self.n_trees):   # sequential float32 sum, as in the C loop
+            sum_h += h[:, t]
+        Eh = sum_h / np.float32(self.n_trees)
+        return _powf_2(-Eh / self.c_max)
+
+    # ---------------- public scoring ----------------
+    def anomaly_score(self, X):
+        """Higher ⇒ more anomalous. Float mode: -score_samples; Q15 mode: iforest_score()."""
+        fn = self._score_float if self.mode == "float" else self._score_q15
+        parts = [fn(c) for c in self._chunks(X)]
+        return np.concatenate(parts) if parts else np.empty(0)
+
+    def score_samples(self, X):
+        return -self.anomaly_score(X)
+
+    def decision_function(self, X):
+        return self.score_samples(X) - self.offset_
+
+    def path_lengths(self, X):
+        """(samples, trees) path length h incl. the leaf c(n) term, the per-tree score input."""
+        fn = self._h_float if self.mode == "float" else self._h_q15
+        parts = [fn(c) for c in self._chunks(X)]
+        return np.concatenate(parts) if parts else np.empty((0, self.n_trees))
+
+    def path_steps(self, X):
+        """Mean internal nodes visited per tree for each sample (traversal cost)."""
+        Z = np.asarray(X, dtype=np.float32)
+        if self.mode == "q15":
+            Z = (Z - self.mean) / self.sd
+        parts = [self._walk(c)[1].mean(axis=1) for c in self._chunks(Z)]
+        return np.concatenate(parts) if parts else np.empty(0)
+
+
+class FlatScaler:
+    """StandardScaler.transform from saved statistics, for flat models (no sklearn import)."""
+
+    def __init__(self, mean, scale, var, n_samples_seen, feature_names=None):
+        self.mean_, self.scale_, self.var_ = mean, scale, var
+        self.n_samples_seen_ = n_samples_seen
+        self.n_features_in_ = len(mean)
+        if feature_names is not None:
+            self.feature_names_in_ = np.array(feature_names, dtype=object)
+
+    def transform(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        if X.shape[-1] != self.n_features_in_:
+            raise ValueError(f"X has {X.shape[-1]} features, but the scaler expects {self.n_features_in_}")
+        return (X - self.mean_) / self.scale_
+
+    def inverse_transform(self, Z):
+        return np.asarray(Z, dtype=np.float64) * self.scale_ + self.mean_
+
+
+class StackedForest:
+    """
+    Float-mode forests with the same number of trees, walked together in one traversal.
+
+    Node arrays are concatenated and every sample starts from the roots of its own forest
+    (`member`), so a batch mixing several rails' windows costs one pass over a
+    (rows, trees) matrix instead of one per forest. Scores equal each member's own
+    `CompiledForest` (and so its IsolationForest) exactly.
+    """
+
+    def __init__(self, forests):
+        forests = list(forests)
+        if not forests or any(f.mode != "float" for f in forests) or len({f.n_trees for f in forests}) != 1:
+            raise ValueError("StackedForest needs float-mode forests with equal tree counts")
+        base = np.cumsum([0] + [len(f.left) for f in forests[:-1]])
+        cat = lambda name, shift: np.concatenate([getattr(f, name) + (b if shift else 0)
+                                                  for f, b in zip(forests, base)])
+        self.n_trees = forests[0].n_trees
+        self.feature, self.threshold, self.leaf_c = cat("feature", False), cat("threshold", False), cat("leaf_c", False)
+        self._next_left, self._next_right = cat("_next_left", True), cat("_next_right", True)
+        self.roots = np.stack([f.tree_offsets + b for f, b in zip(forests, base)])
+        self.max_depth = max(f.max_depth for f in forests)
+        self.c_max = np.array([f.c_max for f in forests])
+        self.offset_ = np.array([f.offset_ for f in forests])
+
+    _walk = CompiledForest._walk
+
+    def anomaly_score(self, Z, member):
+        """-score_samples of each row's forest; Z are scaled features, member the forest index."""
+        Z, member = np.asarray(Z), np.asarray(member, dtype=np.int64)
+        out = np.empty(len(Z))
+        for i in range(0, len(Z), CHUNK_ROWS):
+            z, m = Z[i:i + CHUNK_ROWS], member[i:i + CHUNK_ROWS]
+            node, depth = self._walk(z.astype(np.float32), self.roots[m])
+            h = (depth + 1.0) + self.leaf_c[node] - 1.0
+            depths = np.zeros(len(z))
+            for t in range(self.n_trees):   # same accumulation order as sklearn
+                depths += h[:, t]
+            out[i:i + CHUNK_ROWS] = 2 ** (-(depths / (self.n_trees * self.c_max[m])))
+        return out
+
+    def decision_function(self, Z, member):
+        return -self.anomaly_score(Z, member) - self.offset_[np.asarray(member, dtype=np.int64)]
+
+
+def quantization_error(iso, scaler, X, header=None, threshold=0.56):
+    """
+    Compare the exported Q15 scorer with the float model on raw features X.
+
+    Returns:
+        dict: max/mean absolute score error and the number of threshold decisions that flip
+    """
+    ref = CompiledForest.from_estimator(iso).anomaly_score(scaler.transform(X))
+    q15 = CompiledForest.from_q15(header if header else iso, scaler, threshold).anomaly_score(X)
+    err = np.abs(q15.astype(np.float64) - ref)
+    return {
+        "max_abs_err": float(err.max()) if len(err) else 0.0,
+        "mean_abs_err": float(err.mean()) if len(err) else 0.0,
+        "flipped": int(np.sum((q15 > threshold) != (ref > threshold))),
+    }
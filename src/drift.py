@@ -0,0 +1,169 @@
+# src/drift.py
+"""
+Streaming drift sketches: when has the input moved far enough from the training data to retrain?
+
+A Sketch is a set of fixed-bin histograms, so its memory is constant and partial sketches add up:
+  - one per feature, over the z-score of the model's scaler: Z_BINS bins on [-Z_MAX, Z_MAX] plus
+    an underflow and an overflow bin
+  - one over the anomaly score (-decision_function): S_BINS bins on [S_MIN, S_MAX] plus both ends
+Ingest workers sketch the healthy windows they score (ingest.score_windows), the same population
+as the training rows, and the Regulator merges the per-file sketches. Counts decay with a half-life in windows, so the live sketch follows
+recent data without forgetting a slow drift too soon.
+
+At training, the reference sketch of the training windows the new forest keeps as healthy, scored
+by it, is published with the model version (DRIFT_FILE). `psi` compares the live sketch with it per histogram. Fine
+bins are merged into runs that each hold at least `min_frac` of the reference mass, so sparse tails
+do not dominate. PSI = sum (p - q) ln(p / q). Rule of thumb: < 0.1 stable, 0.1-0.25 moderate,
+> 0.25 a real shift.
+"""
+import json
+import os
+import numpy as np
+
+DRIFT_FILE = "drift_reference.json"
+Z_MAX, Z_BINS = 6.0, 48
+S_MIN, S_MAX, S_BINS = -0.5, 0.5, 50
+MIN_FRAC = 0.05
+EPS = 1e-4
+
+
+def _bin(v, lo, hi, n):
+    """Fixed-bin index with 0 = underflow and n + 1 = overflow (NaN counts as overflow)."""
+    x = np.nan_to_num((np.asarray(v, dtype=np.float64) - lo) * (n / (hi - lo)), nan=n, posinf=n, neginf=-1)
+    return np.clip(np.floor(x), -1, n).astype(np.int64) + 1
+
+
+class Sketch:
+    """Fixed-bin histograms of z-scored features and of the anomaly score; `n` is the total weight."""
+
+    def __init__(self, n_features, features=None, score=None, n=0.0):
+        self.features = np.zeros((n_features, Z_BINS + 2)) if features is None else np.asarray(features, float)
+        self.score = np.zeros(S_BINS + 2) if score is None else np.asarray(score, float)
+        self.n = float(n)
+
+    @classmethod
+    def of(cls, Z, scores):
+        """Sketch of scaled windows Z (n, n_features) and their anomaly scores."""
+        Z = np.asarray(Z, dtype=np.float64)
+        sk = cls(Z.shape[1] if Z.ndim == 2 else 0)
+        if len(Z):
+            k = Z_BINS + 2
+            idx = _bin(Z, -Z_MAX, Z_MAX, Z_BINS) + np.arange(Z.shape[1]) * k
+            sk.features = np.bincount(idx.ravel(), minlength=Z.shape[1] * k).reshape(Z.shape[1], k).astype(float)
+            sk.score = np.bincount(_bin(scores, S_MIN, S_MAX, S_BINS), minlength=S_BINS + 2).astype(float)
+            sk.n = float(len(Z))
+        return sk
+
+    def merge(self, other, half_life=None):
+        """Add `other`; with a half-life (windows), first decay this sketch by other.n windows."""
+        if other is None or other.n == 0:
+            return self
+        if half_life:
+            f = 0.5 ** (other.n / half_life)
+            self.features *= f
+            self.score *= f
+            self.n *= f
+        self.features += other.features
+        self.score += other.score
+        self.n += other.n
+        return self
+
+    def quantiles(self, q):
+        """Approximate quantiles (z units per feature, score units) by linear interpolation in the bins."""
+        z_edges = np.concatenate([[-np.inf], np.linspace(-Z_MAX, Z_MAX, Z_BINS + 1), [np.inf]])
+        s_edges = np.concatenate([[-np.inf], np.linspace(S_MIN, S_MAX, S_BINS + 1), [np.inf]])
+        return (np.array([_quantile(h, z_edges, q) for h in self.features]),
+                _quantile(self.score, s_edges, q))
+
+    # ---------------- persistence ----------------
+    def to_dict(self):
+        return {"n": self.n, "features": self.features.tolist(), "score": self.score.tolist(),
+                "bins": {"z_max": Z_MAX, "z_bins": Z_BINS, "s_min": S_MIN, "s_max": S_MAX, "s_bins": S_BINS}}
+
+    @classmethod
+    def from_dict(cls, d):
+        b = d.get("bins", {})
+        if (b.get("z_bins"), b.get("s_bins")) != (Z_BINS, S_BINS):
+            raise ValueError("sketch was written with other bins")
+        f = np.asarray(d["features"], float)
+        return cls(len(f), f, d["score"], d["n"])
+
+    def save(self, path, **extra):
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({**self.to_dict(), **extra}, f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        """(Sketch, the whole record) or (None, None) if there is none."""
+        try:
+            with open(path) as f:
+                d = json.load(f)
+            return cls.from_dict(d), d
+        except (FileNotFoundError, ValueError, KeyError):
+            return None, None
+
+
+def _quantile(hist, edges, q):
+    total = hist.sum()
+    if total <= 0:
+        return np.full(np.shape(q), np.nan)
+    cdf = np.concatenate([[0.0], np.cumsum(hist)]) / total
+    lo = np.clip(np.searchsorted(cdf, q, side="right") - 1, 0, len(hist) - 1)
+    a, b = edges[lo], edges[lo + 1]
+    a = np.where(np.isinf(a), b, a)                 # open end bins collapse onto their finite edge
+    b = np.where(np.isinf(b), a, b)
+    frac = np.where(hist[lo] > 0, (np.asarray(q) - cdf[lo]) / np.maximum(hist[lo] / total, 1e-300), 0.0)
+    return a + np.clip(frac, 0, 1) * (b - a)
+
+
+def _groups(ref, min_frac=MIN_FRAC):
+    """Group ids merging adjacent bins until each group holds >= min_frac of the reference."""
+    total = ref.sum()
+    gid, acc, g = np.empty(len(ref), np.int64), 0.0, 0
+    for i, c in enumerate(ref):
+        gid[i] = g
+        acc += c
+        if acc >= min_frac * total:
+            g, acc = g + 1, 0.0
+    if acc and g:                                   # a thin last group joins the one before
+        gid[gid == g] = g - 1
+    return gid
+
+
+def psi_hist(ref, live, min_frac=MIN_FRAC):
+    """Population stability index of one live histogram against its reference."""
+    if ref.sum() <= 0 or live.sum() <= 0:
+        return np.nan
+    gid = _groups(ref, min_frac)
+    p = np.bincount(gid, weights=ref) / ref.sum()
+    q = np.bincount(gid, weights=live) / live.sum()
+    p, q = np.maximum(p, EPS), np.maximum(q, EPS)
+    return float(np.sum((q - p) * np.log(q / p)))
+
+
+def psi(reference, live, min_frac=MIN_FRAC):
+    """
+    Returns:
+        tuple: (PSI per feature [n_features], PSI of the anomaly score)
+    """
+    feats = np.array([psi_hist(r, l, min_frac) for r, l in zip(reference.features, live.features)])
+    return feats, psi_hist(reference.score, live.score, min_frac)
+
+
+def reference_sketch(iso, scaler, X, healthy_score=None):
+    """
+    Sketch of training windows X (raw features) scored by the forest trained on them.
+
+    With `healthy_score` (-decision_function units), only the windows that forest keeps as
+    healthy (score at or below it), the population the ingest workers sketch live; all of X if
+    it keeps none.
+    """
+    Z = scaler.transform(X)
+    scores = -iso.decision_function(Z)
+    if healthy_score is not None:
+        kept = scores <= healthy_score
+        if kept.any():
+            Z, scores = Z[kept], scores[kept]
+    return Sketch.of(Z, scores)
@@ -0,0 +1,382 @@
+# src/event_capture.py
+"""
+Pre/post-trigger capture of anomalies, and their compact encoding for downlink.
+
+EventCapture runs over a stream of raw blocks and the feature windows scored on them.
+It keeps the last `pre_ms` of raw samples in a ring. A window scoring above the threshold
+opens an event: the ring gives the samples before the trigger, and the next `post_ms` of
+samples are added as they arrive. Triggers inside an open event's span are merged into it
+(`hits`). The windows (time, features, score) covering the span are kept with the raw samples.
+
+Event layout (little-endian):
+  header   96 B  magic "PSEVT1\\0\\0", u32 event id, f64 t_trigger, t_start, fs,
+                 f32 score, threshold, u32 n_rows, pre_rows, hits, n_windows, body size,
+                 u16 n_cols, n_features, flags, char[16] model version, zero padding
+  body           column table, 32 B per column: char[14] name, char code, u8 masked,
+                 f64 fixed-point step, i64 first value (steps)
+                 then per column: if masked, a bit mask of its non-finite rows
+                 (ceil(n_rows / 8) B, first row in the high bit), decoded as NaN; then
+                 code 'b'/'h'/'i'/'q' = int8/16/32/64 first differences of the fixed-point
+                 values (a non-finite row repeats the previous value), 'f' = float32 values
+                 windows: f64 time[n_windows], f32 features[n_windows, n_features],
+                 f32 score[n_windows]
+  flags    FLAG_ZLIB: body is zlib-compressed; FLAG_PRE_CUT / FLAG_POST_CUT: the stream
+           started less than pre_ms before the trigger / ended before post_ms after it
+
+Fixed-point steps are rawcap.FIXED_POINT_SCALES, below the ADC resolution of each
+channel, and 1 µs for time_s. A regular clock and slow signals give small, repetitive
+differences, which zlib then shrinks further.
+
+Packet layout: 16 B header "PK", u32 event id, u16 seq, u16 count, u16 payload size,
+u32 CRC-32 (zlib polynomial; covers the header up to the CRC field, then the payload),
+then at most packet_bytes - 16 bytes of the encoded event. Packets of several events
+can be concatenated into one file or stream; `decode_packets` reassembles them.
+
+  PYTHONPATH=src python src/event_capture.py data/events/*.pkt --csv decoded/
+"""
+import os, struct, zlib
+import numpy as np
+
+from rawcap import FIXED_POINT_SCALES
+
+PRE_MS        = 20.0
+POST_MS       = 50.0
+PACKET_BYTES  = 256                 # downlink frame budget per packet, header included
+ZLIB_LEVEL    = 6
+TIME_STEP     = 1e-6                # fixed-point step of time_s (s)
+
+MAGIC = b"PSEVT1\0\0"
+_HDR = struct.Struct("<8sIdddffIIIIIHHH16s")
+_HDR_SIZE = 96
+_COL = struct.Struct("<14scBdq")    # 32 B
+_PKT = struct.Struct("<2sIHHHI")    # 16 B
+_PKT_CRC_AT = _PKT.size - 4
+PKT_MAGIC = b"PK"
+FLAG_ZLIB, FLAG_PRE_CUT, FLAG_POST_CUT = 1, 2, 4
+_WIDTHS = [(b"b", np.int8), (b"h", np.int16), (b"i", np.int32), (b"q", np.int64)]
+_DTYPES = {b"b": np.dtype("<i1"), b"h": np.dtype("<i2"), b"i": np.dtype("<i4"), b"q": np.dtype("<i8"),
+           b"f": np.dtype("<f4")}
+
+
+def event_id(t_trigger):
+    """Stable ID of an event: CRC-32 of its trigger time (a re-read capture gives the same ID)."""
+    return zlib.crc32(struct.pack("<d", float(t_trigger)))
+
+
+# -------------------------------------------------
+# Capture
+# -------------------------------------------------
+class EventCapture:
+    """
+    Args:
+        fs (float): sample rate in Hz
+        threshold (float): anomaly score (-decision_function) above which a window triggers
+        pre_ms, post_ms (float): raw samples kept before / after the trigger
+        max_events (int, optional): events opened before further triggers are only counted
+        model_version (str, optional): recorded in each event
+    """
+
+    def __init__(self, fs, threshold, pre_ms=PRE_MS, post_ms=POST_MS, max_events=None, model_version=None):
+        self.fs, self.threshold = float(fs), float(threshold)
+        self.pre = int(round(pre_ms * fs / 1000.0))
+        self.post = int(round(post_ms * fs / 1000.0))
+        self.max_events, self.model_version = max_events, model_version
+        self.columns = None
+        self.ring = None                    # last `pre` raw rows, (rows, n_cols) float64
+        self.win_t = np.empty(0)            # windows that an open or a future event may still cover
+        self.win_X = self.win_s = None
+        self.open = []
+        self.last = None                    # open event that new triggers merge into (None: dropped)
+        self.rows = 0                       # raw rows pushed so far
+        self.end_row = -1                   # triggers up to this row merge into the last event
+        self.n_events = self.dropped = 0
+
+    def push(self, raw, times=(), X=None, scores=()):
+        """
+        Feed the next raw rows (column mapping with time_s) and the windows scored on them.
+
+        Returns:
+            list: events completed by this block (see `_finish`)
+        """
+        if self.columns is None:
+            self.columns = [c for c in raw if c == "time_s"] + [c for c in raw if c != "time_s"]
+            self.ring = np.empty((0, len(self.columns)))
+        if not len(raw["time_s"]):
+            return []
+        block = np.column_stack([np.asarray(raw[c], dtype=np.float64) for c in self.columns])
+        t = block[:, 0]
+        n, base, first = len(block), self.rows - len(self.ring), self.rows
+        data = np.concatenate([self.ring, block]) if len(self.ring) else block
+        self._add_windows(times, X, scores)
+
+        for ev in self.open:                # post-trigger rows of events opened earlier
+            take = min(ev["end"] - ev["have"], n)
+            if take > 0:
+                ev["parts"].append(block[:take])
+                ev["have"] += take
+
+        scores = np.asarray(scores, dtype=np.float64)
+        for i in np.flatnonzero(scores > self.threshold):
+            g = first + int(np.searchsorted(t, times[i]))
+            if g <= self.end_row:
+                if self.last is not None:
+                    self.last["hits"] += 1
+                    self.last["score"] = max(self.last["score"], float(scores[i]))
+                continue
+            self.end_row, self.last = g + self.post, None
+            if self.max_events is not None and self.n_events >= self.max_events:
+                self.dropped += 1
+                continue
+            start, have = max(g - self.pre, base), min(g + self.post + 1, first + n)
+            self.open.append({"t_trigger": float(times[i]), "score": float(scores[i]), "hits": 1,
+                              "trigger_row": g, "start": start, "end": g + self.post + 1, "have": have,
+                              "pre_cut": g - self.pre < base, "parts": [data[start - base:have - base]]})
+            self.last = self.open[-1]
+            self.n_events += 1
+
+        done = [ev for ev in self.open if ev["have"] >= ev["end"]]
+        self.open = [ev for ev in self.open if ev["have"] < ev["end"]]
+        self.rows += n
+        self.ring = data[-self.pre:].copy() if self.pre else data[:0]
+        out = [self._finish(ev) for ev in done]
+        keep_from = min([ev["parts"][0][0, 0] for ev in self.open] + [data[max(len(data) - self.pre, 0), 0]])
+        keep = self.win_t >= keep_from
+        self.win_t, self.win_X, self.win_s = self.win_t[keep], self.win_X[keep], self.win_s[keep]
+        return out
+
+    def flush(self):
+        """Close the events still waiting for post-trigger rows (end of stream)."""
+        out = [self._finish(ev, post_cut=True) for ev in self.open]
+        self.open = []
+        return out
+
+    def _add_windows(self, times, X, scores):
+        times = np.asarray(times, dtype=np.float64)
+        if X is None or not len(times):
+            if self.win_X is None:
+                self.win_X, self.win_s = np.empty((0, 0), np.float32), np.empty(0, np.float32)
+            return
+        X = np.asarray(X, dtype=np.float32)
+        if self.win_X is None or self.win_X.shape[1] != X.shape[1]:
+            self.win_X = np.empty((0, X.shape[1]), np.float32)
+            self.win_t, self.win_s = np.empty(0), np.empty(0, np.float32)
+        self.win_t = np.concatenate([self.win_t, times])
+        self.win_X = np.concatenate([self.win_X, X])
+        self.win_s = np.concatenate([self.win_s, np.asarray(scores, dtype=np.float32)])
+
+    def _finish(self, ev, post_cut=False):
+        """
+        Returns:
+            dict: event_id, t_trigger, t_start, fs, score (max over hits), threshold, hits,
+                  pre_rows, columns, raw [n_rows, n_cols], windows (time, X, score),
+                  model_version, flags
+        """
+        raw = np.concatenate(ev["parts"])
+        t0, t1 = raw[0, 0], raw[-1, 0]
+        w = (self.win_t >= t0) & (self.win_t <= t1)
+        flags = (FLAG_PRE_CUT if ev["pre_cut"] else 0) | (FLAG_POST_CUT if post_cut else 0)
+        return {"event_id": event_id(ev["t_trigger"]), "t_trigger": ev["t_trigger"], "t_start": float(t0),
+                "fs": self.fs, "score": ev["score"], "threshold": self.threshold, "hits": ev["hits"],
+                "pre_rows": ev["trigger_row"] - ev["start"], "columns": list(self.columns), "raw": raw,
+                "windows": (self.win_t[w], self.win_X[w], self.win_s[w]),
+                "model_version": self.model_version, "flags": flags}
+
+
+# -------------------------------------------------
+# Encoding
+# -------------------------------------------------
+def _step(column, scales=None):
+    if column == "time_s":
+        return TIME_STEP
+    return {**FIXED_POINT_SCALES, **(scales or {})}.get(column)
+
+
+def encode_event(event, compress=True, scales=None):
+    """
+    Event dict (EventCapture) → bytes: fixed-point first differences, optionally zlib'd.
+
+    Columns without a fixed-point step (rawcap.FIXED_POINT_SCALES, `scales`) are kept as float32.
+    Non-finite samples of fixed-point columns come back as NaN (validity mask).
+    """
+    raw = np.asarray(event["raw"], dtype=np.float64)
+    table, streams = [], []
+    for k, name in enumerate(event["columns"]):
+        step = _step(name, scales)
+        if step is None:
+            table.append(_COL.pack(name.encode()[:14], b"f", 0, 0.0, 0))
+            streams.append(raw[:, k].astype("<f4").tobytes())
+            continue
+        col, bad = raw[:, k], ~np.isfinite(raw[:, k])
+        mask = b""
+        if bad.any():                   # hold the last finite value, so the differences stay small
+            last = np.maximum.accumulate(np.where(bad, 0, np.arange(len(col))))
+            col = np.nan_to_num(col[last], nan=0.0, posinf=0.0, neginf=0.0)
+            mask = np.packbits(bad).tobytes()
+        q = np.rint(col / step).astype(np.int64)
+        d = np.diff(q)
+        span = max(-int(d.min()), int(d.max())) if len(d) else 0
+        code, dt = next((c, t) for c, t in _WIDTHS if span <= np.iinfo(t).max)
+        table.append(_COL.pack(name.encode()[:14], code, bool(mask), step, int(q[0]) if len(q) else 0))
+        streams.append(mask + d.astype(_DTYPES[code]).tobytes())
+    wt, wX, ws = event["windows"]
+    wX = np.asarray(wX, dtype="<f4").reshape(len(wt), -1)
+    body = b"".join(table + streams + [np.asarray(wt, "<f8").tobytes(), wX.tobytes(),
+                                       np.asarray(ws, "<f4").tobytes()])
+    flags = event.get("flags", 0) & ~FLAG_ZLIB
+    if compress:
+        flags |= FLAG_ZLIB
+    hdr = _HDR.pack(MAGIC, event["event_id"], event["t_trigger"], event["t_start"], event["fs"],
+                    event["score"], event["threshold"], len(raw), event["pre_rows"], event["hits"],
+                    len(wt), len(body), len(event["columns"]), wX.shape[1], flags,
+                    str(event.get("model_version") or "").encode()[:16])
+    return hdr.ljust(_HDR_SIZE, b"\0") + (zlib.compress(body, ZLIB_LEVEL) if compress else body)
+
+
+def decode_event(blob):
+    """
+    bytes (encode_event) → event dict with raw as a DataFrame and windows as a DataFrame
+    (time_s, one column per feature, score).
+    """
+    import pandas as pd
+    from feature_engineering import FEATURE_COLS
+
+    blob = bytes(blob)
+    if len(blob) < _HDR_SIZE or blob[:8] != MAGIC:
+        raise ValueError("not a PowerSense event")
+    (_, eid, t_trig, t_start, fs, score, thr, n_rows, pre_rows, hits, n_win, body_len,
+     n_cols, n_feat, flags, version) = _HDR.unpack_from(blob, 0)
+    body = blob[_HDR_SIZE:]
+    if flags & FLAG_ZLIB:
+        body = zlib.decompress(body)
+    if len(body) != body_len:
+        raise ValueError(f"event {eid:08x}: body is {len(body)} B, header says {body_len}")
+    off, cols = n_cols * _COL.size, {}
+    for k in range(n_cols):
+        name, code, masked, step, first = _COL.unpack_from(body, k * _COL.size)
+        name, dt = name.rstrip(b"\0").decode(), _DTYPES[code]
+        if code == b"f":
+            cols[name] = np.frombuffer(body, dt, n_rows, off).astype(np.float64)
+            off += n_rows * dt.itemsize
+            continue
+        bad = None
+        if masked:
+            n_m = (n_rows + 7) // 8
+            bad = np.unpackbits(np.frombuffer(body, np.uint8, n_m, off))[:n_rows].astype(bool)
+            off += n_m
+        n_d = max(n_rows - 1, 0)
+        d = np.frombuffer(body, dt, n_d, off).astype(np.int64)
+        off += n_d * dt.itemsize
+        q = np.concatenate([[first], first + np.cumsum(d)]) if n_rows else d
+        cols[name] = q * step
+        if bad is not None:
+            cols[name][bad] = np.nan
+    wt = np.frombuffer(body, "<f8", n_win, off)
+    off += n_win * 8
+    wX = np.frombuffer(body, "<f4", n_win * n_feat, off).reshape(n_win, n_feat)
+    off += wX.nbytes
+    ws = np.frombuffer(body, "<f4", n_win, off)
+    names = FEATURE_COLS if n_feat == len(FEATURE_COLS) else [f"x{i}" for i in range(n_feat)]
+    windows = pd.DataFrame(wX, columns=names)
+    windows.insert(0, "time_s", wt)
+    windows["score"] = ws
+    return {"event_id": eid, "t_trigger": t_trig, "t_start": t_start, "fs": fs, "score": float(score),
+            "threshold": float(thr), "hits": hits, "pre_rows": pre_rows,
+            "model_version": version.rstrip(b"\0").decode() or None, "flags": flags,
+            "raw": pd.DataFrame(cols), "windows": windows}
+
+
+# -------------------------------------------------
+# Packets
+# -------------------------------------------------
+def packetize(blob, eid, packet_bytes=PACKET_BYTES):
+    """Split an encoded event into CRC-checked packets of at most `packet_bytes` bytes."""
+    room = packet_bytes - _PKT.size
+    if room <= 0:
+        raise ValueError(f"packet_bytes must exceed the {_PKT.size} B packet header")
+    count = max(1, -(-len(blob) // room))
+    if count > 0xFFFF:
+        raise ValueError(f"event of {len(blob)} B needs {count} packets (max 65535)")
+    out = []
+    for seq in range(count):
+        payload = blob[seq * room:(seq + 1) * room]
+        hdr = _PKT.pack(PKT_MAGIC, eid, seq, count, len(payload), 0)[:_PKT_CRC_AT]
+        crc = zlib.crc32(payload, zlib.crc32(hdr))
+        out.append(hdr + struct.pack("<I", crc) + payload)
+    return out
+
+
+def encode_packets(event, packet_bytes=PACKET_BYTES, compress=True, scales=None):
+    """Event dict → list of packets (bytes)."""
+    return packetize(encode_event(event, compress, scales), event["event_id"], packet_bytes)
+
+
+def iter_packets(data):
+    """
+    Parse a concatenation of packets.
+
+    Yields:
+        tuple: (event id, seq, count, payload, crc ok)
+    """
+    data, off = memoryview(bytes(data)), 0
+    while off + _PKT.size <= len(data):
+        magic, eid, seq, count, n, crc = _PKT.unpack_from(data, off)
+        if magic != PKT_MAGIC:
+            raise ValueError(f"offset {off}: not a packet")
+        payload = bytes(data[off + _PKT.size:off + _PKT.size + n])
+        ok = len(payload) == n and zlib.crc32(payload, zlib.crc32(data[off:off + _PKT_CRC_AT])) == crc
+        yield eid, seq, count, payload, ok
+        off += _PKT.size + n
+
+
+def decode_packets(data):
+    """
+    Reassemble and decode every complete event in a packet stream.
+
+    Returns:
+        tuple: (events in stream order, problems: list of str for bad or missing packets)
+    """
+    parts, counts, problems = {}, {}, []
+    for eid, seq, count, payload, ok in iter_packets(data):
+        if not ok:
+            problems.append(f"event {eid:08x} packet {seq}: CRC mismatch")
+            continue
+        parts.setdefault(eid, {})[seq] = payload
+        counts[eid] = count
+    events = []
+    for eid, got in parts.items():
+        missing = [s for s in range(counts[eid]) if s not in got]
+        if missing:
+            problems.append(f"event {eid:08x}: missing packets {missing}")
+            continue
+        try:
+            events.append(decode_event(b"".join(got[s] for s in range(counts[eid]))))
+        except (ValueError, zlib.error) as e:
+            problems.append(f"event {eid:08x}: {e}")
+    return events, problems
+
+
+if __name__ == "__main__":
+    import argparse, glob, time
+    ap = argparse.ArgumentParser(description="Decode downlinked anomaly event packets")
+    ap.add_argument("packets", nargs="+", help="packet files (globs allowed)")
+    ap.add_argument("--csv", metavar="DIR", help="write <id>_raw.csv and <id>_windows.csv per event")
+    args = ap.parse_args()
+
+    paths = [p for pat in args.packets for p in sorted(glob.glob(pat)) or [pat]]
+    data = b"".join(open(p, "rb").read() for p in paths)
+    t = time.perf_counter()
+    events, problems = decode_packets(data)
+    dt = time.perf_counter() - t
+    for ev in events:
+        raw, cut = ev["raw"], ("pre " if ev["flags"] & FLAG_PRE_CUT else "") + ("post" if ev["flags"] & FLAG_POST_CUT else "")
+        print(f"{ev['event_id']:08x}  t={ev['t_trigger']:.6f} s  score {ev['score']:.4f} (thr {ev['threshold']:.4f}) "
+              f"hits {ev['hits']}  {len(raw)} rows ({ev['pre_rows']} pre)  {len(ev['windows'])} windows  "
+              f"model {ev['model_version']}{'  cut: ' + cut if cut else ''}")
+        if args.csv:
+            os.makedirs(args.csv, exist_ok=True)
+            raw.to_csv(os.path.join(args.csv, f"{ev['event_id']:08x}_raw.csv"), index=False)
+            ev["windows"].to_csv(os.path.join(args.csv, f"{ev['event_id']:08x}_windows.csv"), index=False)
+    for p in problems:
+        print(f"WARNING: {p}")
+    rows = sum(len(ev["raw"]) for ev in events)
+    print(f"{len(events)} events, {rows} raw rows from {len(data)} B in {dt * 1e3:.1f} ms")
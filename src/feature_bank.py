@@ -0,0 +1,336 @@
+# src/feature_bank.py
+"""
+Multi-resolution feature bank.
+
+`extract_features` sees one short window; fast current spikes and slow thermal or efficiency
+drift live on different time scales. A FeatureBank computes registered features over several
+(window, hop) scales in one pass over the raw arrays:
+
+  - every raw series (and the few derived ones: per-sample efficiency, first differences,
+    products) is prefix-summed once, centred on its first sample; each scale then gets its
+    window sums, means, variances and covariances as P[e] - P[s], O(1) per window
+  - window maxima (peak dI/dt) come from one sparse table over block maxima, shared by all
+    scales
+  - output rows are `extract_features`' windows at `base_ms` (same time_s, fault_label and
+    `window_span`); a scale contributes, for each row, its latest window that ended by the
+    end of that row. Windows are clipped at the first sample, so no row is lost to warm-up
+
+Window and hop sizes use `extract_features`' window_ms convention (see `window_span`). Columns
+are named "<feature>@<window>ms", e.g. "dI_dt@2ms", "efficiency@100ms".
+
+Registered features (per-sample units like `extract_features`, except dT_dt):
+  dI_dt        mean np.gradient of Iin (the four-edge-sample telescoping sum)
+  Vout_droop   mean Vin - mean Vout
+  ripple_RMS   standard deviation of Vout
+  efficiency   mean Vout * mean Iout / (mean Vin * mean Iin)
+  dEff_dT      least-squares slope of per-sample efficiency on temperature (0 if Temp is flat)
+  peak_dI_dt   largest |Iin[j] - Iin[j-1]| entering or inside the window
+  ripple_hf    sqrt(mean(ΔVout²) / 2): by Parseval, the Vout spectrum weighted by
+               2 sin²(πf/fs), i.e. switching ripple with slow drift suppressed (= RMS of a tone
+               at fs/4, of white noise)
+  dT_dt        least-squares slope of temperature over the window, in °C/s (a per-sample
+               slope is too small for the shared Q15 scale of the scaler parameters)
+
+The first four match `extract_features_array` at the same window to rtol=1e-9. dEff_dT there is
+the mean gradient of a per-window constant (0 up to rounding); here it is a real slope.
+
+The scaler, model, registry and Q15 export size themselves from the feature matrix, so a model
+trained on `bank.extract(...)` needs no other change on the Python side. The firmware computes
+the five 2 ms features only and refuses models with another NUM_FEATURES.
+
+  PYTHONPATH=src python src/feature_bank.py capture.praw -o features.csv
+"""
+import math
+import numpy as np
+import pandas as pd
+
+from feature_engineering import window_span, _column, _has_column, FEATURE_COLS
+
+BASE_MS = 2
+DEFAULT_SCALES = (
+    # (window_ms, hop_ms, features)
+    (1,   1,  ("dI_dt", "peak_dI_dt")),
+    (2,   2,  tuple(FEATURE_COLS) + ("peak_dI_dt", "ripple_hf")),
+    (10,  2,  ("Vout_droop", "ripple_RMS", "ripple_hf", "efficiency")),
+    (100, 10, ("Vout_droop", "efficiency", "dEff_dT", "dT_dt")),
+)
+
+FEATURES = {}
+
+
+def feature(name):
+    """Register `fn(w: Windows) -> ndarray` under `name`."""
+    def register(fn):
+        FEATURES[name] = fn
+        return fn
+    return register
+
+
+# -------------------------------------------------
+# Shared sums
+# -------------------------------------------------
+class _Series:
+    """Raw and derived per-sample series of one extraction, with lazily built prefix sums."""
+
+    RAW = {"Vin": "Vin_V", "Iin": "Iin_A", "Vout": "Vout_V", "Iout": "Iout_A", "Temp": "Temp_C"}
+
+    def __init__(self, raw, n):
+        self.n = n
+        self.x = {k: _column(raw, c, n) for k, c in self.RAW.items()}
+        self._centred, self._prefix, self._tables = {}, {}, {}
+
+    def series(self, key):
+        if key not in self.x:
+            x = self.x
+            if key == "eta":
+                pin = x["Vin"] * x["Iin"]
+                self.x[key] = np.clip(x["Vout"] * x["Iout"] / np.maximum(pin, 1e-6), 0.0, 1.2)
+            elif key == "j":
+                self.x[key] = np.arange(self.n, dtype=np.float64)
+            elif key.startswith("d"):                 # first difference, 0 at the first sample
+                d = np.zeros(self.n)
+                np.subtract(self.series(key[1:])[1:], self.series(key[1:])[:-1], out=d[1:])
+                self.x[key] = d
+            else:
+                raise KeyError(key)
+        return self.x[key]
+
+    def centred(self, key):
+        """(x - x[0], x[0]): small values keep long prefix sums exact enough for variances."""
+        if key not in self._centred:
+            x = self.series(key)
+            ref = x[0] if len(x) else 0.0
+            self._centred[key] = (x - ref, ref)
+        return self._centred[key]
+
+    def prefix(self, a, b=None):
+        """Prefix sums (leading 0) of centred a, or of centred a * centred b."""
+        key = (a, b)
+        if key not in self._prefix:
+            xa = self.centred(a)[0]
+            v = xa if b is None else xa * self.centred(b)[0]
+            p = np.empty(len(v) + 1)
+            p[0] = 0.0
+            np.cumsum(v, out=p[1:])
+            self._prefix[key] = p
+        return self._prefix[key]
+
+    def max_table(self, key, g, levels):
+        """Sparse table of |series| maxima over blocks of `g` samples: table[k][i] = max of blocks i..i+2^k-1."""
+        if (key, g) not in self._tables:
+            a = np.abs(self.series(key))
+            nb = -(-len(a) // g)
+            pad = np.full(nb * g, -np.inf)
+            pad[:len(a)] = a
+            self._tables[(key, g)] = [pad.reshape(nb, g).max(axis=1)]
+        table = self._tables[(key, g)]
+        while len(table) <= levels and len(table[-1]) > 1 << (len(table) - 1):
+            prev, h = table[-1], 1 << (len(table) - 1)
+            table.append(np.maximum(prev[:-h], prev[h:]))
+        return table
+
+
+class Windows:
+    """Windows [s, e) of one scale; what feature functions see."""
+
+    def __init__(self, series, s, e, g, fs):
+        self.series, self.s, self.e, self.g, self.fs = series, s, e, g, fs
+        self.n = (e - s).astype(np.float64)
+
+    def sum(self, a, b=None):
+        p = self.series.prefix(a, b)
+        return p[self.e] - p[self.s]
+
+    def mean(self, key):
+        c, ref = self.series.centred(key)
+        return self.sum(key) / self.n + ref
+
+    def cov(self, a, b):
+        """Population covariance (variance for a == b) inside each window."""
+        ma, mb = self.sum(a) / self.n, self.sum(b) / self.n
+        return self.sum(a, b) / self.n - ma * mb
+
+    def at(self, key, idx):
+        return self.series.series(key)[idx]
+
+    def max_abs(self, key):
+        """max |series| over each window, from the shared sparse table."""
+        table = self.series.max_table(key, self.g, int(math.log2(max(1, int(self.n.max()) // self.g))))
+        bs, be = self.s // self.g, self.e // self.g
+        k = np.floor(np.log2(be - bs)).astype(np.int64)
+        out = np.empty(len(bs))
+        for lvl in np.unique(k):
+            m = k == lvl
+            t = table[lvl]
+            out[m] = np.maximum(t[bs[m]], t[be[m] - (1 << lvl)])
+        return out
+
+    def slope(self, key):
+        """Least-squares slope of `key` per sample inside each window (0 for single samples)."""
+        n = self.n
+        sxy = self.sum("j", key) - (self.s + self.e - 1) / 2 * self.sum(key)
+        sxx = n * (n * n - 1) / 12
+        return np.where(n > 1, sxy / np.maximum(sxx, 1.0), 0.0)
+
+
+# -------------------------------------------------
+# Features
+# -------------------------------------------------
+@feature("dI_dt")
+def _dI_dt(w):
+    s, e = w.s, w.e
+    return (0.5 * w.at("Iin", s + 1) - 1.5 * w.at("Iin", s)
+            + 1.5 * w.at("Iin", e - 1) - 0.5 * w.at("Iin", e - 2)) / w.n
+
+
+@feature("Vout_droop")
+def _droop(w):
+    return w.mean("Vin") - w.mean("Vout")
+
+
+@feature("ripple_RMS")
+def _ripple(w):
+    return np.sqrt(np.maximum(w.cov("Vout", "Vout"), 0.0))
+
+
+@feature("efficiency")
+def _eff(w):
+    return (w.mean("Vout") * w.mean("Iout")) / (w.mean("Vin") * w.mean("Iin"))
+
+
+@feature("dEff_dT")
+def _deff_dt(w):
+    var_t = w.cov("Temp", "Temp")
+    flat = var_t < 1e-12
+    return np.where(flat, 0.0, w.cov("eta", "Temp") / np.where(flat, 1.0, var_t))
+
+
+@feature("peak_dI_dt")
+def _peak_didt(w):
+    return w.max_abs("dIin")
+
+
+@feature("ripple_hf")
+def _ripple_hf(w):
+    return np.sqrt(w.sum("dVout", "dVout") / w.n / 2)
+
+
+@feature("dT_dt")
+def _dt_dt(w):
+    return w.slope("Temp") * w.fs
+
+
+# -------------------------------------------------
+# Bank
+# -------------------------------------------------
+def _rows(ms, fs):
+    return window_span(0, ms, fs)[1]
+
+
+class FeatureBank:
+    """
+    Registered features over several (window_ms, hop_ms) scales, one row per base window.
+
+    Args:
+        scales: iterable of (window_ms, hop_ms) or (window_ms, hop_ms, feature names);
+                without names a scale computes every registered feature
+        base_ms: window of `extract_features` whose rows (time_s, fault_label) are emitted
+        fs: sampling rate, as in `extract_features`
+    """
+
+    def __init__(self, scales=DEFAULT_SCALES, base_ms=BASE_MS, fs=10000):
+        self.base_ms, self.fs = base_ms, fs
+        self.scales = []
+        for sc in scales:
+            win_ms, hop_ms = sc[0], sc[1]
+            names = tuple(sc[2]) if len(sc) > 2 else tuple(FEATURES)
+            unknown = [f for f in names if f not in FEATURES]
+            if unknown:
+                raise ValueError(f"unknown features {unknown}; registered: {sorted(FEATURES)}")
+            if _rows(win_ms, fs) < 2 or _rows(hop_ms, fs) < 1:
+                raise ValueError(f"scale ({win_ms}, {hop_ms}) ms is under 2 samples at fs={fs}")
+            self.scales.append((win_ms, hop_ms, names))
+        if _rows(base_ms, fs) < 2:
+            raise ValueError(f"base window {base_ms} ms is under 2 samples at fs={fs}")
+        self.columns = [f"{f}@{w:g}ms" for w, _, names in self.scales for f in names]
+        if len(set(self.columns)) != len(self.columns):
+            raise ValueError("two scales share a window size; column names would collide")
+        sizes = [_rows(base_ms, fs)] + [_rows(x, fs) for w, h, _ in self.scales for x in (w, h)]
+        self.block = math.gcd(*sizes)           # every window edge is a multiple of this
+
+    @property
+    def n_features(self):
+        return len(self.columns)
+
+    @property
+    def lookback(self):
+        """Raw rows before a base window that its longest scale reads."""
+        return max(_rows(w, self.fs) + _rows(h, self.fs) for w, h, _ in self.scales)
+
+    def spec(self):
+        """JSON-able description, e.g. for registry meta."""
+        return {"base_ms": self.base_ms, "fs": self.fs, "columns": self.columns,
+                "scales": [[w, h, list(names)] for w, h, names in self.scales]}
+
+    def extract(self, df_raw):
+        """
+        Same contract as `extract_features_array`, with `self.columns` as the features.
+
+        Returns:
+            tuple: (X [n_windows, n_features] float64, time_s [n_windows], fault_label [n_windows])
+        """
+        n_win, step = window_span(len(df_raw["time_s"]), self.base_ms, self.fs)
+        n = n_win * step
+        if n_win == 0:
+            return np.empty((0, self.n_features)), np.empty(0), np.empty(0)
+        series = _Series(df_raw, n)
+        ends = np.arange(1, n_win + 1, dtype=np.int64) * step
+
+        X = np.empty((n_win, self.n_features))
+        col = 0
+        for win_ms, hop_ms, names in self.scales:
+            L, h = _rows(win_ms, self.fs), _rows(hop_ms, self.fs)
+            e = ends // h * h
+            e = np.where(e < 2, ends, e)                      # no window of this scale ended yet
+            s = np.maximum(e - L, 0)
+            w = Windows(series, s, e, self.block, self.fs)
+            for name in names:
+                X[:, col] = FEATURES[name](w)
+                col += 1
+
+        times = _column(df_raw, "time_s", n).reshape(n_win, step).mean(axis=1)
+        labels = (_column(df_raw, "fault_label", n).reshape(n_win, step).max(axis=1)
+                  if _has_column(df_raw, "fault_label") else np.zeros(n_win))
+        return X, times, labels
+
+    def extract_features(self, df_raw):
+        """`extract` as a DataFrame with time_s and fault_label, like `extract_features`."""
+        X, times, labels = self.extract(df_raw)
+        df = pd.DataFrame(X, columns=self.columns)
+        df["time_s"] = times
+        df["fault_label"] = labels
+        return df
+
+
+if __name__ == "__main__":
+    import argparse, time
+    from rawcap import load_raw_range
+
+    ap = argparse.ArgumentParser(description="Multi-resolution features of a raw capture")
+    ap.add_argument("capture", help="raw .csv or .praw capture")
+    ap.add_argument("-o", "--output", help="feature CSV (default: print a summary)")
+    ap.add_argument("--fs", type=int, default=10000)
+    ap.add_argument("--base-ms", type=float, default=BASE_MS)
+    args = ap.parse_args()
+
+    raw, _ = load_raw_range(args.capture)
+    bank = FeatureBank(base_ms=args.base_ms, fs=args.fs)
+    t0 = time.perf_counter()
+    df = bank.extract_features(raw)
+    dt = time.perf_counter() - t0
+    print(f"{len(raw['time_s'])} rows → {len(df)} x {bank.n_features} features in {dt * 1e3:.1f} ms")
+    if args.output:
+        df.to_csv(args.output, index=False)
+        print(f"Wrote {args.output}")
+    else:
+        print(df[bank.columns].describe().T.to_string())
@@ -1,31 +1,236 @@
 # src/feature_engineering.py
-import pandas as pd
 import numpy as np
 
-def extract_features(df_raw, window_ms=2, fs=10000):
+FEATURE_COLS = ["dI_dt", "Vout_droop", "ripple_RMS", "efficiency", "dEff_dT"]
+
+
+def _column(raw, name, n):
+    """First `n` samples of a raw column as a float64 array (DataFrame, dict or structured array)."""
+    return np.asarray(raw[name][:n], dtype=np.float64)
+
+
+def _has_column(raw, name):
+    if hasattr(raw, "dtype") and raw.dtype.names is not None:
+        return name in raw.dtype.names
+    return name in raw
+
+
+def window_span(n_rows, window_ms=2, fs=10000):
+    """
+    (n_windows, step): windows `extract_features_array` takes from `n_rows` raw rows.
+
+    Windows are `step` rows each, back to back from row 0; the same ones as
+    range(0, n_rows - step, step), so the trailing window is never used. They only read
+    their own rows, so a growing capture can be processed in pieces: the first
+    n_windows * step rows now, the rest (with later data) from that row on.
+    """
     step = int(window_ms / 2 * fs / 1000)
-    feats, times, labels = [], [], []
-
-    for i in range(0, len(df_raw) - step, step):
-        seg = df_raw.iloc[i:i + step]
-        Vin  = seg["Vin_V"].mean()
-        Iin  = seg["Iin_A"]
-        Vout = seg["Vout_V"]
-        Iout = seg["Iout_A"]
-        Temp = seg["Temp_C"]
-
-        dIdt      = np.gradient(Iin, edge_order=1).mean()
-        Vout_drop = Vin - Vout.mean()
-        ripple    = np.sqrt(np.mean((Vout - Vout.mean())**2))
-        eff       = (Vout.mean() * Iout.mean()) / (Vin * Iin.mean())
-        dEff_dT   = np.gradient(eff * np.ones(len(seg)), Temp, edge_order=1).mean() if len(seg) > 1 else 0
-
-        feats.append([dIdt, Vout_drop, ripple, eff, dEff_dT])
-        times.append(seg["time_s"].mean())
-        labels.append(seg["fault_label"].max())
-
-    df = pd.DataFrame(feats,
-                      columns=["dI_dt","Vout_droop","ripple_RMS","efficiency","dEff_dT"])
+    return (max(0, -(-(n_rows - step) // step)) if step > 0 else 0), step
+
+
+def _window_views(raw, window_ms, fs):
+    """Reshape the raw columns into (n_windows, step) views, one row per window."""
+    n_win, step = window_span(len(raw["time_s"]), window_ms, fs)
+    n = n_win * step
+    cols = {c: _column(raw, c, n).reshape(n_win, step)
+            for c in ("time_s", "Vin_V", "Iin_A", "Vout_V", "Iout_A", "Temp_C")}
+    if _has_column(raw, "fault_label"):
+        cols["fault_label"] = _column(raw, "fault_label", n).reshape(n_win, step)
+    return cols, step
+
+
+def extract_features_array(df_raw, window_ms=2, fs=10000):
+    """
+    Batched feature extraction returning plain ndarrays.
+
+    Computes the same five features as `extract_features` for every window at once
+    on (n_windows, step) views of the raw columns. `df_raw` can be a DataFrame, a dict
+    of column arrays or a structured array. `fault_label` is optional (0 when absent,
+    e.g. straight from logger_mcp3008).
+
+    Returns:
+        tuple: (X [n_windows, 5] float64, time_s [n_windows], fault_label [n_windows])
+    """
+    c, step = _window_views(df_raw, window_ms, fs)
+    Iin, Vout, Iout, Temp = c["Iin_A"], c["Vout_V"], c["Iout_A"], c["Temp_C"]
+    n_win = Iin.shape[0]
+    if n_win == 0:
+        return np.empty((0, len(FEATURE_COLS))), np.empty(0), np.empty(0)
+
+    Vin       = c["Vin_V"].mean(axis=1)
+    Vout_mean = Vout.mean(axis=1)
+
+    # mean(np.gradient(Iin)) with unit spacing telescopes to the four edge samples
+    dIdt      = (0.5 * Iin[:, 1] - 1.5 * Iin[:, 0] + 1.5 * Iin[:, -1] - 0.5 * Iin[:, -2]) / step
+    Vout_drop = Vin - Vout_mean
+    ripple    = np.sqrt(np.mean((Vout - Vout_mean[:, None]) ** 2, axis=1))
+    eff       = (Vout_mean * Iout.mean(axis=1)) / (Vin * Iin.mean(axis=1))
+    dEff_dT   = _gradient_const_mean(eff, Temp)
+
+    X = np.column_stack([dIdt, Vout_drop, ripple, eff, dEff_dT])
+    times = c["time_s"].mean(axis=1)
+    labels = c["fault_label"].max(axis=1) if "fault_label" in c else np.zeros(n_win)
+    return X, times, labels
+
+
+def _gradient_const_mean(f, x):
+    """Row-wise mean(np.gradient(f * ones, x, edge_order=1)) for a constant f per row."""
+    n = x.shape[1]
+    if n < 2:
+        return np.zeros(len(f))
+    f = f[:, None]
+    dx = np.diff(x, axis=1)
+    out = np.empty_like(x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[:, 0]  = (f[:, 0] - f[:, 0]) / dx[:, 0]
+        out[:, -1] = (f[:, 0] - f[:, 0]) / dx[:, -1]
+        if n > 2:
+            dx1, dx2 = dx[:, :-1], dx[:, 1:]
+            a = -(dx2) / (dx1 * (dx1 + dx2))
+            b = (dx2 - dx1) / (dx1 * dx2)
+            cc = dx1 / (dx2 * (dx1 + dx2))
+            out[:, 1:-1] = a * f + b * f + cc * f
+    return out.mean(axis=1)
+
+
+def extract_features(df_raw, window_ms=2, fs=10000):
+    """
+    Window the raw log and compute [dI_dt, Vout_droop, ripple_RMS, efficiency, dEff_dT].
+
+    Vectorized over all windows (see `extract_features_array`). On float64 input it matches
+    the original per-window loop to rtol=1e-9 (tests/test_feature_engineering.py); only the
+    summation order differs. float32 columns (.praw, synthetic captures) are widened to
+    float64 first, where a loop over them computes in float32: Vout_droop, a difference of
+    two close means, then differs by about 3e-4 relative.
+    """
+    import pandas as pd
+    X, times, labels = extract_features_array(df_raw, window_ms, fs)
+    df = pd.DataFrame(X, columns=FEATURE_COLS)
     df["time_s"] = times
     df["fault_label"] = labels
-    return df
\ No newline at end of file
+    return df
+
+
+class StreamingFeatureExtractor:
+    """
+    Incremental Python mirror of feats_push_raw()/feats_compute() in
+    firmware_raspberry/main/features_if.c.
+
+    Samples are pushed one at a time (or in chunks); a feature vector is emitted every
+    hop once a full window is buffered. Window, baseline and quarter-window sums are
+    kept as running sums, so each sample costs O(1) and memory is bounded by the
+    firmware ring buffer size (FS_HZ/1000 * (WIN_MS + 4) samples).
+
+    Semantics follow the firmware (not `extract_features`):
+      - dI_dt      : (Iin[last] - Iin[first]) / window length in ms
+      - Vout_droop : mean Vout over the last min(5*window, buffered) samples minus window mean
+      - ripple_RMS : mean of the ripple channel if use_ripple, else 0.0
+      - efficiency : mean of clamp(Pout / max(Pin, 1e-6), 0, 1.2)
+      - dEff_dT    : (eff_last_quarter - eff_first_quarter) / (T_last_quarter - T_first_quarter)
+    The firmware runs in float32; this class accumulates in float64, so values are
+    comparable but not bit-identical.
+    """
+
+    RESYNC_EVERY = 1 << 16   # recompute running sums from the ring buffer to cancel drift
+
+    def __init__(self, fs=10000, win_ms=2, hop_ms=1, use_ripple=False):
+        self.fs = fs
+        self.win = (fs // 1000) * win_ms
+        self.hop = max(1, (fs // 1000) * hop_ms)
+        if self.win < 2:
+            raise ValueError("window must hold at least 2 samples")
+        self.buf_max = (fs // 1000) * (win_ms + 4)
+        self.base_cap = min(5 * self.win, self.buf_max)
+        self.q = self.win // 4 or 1
+        self.use_ripple = use_ripple
+        self.dt_ms = self.win / fs * 1000.0
+        self.reset()
+
+    def reset(self):
+        n = self.buf_max
+        self.iin, self.vout, self.eta = [0.0] * n, [0.0] * n, [0.0] * n
+        self.temp, self.ripple = [0.0] * n, [0.0] * n
+        self.n = 0
+        self.s_vout = self.s_base = self.s_rip = self.s_eta = 0.0
+        self.s_eta_head = self.s_T_head = self.s_eta_tail = self.s_T_tail = 0.0
+
+    def push(self, vin, iin, vout, iout, temp, ripple=0.0):
+        """Push one raw sample. Returns the 5-feature ndarray on hop boundaries, else None."""
+        B, n, win, q = self.buf_max, self.n, self.win, self.q
+        pin = vin * iin
+        eta = (vout * iout) / (pin if pin > 1e-6 else 1e-6)
+        eta = 0.0 if eta < 0.0 else (1.2 if eta > 1.2 else eta)
+
+        # Retire samples leaving each running window before their slot is overwritten
+        if n >= win:
+            j = (n - win) % B
+            self.s_vout -= self.vout[j]; self.s_rip -= self.ripple[j]; self.s_eta -= self.eta[j]
+            self.s_eta_head -= self.eta[j]; self.s_T_head -= self.temp[j]
+        if n >= self.base_cap:
+            self.s_base -= self.vout[(n - self.base_cap) % B]
+        if n >= q:
+            j = (n - q) % B
+            self.s_eta_tail -= self.eta[j]; self.s_T_tail -= self.temp[j]
+
+        i = n % B
+        self.iin[i], self.vout[i], self.eta[i], self.temp[i], self.ripple[i] = iin, vout, eta, temp, ripple
+        self.s_vout += vout; self.s_base += vout; self.s_rip += ripple; self.s_eta += eta
+        self.s_eta_tail += eta; self.s_T_tail += temp
+        if n - win + q >= 0:
+            j = (n - win + q) % B
+            self.s_eta_head += self.eta[j]; self.s_T_head += self.temp[j]
+        self.n = n = n + 1
+
+        if n % self.RESYNC_EVERY == 0:
+            self._resync()
+        if n < win or (n - win) % self.hop:
+            return None
+        return self._features()
+
+    def push_chunk(self, raw):
+        """
+        Push a block of samples.
+
+        Args:
+            raw: mapping with Vin_V, Iin_A, Vout_V, Iout_A, Temp_C (and optionally ripple_V),
+                 or an (N, 6) array ordered [vin, iin, vout, iout, temp, ripple].
+
+        Returns:
+            tuple: (features [M, 5], end sample count of each emitted window [M])
+        """
+        if isinstance(raw, np.ndarray) and raw.dtype.names is None:
+            cols = [raw[:, k].tolist() for k in range(raw.shape[1])]
+        else:
+            cols = [np.asarray(raw[c], dtype=np.float64).tolist()
+                    for c in ("Vin_V", "Iin_A", "Vout_V", "Iout_A", "Temp_C")]
+            cols.append(np.asarray(raw["ripple_V"], dtype=np.float64).tolist()
+                        if _has_column(raw, "ripple_V") else [0.0] * len(cols[0]))
+        feats, ends = [], []
+        for s in zip(*cols):
+            f = self.push(*s)
+            if f is not None:
+                feats.append(f)
+                ends.append(self.n)
+        X = np.vstack(feats) if feats else np.empty((0, len(FEATURE_COLS)))
+        return X, np.asarray(ends, dtype=np.int64)
+
+    def _features(self):
+        B, n, win, q = self.buf_max, self.n, self.win, self.q
+        base_n = min(n, self.base_cap)
+        dI_dt = (self.iin[(n - 1) % B] - self.iin[(n - win) % B]) / self.dt_ms
+        droop = self.s_base / base_n - self.s_vout / win
+        ripple = self.s_rip / win if self.use_ripple else 0.0
+        eff = self.s_eta / win
+        dT = (self.s_T_tail - self.s_T_head) / q
+        dEff_dT = 0.0 if abs(dT) < 1e-6 else ((self.s_eta_tail - self.s_eta_head) / q) / dT
+        return np.array([dI_dt, droop, ripple, eff, dEff_dT])
+
+    def _resync(self):
+        B, n, win, q = self.buf_max, self.n, self.win, self.q
+        last = lambda a, k: sum(a[(n - 1 - j) % B] for j in range(min(k, n)))
+        self.s_vout, self.s_rip, self.s_eta = last(self.vout, win), last(self.ripple, win), last(self.eta, win)
+        self.s_base = last(self.vout, self.base_cap)
+        self.s_eta_tail, self.s_T_tail = last(self.eta, q), last(self.temp, q)
+        head = [(n - win + j) % B for j in range(q) if n - win + j >= 0]
+        self.s_eta_head = sum(self.eta[j] for j in head)
+        self.s_T_head = sum(self.temp[j] for j in head)
@@ -0,0 +1,364 @@
+# src/forest_opt.py
+"""
+Forest compaction and node-layout pass between a fitted IsolationForest and the export.
+
+Works on `flatten_forest` dicts and returns one, with a `layout` flag set that
+`quantize_model`/`export_to_q15_header`, `model_image` and `CompiledForest` all understand:
+  - depth truncation: internal nodes at `max_depth` become leaves, whose path length
+    depth + c(n_node_samples) is exactly the IsolationForest leaf rule
+  - tree subset selection: greedy forward selection of the fewest trees whose mean
+    path length keeps the score within `budget` of the full forest on reference data
+  - node order: "dfs" (sklearn), "bfs" (level order: siblings adjacent, so
+    children_right is dropped, LAYOUT_ADJACENT) or "hot" (pre-order with the child taken
+    more often on reference data right after its parent: shortest jumps)
+  - tree-local child indices (LAYOUT_TREE_LOCAL) and narrow int16 child / int8 feature
+    types (LAYOUT_NARROW)
+"""
+import numpy as np
+
+from model_export import (flatten_forest, quantize_model, LAYOUT_TREE_LOCAL, LAYOUT_ADJACENT,
+                          LAYOUT_NARROW)
+from compiled_forest import CompiledForest
+from model_image import build_image
+
+ORDERS = ("dfs", "bfs", "hot")
+SELECT_ROWS = 4096      # reference rows used for tree selection / visit counts
+
+
+# ---------------- canonical form: global child indices ----------------
+def _canonical(flat):
+    """Copy of `flat` with global children_left/right, whatever its layout."""
+    offsets = np.asarray(flat["tree_offsets"], dtype=np.int64)
+    left, right = CompiledForest._global_children(flat, offsets)
+    out = {k: np.array(v) if isinstance(v, np.ndarray) else v for k, v in flat.items()}
+    out.update(children_left=left, children_right=right, tree_offsets=offsets, layout=0)
+    return out
+
+
+def _tree_ids(flat):
+    offsets = flat["tree_offsets"]
+    return np.repeat(np.arange(len(offsets)), np.diff(np.append(offsets, len(flat["threshold"]))))
+
+
+def _levels(flat):
+    """Depth of every node and its position in a level-by-level sweep of all trees."""
+    left, right = flat["children_left"], flat["children_right"]
+    depth = np.full(len(left), -1, dtype=np.int64)
+    seq = np.full(len(left), -1, dtype=np.int64)
+    frontier, d, k = np.asarray(flat["tree_offsets"], dtype=np.int64), 0, 0
+    while len(frontier):
+        depth[frontier] = d
+        seq[frontier] = k + np.arange(len(frontier))
+        k += len(frontier)
+        internal = frontier[left[frontier] >= 0]
+        frontier = np.stack([left[internal], right[internal]], axis=1).ravel()
+        d += 1
+    return depth, seq
+
+
+def _renumber(flat, perm):
+    """Keep nodes `perm` (grouped by tree) in that order; children are remapped."""
+    inv = np.full(len(flat["threshold"]), -1, dtype=np.int64)
+    inv[perm] = np.arange(len(perm))
+    tid = _tree_ids(flat)[perm]
+    out = dict(flat)
+    for k in ("feature", "threshold", "node_samples"):
+        out[k] = np.asarray(flat[k])[perm]
+    for k in ("children_left", "children_right"):
+        c = flat[k][perm]
+        out[k] = np.where(c >= 0, inv[np.maximum(c, 0)], -1)
+    out["tree_offsets"] = np.flatnonzero(np.r_[True, tid[1:] != tid[:-1]]) if len(tid) else tid
+    return out
+
+
+# ---------------- passes ----------------
+def truncate_depth(flat, max_depth):
+    """Turn every internal node at depth `max_depth` into a leaf and drop its subtree."""
+    flat = _canonical(flat)
+    depth, _ = _levels(flat)
+    cut = (depth == max_depth) & (flat["children_left"] >= 0)
+    for k in ("children_left", "children_right"):
+        flat[k] = np.where(cut, -1, flat[k])
+    flat["feature"] = np.where(cut, -2, flat["feature"])
+    flat["threshold"] = np.where(cut, -2.0, flat["threshold"])
+    keep = np.flatnonzero((depth >= 0) & (depth <= max_depth))   # reachable, shallow enough
+    return _renumber(flat, keep)
+
+
+def _greedy(H, target, c_max, budget, chosen=()):
+    """Add trees to `chosen` (greedy, best first) until the max score error on H's rows is <= budget."""
+    chosen = list(chosen)
+    total = H[:, chosen].sum(axis=1)
+    free = np.ones(H.shape[1], dtype=bool)
+    free[chosen] = False
+    while free.any():
+        if chosen and np.abs(2 ** (-(total / len(chosen)) / c_max) - target).max() <= budget:
+            break
+        cand = np.flatnonzero(free)
+        # score of every "chosen + candidate" forest at once: (rows, candidates)
+        s = 2 ** (-((total[:, None] + H[:, cand]) / (len(chosen) + 1)) / c_max)
+        best = cand[np.argmin(np.abs(s - target[:, None]).max(axis=0))]
+        chosen.append(best)
+        free[best] = False
+        total += H[:, best]
+    return chosen
+
+
+def select_trees(flat, Z, budget, reference=None):
+    """
+    Fewest trees (greedy forward selection) whose score stays within `budget` of the
+    full forest on scaled reference rows `Z` (max absolute anomaly-score difference).
+    Selection runs on the first SELECT_ROWS rows and then adds trees until every row holds.
+
+    `reference` (flat dict, default `flat`) is the forest whose scores are the target, e.g. the
+    model before `truncate_depth`, so the budget bounds the total change.
+
+    Returns:
+        tuple: (reduced flat dict, kept tree indices in original numbering)
+
+    Raises:
+        ValueError: even all trees of `flat` are further than `budget` from `reference`
+    """
+    flat = _canonical(flat)
+    cf = CompiledForest(flat, "float")
+    ref = cf if reference is None else CompiledForest(_canonical(reference), "float")
+    target = lambda Z: 2 ** (-ref.path_lengths(Z).mean(axis=1) / ref.c_max)
+    chosen = _greedy(cf.path_lengths(Z[:SELECT_ROWS]), target(Z[:SELECT_ROWS]), cf.c_max, budget)
+    if len(Z) > SELECT_ROWS:
+        chosen = _greedy(cf.path_lengths(Z), target(Z), cf.c_max, budget, chosen)
+    if len(chosen) == cf.n_trees:
+        err = np.abs(cf.anomaly_score(Z) - ref.anomaly_score(Z)).max(initial=0.0)
+        if err > budget:
+            raise ValueError(f"the truncated forest alone changes the score by {err:.4g} "
+                             f"(> budget {budget:g}); use a larger max_depth or budget")
+    kept = np.sort(np.array(chosen))
+    tid = _tree_ids(flat)
+    return _renumber(flat, np.flatnonzero(np.isin(tid, kept))), kept
+
+
+def visit_counts(flat, Z):
+    """How many reference rows pass through each node."""
+    flat = _canonical(flat)
+    cf = CompiledForest(flat, "float")
+    counts = np.zeros(len(flat["threshold"]), dtype=np.int64)
+    Z = np.asarray(Z[:SELECT_ROWS], dtype=np.float32)
+    node = np.broadcast_to(cf.tree_offsets, (len(Z), cf.n_trees)).copy()
+    active = np.ones(node.shape, dtype=bool)
+    while active.any():
+        r, t = np.nonzero(active)
+        n = node[r, t]
+        np.add.at(counts, n, 1)
+        leaf = cf.is_leaf[n]
+        go_left = Z[r, cf.feature[n]] <= cf.threshold[n]
+        node[r, t] = np.where(leaf, n, np.where(go_left, cf.left[n], cf.right[n]))
+        active[r, t] = ~leaf
+    return counts
+
+
+def _subtree_sizes(flat, depth):
+    left, right = flat["children_left"], flat["children_right"]
+    size = np.ones(len(left), dtype=np.int64)
+    for d in range(int(depth.max()), -1, -1):
+        n = np.flatnonzero((depth == d) & (left >= 0))
+        size[n] = 1 + size[left[n]] + size[right[n]]
+    return size
+
+
+def reorder(flat, order="bfs", Z=None):
+    """
+    Renumber nodes within each tree.
+
+    "bfs": level order, siblings adjacent (children_right becomes implicit).
+    "hot": pre-order with the child more rows visit placed right after its parent, so
+           the common path through each tree reads consecutive nodes.
+    """
+    if order not in ORDERS:
+        raise ValueError(f"Unknown order: {order}")
+    flat = _canonical(flat)
+    if order == "dfs":
+        return flat
+    depth, seq = _levels(flat)
+    reach = np.flatnonzero(depth >= 0)
+    tid = _tree_ids(flat)
+    if order == "bfs":
+        return _renumber(flat, reach[np.lexsort((seq[reach], tid[reach]))])
+
+    if Z is None:
+        raise ValueError('order="hot" needs reference data')
+    counts = visit_counts(flat, Z)
+    left, right = flat["children_left"], flat["children_right"]
+    size = _subtree_sizes(flat, depth)
+    pos = np.zeros(len(left), dtype=np.int64)            # pre-order position within the tree
+    for d in range(int(depth.max())):
+        n = np.flatnonzero((depth == d) & (left >= 0))
+        hot_left = counts[left[n]] >= counts[right[n]]
+        first = np.where(hot_left, left[n], right[n])
+        second = np.where(hot_left, right[n], left[n])
+        pos[first] = pos[n] + 1
+        pos[second] = pos[n] + 1 + size[first]
+    return _renumber(flat, reach[np.lexsort((pos[reach], tid[reach]))])
+
+
+def encode_layout(flat, tree_local=False, narrow=False):
+    """Apply the index encoding: adjacency is detected, tree-local/narrow on request."""
+    flat = _canonical(flat)
+    left, right = flat["children_left"], flat["children_right"]
+    layout = 0
+    if np.array_equal(right[left >= 0], left[left >= 0] + 1):
+        layout |= LAYOUT_ADJACENT
+    if tree_local or narrow:
+        base = np.repeat(flat["tree_offsets"], np.diff(np.append(flat["tree_offsets"], len(left))))
+        flat["children_left"] = np.where(left >= 0, left - base, -1)
+        flat["children_right"] = np.where(right >= 0, right - base, -1)
+        layout |= LAYOUT_TREE_LOCAL
+    if narrow:
+        layout |= LAYOUT_NARROW
+        widest = max(np.max(flat["children_left"], initial=0), np.max(flat["children_right"], initial=0))
+        if widest > np.iinfo(np.int16).max:
+            raise ValueError(f"tree-local child index {widest} does not fit int16; a tree is too large for narrow")
+        if np.max(flat["feature"], initial=0) > np.iinfo(np.int8).max:
+            raise ValueError("feature indices do not fit int8; too many features for narrow")
+    for k in ("children_left", "children_right"):
+        flat[k] = flat[k].astype(np.int16 if narrow else np.int32)
+    flat["feature"] = flat["feature"].astype(np.int8 if narrow else np.int16)
+    flat["tree_offsets"] = flat["tree_offsets"].astype(np.int32)
+    flat["layout"] = layout
+    return flat
+
+
+def optimize_forest(iso, X=None, scaler=None, max_depth=None, budget=None, order="dfs",
+                    tree_local=False, narrow=False):
+    """
+    Run the selected passes and return an exportable flattened forest.
+
+    Args:
+        iso: fitted IsolationForest or `flatten_forest` dict
+        X (np.array): reference features (raw if `scaler` is given, else scaled); needed
+            for `budget` and order="hot"
+        max_depth (int): truncate deeper subtrees to c(n) leaves
+        budget (float): max |anomaly score change| from the original forest on `X` allowed by
+            tree selection (after truncation, which may use part of it)
+        order (str): "dfs", "bfs" or "hot"
+        tree_local, narrow (bool): child-index encoding (narrow implies tree_local)
+
+    Returns:
+        dict: flattened forest with `layout` flags and `kept_trees`
+    """
+    flat = original = iso if isinstance(iso, dict) else flatten_forest(iso)
+    n_trees = len(flat["tree_offsets"])
+    Z = None
+    if X is not None:
+        Z = scaler.transform(X) if scaler is not None else np.asarray(X)
+    if max_depth is not None:
+        flat = truncate_depth(flat, max_depth)
+    kept = np.arange(n_trees)
+    if budget is not None:
+        if Z is None:
+            raise ValueError("tree selection needs reference data X")
+        flat, sub = select_trees(flat, Z, budget, reference=original)
+        kept = kept[sub]
+    flat = reorder(flat, order, Z)
+    flat = encode_layout(flat, tree_local, narrow)
+    flat["kept_trees"] = kept
+    return flat
+
+
+# ---------------- report ----------------
+def _jump_stats(cf, Z):
+    """Mean |child - parent| node distance per step, and the share of steps within 32 nodes."""
+    Z = np.asarray(Z, dtype=np.float32)
+    node = np.broadcast_to(cf.tree_offsets, (len(Z), cf.n_trees)).copy()
+    active = ~cf.is_leaf[node]
+    total = near = steps = 0
+    while active.any():
+        r, t = np.nonzero(active)
+        n = node[r, t]
+        go_left = Z[r, cf.feature[n]] <= cf.threshold[n]
+        m = np.where(go_left, cf.left[n], cf.right[n])
+        jump = np.abs(m - n)
+        total += int(jump.sum())
+        near += int(np.sum(jump < 32))      # same 64 B line of int16 thresholds
+        steps += len(n)
+        node[r, t] = m
+        active[r, t] = ~cf.is_leaf[m]
+    return total / max(steps, 1), near / max(steps, 1)
+
+
+def _describe(cf, q, Z):
+    jump, near = _jump_stats(cf, Z)
+    return {
+        "trees": cf.n_trees,
+        "nodes": len(cf.threshold),
+        "image_bytes": len(build_image(q)),
+        "steps_per_tree": float(cf.path_steps(Z).mean()),
+        "mean_jump": jump,
+        "near_frac": near,
+    }
+
+
+def compare(iso, scaler, flat, X, threshold=0.56):
+    """
+    Size, traversal and score deviation of an optimized forest against the original.
+
+    `X` is raw features. Scores are compared in float mode (both vs the sklearn model)
+    and for the Q15 export of the optimized forest.
+
+    Returns:
+        dict: original, optimized (trees, nodes, image_bytes, steps_per_tree, mean_jump,
+              near_frac) and deviation (max/mean |score diff|, flipped decisions)
+    """
+    Z = scaler.transform(X)
+    ref = CompiledForest.from_estimator(iso)
+    opt = CompiledForest.from_estimator(flat)
+    q_ref, q_opt = quantize_model(iso, scaler, threshold), quantize_model(flat, scaler, threshold)
+    s_ref = ref.anomaly_score(Z)
+    s_opt = opt.anomaly_score(Z)
+    s_q15 = CompiledForest.from_q15(q_opt).anomaly_score(X).astype(np.float64)
+    dev = lambda s: {"max_abs": float(np.max(np.abs(s - s_ref), initial=0.0)),
+                     "mean_abs": float(np.mean(np.abs(s - s_ref))) if len(s) else 0.0,
+                     "flipped": int(np.sum((s > threshold) != (s_ref > threshold)))}
+    return {
+        "original": _describe(ref, q_ref, Z),
+        "optimized": _describe(opt, q_opt, Z),
+        "deviation": {"float": dev(s_opt), "q15": dev(s_q15)},
+    }
+
+
+if __name__ == "__main__":
+    import argparse, pandas as pd
+    from model_export import export_to_q15_header
+    from feature_engineering import FEATURE_COLS
+    from model_registry import load_model
+    from model_image import write_image
+
+    ap = argparse.ArgumentParser(description="Compact and re-layout the Isolation Forest before export")
+    ap.add_argument("--features", default="data/cubesat_features.csv")
+    ap.add_argument("--max-depth", type=int)
+    ap.add_argument("--budget", type=float, help="max |score change| for tree selection")
+    ap.add_argument("--order", choices=ORDERS, default="bfs")
+    ap.add_argument("--narrow", action="store_true", help="tree-local int16 children, int8 features")
+    ap.add_argument("--threshold", type=float, default=0.56)
+    ap.add_argument("--header", help="write the optimized Q15 header here")
+    ap.add_argument("--image", help="write the optimized binary image here")
+    args = ap.parse_args()
+
+    iso, scaler, version = load_model()
+    X = pd.read_csv(args.features)[FEATURE_COLS].values
+    try:
+        flat = optimize_forest(iso, X, scaler, args.max_depth, args.budget, args.order,
+                               tree_local=args.narrow, narrow=args.narrow)
+    except ValueError as e:
+        ap.error(str(e))
+    rep = compare(iso, scaler, flat, X, args.threshold)
+    print(f"model {version}, {len(X)} reference rows")
+    print(f"{'':10s} {'trees':>6s} {'nodes':>7s} {'bytes':>8s} {'steps':>6s} {'jump':>7s} {'near':>6s}")
+    for name in ("original", "optimized"):
+        r = rep[name]
+        print(f"{name:10s} {r['trees']:6d} {r['nodes']:7d} {r['image_bytes']:8d} "
+              f"{r['steps_per_tree']:6.2f} {r['mean_jump']:7.1f} {r['near_frac']:6.2f}")
+    for mode, d in rep["deviation"].items():
+        print(f"deviation ({mode}): max {d['max_abs']:.5f}, mean {d['mean_abs']:.6f}, flipped {d['flipped']}")
+    if args.header:
+        export_to_q15_header(flat, scaler, output_path=args.header, threshold=args.threshold)
+    if args.image:
+        write_image(flat, args.image, scaler, args.threshold, version)
@@ -0,0 +1,178 @@
+# src/healthy_store.py
+import os, time, math
+import numpy as np
+
+
+class RunningStats:
+    """
+    Exact running count / mean / M2 per feature, merged batch-wise (Chan et al.).
+
+    Variance is the population variance (ddof=0), as StandardScaler uses.
+    """
+
+    def __init__(self, n_features, count=0, mean=None, m2=None):
+        self.count = int(count)
+        self.mean = np.zeros(n_features) if mean is None else np.asarray(mean, dtype=np.float64).copy()
+        self.m2 = np.zeros(n_features) if m2 is None else np.asarray(m2, dtype=np.float64).copy()
+
+    @classmethod
+    def from_scaler(cls, scaler):
+        """Seed from a fitted StandardScaler (n_samples_seen_, mean_, var_)."""
+        n = int(np.max(scaler.n_samples_seen_))
+        var = scaler.var_ if getattr(scaler, "var_", None) is not None else scaler.scale_ ** 2
+        return cls(len(scaler.mean_), n, scaler.mean_, np.asarray(var, dtype=np.float64) * n)
+
+    def update(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        nb = len(X)
+        if nb == 0:
+            return
+        mean_b = X.mean(axis=0)
+        m2_b = ((X - mean_b) ** 2).sum(axis=0)
+        n = self.count + nb
+        delta = mean_b - self.mean
+        self.mean = self.mean + delta * (nb / n)
+        self.m2 = self.m2 + m2_b + delta ** 2 * (self.count * nb / n)
+        self.count = n
+
+    @property
+    def var(self):
+        return self.m2 / self.count if self.count else np.zeros_like(self.m2)
+
+    def apply_to(self, scaler):
+        """Write the running statistics into a StandardScaler in place."""
+        var = self.var
+        scale = np.sqrt(var)
+        scale[scale == 0.0] = 1.0
+        scaler.mean_, scaler.var_, scaler.scale_ = self.mean.copy(), var, scale
+        scaler.n_samples_seen_ = self.count
+        return scaler
+
+
+class HealthyStore:
+    """
+    Fixed-size sample of healthy feature windows plus exact statistics over all of them.
+
+    Memory and disk use are bounded by `capacity` rows whatever the mission length:
+      - half_life_s=None: uniform reservoir sampling (Algorithm R) over every row ever added
+      - half_life_s=T   : time-decayed sampling (A-Res with weight 2^(t/T)), so a row's
+                          chance of being kept halves every T seconds of age
+    `stats` covers every added row, not just the kept sample. The store checkpoints to a
+    single .npz next to the model.
+    """
+
+    def __init__(self, path, n_features=5, capacity=50000, half_life_s=None, stats=None, seed=None):
+        self.path = path
+        self.capacity = int(capacity)
+        self.half_life_s = half_life_s
+        self.rows = np.empty((0, n_features))
+        self.keys = np.empty(0)               # decay mode: log-priority, smaller is kept
+        self.n_seen = 0
+        self.epoch = 0                        # checkpoint counter (ingest_journal commits against it)
+        self.stats = stats if stats is not None else RunningStats(n_features)
+        self.rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def add(self, X, t=None):
+        """Absorb healthy rows (n, n_features); `t` is their timestamp in seconds (default: now)."""
+        X = np.asarray(X, dtype=np.float64)
+        if len(X) == 0:
+            return
+        self.stats.update(X)
+        if self.half_life_s is None:
+            self._add_uniform(X)
+        else:
+            t = np.full(len(X), time.time()) if t is None else np.broadcast_to(t, len(X))
+            self._add_decayed(X, np.asarray(t, dtype=np.float64))
+        self.n_seen += len(X)
+
+    def _add_uniform(self, X):
+        free = self.capacity - len(self.rows)
+        if free > 0:
+            self.rows = np.vstack([self.rows, X[:free]])
+            X = X[free:]
+        if len(X) == 0:
+            return
+        # Algorithm R, vectorized: row i (global index k) replaces slot j ~ U[0, k] if j < capacity.
+        # Later rows overwrite earlier ones on the same slot, exactly as the sequential loop would.
+        k = self.n_seen + max(free, 0) + np.arange(len(X))
+        j = self.rng.integers(0, k + 1)
+        keep = j < self.capacity
+        self.rows[j[keep]] = X[keep]
+
+    def _keys(self, t):
+        """Decay mode: log-priority keys of rows added at times `t`."""
+        tau = self.half_life_s / math.log(2.0)
+        return np.log(self.rng.exponential(size=len(t))) - t / tau
+
+    def _add_decayed(self, X, t):
+        keys = self._keys(t)
+        rows = np.vstack([self.rows, X])
+        keys = np.concatenate([self.keys, keys])
+        if len(keys) > self.capacity:
+            idx = np.argpartition(keys, self.capacity - 1)[:self.capacity]
+            rows, keys = rows[idx], keys[idx]
+        self.rows, self.keys = rows, keys
+
+    def sample(self):
+        return self.rows
+
+    # ---------------- persistence ----------------
+    def save(self):
+        """Atomically checkpoint rows, sampling state and running statistics."""
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, rows=self.rows, keys=self.keys, n_seen=self.n_seen, capacity=self.capacity, epoch=self.epoch,
+                     half_life_s=np.nan if self.half_life_s is None else self.half_life_s,
+                     count=self.stats.count, mean=self.stats.mean, m2=self.stats.m2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    @classmethod
+    def load(cls, path, seed=None):
+        with np.load(path) as z:
+            hl = float(z["half_life_s"])
+            store = cls(path, z["rows"].shape[1], int(z["capacity"]), None if math.isnan(hl) else hl,
+                        RunningStats(z["rows"].shape[1], int(z["count"]), z["mean"], z["m2"]), seed)
+            store.rows, store.keys, store.n_seen = z["rows"], z["keys"], int(z["n_seen"])
+            store.epoch = int(z["epoch"]) if "epoch" in z.files else 0
+        return store
+
+    def resize(self, capacity):
+        """Change the row budget; a smaller one keeps a uniform subsample (decay mode: the top keys)."""
+        self.capacity = int(capacity)
+        if len(self.rows) <= self.capacity:
+            return
+        if self.half_life_s is None:
+            idx = np.sort(self.rng.choice(len(self.rows), self.capacity, replace=False))
+        else:
+            idx = np.argpartition(self.keys, self.capacity - 1)[:self.capacity]
+            self.keys = self.keys[idx]
+        self.rows = self.rows[idx]
+
+    @classmethod
+    def open(cls, path, scaler, capacity=50000, half_life_s=None):
+        """
+        Load the checkpoint at `path`, or start a new store seeded with `scaler` statistics.
+
+        A checkpoint saved with another capacity is resized to `capacity`. One saved in the
+        other sampling mode or with another half-life is converted: its kept rows count as
+        added when it was saved.
+        """
+        if not os.path.exists(path):
+            return cls(path, len(scaler.mean_), capacity, half_life_s, RunningStats.from_scaler(scaler))
+        store = cls.load(path)
+        if store.half_life_s != half_life_s:
+            mode = lambda hl: "uniform" if hl is None else f"decay ({hl:g} s half-life)"
+            print(f"Healthy store: {mode(store.half_life_s)} checkpoint converted to {mode(half_life_s)} sampling")
+            store.half_life_s = half_life_s
+            store.keys = (np.empty(0) if half_life_s is None
+                          else store._keys(np.full(len(store.rows), os.path.getmtime(path))))
+        if store.capacity != int(capacity):
+            print(f"Healthy store: capacity {store.capacity} → {int(capacity)} rows"
+                  + (f" (subsampled from {len(store)})" if len(store) > capacity else ""))
+            store.resize(capacity)
+        return store
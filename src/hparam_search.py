@@ -0,0 +1,283 @@
+# src/hparam_search.py
+"""
+Latency-budgeted hyperparameter search for the exported forest.
+
+Candidate forests over n_estimators x max_samples x max_depth are trained in a process pool on
+the healthy windows of the first part of a labelled dataset (firmware features, as calibrate.py
+builds them) and evaluated on the rest, as the firmware would run them:
+
+  quality   Q15 scores (CompiledForest, bit-exact with iforest_score()) swept over threshold x
+            DWELL_HITS (calibrate.sweep, rules off): best recall within the false-trip budget,
+            its delay, and the window-level average precision
+  cost      estimated on-target time per window from the flattened export:
+              SCORE_NS + n_trees * TREE_NS + (mean internal nodes visited per tree) * n_trees * NODE_NS
+            and the same with every tree walked to its full depth (worst case)
+  size      bytes of the generated Q15 header and of the binary image
+
+max_depth None is IsolationForest's own ceil(log2 max_samples); a smaller one is applied to the
+export with forest_opt.truncate_depth (leaves keep the c(n) path rule). The Pareto front is
+taken over (recall up, cost down, header size down). The chosen point is the best recall, then
+average precision, among the candidates whose mean cost fits BUDGET_FRACTION of HOP_MS
+(params.h); it is exported with the threshold its sweep picked.
+
+The per-node / per-tree costs are rough figures for the Pi firmware loop. Measure them on the
+target (time iforest_score() over a known forest) and pass --node-ns / --tree-ns.
+
+  PYTHONPATH=src python src/hparam_search.py --synth storm --duration 30m --header model_iforest.h
+  PYTHONPATH=src python src/hparam_search.py data/cubesat_features.csv --out search.csv --workers 4
+"""
+import io, os, time, tempfile, contextlib
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+from calibrate import load_windows, raw_windows, sweep, choose, default_thresholds, DWELLS
+from replay import PARAMS_H, BLOCK_SAMPLES, read_params
+
+N_ESTIMATORS    = (25, 50, 100, 200)
+MAX_SAMPLES     = (64, 128, 256, 512)
+MAX_DEPTHS      = (None, 6, 4)
+CONTAMINATION   = 0.01
+TRAIN_FRACTION  = 0.5                 # leading share of the windows; its healthy ones train
+NODE_NS         = 15.0                # per internal node visited (load, compare, branch)
+TREE_NS         = 60.0                # per tree: leaf c(n) lookup and accumulate
+SCORE_NS        = 800.0               # per window: make_z and the final powf
+BUDGET_FRACTION = 0.25                # of HOP_MS for the forest; features, rules, FDIR share the hop
+MAX_FALSE_PER_H = 1.0
+N_THRESHOLDS    = 100
+
+
+# -------------------------------------------------
+# Data
+# -------------------------------------------------
+def labelled_windows(params, dataset=None, synth=None):
+    """(X float32, label bool, time_s) of a dataset path or of TelemetrySynth kwargs, finite rows only."""
+    if synth is not None:
+        from synth_telemetry import TelemetrySynth
+        gen = TelemetrySynth(**synth)
+        X, label, t = raw_windows(gen.chunks(BLOCK_SAMPLES / gen.fs), dict(params, FS_HZ=gen.fs))
+    else:
+        X, label, t = load_windows(dataset, params)
+    finite = np.isfinite(X).all(axis=1)
+    return X[finite], label[finite], t[finite]
+
+
+def split(X, label, t, train_fraction=TRAIN_FRACTION):
+    """Healthy training rows from the leading part; every row of the rest for evaluation."""
+    cut = int(len(X) * train_fraction)
+    train = X[:cut][~label[:cut]]
+    return train, (X[cut:], label[cut:], t[cut:])
+
+
+# -------------------------------------------------
+# One candidate (pool worker)
+# -------------------------------------------------
+_data = {}
+
+
+def _init_worker(data):
+    _data.update(data)
+
+
+def build(train, scaler, n_estimators, max_samples, max_depth=None, seed=0):
+    """Fitted IsolationForest and the flattened forest that is exported (depth-truncated if asked)."""
+    from sklearn.ensemble import IsolationForest
+    from model_export import flatten_forest
+    from forest_opt import truncate_depth
+
+    iso = IsolationForest(n_estimators=n_estimators, max_samples=min(max_samples, len(train)),
+                          contamination=CONTAMINATION, random_state=seed)
+    iso.fit(scaler.transform(train))
+    flat = flatten_forest(iso)
+    if max_depth is not None:
+        flat = truncate_depth(flat, max_depth)
+    return iso, flat
+
+
+def header_bytes(flat, scaler, threshold):
+    from model_export import export_to_q15_header
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        path = os.path.join(tmp, "model_iforest.h")
+        export_to_q15_header(flat, scaler, output_path=path, threshold=threshold)
+        return os.path.getsize(path)
+
+
+def evaluate(cand):
+    """Train, export and score one (n_estimators, max_samples, max_depth) candidate."""
+    from sklearn.metrics import average_precision_score
+    from model_export import quantize_model
+    from model_image import build_image
+    from compiled_forest import CompiledForest
+
+    d = _data
+    t0 = time.perf_counter()
+    _, flat = build(d["train"], d["scaler"], cand["n_estimators"], cand["max_samples"],
+                    cand["max_depth"], d["seed"])
+    fit_s = time.perf_counter() - t0
+    q = quantize_model(flat, d["scaler"], d["threshold"])
+    cf = CompiledForest.from_q15(q)
+    X, label = d["X"], d["label"]
+    score = cf.anomaly_score(X)
+
+    table = sweep(score, X, label, default_thresholds(score, N_THRESHOLDS), dwells=d["dwells"],
+                  grace=d["grace"], hop_s=d["hop_s"])
+    best = choose(table, d["max_false_per_h"])
+    n_trees = cf.n_trees
+    healthy = X[~label] if (~label).any() else X
+    steps = float(cf.path_steps(healthy[:d["cost_rows"]]).mean())
+    depth = int(np.ceil(np.log2(max(cand["max_samples"], 2)))) if cand["max_depth"] is None else cand["max_depth"]
+    cost = lambda per_tree: (d["score_ns"] + n_trees * (d["tree_ns"] + per_tree * d["node_ns"])) / 1e3
+    q_hdr = quantize_model(flat, d["scaler"], float(best["threshold"]))
+    return {
+        **cand,
+        "trees": n_trees,
+        "nodes": len(cf.threshold),
+        "steps_per_tree": steps,
+        "cost_us": cost(steps),
+        "cost_worst_us": cost(depth),
+        "header_bytes": header_bytes(flat, d["scaler"], float(best["threshold"])),
+        "image_bytes": len(build_image(q_hdr)),
+        "recall": float(best["recall"]),
+        "delay_mean": float(best["delay_mean"]),
+        "false_per_h": float(best["false_per_h"]) if best["false_per_h"] is not None else np.nan,
+        "false_trips": int(best["false_trips"]),
+        "threshold": float(best["threshold"]),
+        "dwell_hits": int(best["dwell_hits"]),
+        "avg_precision": float(average_precision_score(label, score)) if label.any() else np.nan,
+        "fit_s": fit_s,
+    }
+
+
+# -------------------------------------------------
+# Search
+# -------------------------------------------------
+def grid(n_estimators=N_ESTIMATORS, max_samples=MAX_SAMPLES, max_depths=MAX_DEPTHS):
+    out = []
+    for n in n_estimators:
+        for m in max_samples:
+            full = int(np.ceil(np.log2(max(m, 2))))
+            for depth in max_depths:
+                if depth is None or depth < full:      # a deeper cut changes nothing
+                    out.append({"n_estimators": n, "max_samples": m, "max_depth": depth})
+    return out
+
+
+def search(train, X, label, t, params, candidates=None, workers=None, seed=0,
+           max_false_per_h=MAX_FALSE_PER_H, node_ns=NODE_NS, tree_ns=TREE_NS, score_ns=SCORE_NS,
+           cost_rows=4096):
+    """
+    Evaluate every candidate in a process pool.
+
+    Returns:
+        DataFrame: one row per candidate (see `evaluate`) plus `pareto` (bool)
+    """
+    from sklearn.preprocessing import StandardScaler
+    scaler = StandardScaler().fit(train)
+    hop_s = float(np.median(np.diff(t))) if len(t) > 1 else None
+    data = {"train": train, "scaler": scaler, "X": X, "label": label, "seed": seed,
+            "threshold": 0.56, "dwells": DWELLS, "max_false_per_h": max_false_per_h,
+            "grace": max(1, int(params["WIN_MS"]) // int(params["HOP_MS"])), "hop_s": hop_s,
+            "node_ns": node_ns, "tree_ns": tree_ns, "score_ns": score_ns, "cost_rows": cost_rows}
+    candidates = grid() if candidates is None else candidates
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(data,)) as pool:
+        rows = list(pool.map(evaluate, candidates))
+    table = pd.DataFrame(rows)
+    table["max_depth"] = table["max_depth"].astype("Int64")        # <NA>: IsolationForest's own
+    table["pareto"] = pareto_front(table)
+    return table
+
+
+def pareto_front(table, maximize=("recall",), minimize=("cost_us", "header_bytes")):
+    """Rows no other row beats on every objective (and strictly on one)."""
+    V = np.column_stack([table[c].to_numpy(float) for c in maximize] +
+                        [-table[c].to_numpy(float) for c in minimize])
+    V = np.nan_to_num(V, nan=-np.inf)
+    ge = (V[:, None, :] >= V[None, :, :]).all(axis=2)
+    gt = (V[:, None, :] > V[None, :, :]).any(axis=2)
+    dominated = (ge & gt).any(axis=0)
+    return ~dominated
+
+
+def pick(table, budget_us):
+    """Best recall, then average precision, then the cheapest, among points within budget."""
+    ok = table[table["cost_us"] <= budget_us]
+    pool = ok if len(ok) else table[table["cost_us"] == table["cost_us"].min()]
+    return pool.sort_values(["recall", "avg_precision", "cost_us", "header_bytes"],
+                            ascending=[False, False, True, True]).iloc[0]
+
+
+def print_front(table, budget_us):
+    cols = ["n_estimators", "max_samples", "max_depth", "recall", "avg_precision", "delay_mean",
+            "false_per_h", "cost_us", "cost_worst_us", "header_bytes", "image_bytes"]
+    front = table[table["pareto"]].sort_values("cost_us")
+    print(f"Pareto front ({len(front)} of {len(table)} candidates), budget {budget_us:.1f} us/window:")
+    print(front[cols].to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Search forest size / depth against the on-target latency budget")
+    ap.add_argument("dataset", nargs="?", default="data/cubesat_features.csv",
+                    help="features CSV with fault_label, or a raw capture (.praw / CSV)")
+    ap.add_argument("--synth", metavar="SCENARIO", help="search on synthetic telemetry instead")
+    ap.add_argument("--duration", default="30m")
+    ap.add_argument("--fs", type=int, help="synthetic sample rate (default: FS_HZ)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--params", default=PARAMS_H)
+    ap.add_argument("--n-estimators", default=",".join(map(str, N_ESTIMATORS)))
+    ap.add_argument("--max-samples", default=",".join(map(str, MAX_SAMPLES)))
+    ap.add_argument("--max-depth", default=",".join("none" if d is None else str(d) for d in MAX_DEPTHS),
+                    help="'none' = IsolationForest's own depth")
+    ap.add_argument("--workers", type=int, help="pool processes (default: one per CPU)")
+    ap.add_argument("--max-false-per-h", type=float, default=MAX_FALSE_PER_H)
+    ap.add_argument("--budget-us", type=float, help="forest time per window (default: BUDGET_FRACTION of HOP_MS)")
+    ap.add_argument("--node-ns", type=float, default=NODE_NS)
+    ap.add_argument("--tree-ns", type=float, default=TREE_NS)
+    ap.add_argument("--out", help="write every candidate to this CSV")
+    ap.add_argument("--header", help="export the chosen point's Q15 header here")
+    ap.add_argument("--image", help="export the chosen point's binary image here")
+    args = ap.parse_args()
+
+    params = read_params(args.params)
+    synth = None
+    if args.synth:
+        from synth_telemetry import parse_duration
+        synth = {"duration_s": parse_duration(args.duration), "fs": args.fs or int(params["FS_HZ"]),
+                 "scenario": args.synth, "seed": args.seed}
+    X, label, t = labelled_windows(params, args.dataset, synth)
+    train, (Xe, le, te) = split(X, label, t)
+    print(f"{len(train)} healthy training windows, {len(Xe)} evaluation windows ({int(le.sum())} labelled)")
+
+    ints = lambda s: [int(v) for v in s.split(",")]
+    cands = grid(ints(args.n_estimators), ints(args.max_samples),
+                 [None if v.lower() == "none" else int(v) for v in args.max_depth.split(",")])
+    start = time.perf_counter()
+    table = search(train, Xe, le, te, params, cands, args.workers, args.seed, args.max_false_per_h,
+                   args.node_ns, args.tree_ns)
+    print(f"Evaluated {len(table)} candidates in {time.perf_counter() - start:.1f} s")
+    if args.out:
+        table.to_csv(args.out, index=False)
+
+    budget = args.budget_us if args.budget_us is not None else BUDGET_FRACTION * float(params["HOP_MS"]) * 1e3
+    print_front(table, budget)
+    best = pick(table, budget)
+    depth = None if pd.isna(best["max_depth"]) else int(best["max_depth"])
+    print(f"Chosen: n_estimators {int(best['n_estimators'])}, max_samples {int(best['max_samples'])}, "
+          f"max_depth {depth} → recall {best['recall']:.3f}, {best['cost_us']:.1f} us/window "
+          f"(worst {best['cost_worst_us']:.1f}), header {int(best['header_bytes'])} B, "
+          f"threshold {best['threshold']:.4f}, DWELL_HITS {int(best['dwell_hits'])}")
+    print(f"  IFOREST_PARAMS = dict(n_estimators={int(best['n_estimators'])}, "
+          f"max_samples={int(best['max_samples'])}, contamination={CONTAMINATION}, random_state={args.seed})"
+          + (f"  # + forest_opt --max-depth {depth}" if depth is not None else ""))
+
+    if args.header or args.image:
+        from sklearn.preprocessing import StandardScaler
+        from model_export import export_to_q15_header
+        from model_image import write_image
+        scaler = StandardScaler().fit(train)
+        _, flat = build(train, scaler, int(best["n_estimators"]), int(best["max_samples"]), depth, args.seed)
+        if args.header:
+            export_to_q15_header(flat, scaler, output_path=args.header, threshold=float(best["threshold"]))
+        if args.image:
+            tag = f"hp{int(best['n_estimators'])}x{int(best['max_samples'])}" + (f"d{depth}" if depth else "")
+            write_image(flat, args.image, scaler, float(best["threshold"]), tag)
@@ -1,24 +1,34 @@
 # src/inference.py
-import joblib
+import os, copy
 import numpy as np
 
+from model_registry import ModelRegistry, load_operating_point, decision_threshold
+
 # Configuration
 MODEL_DIR = "models/"
-THRESHOLD = 0.56  # Anomaly threshold (adjust if needed)
+# Anomaly-score threshold (-score_samples, the firmware's units): calibrate.py, else default
+THRESHOLD = (load_operating_point(MODEL_DIR) or {}).get("threshold", 0.56)
+FLAT_MODEL = os.environ.get("POWERSENSE_FLAT_MODEL", "1") != "0"   # 0 → always unpickle (sklearn)
+
+# Load the active model version: its memory-mapped flat arrays (CompiledForest, no sklearn import)
+# when published with them, else the pickles (legacy top-level ones if none was published)
+_registry = ModelRegistry(MODEL_DIR)
+iso, scaler, MODEL_VERSION = (_registry.load_fast if FLAT_MODEL else _registry.load)()
 
-# Load the model and scaler
-iso = joblib.load(f"{MODEL_DIR}iforest_model.pkl")
-scaler = joblib.load(f"{MODEL_DIR}feature_scaler.pkl")
+BATCH_ROWS = 65536  # rows per sklearn call in run_inference_batch
+_folded = {}
 
 def run_inference(features):
     """
     Run anomaly detection on input features.
     
     Args:
-        features (list or np.array): [dI_dt, Vout_droop, ripple_RMS, efficiency, dEff_dT]
+        features (list or np.array): [dI_dt, Vout_droop, ripple_RMS, efficiency, dEff_dT],
+            or the model's wider vector (feature_bank.py); one value per scaler feature
     
     Returns:
-        dict: {'anomaly_score': float, 'is_anomaly': bool}
+        dict: {'anomaly_score': float, 'is_anomaly': bool, 'model_version': str}; the score
+            is -decision_function, compared with THRESHOLD through `decision_threshold`
     """
     # Convert to numpy array and reshape for single sample
     X = np.array(features).reshape(1, -1)
@@ -30,26 +40,124 @@ def run_inference(features):
     score = -iso.decision_function(X_scaled)[0]
     
     # Determine if it's an anomaly
-    is_anomaly = score > THRESHOLD
+    is_anomaly = score > decision_threshold(iso, THRESHOLD)
     
     return {
         'anomaly_score': score,
-        'is_anomaly': is_anomaly
+        'is_anomaly': is_anomaly,
+        'model_version': MODEL_VERSION
     }
 
+def fold_scaler(iso, scaler):
+    """
+    Return a copy of `iso` whose split thresholds are expressed in raw feature units.
+
+    A split `(x - mean[f]) / scale[f] <= t` is the same test as `x <= t * scale[f] + mean[f]`
+    (scale > 0), so the folded forest scores unscaled features directly. Results equal the
+    scaled path except for samples lying within float32 rounding of a split threshold.
+    """
+    mean, scale = scaler.mean_, scaler.scale_
+    if not hasattr(iso, "estimators_"):                 # CompiledForest (flat model)
+        folded = copy.copy(iso)
+        f = np.asarray(iso.feature)
+        folded.threshold = np.where(iso.is_leaf, iso.threshold, iso.threshold * scale[f] + mean[f])
+        return folded
+    folded = copy.deepcopy(iso)
+    for est, feats in zip(folded.estimators_, folded.estimators_features_):
+        t = est.tree_
+        internal = t.feature >= 0
+        f = np.asarray(feats)[t.feature[internal]]
+        t.threshold[internal] = t.threshold[internal] * scale[f] + mean[f]
+    return folded
+
+def _folded_model():
+    key = (id(iso), id(scaler))
+    if key not in _folded:
+        _folded.clear()
+        _folded[key] = fold_scaler(iso, scaler)
+    return _folded[key]
+
+def _score_block(X, out_scores, out_flags, fold, work):
+    """Score one (n, n_features) block into the given output slices."""
+    if fold:
+        d = _folded_model().decision_function(X)
+    else:
+        Xs = work[:len(X)]
+        np.subtract(X, scaler.mean_, out=Xs)
+        np.divide(Xs, scaler.scale_, out=Xs)
+        d = iso.decision_function(Xs)
+    np.negative(d, out=out_scores)
+    np.greater(out_scores, decision_threshold(iso, THRESHOLD), out=out_flags)
+
+def run_inference_batch(X, out_scores=None, out_flags=None, fold=False):
+    """
+    Score many feature vectors per sklearn call.
+
+    Args:
+        X (np.array or iterable): (N, n_features) feature matrix, or an iterator of (n_i, n_features) chunks
+        out_scores (np.array, optional): preallocated float64 buffer of length >= N
+        out_flags (np.array, optional): preallocated bool buffer of length >= N; pass both
+            buffers or neither
+        fold (bool): throughput mode; score raw features with the scaler folded into the
+            forest thresholds (see `fold_scaler`), skipping the scaling pass
+
+    Returns:
+        tuple: (anomaly_scores [N], is_anomaly [N]); views into the buffers when given
+    """
+    if (out_scores is None) != (out_flags is None):
+        raise ValueError("Pass both out_scores and out_flags, or neither.")
+    if isinstance(X, np.ndarray):
+        X = np.asarray(X, dtype=np.float64)
+        blocks = (X[i:i + BATCH_ROWS] for i in range(0, len(X), BATCH_ROWS))
+        n_hint = len(X)
+    else:
+        blocks, n_hint = X, None
+
+    if n_hint is not None and out_scores is None:
+        out_scores, out_flags = np.empty(n_hint), np.empty(n_hint, dtype=bool)
+    grow = out_scores is None
+    parts_s, parts_f = [], []
+    work = np.empty((0, len(scaler.mean_)))
+    n = 0
+    for block in blocks:
+        block = np.asarray(block, dtype=np.float64).reshape(-1, len(scaler.mean_))
+        m = len(block)
+        if not fold and len(work) < m:
+            work = np.empty((m, block.shape[1]))
+        if grow:
+            s, f = np.empty(m), np.empty(m, dtype=bool)
+            parts_s.append(s); parts_f.append(f)
+        else:
+            if n + m > min(len(out_scores), len(out_flags)):
+                raise ValueError("Output buffers are smaller than the input.")
+            s, f = out_scores[n:n + m], out_flags[n:n + m]
+        _score_block(block, s, f, fold, work)
+        n += m
+
+    if grow:
+        if not parts_s:
+            return np.empty(0), np.empty(0, dtype=bool)
+        return np.concatenate(parts_s), np.concatenate(parts_f)
+    return out_scores[:n], out_flags[:n]
+
 if __name__ == "__main__":
-    print("Enter the 5 feature values separated by commas:")
-    print("Format: dI_dt, Vout_droop, ripple_RMS, efficiency, dEff_dT")
+    names = list(getattr(scaler, "feature_names_in_", []))
+    if len(names) != len(scaler.mean_):
+        from feature_engineering import FEATURE_COLS
+        names = FEATURE_COLS if len(scaler.mean_) == len(FEATURE_COLS) else [f"x{i}" for i in range(len(scaler.mean_))]
+    print(f"Enter the {len(names)} feature values separated by commas:")
+    print(f"Format: {', '.join(names)}")
     input_str = input("> ")
     
     try:
         features = [float(x.strip()) for x in input_str.split(',')]
-        if len(features) != 5:
-            raise ValueError("Exactly 5 values required.")
+        if len(features) != len(names):
+            raise ValueError(f"Exactly {len(names)} values required.")
         
         result = run_inference(features)
         print("\nResult:")
         print(f"Anomaly Score: {result['anomaly_score']:.4f}")
         print(f"Is Anomaly: {'Yes' if result['is_anomaly'] else 'No'}")
+        print(f"Model Version: {result['model_version']}")
     except ValueError as e:
         print(f"Error: {e}. Please enter valid numbers.")
\ No newline at end of file
@@ -0,0 +1,343 @@
+# src/ingest.py
+import os, time, struct, select, ctypes, ctypes.util
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from feature_engineering import extract_features_array, window_span, FEATURE_COLS
+from rawcap import load_raw_range, SUFFIX as RAWCAP_SUFFIX
+from drift import Sketch
+from event_capture import EventCapture, encode_packets
+
+RAW_SUFFIXES = (".csv", RAWCAP_SUFFIX)
+OUTPUT_PREFIX = "healthy_"        # files written by main.py into the same buffer dir
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO    = 0x00000080
+IN_NONBLOCK    = 0o4000
+IN_CLOEXEC     = 0o2000000
+_EVENT_HDR     = struct.Struct("iIII")   # wd, mask, cookie, len
+
+
+def is_raw_capture(name):
+    name = os.path.basename(name)
+    return name.endswith(RAW_SUFFIXES) and not name.startswith(OUTPUT_PREFIX)
+
+
+# -------------------------------------------------
+# Per-file work (runs in the pool workers)
+# -------------------------------------------------
+def extract_buffer_file(path, start_row=0, start_byte=0, keep_raw=False):
+    """
+    Parse and feature stages of `process_buffer_file`, from a resume point (see ingest_journal).
+
+    Only complete feature windows are used, so a capture still being written can be
+    continued later from `rows_end` / `byte_end`.
+
+    Returns:
+        dict: the `process_buffer_file` fields so far, plus features: (X, times, labels) of
+              the finite windows, or None after an error; with keep_raw, raw: the numeric
+              columns of the rows the windows cover
+    """
+    res = {"path": path, "rows": 0, "n_windows": 0, "n_invalid": 0, "healthy": None, "error": None,
+           "stage": None, "model_version": None, "rows_end": start_row, "byte_end": start_byte,
+           "timings": {}, "features": None}
+    if os.path.getsize(path) == 0:
+        res.update(error="empty file", stage="read")
+        return res
+    timings, clock = res["timings"], time.perf_counter
+    t0 = clock()
+    try:
+        df_raw, row_ends = load_raw_range(path, start_row, start_byte)
+        n = res["rows"] = len(df_raw["time_s"])
+        n_win, step = window_span(n)
+        used = n_win * step
+        res["rows_end"] = start_row + used
+        if row_ends is not None and used:
+            res["byte_end"] = int(row_ends[used - 1])
+        if keep_raw:
+            cols = {c: np.asarray(df_raw[c]) for c in df_raw}
+            res["raw"] = {c: a[:used] for c, a in cols.items() if a.dtype.kind in "fiub"}
+    except Exception as e:
+        res.update(error=str(e), stage="read")
+        return res
+    t1 = clock()
+    timings["parse"] = t1 - t0
+    try:
+        X, times, labels = extract_features_array(df_raw)
+        res["n_windows"] = len(X)
+        finite = np.isfinite(X).all(axis=1)     # dEff_dT is 0/0 when Temp_C is flat over a window
+        if not finite.all():
+            X, times, labels = X[finite], times[finite], labels[finite]
+            res["n_invalid"] = int((~finite).sum())
+    except Exception as e:
+        res.update(error=str(e), stage="features")
+        return res
+    timings["features"] = clock() - t1
+    res["features"] = X, times, labels
+    return res
+
+
+def keep_healthy(res, features, scores, healthy_score=0.0):
+    """Fill res["healthy"] with the windows of `features` scoring at or below `healthy_score` (ndarray)."""
+    X, _, _ = features
+    res["healthy"] = X[scores <= healthy_score]
+    return res
+
+
+def capture_events(res, raw, features, scores, capture):
+    """
+    Fill res["events"] with the packets of the anomalies in one file (event_capture.py).
+
+    The file is its own stream: an event near its start has a shorter pre-trigger window
+    (FLAG_PRE_CUT), one near its end a shorter post-trigger window (FLAG_POST_CUT).
+    """
+    t = raw["time_s"]
+    fs = round((len(t) - 1) / (t[-1] - t[0])) if len(t) > 1 and t[-1] > t[0] else 10000
+    opts = dict(capture)
+    packet_bytes, compress = opts.pop("packet_bytes", None), opts.pop("compress", True)
+    cap = EventCapture(fs, model_version=res["model_version"], **opts)
+    X, times, _ = features
+    events = cap.push(raw, times, X, scores) + cap.flush()
+    kw = {"packet_bytes": packet_bytes} if packet_bytes else {}
+    res["events"] = [(ev["event_id"], ev["t_trigger"], b"".join(encode_packets(ev, compress=compress, **kw)))
+                     for ev in events]
+    res["events_dropped"] = cap.dropped
+    return res
+
+
+def process_buffer_file(path, iso, scaler, healthy_score=0.0, model_version=None, start_row=0, start_byte=0,
+                        capture=None):
+    """
+    Parse, extract and score one raw capture, from a resume point (see ingest_journal).
+
+    Only complete feature windows are used, so a capture still being written can be
+    continued later from `rows_end` / `byte_end`.
+
+    Returns:
+        dict: path, rows, n_windows, n_invalid (windows with non-finite features, not scored),
+              healthy (feature rows [n, 5] of the windows scoring at most healthy_score), error, stage,
+              model_version (the version that scored the file),
+              sketch (drift.Sketch of the healthy windows, in that version's units),
+              events, events_dropped (with `capture`, a dict of EventCapture options plus
+              packet_bytes / compress: [(event id, trigger time, packets)] of the anomalies;
+              events_error if that failed),
+              rows_end, byte_end (resume point after the windows used),
+              timings (seconds per completed stage: parse, features, scale, score)
+    """
+    res = extract_buffer_file(path, start_row, start_byte, keep_raw=capture is not None)
+    res["model_version"] = model_version
+    features, raw = res.pop("features"), res.pop("raw", None)
+    if features is None:
+        return res
+    timings, clock, X = res["timings"], time.perf_counter, features[0]
+    try:
+        t0 = clock()
+        Xs = scaler.transform(X) if len(X) else X
+        t1 = clock()
+        timings["scale"] = t1 - t0
+        scores = -iso.decision_function(Xs) if len(X) else np.empty(0)
+        timings["score"] = clock() - t1
+    except Exception as e:
+        res.update(error=str(e), stage="score")
+        return res
+    return score_windows(res, features, Xs, scores, healthy_score, raw, capture)
+
+
+def score_windows(res, features, Xs, scores, healthy_score=0.0, raw=None, capture=None):
+    """
+    The stages after scoring, shared with the multi-rail workers (rails.py): healthy windows,
+    drift sketch and, with `capture` options, event packets. `Xs` are the scaled windows.
+
+    `healthy_score` is the healthy cut in the same -decision_function units as `scores` and
+    the capture threshold: windows at or below it are kept. The sketch covers the healthy
+    windows only, the population the drift reference is built from (drift.reference_sketch),
+    so an unchanged input does not read as drift.
+    """
+    try:
+        keep_healthy(res, features, scores, healthy_score)
+        kept = scores <= healthy_score
+        res["sketch"] = Sketch.of(Xs[kept], scores[kept])
+    except Exception as e:
+        res.update(error=str(e), stage="score")
+        return res
+    if capture is not None:
+        try:
+            t0 = time.perf_counter()
+            capture_events(res, raw, features, scores, capture)
+            res["timings"]["events"] = time.perf_counter() - t0
+        except Exception as e:                  # the windows are fine; only the capture is lost
+            res["events_error"] = str(e)
+    return res
+
+
+_worker_model = {}
+
+def _init_worker(iso, scaler, healthy_score, version, capture=None):
+    _worker_model.update(iso=iso, scaler=scaler, healthy_score=healthy_score, version=version, capture=capture)
+
+def _process_in_worker(path, start_row=0, start_byte=0):
+    m = _worker_model
+    return process_buffer_file(path, m["iso"], m["scaler"], m["healthy_score"], m["version"], start_row, start_byte,
+                               m["capture"])
+
+
+# -------------------------------------------------
+# Completion notification: inotify, polling fallback
+# -------------------------------------------------
+class BufferWatcher:
+    """
+    Reports raw captures in `buffer_dir` once they are complete.
+
+    On Linux, inotify IN_CLOSE_WRITE / IN_MOVED_TO signal that the logger closed (or
+    atomically renamed) a file. Elsewhere, or if inotify is unavailable, the directory is
+    polled and a file is ready once its size and mtime are unchanged for `settle_s`.
+    Files already present at start-up are reported on the first call.
+    """
+
+    def __init__(self, buffer_dir, poll_s=1.0, settle_s=1.0, use_inotify=True):
+        self.dir = buffer_dir
+        self.poll_s, self.settle_s = poll_s, settle_s
+        self.fd = self._inotify() if use_inotify else None
+        self._seen = {}                     # polling: path -> (size, mtime_ns, first_seen)
+        self._reported = set()
+        self._pending = deque(self._scan_existing())
+
+    @property
+    def mode(self):
+        return "inotify" if self.fd is not None else "poll"
+
+    def _inotify(self):
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd < 0:
+                return None
+            wd = libc.inotify_add_watch(fd, os.fsencode(self.dir), IN_CLOSE_WRITE | IN_MOVED_TO)
+            if wd < 0:
+                os.close(fd)
+                return None
+            return fd
+        except (OSError, AttributeError, TypeError):
+            return None
+
+    def _scan_existing(self):
+        if self.fd is None:
+            return []
+        return sorted(e.path for e in os.scandir(self.dir) if e.is_file() and is_raw_capture(e.name))
+
+    def wait(self, timeout=None):
+        """Block up to `timeout` seconds; return newly completed capture paths."""
+        timeout = self.poll_s if timeout is None else timeout
+        if self.fd is not None:
+            ready = list(self._pending)
+            self._pending.clear()
+            r, _, _ = select.select([self.fd], [], [], 0 if ready else timeout)
+            if r:
+                ready.extend(self._read_events())
+        else:
+            time.sleep(timeout)
+            ready = self._poll()
+        out = [p for p in ready if p not in self._reported and os.path.exists(p)]
+        self._reported.update(out)
+        return out
+
+    def forget(self, path):
+        """Drop bookkeeping for a consumed (deleted) file."""
+        self._reported.discard(path)
+        self._seen.pop(path, None)
+
+    def _read_events(self):
+        paths = []
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return paths
+        i = 0
+        while i + _EVENT_HDR.size <= len(buf):
+            _, mask, _, n = _EVENT_HDR.unpack_from(buf, i)
+            name = buf[i + _EVENT_HDR.size:i + _EVENT_HDR.size + n].rstrip(b"\0").decode(errors="replace")
+            i += _EVENT_HDR.size + n
+            if mask & (IN_CLOSE_WRITE | IN_MOVED_TO) and is_raw_capture(name):
+                paths.append(os.path.join(self.dir, name))
+        return paths
+
+    def _poll(self):
+        now, ready, present = time.monotonic(), [], set()
+        for e in os.scandir(self.dir):
+            if not (e.is_file() and is_raw_capture(e.name)):
+                continue
+            st = e.stat()
+            present.add(e.path)
+            sig = (st.st_size, st.st_mtime_ns)
+            prev = self._seen.get(e.path)
+            if prev is None or prev[:2] != sig:
+                self._seen[e.path] = sig + (now,)
+            elif now - prev[2] >= self.settle_s:
+                ready.append(e.path)
+        for p in set(self._seen) - present:
+            self.forget(p)
+        return sorted(ready)
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+# -------------------------------------------------
+# Process pool with in-order merge
+# -------------------------------------------------
+class IngestPool:
+    """
+    Fans capture files out to worker processes and hands results back in submission order.
+
+    Each worker holds its own copy of the model (sent once at pool start). Call `reload`
+    after a retrain so new submissions are scored with the new model; every result
+    carries the `model_version` that scored it. The healthy cut depends on the model
+    (see Regulator.healthy_score): set `healthy_score` before reloading.
+    """
+
+    def __init__(self, iso, scaler, workers=None, healthy_score=0.0, version=None, capture=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.healthy_score, self.capture = healthy_score, capture
+        self._inflight = deque()
+        self.files_done = self.rows_done = 0
+        self.t0 = time.monotonic()
+        self._start(iso, scaler, version)
+
+    def _start(self, iso, scaler, version):
+        self.version = version
+        self.pool = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                        initargs=(iso, scaler, self.healthy_score, version, self.capture))
+
+    def reload(self, iso, scaler, version=None):
+        old = self.pool
+        self._start(iso, scaler, version)
+        old.shutdown(wait=False)            # in-flight files finish on the old model
+
+    def submit(self, path, start_row=0, start_byte=0):
+        self._inflight.append(self.pool.submit(_process_in_worker, path, start_row, start_byte))
+
+    @property
+    def queue_depth(self):
+        return len(self._inflight)
+
+    def collect(self, block=False):
+        """Return finished results, oldest first, stopping at the first unfinished file."""
+        out = []
+        while self._inflight and (block or self._inflight[0].done()):
+            res = self._inflight.popleft().result()
+            self.files_done += 1
+            self.rows_done += res["rows"]
+            out.append(res)
+        return out
+
+    def throughput(self):
+        dt = max(time.monotonic() - self.t0, 1e-9)
+        return {"files_per_s": self.files_done / dt, "rows_per_s": self.rows_done / dt,
+                "queue_depth": self.queue_depth}
+
+    def shutdown(self):
+        self.pool.shutdown(wait=True)
@@ -0,0 +1,203 @@
+# src/ingest_journal.py
+"""
+Durable manifest of buffer captures, so ingestion is idempotent and resumable.
+
+One sqlite row per capture path:
+  dev, ino, size, mtime_ns     identity and size at the last claim (a replaced file starts over)
+  rows_done, byte_done         prefix whose healthy rows are in the saved HealthyStore
+  rows_pending, byte_pending   prefix scored into the in-memory store, not yet checkpointed
+  epoch                        store checkpoint that will hold the pending rows
+  status                       pending | in_progress | scored | partial | done | failed | quarantined
+  complete, model_version, attempts, stage, error, updated
+
+Regulator (regulator.py) drives it:
+  claim(path, complete)   before submitting: (start_row, start_byte) of unread data, or None
+                          when there is nothing new (unchanged, in flight, done, quarantined);
+                          a close (complete) reported while the file is in flight is kept
+  record(res, epoch)      after scoring, before the rows go into the store
+  commit(epoch)           after store.save() wrote checkpoint `epoch`: pending → done;
+                          returns the complete files that may now be deleted
+  recover(store_epoch)    at start-up: commit what the saved store already holds, roll the
+                          rest back to the committed prefix
+  forget_missing(age)     after commit: drop the rows of done / quarantined files that left
+                          the buffer, so the manifest stays as small as the buffer
+
+The store checkpoint carries its epoch, so a crash between store.save() and commit() is
+resolved exactly once: rows tagged with an epoch the store reached are committed, later
+ones are read again. Files the logger is still appending to are read up to their last
+complete feature window and continued from that offset on the next claim. A complete file
+is deleted only once the committed read covered it as it is on disk; if it grew after its
+claim it stays partial and the next scan reads the rest.
+"""
+import os, time, sqlite3
+
+PENDING, IN_PROGRESS, SCORED, PARTIAL, DONE, FAILED, QUARANTINED = (
+    "pending", "in_progress", "scored", "partial", "done", "failed", "quarantined")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path          TEXT PRIMARY KEY,
+    dev           INTEGER, ino INTEGER, size INTEGER, mtime_ns INTEGER,
+    rows_done     INTEGER NOT NULL DEFAULT 0,
+    byte_done     INTEGER NOT NULL DEFAULT 0,
+    rows_pending  INTEGER NOT NULL DEFAULT 0,
+    byte_pending  INTEGER NOT NULL DEFAULT 0,
+    epoch         INTEGER NOT NULL DEFAULT 0,
+    status        TEXT NOT NULL,
+    complete      INTEGER NOT NULL DEFAULT 0,
+    model_version TEXT,
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    stage         TEXT,
+    error         TEXT,
+    updated       REAL
+);
+CREATE INDEX IF NOT EXISTS files_status ON files(status);
+"""
+
+
+def _grew(row):
+    """The file changed on disk after the claim its journal row describes."""
+    try:
+        st = os.stat(row["path"])
+    except FileNotFoundError:
+        return False
+    return (st.st_size, st.st_mtime_ns) != (row["size"], row["mtime_ns"])
+
+
+class IngestJournal:
+    """sqlite3 (WAL) manifest of buffer files; see the module docstring for the protocol."""
+
+    def __init__(self, path, max_attempts=3):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.db = sqlite3.connect(path, isolation_level=None)       # autocommit per statement
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")                # made durable by sync()
+        self.db.executescript(_SCHEMA)
+
+    def get(self, path):
+        return self.db.execute("SELECT * FROM files WHERE path = ?", (path,)).fetchone()
+
+    def status(self, path):
+        row = self.get(path)
+        return row["status"] if row else None
+
+    def counts(self):
+        """{status: number of files}."""
+        return dict(self.db.execute("SELECT status, COUNT(*) FROM files GROUP BY status").fetchall())
+
+    # ---------------- protocol ----------------
+    def claim(self, path, complete=True):
+        """
+        Mark `path` in progress and return (start_row, start_byte) of its unread data, or
+        None if there is nothing to do. `complete` is whether the writer has closed it.
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        if st.st_size == 0 and not complete:
+            return None                                         # logger has not written yet
+        row, now = self.get(path), time.time()
+        snap = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+        if row is None or (row["dev"], row["ino"]) != snap[:2] or st.st_size < row["size"]:
+            if row is not None and row["status"] == IN_PROGRESS:
+                return None
+            self.db.execute(
+                "INSERT OR REPLACE INTO files (path, dev, ino, size, mtime_ns, status, complete, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (path, *snap, IN_PROGRESS, int(complete), now))
+            return 0, 0
+
+        status = row["status"]
+        if status == IN_PROGRESS and complete and not row["complete"]:
+            # the logger closed it while a growing-file read is in flight: keep the close
+            self.db.execute("UPDATE files SET complete = 1, updated = ? WHERE path = ?", (now, path))
+        if status in (IN_PROGRESS, DONE, QUARANTINED):
+            return None
+        unchanged = (row["size"], row["mtime_ns"]) == snap[2:]
+        if unchanged and status in (SCORED, PARTIAL):
+            if complete and not row["complete"]:
+                # a partial file is now fully committed: scored again so the next commit deletes it
+                self.db.execute("UPDATE files SET complete = 1, status = ?, updated = ? WHERE path = ?",
+                                (SCORED, now, path))
+            return None
+        self.db.execute("UPDATE files SET dev = ?, ino = ?, size = ?, mtime_ns = ?, status = ?, "
+                        "complete = MAX(complete, ?), updated = ? WHERE path = ?",
+                        (*snap, IN_PROGRESS, int(complete), now, path))
+        return row["rows_pending"], row["byte_pending"]
+
+    def record(self, res, epoch):
+        """
+        Store a process_buffer_file result; `epoch` is the checkpoint that will hold its rows.
+
+        Returns:
+            str: the file's new status (QUARANTINED means: move it out of the buffer)
+        """
+        row, now = self.get(res["path"]), time.time()
+        if row is None:
+            return None
+        if res["error"]:
+            attempts = row["attempts"] + int(bool(row["complete"]))   # a growing file may just be cut short
+            status = QUARANTINED if attempts >= self.max_attempts else FAILED
+            self.db.execute("UPDATE files SET status = ?, attempts = ?, stage = ?, error = ?, updated = ? "
+                            "WHERE path = ?", (status, attempts, res["stage"], res["error"], now, res["path"]))
+            return status
+        self.db.execute("UPDATE files SET status = ?, rows_pending = ?, byte_pending = ?, epoch = ?, "
+                        "model_version = ?, stage = NULL, error = NULL, updated = ? WHERE path = ?",
+                        (SCORED, res["rows_end"], res["byte_end"], epoch, res["model_version"], now, res["path"]))
+        return SCORED
+
+    def sync(self):
+        """Make every recorded result durable (call before saving the store)."""
+        self.db.execute("PRAGMA wal_checkpoint(FULL)")
+
+    def commit(self, epoch):
+        """
+        Checkpoint `epoch` of the store was saved: its pending prefixes are now committed.
+
+        Returns:
+            list: paths of complete files fully committed (safe to delete)
+        """
+        now = time.time()
+        with self.db:
+            self.db.execute("BEGIN IMMEDIATE")
+            rows = self.db.execute("SELECT path, size, mtime_ns FROM files WHERE status = ? AND complete "
+                                   "AND epoch <= ?", (SCORED, epoch)).fetchall()
+            done = [r["path"] for r in rows if not _grew(r)]
+            self.db.execute("UPDATE files SET rows_done = rows_pending, byte_done = byte_pending "
+                            "WHERE epoch <= ? AND status != ?", (epoch, QUARANTINED))
+            self.db.execute("UPDATE files SET status = CASE WHEN complete THEN ? ELSE ? END, updated = ? "
+                            "WHERE status = ? AND epoch <= ?", (DONE, PARTIAL, now, SCORED, epoch))
+            self.db.executemany("UPDATE files SET status = ? WHERE path = ?",
+                                [(PARTIAL, r["path"]) for r in rows if _grew(r)])
+        return done
+
+    def recover(self, store_epoch):
+        """
+        Start-up: commit results the saved store (at `store_epoch`) already holds and roll
+        everything newer or in flight back to its committed prefix.
+
+        Returns:
+            list: complete files that were committed here (safe to delete)
+        """
+        done = self.commit(store_epoch)
+        with self.db:
+            self.db.execute("BEGIN IMMEDIATE")
+            self.db.execute("UPDATE files SET rows_pending = rows_done, byte_pending = byte_done, "
+                            "status = CASE WHEN status IN (?, ?) THEN ? ELSE status END "
+                            "WHERE epoch > ? OR status = ?",
+                            (IN_PROGRESS, SCORED, PENDING, store_epoch, IN_PROGRESS))
+        return done
+
+    def forget_missing(self, max_age_s=86400):
+        """Drop rows of done / quarantined files that left the buffer over `max_age_s` ago."""
+        cutoff = time.time() - max_age_s
+        gone = [r[0] for r in self.db.execute(
+            "SELECT path FROM files WHERE status IN (?, ?) AND updated < ?", (DONE, QUARANTINED, cutoff))
+            if not os.path.exists(r[0])]
+        self.db.executemany("DELETE FROM files WHERE path = ?", [(p,) for p in gone])
+        return len(gone)
+
+    def close(self):
+        self.db.close()
@@ -0,0 +1,58 @@
+# src/liveness.py
+"""
+Pipeline liveness for the watchdog heartbeat daemon.
+
+main.py and rails.py call `beat(stage, ...)` for every stage that is making progress or has nothing to
+do. Beats are written at most once per `interval`, atomically, to a small JSON file:
+  {"pid": 1234, "written": 1718000000.2, "stages": {"ingest": 1718000000.1, ...}}
+`watchdog system/Raspberypi Heartbeat.py` pulses the ESP32 only while no stage is `stale`,
+so a hung ingestion loop, a stuck scoring worker or a runaway retrain ends in a reset.
+Wall-clock times, because the daemon is another process.
+"""
+import os, json, time
+
+STAGES = ("ingest", "score", "retrain")
+MAX_AGE_S = {"ingest": 30.0, "score": 120.0, "retrain": 30.0}   # score: one slow capture file
+
+
+class Liveness:
+    """Rate-limited writer of the liveness file."""
+
+    def __init__(self, path, interval=1.0):
+        self.path, self.interval = path, interval
+        self.stages = {}
+        self._written = 0.0
+
+    def beat(self, *stages):
+        now = time.time()
+        for stage in stages:
+            self.stages[stage] = now
+        if now - self._written >= self.interval:
+            self.flush(now)
+
+    def flush(self, now=None):
+        now = time.time() if now is None else now
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"pid": os.getpid(), "written": now, "stages": self.stages}, f)
+        os.replace(tmp, self.path)
+        self._written = now
+
+
+def read(path):
+    """The liveness record, or None if there is none (yet)."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def stale(path, max_age=MAX_AGE_S, now=None):
+    """Stages that did not beat within their `max_age` (none without a file: not gated yet)."""
+    rec = read(path)
+    if rec is None:
+        return []
+    now = time.time() if now is None else now
+    beats = rec.get("stages", {})
+    return [s for s, age in max_age.items() if now - beats.get(s, -float("inf")) > age]
@@ -1,151 +1,131 @@
 # src/main.py
-import os, time, glob, joblib, pandas as pd, numpy as np
-from sklearn.ensemble import IsolationForest
-from feature_engineering import extract_features
-from model_export import export_to_q15_header
+import os, time, glob
+from feature_engineering import FEATURE_COLS
+from ingest import BufferWatcher, IngestPool
+from liveness import Liveness
+from regulator import (Regulator, RetrainScheduler, RETRAIN_TRIGGER, DRIFT_PSI, DRIFT_MAX_AGE_SEC,
+                       QUEUE_DEPTH)
+import metrics
 
 # -------------------------------------------------
-# CONFIGURATION
+# CONFIGURATION (per-regulator settings: regulator.py)
 # -------------------------------------------------
 BUFFER_DIR          = "data/buffer/"
 MODEL_DIR           = "models/"
-MIN_HEALTHY_SAMPLES = 100
-HEALTHY_SCORE       = 0.0
-RETRAIN_EVERY_SEC   = 5                       # 5 sec for test
-THRESHOLD           = 0.56
+RETRAIN_EVERY_SEC   = 5                       # 5 sec for test; ONLINE_MODEL: publish period; drift: minimum gap
+INGEST_WORKERS      = None                    # None → one per CPU
+STORE_CHECKPOINT_SEC = 60                    # also when processed captures get deleted
+JOURNAL_SCAN_SEC    = 10                      # catch-up scan: growing captures, retries after errors
+METRICS_ENABLED     = True                    # False (or POWERSENSE_METRICS=0) → no-op timers/counters
+METRICS_TEXTFILE    = f"{MODEL_DIR}metrics.prom"  # Prometheus textfile; None → not written
+METRICS_PORT        = None                    # e.g. 9108 → http://127.0.0.1:9108/metrics
+METRICS_EVERY_SEC   = 10
+LIVENESS_PATH       = f"{MODEL_DIR}liveness.json"   # read by the watchdog heartbeat daemon; None → off
+RETRAIN_MAX_SEC     = 900                     # a longer retrain counts as hung
+EVENT_DIR           = "data/events/"          # one packet file per event, for downlink
 # -------------------------------------------------
 
-print("Loading model...")
-iso    = joblib.load(f"{MODEL_DIR}iforest_model.pkl")
-scaler = joblib.load(f"{MODEL_DIR}feature_scaler.pkl")
-print("Model loaded.")
-
-def load_healthy_chunks():
-    print("Scanning buffer for CSVs...")
-    healthy = []
-    for path in glob.glob(f"{BUFFER_DIR}*.csv"):
-        print(f"  → Found: {os.path.basename(path)} (size: {os.path.getsize(path)} bytes)")
-        if os.path.getsize(path) == 0:
-            print("  → Empty file, skipping.")
-            os.remove(path)
-            continue
+metrics.configure(METRICS_ENABLED and metrics.is_enabled())
 
-        try:
-            df_raw = pd.read_csv(path)
-            print(f"  → Loaded {len(df_raw)} rows")
-        except Exception as e:
-            print(f"  → ERROR reading CSV: {e}")
-            os.remove(path)
-            continue
 
-        try:
-            df_feat = extract_features(df_raw)
-            print(f"  → Extracted {len(df_feat)} feature rows")
-        except Exception as e:
-            print(f"  → ERROR in feature extraction: {e}")
-            os.remove(path)
-            continue
+def open_regulator():
+    """The one regulator of this service: models/ and data/buffer/."""
+    print("Loading model...")
+    return Regulator(MODEL_DIR, BUFFER_DIR, event_dir=EVENT_DIR, retrain_every_s=RETRAIN_EVERY_SEC)
+
+def export_metrics(reg, pool=None):
+    """Refresh the gauges and rewrite the Prometheus textfile."""
+    if not metrics.is_enabled():
+        return
+    if pool is not None:
+        QUEUE_DEPTH.set(pool.queue_depth)
+    reg.export_metrics()
+    if METRICS_TEXTFILE:
+        metrics.write_textfile(METRICS_TEXTFILE)
 
-        X = df_feat[["dI_dt","Vout_droop","ripple_RMS","efficiency","dEff_dT"]].values
+def absorb_legacy_healthy(reg):
+    """Move healthy_*.csv files left by older versions into the healthy store."""
+    import pandas as pd
+    for path in glob.glob(f"{reg.buffer_dir}healthy_*.csv"):
         try:
-            X_scaled = scaler.transform(X)
-            scores = -iso.decision_function(X_scaled)
-            mask = scores > HEALTHY_SCORE
-            healthy_part = df_feat[mask]
-            print(f"  → {len(healthy_part)} healthy rows kept (score > {HEALTHY_SCORE})")
-            healthy.append(healthy_part)
+            reg.store.add(pd.read_csv(path)[FEATURE_COLS].values, t=os.path.getmtime(path))
+            os.remove(path)
+            print(f"Absorbed legacy {os.path.basename(path)} into healthy store")
         except Exception as e:
-            print(f"  → ERROR in scoring: {e}")
-
-        print(f"  → Deleting {os.path.basename(path)}")
-        os.remove(path)
-
-    if not healthy:
-        print("No healthy data found in buffer.")
-        return pd.DataFrame()
-    return pd.concat(healthy, ignore_index=True)
-
-def retrain():
-    global iso, scaler
-    print("Starting retrain...")
-
-    all_files = glob.glob(f"{BUFFER_DIR}healthy_*.csv")
-    if not all_files:
-        print("No healthy_*.csv files found for retraining.")
-        return False
-
-    print(f"Found {len(all_files)} healthy files. Loading...")
-    healthy = pd.concat([pd.read_csv(f) for f in all_files])
-    print(f"Total healthy samples: {len(healthy)}")
-
-    if len(healthy) < MIN_HEALTHY_SAMPLES:
-        print(f"Not enough samples ({len(healthy)} < {MIN_HEALTHY_SAMPLES}). Skipping retrain.")
-        return False
-
-    X = healthy[["dI_dt","Vout_droop","ripple_RMS","efficiency","dEff_dT"]].values
-    print(f"Feature matrix shape: {X.shape}")
-
-    # ---- Online scaler update (FIX: axis=0) ----
-    old_n = 10000
-    new_n = len(X)
-    old_mean, old_scale = scaler.mean_, scaler.scale_
-
-    new_mean = (old_mean * old_n + X.mean(axis=0) * new_n) / (old_n + new_n)
-    new_var  = (old_scale**2 * old_n +
-                X.var(axis=0) * new_n +
-                ((X.mean(axis=0) - old_mean)**2 * old_n * new_n) / (old_n + new_n))
-    new_scale = np.sqrt(new_var / (old_n + new_n))
-
-    scaler.mean_  = new_mean
-    scaler.scale_ = new_scale
-    print("Scaler updated.")
-
-    # ---- Retrain model ----
-    iso = IsolationForest(n_estimators=100, contamination=0.01, random_state=42)
-    iso.fit(scaler.transform(X))
-    print("Isolation Forest retrained.")
-
-    # ---- Save ----
-    joblib.dump(iso,    f"{MODEL_DIR}iforest_model.pkl")
-    joblib.dump(scaler, f"{MODEL_DIR}feature_scaler.pkl")
-    export_to_q15_header(iso, scaler, threshold=THRESHOLD)
-
-    # ---- Timestamp ----
-    with open(f"{MODEL_DIR}last_retrain.txt", "w") as f:
-        f.write(str(int(time.time())))
-
-    # ---- Clean ----
-    for f in all_files:
-        os.remove(f)
-
-    print(f"RETRAINED with {len(X)} healthy samples")
-    print(f"New model saved: {MODEL_DIR}model_iforest.h")
-    return True
+            print(f"  → ERROR reading {os.path.basename(path)}: {e}")
 
 # -------------------------------------------------
 # MAIN LOOP
 # -------------------------------------------------
 if __name__ == "__main__":
-    os.makedirs(BUFFER_DIR, exist_ok=True)
-
-    # Force first retrain
-    if not os.path.exists(f"{MODEL_DIR}last_retrain.txt"):
-        with open(f"{MODEL_DIR}last_retrain.txt", "w") as f:
-            f.write(str(int(time.time()) - 3600))
+    reg = open_regulator()
 
     print("PowerSense continuous-learning STARTED")
-    print(f"   → Will retrain every {RETRAIN_EVERY_SEC} seconds (test mode)")
-
-    while True:
-        new_data = load_healthy_chunks()
-        if len(new_data) > 0:
-            ts = int(time.time())
-            out_path = f"{BUFFER_DIR}healthy_{ts}.csv"
-            new_data.to_csv(out_path, index=False)
-            print(f"Saved {len(new_data)} healthy rows → {os.path.basename(out_path)}")
-
-        last = int(open(f"{MODEL_DIR}last_retrain.txt").read().strip())
-        if time.time() - last >= RETRAIN_EVERY_SEC:
-            retrain()
-
-        time.sleep(1)
+    if RETRAIN_TRIGGER == "timer":
+        print(f"   → Will retrain every {RETRAIN_EVERY_SEC} seconds (test mode)")
+    else:
+        print(f"   → Will retrain on drift (PSI >= {DRIFT_PSI}), at least {RETRAIN_EVERY_SEC} s apart, "
+              f"at most {DRIFT_MAX_AGE_SEC} s apart")
+
+    reg.start()
+    absorb_legacy_healthy(reg)
+    last_checkpoint = last_metrics = last_scan = time.time()
+    if metrics.is_enabled() and METRICS_PORT:
+        try:
+            metrics.serve(METRICS_PORT)
+            print(f"   → Metrics on http://127.0.0.1:{METRICS_PORT}/metrics")
+        except OSError as e:
+            print(f"   → Metrics endpoint disabled: {e}")
+
+    reg.watcher = BufferWatcher(reg.buffer_dir, poll_s=1.0)
+    scheduler = RetrainScheduler([reg])
+    liveness = Liveness(LIVENESS_PATH) if LIVENESS_PATH else None
+    pool = IngestPool(reg.iso, reg.scaler, workers=INGEST_WORKERS, healthy_score=reg.healthy_score,
+                      version=reg.version, capture=reg.event_options())
+    print(f"   → Ingestion: {reg.watcher.mode} notifications, {pool.workers} worker processes")
+
+    try:
+        while True:
+            for path in reg.watcher.wait(timeout=1.0):
+                work = reg.claim(path)
+                if work is not None:
+                    pool.submit(path, *work)
+            if time.time() - last_scan >= JOURNAL_SCAN_SEC:
+                for work in reg.scan():
+                    pool.submit(*work)
+                last_scan = time.time()
+
+            results = pool.collect()
+            if results:
+                reg.absorb([reg.record(res) for res in results])
+                tp = pool.throughput()
+                print(f"Ingest: {tp['files_per_s']:.2f} files/s, {tp['rows_per_s']:.0f} rows/s, "
+                      f"queue depth {tp['queue_depth']}")
+
+            if time.time() - last_checkpoint >= STORE_CHECKPOINT_SEC:
+                reg.checkpoint()
+                last_checkpoint = time.time()
+
+            if time.time() - last_metrics >= METRICS_EVERY_SEC:
+                reg.check_drift()
+                export_metrics(reg, pool)
+                last_metrics = time.time()
+
+            if scheduler.poll():
+                pool.capture, pool.healthy_score = reg.event_options(), reg.healthy_score
+                pool.reload(reg.iso, reg.scaler, reg.version)
+
+            # ---- Liveness: a stage beats while it makes progress or has nothing to do ----
+            if liveness is not None:
+                stages = ["ingest"]
+                if results or pool.queue_depth == 0:
+                    stages.append("score")
+                if not scheduler.hung(RETRAIN_MAX_SEC):
+                    stages.append("retrain")
+                liveness.beat(*stages)
+    finally:
+        reg.checkpoint()                    # files still in flight are read again after restart
+        export_metrics(reg)
+        scheduler.shutdown()
+        pool.shutdown()
+        reg.watcher.close()
@@ -0,0 +1,227 @@
+# src/metrics.py
+"""
+In-process metrics for the OBC service: counters, gauges and rolling latency summaries,
+exported in the Prometheus text format, either as a file for node_exporter's textfile
+collector or from a local HTTP endpoint.
+
+  from metrics import counter, gauge, summary, timer
+  ROWS = counter("powersense_rows_total", "Raw rows ingested")
+  ROWS.inc(len(df))
+  with timer("powersense_stage_seconds", stage="parse"):
+      ...
+
+Summaries keep the last `window` observations per label set, so their quantiles describe
+recent behaviour; _sum / _count are cumulative. When disabled (configure(enabled=False)
+or POWERSENSE_METRICS=0 in the environment), updates return after one flag check and
+`timer()` hands out a shared no-op context manager.
+"""
+import os, time, threading
+from collections import deque
+
+QUANTILES = (0.5, 0.9, 0.99)
+WINDOW = 1024
+
+_enabled = os.environ.get("POWERSENSE_METRICS", "1") != "0"
+_lock = threading.Lock()
+_registry = {}
+
+
+def configure(enabled=True):
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled():
+    return _enabled
+
+
+def _key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _fmt_labels(key, extra=()):
+    items = list(key) + list(extra)
+    if not items:
+        return ""
+    esc = lambda v: str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{k}="{esc(v)}"' for k, v in items) + "}"
+
+
+def _fmt_value(v):
+    return repr(float(v)) if v == v else "NaN"
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, help=""):
+        self.name, self.help = name, help
+        self.values = {}
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for key, v in self.values.items():
+            lines.append(f"{self.name}{_fmt_labels(key)} {_fmt_value(v)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonic count (Prometheus counter)."""
+    kind = "counter"
+
+    def inc(self, n=1, **labels):
+        if not _enabled:
+            return
+        k = _key(labels)
+        with _lock:
+            self.values[k] = self.values.get(k, 0) + n
+
+
+class Gauge(_Metric):
+    """Value that goes up and down (queue depth, store size, ...)."""
+    kind = "gauge"
+
+    def set(self, v, **labels):
+        if not _enabled:
+            return
+        with _lock:
+            self.values[_key(labels)] = v
+
+
+class Summary(_Metric):
+    """Rolling quantiles over the last `window` observations, plus cumulative sum and count."""
+    kind = "summary"
+
+    def __init__(self, name, help="", window=WINDOW, quantiles=QUANTILES):
+        super().__init__(name, help)
+        self.window, self.quantiles = window, quantiles
+
+    def observe(self, v, **labels):
+        if not _enabled:
+            return
+        k = _key(labels)
+        with _lock:
+            st = self.values.get(k)
+            if st is None:
+                st = self.values[k] = [deque(maxlen=self.window), 0, 0.0]
+            st[0].append(v)
+            st[1] += 1
+            st[2] += v
+
+    def quantile(self, q, **labels):
+        st = self.values.get(_key(labels))
+        if not st or not st[0]:
+            return None
+        vals = sorted(st[0])
+        return vals[min(len(vals) - 1, int(q * len(vals)))]
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for key, (recent, count, total) in self.values.items():
+            vals = sorted(recent)
+            for q in self.quantiles:
+                v = vals[min(len(vals) - 1, int(q * len(vals)))] if vals else float("nan")
+                lines.append(f"{self.name}{_fmt_labels(key, [('quantile', q)])} {_fmt_value(v)}")
+            lines.append(f"{self.name}_sum{_fmt_labels(key)} {_fmt_value(total)}")
+            lines.append(f"{self.name}_count{_fmt_labels(key)} {count}")
+        return lines
+
+
+def _get(cls, name, help, **kw):
+    with _lock:
+        m = _registry.get(name)
+        if m is None:
+            m = _registry[name] = cls(name, help, **kw)
+        elif not isinstance(m, cls):
+            raise TypeError(f"{name} is already registered as a {m.kind}")
+    return m
+
+
+def counter(name, help=""):
+    return _get(Counter, name, help)
+
+def gauge(name, help=""):
+    return _get(Gauge, name, help)
+
+def summary(name, help="", window=WINDOW):
+    return _get(Summary, name, help, window=window)
+
+
+# -------------------------------------------------
+# Timers
+# -------------------------------------------------
+class _Timer:
+    __slots__ = ("metric", "labels", "t0", "elapsed")
+
+    def __init__(self, metric, labels):
+        self.metric, self.labels, self.elapsed = metric, labels, None
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self.t0
+        self.metric.observe(self.elapsed, **self.labels)
+
+
+class _NullTimer:
+    __slots__ = ()
+    elapsed = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_TIMER = _NullTimer()
+
+
+def timer(name, help="Stage latency in seconds", **labels):
+    """Context manager observing the block's monotonic duration into summary `name`."""
+    if not _enabled:
+        return _NULL_TIMER
+    return _Timer(summary(name, help), labels)
+
+
+# -------------------------------------------------
+# Export
+# -------------------------------------------------
+def render():
+    """All metrics in the Prometheus text exposition format."""
+    with _lock:
+        lines = [line for m in _registry.values() for line in m.render()]
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path):
+    """Atomically (re)write `path` for node_exporter's textfile collector."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        f.write(render())
+    os.replace(tmp, path)
+
+
+def serve(port, host="127.0.0.1"):
+    """Serve /metrics from a daemon thread; returns the server (call .shutdown() to stop)."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
@@ -1,7 +1,15 @@
-import joblib
+import re
 import numpy as np
 import math
 
+# Node layout flags of a flattened forest (set by forest_opt.py); 0 is sklearn's layout
+LAYOUT_TREE_LOCAL = 1   # child indices relative to the first node of their tree
+LAYOUT_ADJACENT   = 2   # right child == left child + 1, children_right omitted
+LAYOUT_NARROW     = 4   # int16 child indices, int8 feature indices
+_LAYOUT_MACROS = {LAYOUT_TREE_LOCAL: "CHILDREN_TREE_LOCAL", LAYOUT_ADJACENT: "CHILDREN_ADJACENT",
+                  LAYOUT_NARROW: "MODEL_NARROW_TYPES"}
+_CTYPES = {np.dtype(np.int8): "int8_t", np.dtype(np.int16): "int16_t", np.dtype(np.int32): "int32_t"}
+
 def to_q15(x, max_abs=None):
     if max_abs is None:
         max_abs = np.max(np.abs(x))
@@ -9,56 +17,63 @@ def to_q15(x, max_abs=None):
         return np.zeros_like(x, dtype=np.int16)
     return np.int16(np.clip(x / max_abs * 32767, -32768, 32767))
 
-def export_to_q15_header(iso, scaler, output_path='models/model_iforest2.h', threshold=0.56):
+def c_of(n: int) -> float:
+    """c(n) average path length, as used by the firmware (no special case for n == 2)."""
+    if n <= 1: return 0.0
+    gamma = 0.5772156649015329
+    return 2.0 * (math.log(n - 1.0) + gamma) - (2.0 * (n - 1.0) / n)
+
+def flatten_forest(iso):
     """
-    Exports a Q15 header with everything needed for IsolationForest inference on MCU:
-      - scaler mean/scale (Q15) + their dequant scales
-      - concatenated node arrays: feature, threshold(Q15), children_left/right, node_samples
-      - per-tree offsets
-      - decision threshold in Q15 + its dequant scale
-      - c(max_samples) constant
-    Keeps the original signature unchanged.
+    Concatenate the node arrays of every tree in a fitted IsolationForest.
+
+    Child indices are rebased to global node indices (-1 stays -1 at leaves), so the
+    arrays can be walked directly from tree_offsets[t]. Thresholds are kept in float64
+    exactly as sklearn stores them; the exporters quantize from here.
+
+    Returns:
+        dict: feature, threshold, children_left, children_right, node_samples,
+              tree_offsets (numpy arrays) and max_samples (int)
     """
-    # -----------------------------
-    # 1) Gather forest structures
-    # -----------------------------
-    n_trees = len(iso.estimators_)
-    trees = [t.tree_ for t in iso.estimators_]
-
-    # Flatten arrays across all trees
-    all_feat  = []
-    all_thr   = []
-    all_left  = []
-    all_right = []
-    all_nsamp = []
-    tree_offsets = []
-
-    node_base = 0
-    for est in iso.estimators_:
-        t = est.tree_
-        n_nodes = t.node_count
-        tree_offsets.append(node_base)
+    trees = [est.tree_ for est in iso.estimators_]
+    counts = np.array([t.node_count for t in trees], dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(np.int32)
+    base = np.repeat(offsets, counts)
 
+    def rebase(children):
+        c = np.concatenate(children).astype(np.int32)
+        return np.where(c >= 0, c + base, -1).astype(np.int32)
+
+    return {
         # features: -2 means leaf (sklearn convention)
-        all_feat.extend(t.feature.tolist())
-        all_thr.extend(t.threshold.astype(np.float32).tolist())
-        all_left.extend(t.children_left.tolist())
-        all_right.extend(t.children_right.tolist())
+        "feature":        np.concatenate([t.feature for t in trees]).astype(np.int16),
+        "threshold":      np.concatenate([t.threshold for t in trees]).astype(np.float64),
+        "children_left":  rebase([t.children_left for t in trees]),
+        "children_right": rebase([t.children_right for t in trees]),
         # use weighted_n_node_samples (float) -> cast to int
-        all_nsamp.extend(t.weighted_n_node_samples.astype(np.int32).tolist())
+        "node_samples":   np.concatenate([t.weighted_n_node_samples for t in trees]).astype(np.int32),
+        "tree_offsets":   offsets,
+        # sklearn exposes .max_samples_ after fit
+        "max_samples":    int(getattr(iso, "max_samples_", 256)),
+    }
 
-        node_base += n_nodes
+def quantize_model(iso, scaler, threshold=0.56):
+    """
+    Everything `export_to_q15_header` writes, as numpy arrays and Python scalars.
 
-    feat_flat = np.asarray(all_feat,  dtype=np.int16)   # -2, 0..NUM_FEATURES-1
-    thr_flat  = np.asarray(all_thr,   dtype=np.float32)
-    left_flat = np.asarray(all_left,  dtype=np.int32)
-    right_flat= np.asarray(all_right, dtype=np.int32)
-    ns_flat   = np.asarray(all_nsamp, dtype=np.int16)   # fits typical values
-    offsets   = np.asarray(tree_offsets, dtype=np.int32)
+    The keys mirror the header symbols (lower-cased), so the same dict can come from
+    a fitted model here or from an existing header via `read_q15_header`. A flattened
+    dict from `forest_opt.optimize_forest` keeps its node layout (`layout` flags).
+    """
+    flat = iso if isinstance(iso, dict) else flatten_forest(iso)
+    thr_flat = flat["threshold"].astype(np.float32)
+    layout = int(flat.get("layout", 0))
+    child_t = np.int16 if layout & LAYOUT_NARROW else np.int32
+    feat_t = np.int8 if layout & LAYOUT_NARROW else np.int16
+    widest = max(np.max(flat[k], initial=0) for k in ("children_left", "children_right") if k in flat)
+    if layout & LAYOUT_NARROW and widest > np.iinfo(np.int16).max:
+        raise ValueError("child indices do not fit int16; use LAYOUT_TREE_LOCAL")
 
-    # -----------------------------
-    # 2) Prepare scaler + quantize
-    # -----------------------------
     mean = scaler.mean_.astype(np.float32)
     scale = scaler.scale_.astype(np.float32)
 
@@ -68,27 +83,60 @@ def export_to_q15_header(iso, scaler, output_path='models/model_iforest2.h', thr
     thr_scale   = float(np.max(np.abs(thr_flat))) or 1.0
     dec_scale   = float(abs(threshold)) or 1.0
 
-    mean_q15  = to_q15(mean,  mean_scale)
-    scale_q15 = to_q15(scale, scale_scale)
-    thr_q15   = to_q15(thr_flat, thr_scale)
-    th_q15    = int(to_q15(np.array([threshold], dtype=np.float32), dec_scale)[0])
-
-    # -----------------------------
-    # 3) c(max_samples) constant
-    # -----------------------------
     # IsolationForest score uses c(max_samples) in 2^{-E[h]/c(ms)}
-    def _c_of(n: int) -> float:
-        if n <= 1: return 0.0
-        gamma = 0.5772156649015329
-        return 2.0 * (math.log(n - 1.0) + gamma) - (2.0 * (n - 1.0) / n)
-
-    # sklearn exposes .max_samples_ after fit
-    max_samples = int(getattr(iso, "max_samples_", 256))
-    c_max = _c_of(max_samples)
-
-    # -----------------------------
-    # 4) Emit header
-    # -----------------------------
+    max_samples = flat["max_samples"]
+    q = {
+        "num_trees":           len(flat["tree_offsets"]),
+        "num_features":        len(scaler.mean_),
+        "num_nodes":           len(thr_flat),
+        "scale_mean":          mean_scale,
+        "scale_scale":         scale_scale,
+        "scale_thresholds":    thr_scale,
+        "scale_decision_th":   dec_scale,
+        "iforest_max_samples": max_samples,
+        "iforest_c_maxsamples": c_of(max_samples),
+        "model_threshold_q15": int(to_q15(np.array([threshold], dtype=np.float32), dec_scale)[0]),
+        "scaler_mean_q15":     to_q15(mean,  mean_scale),
+        "scaler_scale_q15":    to_q15(scale, scale_scale),
+        "features_idx":        flat["feature"].astype(feat_t),   # -2, 0..NUM_FEATURES-1
+        "thresholds_q15":      to_q15(thr_flat, thr_scale),
+        "children_left":       flat["children_left"].astype(child_t),
+        "children_right":      flat["children_right"].astype(child_t),
+        "node_samples":        flat["node_samples"].astype(np.int16),  # fits typical values
+        "tree_offsets":        flat["tree_offsets"].astype(np.int32),
+        "layout":              layout,
+    }
+    if layout & LAYOUT_ADJACENT:
+        del q["children_right"]
+    return q
+
+def export_to_q15_header(iso, scaler, output_path='models/model_iforest2.h', threshold=0.56, feature_names=None):
+    """
+    Exports a Q15 header with everything needed for IsolationForest inference on MCU:
+      - scaler mean/scale (Q15) + their dequant scales
+      - concatenated node arrays: feature, threshold(Q15), children_left/right, node_samples
+      - per-tree offsets
+      - decision threshold in Q15 + its dequant scale
+      - c(max_samples) constant
+      - the feature order as a comment, from `feature_names` or the scaler's feature_names_in_
+        (wider vectors from feature_bank.py export the same way; NUM_FEATURES follows the scaler)
+    Keeps the original positional signature unchanged.
+    """
+    q = quantize_model(iso, scaler, threshold)
+    if feature_names is None:
+        feature_names = getattr(scaler, "feature_names_in_", None)
+    names = ([f"/* Feature order: {', '.join(map(str, feature_names))} */"]
+             if feature_names is not None and len(feature_names) == q["num_features"] else [])
+    arr = lambda a: ", ".join(map(str, a))
+    ctype = lambda k: _CTYPES[q[k].dtype]
+    layout = [f"#define {m} 1" for bit, m in _LAYOUT_MACROS.items() if q["layout"] & bit]
+    if layout:
+        layout = ["/* Node layout (forest_opt.py) */"] + layout + [""]
+    if "children_right" in q:
+        right = [f"static const {ctype('children_right')} children_right[NUM_NODES] = {{{arr(q['children_right'])}}};"]
+    else:
+        right = []
+
     lines = [
         "/* =============================================== */",
         "/*   PowerSense: SEL Detector (Q15 Model)     */",
@@ -99,38 +147,40 @@ def export_to_q15_header(iso, scaler, output_path='models/model_iforest2.h', thr
         "",
         "#include <stdint.h>",
         "",
-        f"#define NUM_TREES {n_trees}",
-        f"#define NUM_FEATURES {len(scaler.mean_)}",
-        f"#define NUM_NODES {len(thr_q15)}",
+        f"#define NUM_TREES {q['num_trees']}",
+        f"#define NUM_FEATURES {q['num_features']}",
+        f"#define NUM_NODES {q['num_nodes']}",
+        *names,
         "",
         "/* Q15 dequantization scales: real = (q15/32767.0f) * SCALE_* */",
-        f"#define SCALE_MEAN {mean_scale:.9f}f",
-        f"#define SCALE_SCALE {scale_scale:.9f}f",
-        f"#define SCALE_THRESHOLDS {thr_scale:.9f}f",
-        f"#define SCALE_DECISION_TH {dec_scale:.9f}f",
+        f"#define SCALE_MEAN {q['scale_mean']:.9f}f",
+        f"#define SCALE_SCALE {q['scale_scale']:.9f}f",
+        f"#define SCALE_THRESHOLDS {q['scale_thresholds']:.9f}f",
+        f"#define SCALE_DECISION_TH {q['scale_decision_th']:.9f}f",
         "",
         "/* IsolationForest constants */",
-        f"#define IFOREST_MAX_SAMPLES {max_samples}",
-        f"#define IFOREST_C_MAXSAMPLES {c_max:.9f}f",
+        f"#define IFOREST_MAX_SAMPLES {q['iforest_max_samples']}",
+        f"#define IFOREST_C_MAXSAMPLES {q['iforest_c_maxsamples']:.9f}f",
         "",
-        f"#define MODEL_THRESHOLD_Q15 {th_q15}",  # decision threshold on anomaly_score
+        f"#define MODEL_THRESHOLD_Q15 {q['model_threshold_q15']}",  # decision threshold on anomaly_score
         "",
+        *layout,
         "/* StandardScaler params (Q15) */",
-        f"static const int16_t scaler_mean_q15[NUM_FEATURES] = {{{', '.join(map(str, mean_q15))}}};",
-        f"static const int16_t scaler_scale_q15[NUM_FEATURES] = {{{', '.join(map(str, scale_q15))}}};",
+        f"static const int16_t scaler_mean_q15[NUM_FEATURES] = {{{arr(q['scaler_mean_q15'])}}};",
+        f"static const int16_t scaler_scale_q15[NUM_FEATURES] = {{{arr(q['scaler_scale_q15'])}}};",
         "",
         "/* Forest arrays (flattened across trees) */",
         "/* feature index per node; -2 denotes leaf */",
-        f"static const int16_t features_idx[NUM_NODES] = {{{', '.join(map(str, feat_flat))}}};",
+        f"static const {ctype('features_idx')} features_idx[NUM_NODES] = {{{arr(q['features_idx'])}}};",
         "/* threshold per node (Q15, dequant with SCALE_THRESHOLDS) */",
-        f"static const int16_t thresholds_q15[NUM_NODES] = {{{', '.join(map(str, thr_q15))}}};",
+        f"static const int16_t thresholds_q15[NUM_NODES] = {{{arr(q['thresholds_q15'])}}};",
         "/* children indices per node (-1 for none) */",
-        f"static const int32_t children_left[NUM_NODES]  = {{{', '.join(map(str, left_flat))}}};",
-        f"static const int32_t children_right[NUM_NODES] = {{{', '.join(map(str, right_flat))}}};",
+        f"static const {ctype('children_left')} children_left[NUM_NODES]  = {{{arr(q['children_left'])}}};",
+        *right,
         "/* samples per node (int) for c(n) correction at leaves) */",
-        f"static const int16_t node_samples[NUM_NODES] = {{{', '.join(map(str, ns_flat))}}};",
+        f"static const int16_t node_samples[NUM_NODES] = {{{arr(q['node_samples'])}}};",
         "/* start index of each tree in the flattened arrays */",
-        f"static const int32_t tree_offsets[NUM_TREES] = {{{', '.join(map(str, offsets))}}};",
+        f"static const int32_t tree_offsets[NUM_TREES] = {{{arr(q['tree_offsets'])}}};",
         "",
         "#endif // MODEL_IFOREST_H"
     ]
@@ -138,11 +188,25 @@ def export_to_q15_header(iso, scaler, output_path='models/model_iforest2.h', thr
     with open(output_path, "w") as f:
         f.write("\n".join(lines))
     print(f"{output_path} generated!")
+
+def read_q15_header(path):
+    """Parse a header written by `export_to_q15_header` back into the `quantize_model` dict."""
+    text = open(path).read()
+    q = {}
+    for name, val in re.findall(r"#define\s+([A-Z0-9_]+)\s+(-?[0-9.]+)f?\b", text):
+        q[name.lower()] = float(val) if "." in val else int(val)
+    dtypes = {v: k for k, v in _CTYPES.items()}
+    for ctype, name, body in re.findall(r"static const (int8_t|int16_t|int32_t) (\w+)\[\w+\]\s*=\s*\{([^}]*)\}", text):
+        q[name] = np.array([int(v) for v in body.split(",") if v.strip()], dtype=dtypes[ctype])
+    q["layout"] = sum(bit for bit, m in _LAYOUT_MACROS.items() if q.pop(m.lower(), 0))
+    return q
 if __name__ == "__main__":
     # ------------------------------------------------------------
     # 9Export model to Q15 header for embedded use
     # ------------------------------------------------------------
 
+    import joblib
+
     # Load trained parts
     pack = joblib.load("models/iforest_optimized_pack.pkl")
     pipe = pack["pipe"]
@@ -152,4 +216,3 @@ if __name__ == "__main__":
 
     # Export header
     export_to_q15_header(iso, scaler, output_path="models/model_iforest2.h", threshold=threshold)
-
@@ -0,0 +1,286 @@
+# src/model_image.py
+"""
+Binary Isolation Forest image for runtime loading, and delta updates between images.
+
+Image layout (little-endian), loaded by firmware_raspberry/main/model_image.c:
+  header   80 B  magic "PSIMG1\\0\\0", u16 format, u16 header size, u32 flags (layout),
+                 u32 num_trees, num_features, num_nodes, max_samples,
+                 f32 scale_mean, scale_scale, scale_thresholds, scale_decision_th,
+                 c_maxsamples, i16 model_threshold_q15, u16 reserved,
+                 char[16] model version, u32 payload size, u32 CRC-32
+  payload        scaler_mean_q15, scaler_scale_q15         int16[num_features]
+                 features_idx, thresholds_q15, node_samples int16[num_nodes]
+                 children_left, children_right              int32[num_nodes]
+                 tree_offsets                               int32[num_trees]
+                 each section zero-padded to 4 bytes
+The flags are the model_export LAYOUT_* bits: LAYOUT_NARROW stores features_idx as
+int8 and children as int16, LAYOUT_ADJACENT omits children_right.
+The CRC-32 (zlib polynomial) covers the header up to the CRC field, then the payload.
+The arrays and scales are exactly those of the Q15 header, so both paths score
+identically.
+
+Delta layout: header "PSDLT1\\0\\0", u32 CRC-32 of the whole base image, u32 target
+length, u32 CRC-32 of the whole target image, u32 op count; then ops
+  'C' u32 offset u32 length   copy bytes from the base image
+  'I' u32 length, bytes       insert literal bytes
+"""
+import struct, zlib
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from model_export import quantize_model, read_q15_header, LAYOUT_ADJACENT, LAYOUT_NARROW
+
+MAGIC = b"PSIMG1\0\0"
+FORMAT = 1
+_HDR = struct.Struct("<8sHHIIIII5fhH16sII")     # 80 B
+_CRC_AT = _HDR.size - 4
+DELTA_MAGIC = b"PSDLT1\0\0"
+_DHDR = struct.Struct("<8sIIII")
+_COPY = struct.Struct("<cII")
+_INSERT = struct.Struct("<cI")
+BLOCK = 16                                       # delta match granularity (bytes)
+
+# (key, dtype, count key) in payload order
+SECTIONS = [
+    ("scaler_mean_q15",  "<i2", "num_features"),
+    ("scaler_scale_q15", "<i2", "num_features"),
+    ("features_idx",     "<i2", "num_nodes"),
+    ("thresholds_q15",   "<i2", "num_nodes"),
+    ("node_samples",     "<i2", "num_nodes"),
+    ("children_left",    "<i4", "num_nodes"),
+    ("children_right",   "<i4", "num_nodes"),
+    ("tree_offsets",     "<i4", "num_trees"),
+]
+
+
+def _sections(flags):
+    """SECTIONS with the dtypes / presence implied by the layout flags."""
+    out = []
+    for key, dt, count in SECTIONS:
+        if key == "children_right" and flags & LAYOUT_ADJACENT:
+            continue
+        if flags & LAYOUT_NARROW:
+            dt = {"features_idx": "<i1", "children_left": "<i2", "children_right": "<i2"}.get(key, dt)
+        out.append((key, dt, count))
+    return out
+
+_SCALES = ("scale_mean", "scale_scale", "scale_thresholds", "scale_decision_th", "iforest_c_maxsamples")
+
+
+def _as_header_float(v):
+    """The float32 the C compiler makes of the header literal `%.9f`."""
+    return float(np.float32(float(f"{v:.9f}")))
+
+
+def build_image(q, version=""):
+    """
+    Pack a `quantize_model` / `read_q15_header` dict into image bytes.
+
+    Returns:
+        bytes: header + payload
+    """
+    flags = int(q.get("layout", 0))
+    parts = []
+    for key, dt, _ in _sections(flags):
+        b = np.ascontiguousarray(q[key], dtype=dt).tobytes()
+        parts.append(b + b"\0" * (-len(b) % 4))
+    payload = b"".join(parts)
+    head = _HDR.pack(MAGIC, FORMAT, _HDR.size, flags,
+                     q["num_trees"], q["num_features"], q["num_nodes"], q["iforest_max_samples"],
+                     *(_as_header_float(q[k]) for k in _SCALES),
+                     q["model_threshold_q15"], 0, version.encode()[:16], len(payload), 0)
+    crc = zlib.crc32(payload, zlib.crc32(head[:_CRC_AT]))
+    return head[:_CRC_AT] + struct.pack("<I", crc) + payload
+
+
+def parse_image(buf):
+    """
+    Verify and unpack image bytes into the `quantize_model` dict (arrays are views).
+
+    Extra key: version.
+    """
+    buf = memoryview(bytes(buf) if not isinstance(buf, (bytes, bytearray, memoryview)) else buf)
+    if len(buf) < _HDR.size or bytes(buf[:8]) != MAGIC:
+        raise ValueError("not a PowerSense model image")
+    (_, fmt, hsize, flags, n_trees, n_feat, n_nodes, max_samples, *rest) = _HDR.unpack_from(buf)
+    scales, thr_q15, _, version, plen, crc = rest[:5], rest[5], rest[6], rest[7], rest[8], rest[9]
+    if fmt != FORMAT:
+        raise ValueError(f"unsupported model image format {fmt}")
+    if len(buf) < hsize + plen:
+        raise ValueError("truncated model image")
+    if zlib.crc32(buf[hsize:hsize + plen], zlib.crc32(buf[:_CRC_AT])) != crc:
+        raise ValueError("model image CRC mismatch")
+    q = {"num_trees": n_trees, "num_features": n_feat, "num_nodes": n_nodes,
+         "iforest_max_samples": max_samples, "model_threshold_q15": thr_q15,
+         "version": version.rstrip(b"\0").decode(), "layout": flags}
+    q.update(zip(_SCALES, scales))
+    pos = hsize
+    for key, dt, count in _sections(flags):
+        n = q[count]
+        q[key] = np.frombuffer(buf, dtype=dt, count=n, offset=pos)
+        pos += n * np.dtype(dt).itemsize
+        pos += -pos % 4
+    return q
+
+
+def write_image(source, path, scaler=None, threshold=0.56, version=""):
+    """
+    Write an image from a header path, a quantized dict, or a fitted IsolationForest + scaler.
+
+    Returns:
+        bytes: the image written
+    """
+    if isinstance(source, str):
+        q = read_q15_header(source)
+    elif isinstance(source, dict) and "thresholds_q15" in source:
+        q = source
+    else:
+        q = quantize_model(source, scaler, threshold)
+    img = build_image(q, version)
+    with open(path, "wb") as f:
+        f.write(img)
+    return img
+
+
+# ---------------- delta encoding ----------------
+def _block_keys(blocks):
+    """64-bit key per BLOCK-byte row (two little-endian words mixed)."""
+    w = np.ascontiguousarray(blocks).view("<u8")
+    with np.errstate(over="ignore"):
+        return w[:, 0] * np.uint64(0x9E3779B97F4A7C15) ^ w[:, 1]
+
+
+def _match_len(a, b):
+    """Length of the common prefix of two uint8 arrays."""
+    n = min(len(a), len(b))
+    for i in range(0, n, 4096):
+        k = min(i + 4096, n)
+        ne = np.flatnonzero(a[i:k] != b[i:k])
+        if len(ne):
+            return i + int(ne[0])
+    return n
+
+
+def make_delta(old, new):
+    """
+    Encode `new` as COPY/INSERT ops against `old`.
+
+    Every aligned BLOCK-byte block of `old` is indexed, and each byte offset of `new` is
+    looked up at once (sorted-key search). Matches are then extended byte-wise in both
+    directions, so data that moved by any number of bytes is still copied.
+
+    Returns:
+        bytes: the delta
+    """
+    a = np.frombuffer(old, dtype=np.uint8)
+    b = np.frombuffer(new, dtype=np.uint8)
+    ops, lit = [], 0
+    n_old = len(a) // BLOCK * BLOCK
+    if n_old and len(b) >= BLOCK:
+        keys = _block_keys(a[:n_old].reshape(-1, BLOCK))
+        order = np.argsort(keys, kind="stable")
+        sk = keys[order]
+        probe = _block_keys(sliding_window_view(b, BLOCK))
+        idx = np.minimum(np.searchsorted(sk, probe), len(sk) - 1)
+        cand = np.flatnonzero(sk[idx] == probe)
+        src = order[idx[cand]] * BLOCK
+        i = 0
+        while True:
+            c = np.searchsorted(cand, i)
+            if c == len(cand):
+                break
+            j, s = int(cand[c]), int(src[c])
+            if not np.array_equal(a[s:s + BLOCK], b[j:j + BLOCK]):
+                i = j + 1                   # key collision
+                continue
+            n = BLOCK + _match_len(a[s + BLOCK:], b[j + BLOCK:])
+            back = _match_len(a[:s][::-1], b[lit:j][::-1])
+            j, s, n = j - back, s - back, n + back
+            if j > lit:
+                ops.append(_INSERT.pack(b"I", j - lit) + bytes(b[lit:j]))
+            ops.append(_COPY.pack(b"C", s, n))
+            i = lit = j + n
+    if lit < len(b):
+        ops.append(_INSERT.pack(b"I", len(b) - lit) + bytes(b[lit:]))
+    head = _DHDR.pack(DELTA_MAGIC, zlib.crc32(old), len(new), zlib.crc32(new), len(ops))
+    return head + b"".join(ops)
+
+
+def apply_delta(old, delta):
+    """Rebuild the target image from `old` and a `make_delta` output (CRC-checked)."""
+    delta = memoryview(delta)
+    magic, base_crc, n_out, out_crc, n_ops = _DHDR.unpack_from(delta)
+    if magic != DELTA_MAGIC:
+        raise ValueError("not a PowerSense model delta")
+    if zlib.crc32(old) != base_crc:
+        raise ValueError("delta was made against a different base image")
+    out, pos = bytearray(), _DHDR.size
+    for _ in range(n_ops):
+        tag = bytes(delta[pos:pos + 1])
+        if tag == b"C":
+            _, off, n = _COPY.unpack_from(delta, pos)
+            out += old[off:off + n]
+            pos += _COPY.size
+        elif tag == b"I":
+            _, n = _INSERT.unpack_from(delta, pos)
+            pos += _INSERT.size
+            out += delta[pos:pos + n]
+            pos += n
+        else:
+            raise ValueError(f"bad delta op {tag!r} at {pos}")
+    if len(out) != n_out or zlib.crc32(out) != out_crc:
+        raise ValueError("delta output CRC mismatch")
+    return bytes(out)
+
+
+def delta_report(old, new, delta=None):
+    """Transfer sizes for sending `new` in full or as a delta against `old`."""
+    delta = make_delta(old, new) if delta is None else delta
+    ops = memoryview(delta)[_DHDR.size:]
+    copied = inserted = pos = 0
+    while pos < len(ops):
+        if bytes(ops[pos:pos + 1]) == b"C":
+            copied += _COPY.unpack_from(ops, pos)[2]
+            pos += _COPY.size
+        else:
+            n = _INSERT.unpack_from(ops, pos)[1]
+            inserted += n
+            pos += _INSERT.size + n
+    r = {
+        "image_bytes": len(new),
+        "image_zlib_bytes": len(zlib.compress(new, 9)),
+        "delta_bytes": len(delta),
+        "delta_zlib_bytes": len(zlib.compress(delta, 9)),
+        "copied_bytes": copied,
+        "inserted_bytes": inserted,
+        "ratio": len(delta) / max(len(new), 1),
+    }
+    r["send"] = "delta" if r["delta_zlib_bytes"] < r["image_zlib_bytes"] else "image"
+    return r
+
+
+if __name__ == "__main__":
+    import argparse, os
+    ap = argparse.ArgumentParser(description="Build model images and delta updates")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("build", help="image from a Q15 header")
+    p.add_argument("header"); p.add_argument("out"); p.add_argument("--version", default="")
+    p = sub.add_parser("delta", help="delta from OLD to NEW image")
+    p.add_argument("old"); p.add_argument("new"); p.add_argument("out")
+    p = sub.add_parser("apply", help="rebuild an image from OLD + DELTA")
+    p.add_argument("old"); p.add_argument("delta"); p.add_argument("out")
+    args = ap.parse_args()
+
+    read = lambda path: open(path, "rb").read()
+    if args.cmd == "build":
+        img = write_image(args.header, args.out, version=args.version)
+        print(f"{args.out}: {len(img)} B ({os.path.getsize(args.header)} B header)")
+    elif args.cmd == "delta":
+        old, new = read(args.old), read(args.new)
+        d = make_delta(old, new)
+        open(args.out, "wb").write(d)
+        for k, v in delta_report(old, new, d).items():
+            print(f"{k:18s} {v:.4f}" if isinstance(v, float) else f"{k:18s} {v}")
+    else:
+        open(args.out, "wb").write(apply_delta(read(args.old), read(args.delta)))
+        print(f"{args.out} rebuilt and verified")
@@ -0,0 +1,378 @@
+# src/model_registry.py
+"""
+Versioned model store with atomic publish, hot-swap and rollback.
+
+Layout under the model directory:
+  versions/<vid>/iforest_model.pkl, feature_scaler.pkl, meta.json
+                 model_iforest.h / .bin   Q15 header and binary image (model_image.py)
+                 from_<parent>.delta      image delta against the parent version
+                 drift_reference.json     feature / score sketch of the training windows (drift.py)
+                 flat/                    forest + scaler as .npy arrays, memory-mapped by load_fast
+  CURRENT        one line: the active version ID
+  operating_point.json   calibrated threshold / DWELL_HITS / rule thresholds (calibrate.py)
+
+A version directory is written under a temporary name, fsync'ed and renamed into
+place, so a crash leaves either a complete version or a stray `.staging-*` directory.
+CURRENT is replaced with os.replace, so readers see the old or the new version,
+never a half-written pair. Without CURRENT the legacy top-level pickles are used.
+
+`load_fast` maps the flat/ arrays into a CompiledForest and FlatScaler (compiled_forest.py)
+without importing sklearn or unpickling anything; the pickles are the fallback for versions
+without flat/ (`flatten` writes one) and what retraining starts from.
+"""
+import os, json, time, shutil, tempfile, zlib
+
+MODEL_FILE  = "iforest_model.pkl"
+SCALER_FILE = "feature_scaler.pkl"
+HEADER_FILE = "model_iforest.h"
+IMAGE_FILE  = "model_iforest.bin"
+META_FILE   = "meta.json"
+FLAT_DIR    = "flat"
+OPERATING_POINT_FILE = "operating_point.json"   # written by calibrate.py
+LEGACY_VERSION = "legacy"
+KEEP_VERSIONS  = 10                  # older versions are pruned after each publish
+
+
+def _file_crc(path):
+    """CRC-32 of a file's bytes (ties flat/ to the pickle it was made from)."""
+    crc = 0
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            crc = zlib.crc32(block, crc)
+    return crc
+
+
+def _unwrap(iso):
+    if isinstance(iso, dict):  # packed {"pipe", "threshold"} from notebooks/model.ipynb
+        iso = iso["pipe"].named_steps["iforest"]
+    return iso
+
+
+def _fsync_dir(path):
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class ModelRegistry:
+    """Publish, activate and load (model, scaler) pairs by version ID."""
+
+    def __init__(self, root="models/", keep=KEEP_VERSIONS):
+        self.root = root
+        self.versions_dir = os.path.join(root, "versions")
+        self.keep = keep                      # versions/ is created by the first publish, not here
+
+    # ---------------- queries ----------------
+    def versions(self):
+        """Published version IDs, oldest first."""
+        if not os.path.isdir(self.versions_dir):
+            return []
+        return sorted(d for d in os.listdir(self.versions_dir)
+                      if not d.startswith(".") and os.path.isdir(self.path(d)))
+
+    def current(self):
+        """Active version ID, or None when still running on the legacy pickles."""
+        try:
+            with open(os.path.join(self.root, "CURRENT")) as f:
+                vid = f.read().strip()
+        except FileNotFoundError:
+            return None
+        return vid or None
+
+    def path(self, vid, name=""):
+        return os.path.join(self.versions_dir, vid, name)
+
+    def meta(self, vid):
+        with open(self.path(vid, META_FILE)) as f:
+            return json.load(f)
+
+    def load(self, vid=None):
+        """
+        Load one version (default: the active one).
+
+        Returns:
+            tuple: (iso, scaler, vid); vid is LEGACY_VERSION for the top-level pickles
+        """
+        import joblib
+        vid = vid or self.current()
+        if vid is None:
+            iso = joblib.load(os.path.join(self.root, MODEL_FILE))
+            scaler = joblib.load(os.path.join(self.root, SCALER_FILE))
+            return _unwrap(iso), scaler, LEGACY_VERSION
+        return _unwrap(joblib.load(self.path(vid, MODEL_FILE))), joblib.load(self.path(vid, SCALER_FILE)), vid
+
+    # ---------------- publishing ----------------
+    def _next_vid(self):
+        done = [int(v[1:]) for v in self.versions() if v[1:].isdigit()]
+        return f"v{(max(done) + 1 if done else 1):04d}"
+
+    def flat_path(self, vid=None):
+        """flat/ of a version (default: active), or of the legacy top-level pickles."""
+        vid = vid or self.current()
+        return self.path(vid, FLAT_DIR) if vid else os.path.join(self.root, FLAT_DIR)
+
+    def load_fast(self, vid=None):
+        """
+        Like `load`, from the memory-mapped flat/ arrays when the version has them.
+
+        Returns:
+            tuple: (CompiledForest or IsolationForest, FlatScaler or StandardScaler, vid)
+        """
+        from compiled_forest import CompiledForest
+        vid = vid or self.current()
+        try:
+            cf, scaler, meta = CompiledForest.load_flat(self.flat_path(vid))
+        except (FileNotFoundError, ValueError, KeyError):
+            return self.load(vid)
+        if scaler is None or meta.get("model_crc32") != _file_crc(self._model_file(vid)):
+            return self.load(vid)               # no scaler, or the pickle changed since flat/ was written
+        return cf, scaler, vid or LEGACY_VERSION
+
+    def _model_file(self, vid):
+        return self.path(vid, MODEL_FILE) if vid else os.path.join(self.root, MODEL_FILE)
+
+    def flatten(self, vid=None):
+        """Write flat/ for a version published before it existed (or the legacy pickles)."""
+        from compiled_forest import CompiledForest
+        iso, scaler, vid = self.load(vid)
+        path = self.flat_path(None if vid == LEGACY_VERSION else vid)
+        stage = f"{path}.tmp"
+        shutil.rmtree(stage, ignore_errors=True)
+        crc = _file_crc(self._model_file(None if vid == LEGACY_VERSION else vid))
+        CompiledForest.from_estimator(iso).save_flat(stage, scaler, {"model_crc32": crc})
+        shutil.rmtree(path, ignore_errors=True)
+        os.rename(stage, path)
+        return path
+
+    def drift_reference(self, vid=None):
+        """The training-data sketch published with a version (default: active), or None."""
+        from drift import Sketch, DRIFT_FILE
+        vid = vid or self.current()
+        return Sketch.load(self.path(vid, DRIFT_FILE))[0] if vid else None
+
+    def publish(self, iso, scaler, threshold=None, meta=None, files=None):
+        """
+        Write a new version (pickles, Q15 header and image, meta.json) without activating it.
+
+        `files` maps extra file names in the version directory to their text content.
+
+        Returns:
+            str: the new version ID
+        """
+        import joblib
+        from model_export import export_to_q15_header, quantize_model
+        from compiled_forest import CompiledForest
+
+        parent = self.current()
+        os.makedirs(self.versions_dir, exist_ok=True)
+        stage = tempfile.mkdtemp(prefix=".staging-", dir=self.versions_dir)
+        try:
+            joblib.dump(iso, os.path.join(stage, MODEL_FILE))
+            joblib.dump(scaler, os.path.join(stage, SCALER_FILE))
+            CompiledForest.from_estimator(iso).save_flat(os.path.join(stage, FLAT_DIR), scaler,
+                                                         {"model_crc32": _file_crc(os.path.join(stage, MODEL_FILE))})
+            for name, text in (files or {}).items():
+                with open(os.path.join(stage, name), "w") as f:
+                    f.write(text)
+            info = {"created": time.time(), "threshold": threshold, "parent": parent, **(meta or {})}
+            if threshold is not None:
+                t0 = time.perf_counter()
+                export_to_q15_header(iso, scaler, output_path=os.path.join(stage, HEADER_FILE), threshold=threshold)
+                q = quantize_model(iso, scaler, threshold)
+                info["export_s"] = time.perf_counter() - t0
+            for d, _, names in os.walk(stage):
+                for name in names:
+                    if name != META_FILE:
+                        with open(os.path.join(d, name), "rb+") as f:
+                            os.fsync(f.fileno())
+                if d != stage:
+                    _fsync_dir(d)
+            while True:
+                vid = self._next_vid()
+                info["version"] = vid
+                if threshold is not None:
+                    self._write_image(stage, q, vid, parent, info)
+                with open(os.path.join(stage, META_FILE), "w") as f:
+                    json.dump(info, f, indent=1)
+                    f.flush()
+                    os.fsync(f.fileno())
+                try:
+                    os.rename(stage, self.path(vid))
+                    break
+                except OSError:
+                    if not os.path.exists(self.path(vid)):
+                        raise               # not a name clash with a concurrent publish
+        except BaseException:
+            shutil.rmtree(stage, ignore_errors=True)
+            raise
+        _fsync_dir(self.versions_dir)
+        self.prune()
+        return vid
+
+    def _write_image(self, stage, q, vid, parent, info):
+        """Binary image stamped with `vid`, plus a delta against the parent's image."""
+        from model_image import build_image, make_delta, delta_report
+
+        image = build_image(q, vid)
+        files = {IMAGE_FILE: image}
+        info["image_bytes"] = len(image)
+        base = self.path(parent, IMAGE_FILE) if parent else None
+        if base and os.path.exists(base):
+            with open(base, "rb") as f:
+                old = f.read()
+            delta = make_delta(old, image)
+            files[f"from_{parent}.delta"] = delta
+            info["delta"] = delta_report(old, image, delta)
+        for name, data in files.items():
+            with open(os.path.join(stage, name), "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def activate(self, vid):
+        """Atomically point CURRENT at `vid`."""
+        if not os.path.isdir(self.path(vid)):
+            raise KeyError(f"Unknown model version: {vid}")
+        tmp = os.path.join(self.root, "CURRENT.tmp")
+        with open(tmp, "w") as f:
+            f.write(vid + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, os.path.join(self.root, "CURRENT"))
+        _fsync_dir(self.root)
+        return vid
+
+    def rollback(self):
+        """Activate the version this one was trained from (else the previous one)."""
+        cur = self.current()
+        vs = self.versions()
+        if cur is None or cur not in vs:
+            raise RuntimeError("No active version to roll back from")
+        parent = self.meta(cur).get("parent")
+        if parent in vs and parent != cur:
+            return self.activate(parent)
+        older = [v for v in vs if v < cur]
+        if not older:
+            raise RuntimeError(f"{cur} is the oldest version")
+        return self.activate(older[-1])
+
+    def prune(self):
+        """Delete all but the newest `keep` versions; the active one and its parent are kept."""
+        vs = self.versions()
+        cur = self.current()
+        protect = {cur}
+        if cur in vs:
+            protect.add(self.meta(cur).get("parent"))
+        for vid in vs[:-self.keep] if self.keep else []:
+            if vid not in protect:
+                shutil.rmtree(self.path(vid), ignore_errors=True)
+
+
+def load_model(root="models/"):
+    """(iso, scaler, version) of the active model, falling back to the legacy pickles."""
+    return ModelRegistry(root).load()
+
+
+def load_operating_point(root="models/"):
+    """Calibrated operating point (threshold, dwell_hits, rule thresholds), or None."""
+    try:
+        with open(os.path.join(root, OPERATING_POINT_FILE)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def decision_threshold(iso, threshold):
+    """
+    An operating threshold in -decision_function units.
+
+    Thresholds (THRESHOLD, operating_point.json, the Q15 header) are anomaly scores,
+    -score_samples, as in the firmware's iforest_score. The Python scorers report
+    -decision_function = -score_samples + offset_.
+    """
+    return threshold + iso.offset_
+
+
+def train_and_publish(root, X, scaler, stats, threshold, iforest_params, meta=None, healthy_threshold=None):
+    """
+    Fit a new scaler/IsolationForest pair and publish it as a version (not activated).
+
+    Self-contained so it can run in a separate process while ingestion continues.
+    `healthy_threshold` (anomaly score) restricts the drift reference to the windows the new
+    forest keeps as healthy.
+
+    Returns:
+        str: the new version ID
+    """
+    from sklearn.ensemble import IsolationForest
+
+    scaler = _standard_scaler(scaler)
+    stats.apply_to(scaler)
+    iso = IsolationForest(**iforest_params)
+    t0 = time.perf_counter()
+    iso.fit(scaler.transform(X))
+    info = {"n_samples": len(X), "scaler_n": stats.count, "fit_s": time.perf_counter() - t0, **(meta or {})}
+    return ModelRegistry(root).publish(iso, scaler, threshold=threshold, meta=info,
+                                       files=_drift_files(iso, scaler, X, healthy_threshold))
+
+
+def publish_model(root, iso, scaler, threshold, meta=None, X=None, healthy_threshold=None):
+    """
+    Publish an already fitted forest (e.g. an OnlineIsolationForest snapshot) as a version.
+
+    With X (raw windows the forest stands for), a drift reference sketch is published too.
+    """
+    files = _drift_files(iso, scaler, X, healthy_threshold) if X is not None and len(X) else None
+    return ModelRegistry(root).publish(iso, scaler, threshold=threshold, meta=meta, files=files)
+
+
+def _standard_scaler(scaler):
+    """A StandardScaler to refit into: `scaler` itself, or one shaped like a FlatScaler."""
+    import numpy as np
+    from sklearn.preprocessing import StandardScaler
+    if isinstance(scaler, StandardScaler):
+        return scaler
+    out = StandardScaler()
+    out.n_features_in_ = scaler.n_features_in_
+    if hasattr(scaler, "feature_names_in_"):
+        out.feature_names_in_ = np.asarray(scaler.feature_names_in_, dtype=object)
+    return out
+
+
+def _drift_files(iso, scaler, X, healthy_threshold=None):
+    from drift import reference_sketch, DRIFT_FILE
+    cut = None if healthy_threshold is None else decision_threshold(iso, healthy_threshold)
+    return {DRIFT_FILE: json.dumps(reference_sketch(iso, scaler, X, cut).to_dict())}
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Inspect or switch model versions")
+    ap.add_argument("command", choices=["list", "rollback", "activate", "flatten"])
+    ap.add_argument("version", nargs="?")
+    ap.add_argument("--root", default="models/")
+    args = ap.parse_args()
+    reg = ModelRegistry(args.root)
+    if args.command == "list":
+        cur = reg.current()
+        for v in reg.versions():
+            m = reg.meta(v)
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(m.get("created", 0)))
+            print(f"{'*' if v == cur else ' '} {v}  {stamp}  n={m.get('n_samples', '-')}  parent={m.get('parent')}")
+        if cur is None:
+            print(f"* {LEGACY_VERSION} (top-level pickles)")
+    elif args.command == "rollback":
+        print(f"Active version: {reg.rollback()}")
+    elif args.command == "flatten":
+        print(f"Wrote {reg.flatten(args.version)}")
+    else:
+        if not args.version:
+            ap.error("activate needs a version ID")
+        print(f"Active version: {reg.activate(args.version)}")
@@ -0,0 +1,155 @@
+# src/online_forest.py
+"""
+Sliding-window Isolation Forest: an incremental alternative to refitting in retrain().
+
+The forest covers the last n_trees * refresh_rows healthy windows. Every `refresh_rows` new
+windows, its oldest tree is replaced by one grown the way IsolationForest grows them (an
+ExtraTreeRegressor with max_features=1, random splits, depth ceil(log2 ψ)) on ψ = max_samples
+windows drawn from that span. Absorbing a window costs a ring-buffer write plus 1/refresh_rows
+of a ψ-sample tree fit: amortized constant, whatever the size of the healthy store.
+
+The trees live in a real sklearn IsolationForest (`forest`): score_samples, decision_function
+and offset_ are sklearn's, and `snapshot()` returns a plain IsolationForest that pickles,
+registers (model_registry.py), folds (inference.fold_scaler), compiles (compiled_forest.py)
+and exports through the Q15 flattened-forest path of model_export.py unchanged. The firmware
+sees an ordinary model.
+
+Windows are absorbed scaled, with the scaler of the seed model. That scaler stays fixed until
+the next full refit, since the trees are grown in its units.
+"""
+import copy
+import numpy as np
+
+from sklearn.ensemble import IsolationForest
+from sklearn.ensemble._iforest import _average_path_length
+from sklearn.tree import ExtraTreeRegressor
+
+REFRESH_ROWS = 256          # new healthy windows per replaced tree
+OFFSET_ROWS = 4096          # window rows scored to re-estimate offset_ (contamination != "auto")
+
+
+class OnlineIsolationForest:
+    """
+    Args:
+        forest: fitted IsolationForest to start from (its trees are the oldest)
+        refresh_rows: new windows per replaced tree; the span is n_trees * refresh_rows
+        seed: random state of tree growth and window draws
+    """
+
+    def __init__(self, forest, refresh_rows=REFRESH_ROWS, seed=0):
+        self.forest = copy.copy(forest)
+        self.forest.estimators_ = list(forest.estimators_)
+        self.forest.estimators_features_ = list(forest.estimators_features_)
+        self._cached = hasattr(forest, "_decision_path_lengths")        # sklearn >= 1.3
+        if self._cached:
+            self.forest._average_path_length_per_tree = list(forest._average_path_length_per_tree)
+            self.forest._decision_path_lengths = list(forest._decision_path_lengths)
+        self.n_trees = len(forest.estimators_)
+        self.n_features = forest.n_features_in_
+        self.max_samples = int(forest.max_samples_)
+        self.max_depth = int(np.ceil(np.log2(max(self.max_samples, 2))))
+        self.refresh_rows = int(refresh_rows)
+        self.rng = np.random.default_rng(seed)
+
+        self.span = self.n_trees * self.refresh_rows
+        self.ring = np.empty((self.span, self.n_features), dtype=np.float32)
+        self.n_seen = 0                 # windows absorbed
+        self.pending = 0                # absorbed since the last replaced tree
+        self.next_tree = 0              # oldest tree
+        self.trees_replaced = 0
+
+    @classmethod
+    def fit(cls, X, iforest_params=None, refresh_rows=REFRESH_ROWS, seed=0):
+        """Batch-fit the starting forest on scaled X, then keep absorbing from there."""
+        forest = IsolationForest(**(iforest_params or {})).fit(X)
+        online = cls(forest, refresh_rows, seed)
+        online.absorb(X[-online.span:], grow=False)
+        return online
+
+    # ---------------- updates ----------------
+    def absorb(self, X, grow=True):
+        """
+        Take scaled healthy windows; replaces one tree per `refresh_rows` of them.
+
+        Returns:
+            int: trees replaced by this call
+        """
+        X = np.asarray(X, dtype=np.float32).reshape(-1, self.n_features)
+        skip = max(0, len(X) - self.span)           # older than the span before they land
+        X = X[skip:]
+        self.n_seen += skip
+        i = self.n_seen % self.span
+        head = min(len(X), self.span - i)
+        self.ring[i:i + head] = X[:head]
+        self.ring[:len(X) - head] = X[head:]
+        self.n_seen += len(X)
+        if not grow:
+            return 0
+        self.pending += skip + len(X)
+        grown = 0
+        while self.pending >= self.refresh_rows and self.n_seen >= self.max_samples:
+            self.pending -= self.refresh_rows
+            self._replace_oldest()
+            grown += 1
+            if grown == self.n_trees:               # every tree is new; the rest adds nothing
+                self.pending %= self.refresh_rows
+        return grown
+
+    partial_fit = absorb
+
+    def window(self):
+        """Scaled windows of the current span, oldest first only until the ring wraps."""
+        return self.ring[:min(self.n_seen, self.span)]
+
+    def _replace_oldest(self):
+        W = self.window()
+        rows = self.rng.choice(len(W), size=self.max_samples, replace=False)
+        tree = ExtraTreeRegressor(max_features=1, splitter="random", max_depth=self.max_depth,
+                                  random_state=int(self.rng.integers(np.iinfo(np.int32).max)))
+        tree.fit(W[rows], self.rng.uniform(size=self.max_samples))
+        k, f = self.next_tree, self.forest
+        f.estimators_[k] = tree
+        f.estimators_features_[k] = np.arange(self.n_features)
+        if self._cached:
+            f._average_path_length_per_tree[k] = _average_path_length(tree.tree_.n_node_samples)
+            f._decision_path_lengths[k] = tree.tree_.compute_node_depths()
+        self.next_tree = (k + 1) % self.n_trees
+        self.trees_replaced += 1
+
+    # ---------------- scoring (sklearn semantics) ----------------
+    def score_samples(self, X):
+        return self.forest.score_samples(X)
+
+    def decision_function(self, X):
+        return self.forest.decision_function(X)
+
+    def predict(self, X):
+        return self.forest.predict(X)
+
+    @property
+    def offset_(self):
+        return self.forest.offset_
+
+    def snapshot(self):
+        """
+        A standalone IsolationForest of the current trees, for publishing / export.
+
+        With a numeric contamination, offset_ is re-estimated on up to OFFSET_ROWS windows of
+        the span, as fit() would on its training data.
+        """
+        snap = copy.copy(self.forest)
+        snap.estimators_ = list(self.forest.estimators_)
+        snap.estimators_features_ = list(self.forest.estimators_features_)
+        if self._cached:
+            snap._average_path_length_per_tree = tuple(self.forest._average_path_length_per_tree)
+            snap._decision_path_lengths = tuple(self.forest._decision_path_lengths)
+        if snap.contamination != "auto" and self.n_seen:
+            W = self.window()
+            if len(W) > OFFSET_ROWS:
+                W = W[self.rng.choice(len(W), size=OFFSET_ROWS, replace=False)]
+            snap.offset_ = np.percentile(snap.score_samples(W), 100.0 * snap.contamination)
+        return snap
+
+    def state(self):
+        return {"n_seen": self.n_seen, "trees_replaced": self.trees_replaced,
+                "span_rows": self.span, "window_rows": len(self.window())}
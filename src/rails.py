@@ -0,0 +1,315 @@
+# src/rails.py
+"""
+Multi-rail service: several DC-DC rails ingested, scored and retrained side by side.
+
+Each rail is a Regulator (regulator.py) with the same pipeline as main.py's one regulator:
+  data/buffer/<rail>/            raw captures of that rail (quarantine/ below it)
+  models/rails/<rail>/           its model registry and state (healthy store, ingest journal,
+                                 drift sketch, last_retrain.txt, operating_point.json)
+  data/events/<rail>/            its anomaly event packets
+Until its first retrain a rail scores with the active model of models/ (the seed).
+
+Scoring: files of all rails go to one process pool in batches that take one file per rail
+in turn, so a rail with a long backlog cannot hold the others back. Each worker parses and
+extracts a batch, then scores it with RailScorer: the rails' own scalers, and one
+StackedForest traversal over every rail whose forest has the same tree count when the
+batch is small (the per-call overhead of scoring rail by rail dominates there).
+
+Retraining: one retrain process is shared; among the rails that are due (drift or timer,
+per rail), the one that has waited longest goes first.
+
+  PYTHONPATH=src python src/rails.py                  # rails = subdirectories of data/buffer/
+  PYTHONPATH=src python src/rails.py --rails 3v3,5v0,12v0
+"""
+import os, time
+from collections import deque, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from compiled_forest import CompiledForest, StackedForest
+from ingest import BufferWatcher, IngestPool, extract_buffer_file, score_windows
+from liveness import Liveness
+from regulator import Regulator, RetrainScheduler, QUEUE_DEPTH, EVENT_CAPTURE
+import metrics
+
+# -------------------------------------------------
+# CONFIGURATION (per-regulator settings: regulator.py)
+# -------------------------------------------------
+BUFFER_ROOT         = "data/buffer/"
+RAILS_DIR           = "models/rails/"
+SEED_MODEL_DIR      = "models/"                 # scores a rail until its first retrain
+EVENT_ROOT          = "data/events/"            # <rail>/ below it
+RETRAIN_EVERY_SEC   = 3600                      # per rail; drift trigger: minimum gap
+RETRAIN_WORKERS     = 1                         # rails share these; longest-waiting first
+INGEST_WORKERS      = None                      # None → one per CPU
+BATCH_FILES         = 8                         # files per worker job, one per rail in turn
+MAX_INFLIGHT        = 2                         # batches per worker waiting in the pool
+STACK_ROWS_PER_RAIL = 128                       # stacked forest below this many windows per rail
+STORE_CHECKPOINT_SEC = 60
+JOURNAL_SCAN_SEC    = 10
+METRICS_TEXTFILE    = f"{RAILS_DIR}metrics.prom"
+METRICS_EVERY_SEC   = 10
+LIVENESS_PATH       = "models/liveness.json"    # read by the watchdog heartbeat daemon; None → off
+RETRAIN_MAX_SEC     = 900                       # a longer retrain counts as hung
+# -------------------------------------------------
+
+
+def discover_rails(buffer_root=BUFFER_ROOT, rails_dir=RAILS_DIR):
+    """Rail IDs: subdirectories of the buffer root and of the rails model directory."""
+    found = set()
+    for d in (buffer_root, rails_dir):
+        if os.path.isdir(d):
+            found.update(e.name for e in os.scandir(d)
+                         if e.is_dir() and not e.name.startswith(".") and e.name != "quarantine")
+    return sorted(found)
+
+
+# -------------------------------------------------
+# Scoring (runs in the pool workers)
+# -------------------------------------------------
+def _compiled(iso):
+    """Float-mode CompiledForest of a rail's model, or None if it cannot be stacked."""
+    if isinstance(iso, CompiledForest):
+        return iso if iso.mode == "float" else None
+    return CompiledForest.from_estimator(iso) if hasattr(iso, "estimators_") else None
+
+
+class RailScorer:
+    """
+    Per-rail (iso, scaler) pairs; rails whose forests have the same tree count are stacked.
+
+    `score` returns -decision_function of each rail's own model, like process_buffer_file.
+    """
+
+    def __init__(self, models, stack_rows=STACK_ROWS_PER_RAIL):
+        self.models = dict(models)               # rail -> (iso, scaler, version)
+        self.stack_rows = stack_rows
+        groups = defaultdict(list)
+        for rail, (iso, _, _) in sorted(self.models.items()):
+            cf = _compiled(iso)
+            if cf is not None:
+                groups[cf.n_trees].append((rail, cf))
+        self.member = {}                         # rail -> (StackedForest, index), for groups > 1
+        for group in groups.values():
+            if len(group) > 1:
+                stack = StackedForest([cf for _, cf in group])
+                self.member.update({r: (stack, i) for i, (r, _) in enumerate(group)})
+
+    def score(self, batches):
+        """batches: [(rail, X)] → [(scaled X, scores)] in the same order."""
+        out = [None] * len(batches)
+        Xs = [self.models[rail][1].transform(X) if len(X) else X for rail, X in batches]
+        stacked = defaultdict(list)
+        for i, (rail, X) in enumerate(batches):
+            if len(X) and rail in self.member:
+                stacked[id(self.member[rail][0])].append(i)
+            else:
+                out[i] = -self.models[rail][0].decision_function(Xs[i]) if len(X) else np.empty(0)
+        for idx in stacked.values():
+            rails = {batches[i][0] for i in idx}
+            if sum(len(Xs[i]) for i in idx) > self.stack_rows * len(rails):
+                for i in idx:                     # large batches: each rail's own forest is faster
+                    out[i] = -self.models[batches[i][0]][0].decision_function(Xs[i])
+                continue
+            stack = self.member[batches[idx[0]][0]][0]
+            Z = np.concatenate([Xs[i] for i in idx])
+            m = np.concatenate([np.full(len(Xs[i]), self.member[batches[i][0]][1]) for i in idx])
+            scores = -stack.decision_function(Z, m)
+            for i, part in zip(idx, np.split(scores, np.cumsum([len(Xs[i]) for i in idx])[:-1])):
+                out[i] = part
+        return list(zip(Xs, out))
+
+
+_worker = {}
+
+def _init_worker(models, healthy_scores, captures):
+    _worker.update(scorer=RailScorer(models), healthy_scores=healthy_scores, captures=captures)
+
+def _process_batch(items):
+    """items: [(rail, path, start_row, start_byte)] → [(rail, res)], scored together."""
+    scorer, captures, clock = _worker["scorer"], _worker["captures"], time.perf_counter
+    results = []
+    for rail, path, start_row, start_byte in items:
+        res = extract_buffer_file(path, start_row, start_byte, keep_raw=captures.get(rail) is not None)
+        res["model_version"] = scorer.models[rail][2]
+        results.append((rail, res, res.pop("features"), res.pop("raw", None)))
+    todo = [r for r in results if r[2] is not None]
+    try:
+        t0 = clock()
+        scored = scorer.score([(rail, f[0]) for rail, _, f, _ in todo])
+        dt = (clock() - t0) / max(len(todo), 1)
+    except Exception as e:
+        for _, res, _, _ in todo:
+            res.update(error=str(e), stage="score")
+        return [(rail, res) for rail, res, _, _ in results]
+    for (rail, res, f, raw), (Xs, s) in zip(todo, scored):
+        res["timings"]["score"] = dt
+        score_windows(res, f, Xs, s, _worker["healthy_scores"][rail], raw, captures.get(rail))
+    return [(rail, res) for rail, res, _, _ in results]
+
+
+class RailPool(IngestPool):
+    """
+    IngestPool whose workers hold every rail's model and take batches of files; `healthy_scores`
+    and `captures` are per rail, like the models.
+    """
+
+    def __init__(self, models, workers=None, healthy_scores=None, captures=None):
+        super().__init__(models, None, workers, dict(healthy_scores or {}), capture=dict(captures or {}))
+
+    def _start(self, models, _scaler=None, _version=None):
+        self.models = dict(models)
+        self.version = {rail: m[2] for rail, m in self.models.items()}
+        self.pool = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                        initargs=(self.models, self.healthy_score, self.capture))
+
+    def reload(self, rail, iso, scaler, version, capture=None, healthy_score=0.0):
+        old = self.pool
+        self.capture = {**self.capture, rail: capture}
+        self.healthy_score = {**self.healthy_score, rail: healthy_score}
+        self._start({**self.models, rail: (iso, scaler, version)})
+        old.shutdown(wait=False)            # in-flight batches finish on the old models
+
+    def submit(self, items):
+        self._inflight.append(self.pool.submit(_process_batch, items))
+
+    def collect(self, block=False):
+        """Finished (rail, result) pairs, oldest batch first."""
+        out = []
+        while self._inflight and (block or self._inflight[0].done()):
+            for rail, res in self._inflight.popleft().result():
+                self.files_done += 1
+                self.rows_done += res["rows"]
+                out.append((rail, res))
+        return out
+
+
+def open_rail(rail_id, buffer_root=BUFFER_ROOT, rails_dir=RAILS_DIR, seed_dir=SEED_MODEL_DIR,
+              event_root=EVENT_ROOT):
+    """The Regulator of one rail; see the module docstring for the directory layout."""
+    return Regulator(os.path.join(rails_dir, rail_id), os.path.join(buffer_root, rail_id), rail=rail_id,
+                     seed_dir=seed_dir, event_dir=os.path.join(event_root, rail_id) if EVENT_CAPTURE else None,
+                     retrain_every_s=RETRAIN_EVERY_SEC)
+
+
+def next_batch(queues, order):
+    """Up to BATCH_FILES queued files, taking one per rail in turn starting at `order`'s head."""
+    items = []
+    while len(items) < BATCH_FILES:
+        took = False
+        for _ in range(len(order)):
+            rail = order[0]
+            order.rotate(-1)
+            if queues[rail]:
+                items.append((rail, *queues[rail].popleft()))
+                took = True
+                if len(items) == BATCH_FILES:
+                    break
+        if not took:
+            break
+    return items
+
+
+def export_metrics(rails, queues, pool=None):
+    if not metrics.is_enabled():
+        return
+    if pool is not None:
+        QUEUE_DEPTH.set(pool.queue_depth)
+    for rail_id, reg in rails.items():
+        reg.check_drift()
+        reg.export_metrics(queued=len(queues[rail_id]))
+    if METRICS_TEXTFILE:
+        metrics.write_textfile(METRICS_TEXTFILE)
+
+
+# -------------------------------------------------
+# MAIN LOOP
+# -------------------------------------------------
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Ingest, score and retrain several rails")
+    ap.add_argument("--rails", help="comma-separated rail IDs (default: subdirectories of the buffer)")
+    args = ap.parse_args()
+
+    rail_ids = args.rails.split(",") if args.rails else discover_rails()
+    if not rail_ids:
+        ap.error(f"no rails: create {BUFFER_ROOT}<rail>/ or pass --rails")
+    rails = {rid: open_rail(rid) for rid in rail_ids}
+    queues = {rid: deque() for rid in rail_ids}     # claimed (path, start_row, start_byte), not yet submitted
+    print("PowerSense multi-rail STARTED")
+    for reg in rails.values():
+        reg.start()
+        reg.watcher = BufferWatcher(reg.buffer_dir, poll_s=0.0)
+        print(f"   → {reg.rail}: model {reg.version}, threshold {reg.threshold:.6f}, "
+              f"{len(reg.store)} healthy samples")
+
+    def claim(rail_id, path, complete=True):
+        work = rails[rail_id].claim(path, complete)
+        if work is not None:
+            queues[rail_id].append((path, *work))
+
+    pool = RailPool({r.rail: (r.iso, r.scaler, r.version) for r in rails.values()},
+                    workers=INGEST_WORKERS, healthy_scores={r.rail: r.healthy_score for r in rails.values()},
+                    captures={r.rail: r.event_options() for r in rails.values()})
+    scheduler = RetrainScheduler(rails.values(), workers=RETRAIN_WORKERS)
+    liveness = Liveness(LIVENESS_PATH) if LIVENESS_PATH else None
+    order = deque(rails)
+    last_checkpoint = last_metrics = last_scan = time.time()
+    print(f"   → {len(rails)} rails, {pool.workers} worker processes, {scheduler.workers} retrain slot(s)")
+
+    try:
+        while True:
+            busy = False
+            for rail_id, reg in rails.items():
+                for path in reg.watcher.wait(timeout=0.0):
+                    claim(rail_id, path)
+            if time.time() - last_scan >= JOURNAL_SCAN_SEC:
+                for rail_id, reg in rails.items():
+                    queues[rail_id].extend(reg.scan())
+                last_scan = time.time()
+
+            while pool.queue_depth < MAX_INFLIGHT * pool.workers:
+                items = next_batch(queues, order)
+                if not items:
+                    break
+                pool.submit(items)
+                busy = True
+
+            new = defaultdict(list)
+            for rail_id, res in pool.collect():
+                new[rail_id].append(rails[rail_id].record(res))
+                busy = True
+            for rail_id, parts in new.items():
+                rails[rail_id].absorb(parts)
+
+            if time.time() - last_checkpoint >= STORE_CHECKPOINT_SEC:
+                for reg in rails.values():
+                    reg.checkpoint()
+                last_checkpoint = time.time()
+
+            if time.time() - last_metrics >= METRICS_EVERY_SEC:
+                export_metrics(rails, queues, pool)
+                last_metrics = time.time()
+
+            for reg in scheduler.poll():
+                pool.reload(reg.rail, reg.iso, reg.scaler, reg.version, reg.event_options(), reg.healthy_score)
+
+            # ---- Liveness: a stage beats while it makes progress or has nothing to do ----
+            if liveness is not None:
+                stages = ["ingest"]
+                if new or pool.queue_depth == 0:
+                    stages.append("score")
+                if not scheduler.hung(RETRAIN_MAX_SEC):
+                    stages.append("retrain")
+                liveness.beat(*stages)
+
+            if not busy:
+                time.sleep(0.2)
+    finally:
+        for reg in rails.values():
+            reg.checkpoint()                # files still in flight are read again after restart
+            reg.watcher.close()
+        export_metrics(rails, queues)
+        scheduler.shutdown()
+        pool.shutdown()
@@ -0,0 +1,303 @@
+# src/rawcap.py
+"""
+PowerSense binary raw capture (.praw): a fixed header followed by columnar chunks.
+
+Layout (little-endian):
+  file header   64 B  magic "PSRAW1\\0\\0", u16 version, u16 n_cols, u32 data offset,
+                      f64 fs, f64 t0, zero padding
+  column table  32 B per column: char[14] name, char code, pad, f64 scale, f64 offset
+                code 'd' = float64, 'f' = float32, 'h' = int16 fixed point
+                (value = q * scale + offset; q = -32768 is NaN)
+  chunk         16 B  "CHNK", u32 n_rows, u64 reserved
+                then each column as n_rows contiguous values, padded to 8 bytes
+
+Chunks are appended one at a time, so a file that is still being written is readable up
+to its last complete chunk. Float columns of a single-chunk file are zero-copy views
+into the memory map.
+"""
+import io, os, struct
+import numpy as np
+
+MAGIC = b"PSRAW1\0\0"
+VERSION = 1
+SUFFIX = ".praw"
+_HDR = struct.Struct("<8sHHIdd")          # 32 B, padded to 64
+_HDR_SIZE = 64
+_COL = struct.Struct("<14scxdd")          # 32 B
+_CHUNK = struct.Struct("<4sIQ")           # 16 B
+_DTYPES = {b"d": np.dtype("<f8"), b"f": np.dtype("<f4"), b"h": np.dtype("<i2")}
+
+LOGGER_COLUMNS = ["time_s", "Vin_V", "Iin_A", "Vout_V", "Iout_A", "Temp_C", "ripple_V"]
+# Full-scale range of each logger channel: VREF 3.3 V through the dividers / shunt amplifiers of
+# logger_mcp3008.c. Temp_C covers the NTC formula over ADC codes 1-1022 (about -77 to 352 °C).
+LOGGER_FULL_SCALE = {"Vin_V": 3.3 * (100e3 + 10e3) / 10e3, "Iin_A": 3.3 / (0.01 * 50),
+                     "Vout_V": 3.3 * (47e3 + 10e3) / 10e3, "Iout_A": 3.3 / (0.02 * 50),
+                     "Temp_C": 400.0, "ripple_V": 3.3}
+Q_MAX = 32767
+Q_NAN = -32768                            # int16 code reserved for NaN (the logger's out-of-range Temp_C)
+# Fixed-point steps for fixed_point=True: ±full scale over ±Q_MAX, still ~30x finer than the
+# MCP3008 10-bit step on each channel
+FIXED_POINT_SCALES = {**{c: fs / Q_MAX for c, fs in LOGGER_FULL_SCALE.items()}, "fault_label": 1.0}
+
+
+def to_fixed_point(a, scale, column="value"):
+    """
+    int16 codes of `a` in steps of `scale`, NaN as Q_NAN.
+
+    Raises:
+        ValueError: a finite or infinite value outside ±Q_MAX steps (it would be clipped)
+    """
+    q = np.rint(np.asarray(a, dtype=np.float64) / scale)
+    nan = np.isnan(q)
+    over = ~nan & (np.abs(q) > Q_MAX)
+    if over.any():
+        raise ValueError(f"{column}: {np.asarray(a)[over][0]!r} is outside the fixed-point range "
+                         f"±{Q_MAX * scale:.6g}")
+    q[nan] = Q_NAN
+    return q.astype(np.int16)
+
+
+def from_fixed_point(q, scale, offset=0.0):
+    """Values of int16 codes (Q_NAN → NaN)."""
+    v = q * scale + offset
+    return np.where(q == Q_NAN, np.nan, v)
+
+
+def _pad8(n):
+    return (n + 7) & ~7
+
+
+class RawCaptureWriter:
+    """
+    Append-only writer. Each `write()` call emits one chunk.
+
+    Args:
+        path (str): output .praw path
+        columns (list): column names (time_s is always stored as float64)
+        fs (float): sample rate in Hz
+        fixed_point (bool): store non-time columns as int16 using FIXED_POINT_SCALES; `write`
+            raises ValueError on a value beyond a column's range, NaN is kept
+        scales (dict, optional): per-column fixed-point step overriding the defaults
+    """
+
+    def __init__(self, path, columns=LOGGER_COLUMNS, fs=10000.0, fixed_point=False, scales=None, t0=0.0):
+        self.columns = list(columns)
+        scales = {**FIXED_POINT_SCALES, **(scales or {})}
+        self.codes, self.scales = [], []
+        for c in self.columns:
+            if c == "time_s":
+                code, s = b"d", 1.0
+            elif fixed_point and c in scales:
+                code, s = b"h", float(scales[c])
+            else:
+                code, s = b"f", 1.0
+            self.codes.append(code)
+            self.scales.append(s)
+        self.f = open(path, "wb")
+        data_off = _HDR_SIZE + _COL.size * len(self.columns)
+        self.f.write(_HDR.pack(MAGIC, VERSION, len(self.columns), data_off, float(fs), float(t0)).ljust(_HDR_SIZE, b"\0"))
+        for c, code, s in zip(self.columns, self.codes, self.scales):
+            self.f.write(_COL.pack(c.encode()[:14], code, s, 0.0))
+        self.rows = 0
+
+    def write(self, block):
+        """Write one chunk from a mapping of columns (DataFrame/dict) or an (n, n_cols) array."""
+        if isinstance(block, np.ndarray) and block.dtype.names is None:
+            cols = [block[:, k] for k in range(block.shape[1])]
+        else:
+            cols = [np.asarray(block[c]) for c in self.columns]
+        n = len(cols[0])
+        if n == 0:
+            return
+        cols = [to_fixed_point(a, s, c) if code == b"h" else a          # raises before writing anything
+                for a, c, code, s in zip(cols, self.columns, self.codes, self.scales)]
+        self.f.write(_CHUNK.pack(b"CHNK", n, 0))
+        for a, code in zip(cols, self.codes):
+            dt = _DTYPES[code]
+            buf = np.ascontiguousarray(a, dtype=dt).tobytes()
+            self.f.write(buf.ljust(_pad8(len(buf)), b"\0"))
+        self.rows += n
+
+    def close(self):
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RawCapture:
+    """
+    Memory-mapped reader. Behaves like a read-only mapping of column name → ndarray, so it
+    can be passed straight to `extract_features` / `extract_features_array`.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._mm = np.memmap(path, mode="r", dtype=np.uint8) if os.path.getsize(path) else np.empty(0, np.uint8)
+        if len(self._mm) < _HDR_SIZE or bytes(self._mm[:8]) != MAGIC:
+            raise ValueError(f"{path}: not a PowerSense raw capture")
+        magic, version, n_cols, data_off, self.fs, self.t0 = _HDR.unpack_from(self._mm, 0)
+        if version != VERSION:
+            raise ValueError(f"{path}: unsupported version {version}")
+        self.columns, self._dtypes, self._scales, self._offsets = [], [], [], []
+        for k in range(n_cols):
+            name, code, scale, offset = _COL.unpack_from(self._mm, _HDR_SIZE + k * _COL.size)
+            self.columns.append(name.rstrip(b"\0").decode())
+            self._dtypes.append(_DTYPES[code])
+            self._scales.append(scale)
+            self._offsets.append(offset)
+        self._chunks = self._index(data_off)
+
+    def _index(self, pos):
+        """(row_count, [column byte offsets]) for every complete chunk."""
+        chunks, size = [], len(self._mm)
+        while pos + _CHUNK.size <= size:
+            tag, n, _ = _CHUNK.unpack_from(self._mm, pos)
+            if tag != b"CHNK":
+                break
+            offs, p = [], pos + _CHUNK.size
+            for dt in self._dtypes:
+                offs.append(p)
+                p += _pad8(n * dt.itemsize)
+            if p > size:
+                break                       # chunk still being written
+            chunks.append((n, offs))
+            pos = p
+        return chunks
+
+    def __len__(self):
+        return sum(n for n, _ in self._chunks)
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def keys(self):
+        return list(self.columns)
+
+    @property
+    def n_chunks(self):
+        return len(self._chunks)
+
+    def _raw_view(self, k, chunk):
+        n, offs = self._chunks[chunk]
+        return np.frombuffer(self._mm, dtype=self._dtypes[k], count=n, offset=offs[k])
+
+    def chunk(self, i, decode=False):
+        """Zero-copy views of chunk `i` (fixed-point columns left as int16 codes unless `decode`)."""
+        if not decode:
+            return {c: self._raw_view(k, i) for k, c in enumerate(self.columns)}
+        return {c: self._decode(k, self._raw_view(k, i)) for k, c in enumerate(self.columns)}
+
+    def iter_chunks(self, decode=False):
+        for i in range(self.n_chunks):
+            yield self.chunk(i, decode)
+
+    def _decode(self, k, a):
+        if self._dtypes[k].kind == "i":
+            return from_fixed_point(a, self._scales[k], self._offsets[k])
+        return a
+
+    def __getitem__(self, name):
+        k = self.columns.index(name)
+        views = [self._raw_view(k, i) for i in range(self.n_chunks)]
+        if not views:
+            return np.empty(0, dtype=self._dtypes[k])
+        return self._decode(k, views[0] if len(views) == 1 else np.concatenate(views))
+
+    def rows(self, start=0, stop=None):
+        """Decoded columns for rows [start, stop), reading only the chunks that cover them."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        parts, pos = {c: [] for c in self.columns}, 0
+        for i, (n, _) in enumerate(self._chunks):
+            a, b = max(start - pos, 0), min(stop - pos, n)
+            if a < b:
+                for k, c in enumerate(self.columns):
+                    parts[c].append(self._decode(k, self._raw_view(k, i)[a:b]))
+            pos += n
+            if pos >= stop:
+                break
+        return {c: np.concatenate(v) if len(v) > 1 else v[0] if v else np.empty(0, self._dtypes[k])
+                for k, (c, v) in enumerate(parts.items())}
+
+    def to_frame(self):
+        import pandas as pd
+        return pd.DataFrame({c: self[c] for c in self.columns})
+
+
+def load_raw(path):
+    """Open a raw capture in either format: RawCapture for .praw, DataFrame for CSV."""
+    if str(path).endswith(SUFFIX):
+        return RawCapture(path)
+    import pandas as pd
+    return pd.read_csv(path)
+
+
+def load_raw_range(path, start_row=0, start_byte=0):
+    """
+    The complete rows of a capture from a resume point, for files still being written.
+
+    .praw: rows from `start_row` in the complete chunks. CSV: the lines from byte
+    `start_byte` (0 = first data line) up to the last newline, so a half-written line
+    is left for later.
+
+    Returns:
+        tuple: (columns: DataFrame / dict, row_ends: absolute byte offset just past each
+                CSV row, None for .praw)
+    """
+    if str(path).endswith(SUFFIX):
+        return RawCapture(path).rows(start_row), None
+    import pandas as pd
+    with open(path, "rb") as f:
+        header = f.readline()
+        if not header.endswith(b"\n"):
+            raise ValueError(f"{path}: incomplete CSV header")
+        pos = max(start_byte, len(header))
+        f.seek(pos)
+        buf = f.read()
+    buf = buf[:buf.rfind(b"\n") + 1]
+    names = header.decode().strip().split(",")
+    if not buf:
+        return pd.DataFrame(columns=names), np.empty(0, np.int64)
+    raw = np.frombuffer(buf, np.uint8)
+    ends = np.flatnonzero(raw == 10) + 1
+    starts = np.concatenate([[0], ends[:-1]]).astype(np.int64)
+    blank = (ends - starts == 1) | ((ends - starts == 2) & (raw[np.minimum(starts, len(raw) - 1)] == 13))
+    ends = ends[~blank]                                   # read_csv skips blank lines too
+    return pd.read_csv(io.BytesIO(buf), names=names, header=None), pos + ends
+
+
+def csv_to_rawcap(csv_path, out_path=None, fixed_point=False, fs=None, chunk_rows=65536):
+    """
+    Convert a logger CSV to .praw without loading it whole.
+
+    Returns:
+        str: path of the written capture
+    """
+    import pandas as pd
+    out_path = out_path or os.path.splitext(csv_path)[0] + SUFFIX
+    writer = None
+    for block in pd.read_csv(csv_path, chunksize=chunk_rows):
+        if writer is None:
+            if fs is None:
+                t = block["time_s"].values
+                fs = round((len(t) - 1) / (t[-1] - t[0])) if len(t) > 1 and t[-1] > t[0] else 10000.0
+            writer = RawCaptureWriter(out_path, list(block.columns), fs=fs, fixed_point=fixed_point)
+        writer.write(block)
+    if writer is None:
+        writer = RawCaptureWriter(out_path, LOGGER_COLUMNS, fs=fs or 10000.0, fixed_point=fixed_point)
+    writer.close()
+    return out_path
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Convert logger CSV captures to .praw")
+    ap.add_argument("csv", nargs="+")
+    ap.add_argument("--fixed-point", action="store_true", help="store columns as int16 fixed point")
+    args = ap.parse_args()
+    for p in args.csv:
+        out = csv_to_rawcap(p, fixed_point=args.fixed_point)
+        print(f"{p} ({os.path.getsize(p)} B) → {out} ({os.path.getsize(out)} B)")
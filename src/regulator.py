@@ -0,0 +1,533 @@
+# src/regulator.py
+"""
+One regulator's pipeline state, shared by main.py (one regulator) and rails.py (one per rail).
+
+A Regulator owns everything that is kept per DC-DC regulator:
+  <model_dir>    ModelRegistry root (versions/, CURRENT, operating_point.json) plus
+                 healthy_store.npz, ingest_journal.sqlite, drift_live.json, last_retrain.txt
+  <buffer_dir>   raw captures of that regulator (quarantine/ below it)
+  <event_dir>    anomaly event packets for downlink
+and the model scoring it (hot-swapped when CURRENT moves, optionally an online forest), the
+drift sketches that trigger its retrains, and its metrics. Metrics carry a `rail` label when
+the regulator has a rail ID. Until its first retrain a regulator with a `seed_dir` scores
+with the active model of that directory.
+
+The entry points own the process-level parts: worker pools, buffer watchers, the retrain
+processes (RetrainScheduler, below), the liveness file and the metrics export.
+"""
+import os, time, glob
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from feature_engineering import FEATURE_COLS
+from ingest import process_buffer_file, is_raw_capture
+from healthy_store import HealthyStore
+from ingest_journal import IngestJournal, DONE, QUARANTINED
+from model_registry import (ModelRegistry, HEADER_FILE, train_and_publish, publish_model, load_operating_point,
+                            decision_threshold)
+from drift import Sketch, psi
+import metrics
+
+# -------------------------------------------------
+# CONFIGURATION (every regulator)
+# -------------------------------------------------
+MIN_HEALTHY_SAMPLES = 100
+HEALTHY_MARGIN      = 0.0                     # healthy: anomaly score at least this far below the threshold
+RETRAIN_TRIGGER     = "drift"                 # "drift" → when the input drifts (drift.py); "timer" → every period
+DRIFT_PSI           = 0.2                     # retrain once a feature's (or the score's) PSI reaches this
+DRIFT_MIN_WINDOWS   = 2000                    # live windows needed before the test is trusted
+DRIFT_HALF_LIFE_WINDOWS = 100000              # decay of the live sketch (~100 s of windows at 10 kHz)
+DRIFT_MAX_AGE_SEC   = 86400                   # retrain anyway after this long without drift
+THRESHOLD           = 0.56                    # anomaly score; overridden by operating_point.json (calibrate.py)
+STORE_CAPACITY      = 50000                   # rows kept for retraining (~2 MB on disk)
+STORE_HALF_LIFE_S   = None                    # None → uniform reservoir; seconds → time-decayed
+INGEST_MAX_ATTEMPTS = 3                       # failures before a capture is quarantined
+JOURNAL_FORGET_SEC  = 86400                   # journal rows of deleted / quarantined captures kept this long
+IFOREST_PARAMS      = dict(n_estimators=100, contamination=0.01, random_state=42)
+ONLINE_MODEL        = False                   # True → sliding-window forest, no full refits (online_forest.py)
+ONLINE_REFRESH_ROWS = 256                     # healthy windows per replaced tree
+FLAT_MODEL          = True                    # score with the memory-mapped flat/ arrays (fast start, no sklearn);
+                                              # False, or ONLINE_MODEL → unpickle the sklearn model
+EVENT_CAPTURE       = True                    # keep raw pre/post-trigger windows of anomalies (event_capture.py)
+EVENT_PRE_MS        = 20.0
+EVENT_POST_MS       = 50.0
+EVENT_MAX_PER_FILE  = 16                      # further events of a capture are only counted
+EVENT_PACKET_BYTES  = 256
+EVENT_DIR_MAX_BYTES = 50_000_000              # oldest events are deleted beyond this
+# -------------------------------------------------
+
+STAGE_SECONDS = metrics.summary("powersense_stage_seconds", "Per-stage latency in seconds")
+ROWS_IN       = metrics.counter("powersense_rows_in_total", "Raw telemetry rows parsed")
+WINDOWS       = metrics.counter("powersense_windows_total", "Feature windows extracted")
+WINDOWS_BAD   = metrics.counter("powersense_windows_invalid_total", "Windows skipped for non-finite features")
+HEALTHY_KEPT  = metrics.counter("powersense_healthy_rows_total", "Healthy windows added to the store")
+FILES         = metrics.counter("powersense_files_total", "Buffer file reads, by result (ok / error)")
+QUARANTINED_N = metrics.counter("powersense_files_quarantined_total", "Captures moved to quarantine")
+JOURNAL_FILES = metrics.gauge("powersense_journal_files", "Buffer files in the ingest journal, by status")
+RETRAINS      = metrics.counter("powersense_retrains_total", "Retrains, by result (ok / failed / skipped)")
+MODEL_SWAPS   = metrics.counter("powersense_model_swaps_total", "Hot swaps to a new active model version")
+INGEST_LAG    = metrics.summary("powersense_ingest_lag_seconds", "Capture file closed (mtime) to result collected")
+QUEUE_DEPTH   = metrics.gauge("powersense_queue_depth", "Files submitted to the ingest pool, not yet collected")
+BACKLOG       = metrics.gauge("powersense_buffer_backlog_files", "Raw captures in the buffer directory")
+STORE_ROWS    = metrics.gauge("powersense_store_rows", "Healthy rows kept for retraining")
+TRIGGERS      = metrics.counter("powersense_retrain_triggers_total", "Retrains started, by trigger")
+DRIFT_PSI_G   = metrics.gauge("powersense_drift_psi", "PSI of live vs training windows, by feature (score: anomaly score)")
+DRIFT_LIVE_N  = metrics.gauge("powersense_drift_live_windows", "Decayed window count of the live drift sketch")
+EVENTS        = metrics.counter("powersense_events_total", "Anomaly events, by result (captured / dropped)")
+EVENT_BYTES   = metrics.counter("powersense_event_bytes_total", "Encoded event packets written for downlink")
+LIVE_QUANTILE = metrics.gauge("powersense_live_quantile", "Live quantiles from the drift sketch (raw feature units), by feature")
+
+
+def _feature_names(n):
+    return FEATURE_COLS if n == len(FEATURE_COLS) else [f"x{i}" for i in range(n)]
+
+
+def _merge(parts):
+    parts = [p for p in parts if p is not None and len(p)]
+    if not parts:
+        print("No healthy data found in buffer.")
+        return np.empty((0, len(FEATURE_COLS)))
+    return np.concatenate(parts)
+
+
+class Regulator:
+    """
+    Args:
+        model_dir (str): model registry root and state files (see the module docstring)
+        buffer_dir (str): raw captures
+        rail (str, optional): rail ID; labels metrics and prefixes log lines
+        seed_dir (str, optional): registry whose active model scores until the first retrain
+        event_dir (str, optional): event packet directory (None → no event capture)
+        retrain_every_s (float): timer period; with RETRAIN_TRIGGER "drift" the minimum gap
+    """
+
+    def __init__(self, model_dir, buffer_dir, rail=None, seed_dir=None, event_dir=None, retrain_every_s=3600):
+        self.rail = rail
+        self.labels = {"rail": rail} if rail else {}
+        self.tag = f"[{rail}] " if rail else ""
+        self.model_dir = os.path.join(model_dir, "")
+        self.buffer_dir = os.path.join(buffer_dir, "")
+        self.quarantine_dir = os.path.join(self.buffer_dir, "quarantine", "")
+        self.event_dir = event_dir
+        self.seed_dir = seed_dir
+        self.retrain_every_s = retrain_every_s
+        os.makedirs(self.model_dir, exist_ok=True)
+        os.makedirs(self.buffer_dir, exist_ok=True)
+        self.registry = ModelRegistry(self.model_dir)
+
+        t0 = time.perf_counter()
+        self.iso, self.scaler, self.version = self.load_model()
+        print(f"{self.tag}Model loaded (version {self.version}, {type(self.iso).__name__}) "
+              f"in {(time.perf_counter() - t0) * 1e3:.0f} ms.")
+        self.store = HealthyStore.open(self.model_dir + "healthy_store.npz", self.scaler,
+                                       capacity=STORE_CAPACITY, half_life_s=STORE_HALF_LIFE_S)
+        print(f"{self.tag}Healthy store: {len(self.store)} samples ({self.store.n_seen} seen).")
+        self.journal = IngestJournal(self.model_dir + "ingest_journal.sqlite", max_attempts=INGEST_MAX_ATTEMPTS)
+        self.watcher = None
+        self.online = None                    # OnlineIsolationForest when ONLINE_MODEL
+        self.online_version = None            # the version `online` was seeded from or last published
+        self.online_published = 0             # online.trees_replaced at that point
+        self.reference = None                 # drift.Sketch of the active version's training windows
+        self.live = None                      # drift.Sketch of the windows it has scored since
+        self.load_drift()
+
+    def start(self):
+        """Service start: settle the journal against the saved store, seed the online forest."""
+        self.discard(self.journal.recover(self.store.epoch))
+        print(f"   → {self.tag}Ingest journal: {self.journal.counts()}")
+        if ONLINE_MODEL:
+            self.seed_online()
+
+    # ---------------- model ----------------
+    def load_model(self, vid=None):
+        """
+        (iso, scaler, version) of `vid` (default: active): flat arrays when possible, else pickles.
+        Before its first retrain a regulator with a seed scores with the seed's active model,
+        as version "seed:<vid>".
+        """
+        reg = self.registry
+        if vid is None and self.seed_dir and reg.current() is None and not os.path.exists(reg._model_file(None)):
+            reg = ModelRegistry(self.seed_dir)
+        iso, scaler, v = (reg.load_fast if FLAT_MODEL and not ONLINE_MODEL else reg.load)(vid)
+        self.source = reg                     # where the drift reference of this version lives
+        return iso, scaler, (v if reg is self.registry else f"seed:{v}")
+
+    def sync_model(self):
+        """Load the active version if CURRENT moved (retrain or external rollback); True if it changed."""
+        vid = self.registry.current()
+        if vid is None or vid == self.version:
+            return False
+        with metrics.timer("powersense_stage_seconds", stage="model_load", **self.labels):
+            self.iso, self.scaler, self.version = self.load_model(vid)
+        MODEL_SWAPS.inc(**self.labels)
+        self.load_drift()
+        print(f"{self.tag}Model hot-swapped to version {self.version}")
+        if self.online is not None and self.version != self.online_version:
+            self.seed_online()                # rollback / external activation: start over from it
+        return True
+
+    @property
+    def threshold(self):
+        """Anomaly-score threshold: operating_point.json of this regulator, else of the seed."""
+        op = load_operating_point(self.model_dir) or (self.seed_dir and load_operating_point(self.seed_dir)) or {}
+        return op.get("threshold", THRESHOLD)
+
+    @property
+    def healthy_score(self):
+        """
+        Healthy cut of the current model in the workers' -decision_function units: windows at or
+        below it are kept, those above the operating threshold raise events, never both.
+        """
+        return decision_threshold(self.iso, self.threshold - HEALTHY_MARGIN)
+
+    @property
+    def last_retrain(self):
+        try:
+            with open(self.model_dir + "last_retrain.txt") as f:
+                return int(f.read().strip())
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def mark_retrained(self):
+        """Timestamp a retrain (also a failed or skipped one, so it is retried next period, not in a loop)."""
+        with open(self.model_dir + "last_retrain.txt", "w") as f:
+            f.write(str(int(time.time())))
+
+    # ---------------- drift ----------------
+    def load_drift(self):
+        """Reference sketch of the active version; the live one saved for it, else an empty one."""
+        self.reference = self.source.drift_reference(self.version.split(":", 1)[-1])
+        self.live, saved = Sketch.load(self.model_dir + "drift_live.json")
+        if self.live is None or saved.get("version") != self.version:
+            self.live = Sketch(self.scaler.n_features_in_)
+
+    def check_drift(self):
+        """
+        PSI of the live sketch against the reference, into the gauges.
+
+        Returns:
+            float: the largest PSI (features and score), NaN before DRIFT_MIN_WINDOWS or without a reference
+        """
+        if self.reference is None or self.live.n < DRIFT_MIN_WINDOWS:
+            return np.nan
+        feats, score = psi(self.reference, self.live)
+        for name, v in zip(_feature_names(len(feats)), feats):
+            DRIFT_PSI_G.set(v, feature=name, **self.labels)
+        DRIFT_PSI_G.set(score, feature="score", **self.labels)
+        return float(np.nanmax(np.append(feats, score)))
+
+    # ---------------- ingestion ----------------
+    def event_options(self):
+        """
+        EventCapture options for the ingest workers scoring with the current model, or None when
+        capture is off. The workers' scores are -decision_function, so the operating threshold
+        (anomaly-score units) is converted with this model's offset_; reload them with the model.
+        """
+        if not EVENT_CAPTURE or self.event_dir is None:
+            return None
+        return dict(threshold=decision_threshold(self.iso, self.threshold), pre_ms=EVENT_PRE_MS, post_ms=EVENT_POST_MS,
+                    max_events=EVENT_MAX_PER_FILE, packet_bytes=EVENT_PACKET_BYTES)
+
+    def save_events(self, res):
+        """Write the event packets of one result (before its capture is deleted); prune the oldest."""
+        events = res.get("events") or []
+        if res.get("events_dropped"):
+            EVENTS.inc(res["events_dropped"], result="dropped", **self.labels)
+        if not events:
+            return
+        os.makedirs(self.event_dir, exist_ok=True)
+        for eid, t, packets in events:
+            path = os.path.join(self.event_dir, f"event_{eid:08x}.pkt")
+            with open(f"{path}.tmp", "wb") as f:
+                f.write(packets)
+            os.replace(f"{path}.tmp", path)
+            EVENT_BYTES.inc(len(packets), **self.labels)
+        EVENTS.inc(len(events), result="captured", **self.labels)
+        files = sorted((e for e in os.scandir(self.event_dir) if e.name.endswith(".pkt")),
+                       key=lambda e: e.stat().st_mtime)
+        total = sum(e.stat().st_size for e in files)
+        for e in files:
+            if total <= EVENT_DIR_MAX_BYTES:
+                break
+            total -= e.stat().st_size
+            os.remove(e.path)
+
+    def _observe(self, res):
+        """Feed one processed file into the metrics (before it is deleted: lag uses its mtime)."""
+        if not metrics.is_enabled():
+            return
+        for stage, seconds in res.get("timings", {}).items():
+            STAGE_SECONDS.observe(seconds, stage=stage, **self.labels)
+        ROWS_IN.inc(res["rows"], **self.labels)
+        WINDOWS.inc(res["n_windows"], **self.labels)
+        WINDOWS_BAD.inc(res["n_invalid"], **self.labels)
+        FILES.inc(result="error" if res["error"] else "ok", **self.labels)
+        try:
+            INGEST_LAG.observe(time.time() - os.path.getmtime(res["path"]), **self.labels)
+        except OSError:
+            pass
+
+    def _report(self, res):
+        """Print one processed file the way the serial scan always has."""
+        print(f"  → {self.tag}Found: {os.path.basename(res['path'])}")
+        if res["error"]:
+            print(f"  → ERROR in {res['stage']}: {res['error']}")
+            return
+        print(f"  → Loaded {res['rows']} rows, extracted {res['n_windows']} feature rows")
+        if res["n_invalid"]:
+            print(f"  → Skipped {res['n_invalid']} windows with non-finite features")
+        if res.get("events"):
+            print(f"  → Captured {len(res['events'])} anomaly events "
+                  f"({sum(len(p) for _, _, p in res['events'])} B of packets)"
+                  + (f", {res['events_dropped']} more not kept" if res.get("events_dropped") else ""))
+        if res.get("events_error"):
+            print(f"  → Event capture failed: {res['events_error']}")
+        print(f"  → {len(res['healthy'])} healthy rows kept (below the threshold, model {res['model_version']})")
+
+    def discard(self, paths, verb="Deleting"):
+        for path in paths:
+            print(f"  → {self.tag}{verb} {os.path.basename(path)}")
+            try:
+                if verb == "Deleting":
+                    os.remove(path)
+                else:
+                    os.makedirs(self.quarantine_dir, exist_ok=True)
+                    os.replace(path, os.path.join(self.quarantine_dir, os.path.basename(path)))
+            except FileNotFoundError:
+                pass
+            if self.watcher is not None:
+                self.watcher.forget(path)
+
+    def claim(self, path, complete=True):
+        """(start_row, start_byte) of the unread part of `path`, or None if there is none."""
+        work = self.journal.claim(path, complete)
+        if work is None and self.journal.status(path) == DONE:
+            self.discard([path])              # fully ingested; left over from before a restart
+        return work
+
+    def scan(self):
+        """[(path, start_row, start_byte)] the journal has not read yet: growing captures, retries, leftovers."""
+        todo = []
+        for e in os.scandir(self.buffer_dir):
+            if e.is_file() and is_raw_capture(e.name):
+                work = self.claim(e.path, complete=False)
+                if work is not None:
+                    todo.append((e.path, *work))
+        return todo
+
+    def record(self, res):
+        """Report and journal one result (before its rows go into the store); return its healthy rows."""
+        self._observe(res)
+        self._report(res)
+        if self.event_dir is not None:
+            self.save_events(res)
+        if res.get("sketch") is not None and res["model_version"] == self.version:
+            self.live.merge(res["sketch"], DRIFT_HALF_LIFE_WINDOWS)
+        if self.journal.record(res, self.store.epoch + 1) == QUARANTINED:
+            QUARANTINED_N.inc(**self.labels)
+            self.discard([res["path"]], verb="Quarantining")
+        return res["healthy"]
+
+    def absorb(self, parts):
+        """Healthy rows of recorded results into the store and, in online mode, the sliding-window forest."""
+        rows = _merge(parts)
+        if not len(rows):
+            return 0
+        with metrics.timer("powersense_stage_seconds", stage="store_add", **self.labels):
+            self.store.add(rows)
+        if self.online is not None:
+            with metrics.timer("powersense_stage_seconds", stage="online_absorb", **self.labels):
+                self.online.absorb(self.scaler.transform(rows))
+        HEALTHY_KEPT.inc(len(rows), **self.labels)
+        print(f"{self.tag}Stored {len(rows)} healthy rows ({len(self.store)} kept, {self.store.n_seen} seen)")
+        return len(rows)
+
+    def checkpoint(self):
+        """
+        Save the store, then commit the journal against it, delete fully ingested captures and
+        drop the journal rows of captures gone for JOURNAL_FORGET_SEC.
+        """
+        self.journal.sync()
+        self.store.epoch += 1
+        with metrics.timer("powersense_stage_seconds", stage="store_save", **self.labels):
+            self.store.save()
+        self.live.save(self.model_dir + "drift_live.json", version=self.version)
+        self.discard(self.journal.commit(self.store.epoch))
+        self.journal.forget_missing(JOURNAL_FORGET_SEC)
+
+    def load_healthy_chunks(self):
+        """Serial scan of the buffer; record every capture and return the healthy rows (call `checkpoint()` after)."""
+        print(f"{self.tag}Scanning buffer for captures...")
+        parts = []
+        for path in sorted(p for p in glob.glob(f"{self.buffer_dir}*") if is_raw_capture(p)):
+            work = self.claim(path)
+            if work is not None:
+                parts.append(self.record(process_buffer_file(path, self.iso, self.scaler, self.healthy_score,
+                                                             self.version, *work, capture=self.event_options())))
+        return _merge(parts)
+
+    # ---------------- retraining ----------------
+    def retrain_trigger(self):
+        """Why a retrain should start now (timer / drift / max_age / no_reference), or None."""
+        age = time.time() - self.last_retrain
+        if age < self.retrain_every_s:
+            return None
+        if RETRAIN_TRIGGER == "timer":
+            return "timer"
+        if age >= DRIFT_MAX_AGE_SEC:
+            return "max_age"
+        if self.reference is None:
+            print(f"{self.tag}No drift reference for model {self.version}: retraining to publish one.")
+            return "no_reference"
+        worst = self.check_drift()
+        if worst >= DRIFT_PSI:
+            print(f"{self.tag}Input drift: PSI {worst:.3f} >= {DRIFT_PSI} over {self.live.n:.0f} windows.")
+            return "drift"
+        return None
+
+    def seed_online(self):
+        """Sliding-window forest from the active model, its span filled from the healthy store."""
+        from online_forest import OnlineIsolationForest
+        self.online = OnlineIsolationForest(self.iso, refresh_rows=ONLINE_REFRESH_ROWS, seed=self.store.n_seen)
+        X = self.store.sample()
+        if len(X):
+            self.online.absorb(self.scaler.transform(X), grow=False)
+        self.online_version, self.online_published = self.version, 0
+        print(f"{self.tag}Online forest seeded from {self.version}: {self.online.state()}")
+
+    def _start_online_publish(self, executor):
+        """Publish the online forest's current trees as a version (export in the retrain process)."""
+        if self.online.trees_replaced == self.online_published:
+            print(f"{self.tag}Online forest unchanged since {self.online_version}. Skipping publish.")
+            RETRAINS.inc(result="skipped", **self.labels)
+            self.mark_retrained()             # look again next period
+            return None
+        state = self.online.state()
+        self.online_published = self.online.trees_replaced
+        print(f"{self.tag}Publishing online forest: {state}")
+        self.checkpoint()
+        meta = {"n_samples": state["window_rows"], "scaler_n": int(np.max(self.scaler.n_samples_seen_)),
+                "n_seen": self.store.n_seen, "online": state, **self.labels}
+        window = self.scaler.inverse_transform(self.online.window())     # drift reference: the span it covers
+        job = executor.submit(publish_model, self.model_dir, self.online.snapshot(), self.scaler,
+                              self.threshold, meta, window,
+                              healthy_threshold=self.threshold - HEALTHY_MARGIN)
+        job.online = True
+        return job
+
+    def start_retrain(self, executor):
+        """Snapshot the healthy store and fit a new model version in `executor`; the job, or None if skipped."""
+        if self.online is not None:
+            job = self._start_online_publish(executor)
+        else:
+            print(f"{self.tag}Starting retrain...")
+            X = self.store.sample()
+            print(f"{self.tag}Healthy store: {len(X)} samples kept of {self.store.n_seen} seen")
+            if len(X) < MIN_HEALTHY_SAMPLES:
+                print(f"{self.tag}Not enough samples ({len(X)} < {MIN_HEALTHY_SAMPLES}). Skipping retrain.")
+                RETRAINS.inc(result="skipped", **self.labels)
+                self.mark_retrained()
+                return None
+            print(f"{self.tag}Feature matrix shape: {X.shape}")
+            self.checkpoint()
+            # Scaler from exact running statistics (all healthy windows + original fit), then the
+            # Isolation Forest; both happen in the worker while ingestion keeps scoring.
+            job = executor.submit(train_and_publish, self.model_dir, X.copy(), self.scaler, self.store.stats,
+                                  self.threshold, IFOREST_PARAMS, {"n_seen": self.store.n_seen, **self.labels},
+                                  healthy_threshold=self.threshold - HEALTHY_MARGIN)
+        if job is not None:
+            job.started = time.perf_counter()
+        return job
+
+    def finish_retrain(self, job):
+        """Activate the version a finished retrain published; False if it failed."""
+        self.mark_retrained()
+        try:
+            vid = job.result()
+        except Exception as e:
+            print(f"{self.tag}Retrain FAILED: {e}. Keeping model {self.version}.")
+            RETRAINS.inc(result="failed", **self.labels)
+            return False
+        self.registry.activate(vid)
+        meta = self.registry.meta(vid)
+        if getattr(job, "online", False):
+            self.online_version = vid
+        RETRAINS.inc(result="ok", **self.labels)
+        STAGE_SECONDS.observe(time.perf_counter() - job.started, stage="retrain", **self.labels)
+        for stage in ("fit", "export"):
+            if f"{stage}_s" in meta:
+                STAGE_SECONDS.observe(meta[f"{stage}_s"], stage=stage, **self.labels)
+        print(f"{self.tag}RETRAINED with {meta['n_samples']} healthy samples (scaler n = {meta['scaler_n']})")
+        print(f"{self.tag}New model {vid} published: {self.registry.path(vid, HEADER_FILE)}")
+        if "delta" in meta:
+            d = meta["delta"]
+            print(f"{self.tag}Uplink size (zlib): image {d['image_zlib_bytes']} B, delta {d['delta_zlib_bytes']} B "
+                  f"→ send {d['send']}")
+        return True
+
+    def retrain(self):
+        """Blocking retrain: fit, publish and activate before returning."""
+        with ProcessPoolExecutor(1) as executor:
+            job = self.start_retrain(executor)
+            ok = job is not None and self.finish_retrain(job)
+        return ok and self.sync_model()
+
+    # ---------------- metrics ----------------
+    def export_metrics(self, queued=0):
+        """Refresh this regulator's gauges (the entry point writes the textfile)."""
+        if not metrics.is_enabled():
+            return
+        BACKLOG.set(sum(1 for e in os.scandir(self.buffer_dir) if e.is_file() and is_raw_capture(e.name))
+                    + queued, **self.labels)
+        STORE_ROWS.set(len(self.store), **self.labels)
+        DRIFT_LIVE_N.set(self.live.n, **self.labels)
+        if self.live.n:
+            zq, sq = self.live.quantiles(np.array([0.05, 0.5, 0.95]))
+            raw = zq * self.scaler.scale_[:, None] + self.scaler.mean_[:, None]
+            for name, row in [*zip(_feature_names(len(raw)), raw), ("score", sq)]:
+                for q, v in zip(("0.05", "0.5", "0.95"), row):
+                    LIVE_QUANTILE.set(v, feature=name, quantile=q, **self.labels)
+        for status, n in self.journal.counts().items():
+            JOURNAL_FILES.set(n, status=status, **self.labels)
+
+
+class RetrainScheduler:
+    """
+    Retrains regulators in shared retrain processes, longest-waiting due regulator first.
+
+    A regulator is due when `retrain_trigger()` says so; its last retrain (or skipped attempt)
+    orders the queue, so one with lots of data cannot take every slot while another waits.
+    """
+
+    def __init__(self, regulators, workers=1):
+        self.regulators = list(regulators)
+        self.executor = ProcessPoolExecutor(workers)
+        self.workers = workers
+        self.jobs = {}                        # Regulator -> future
+
+    def poll(self):
+        """Activate finished retrains and start due ones in free slots; returns regulators whose model changed."""
+        for reg, job in list(self.jobs.items()):
+            if job.done():
+                del self.jobs[reg]
+                reg.finish_retrain(job)
+        for reg in sorted((r for r in self.regulators if r not in self.jobs), key=lambda r: r.last_retrain):
+            if len(self.jobs) >= self.workers:
+                break
+            trigger = reg.retrain_trigger()
+            if trigger is None:
+                continue
+            TRIGGERS.inc(trigger=trigger, **reg.labels)
+            job = reg.start_retrain(self.executor)
+            if job is not None:
+                self.jobs[reg] = job
+        return [r for r in self.regulators if r.sync_model()]
+
+    def hung(self, max_s):
+        """A retrain has been running longer than `max_s`."""
+        now = time.perf_counter()
+        return any(now - job.started > max_s for job in self.jobs.values())
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
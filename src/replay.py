@@ -0,0 +1,402 @@
+# src/replay.py
+"""
+Faster-than-real-time replay of the firmware detection loop (firmware_raspberry/main).
+
+Emulates, on a virtual clock, what main.c does every HOP_MS:
+  feats_push_raw → feats_compute → iforest_score / rules_triggered → fdir_step
+with the constants from params.h. Raw samples are processed in blocks:
+  - features for every hop at once from prefix sums over the block (plus the ring-buffer
+    tail carried from the previous block): same windows, baseline and formulas as
+    features_if.c, summed in float64 instead of the C loop's float32
+  - iforest_score through CompiledForest in Q15 mode (bit-exact with features_if.c)
+  - the FDIR state machine jumps from event to event (next dwell trigger, HOLDOFF and
+    VERIFY deadlines, next re-latch) instead of stepping every tick
+
+The replay is open loop: a cut does not change the recorded signal, so a latch that is
+still in the log after HOLDOFF_MS is seen again during VERIFY.
+
+  PYTHONPATH=src python src/replay.py capture.praw
+  PYTHONPATH=src python src/replay.py --synth storm --duration 1h --fs 10000 --set DWELL_HITS=3
+"""
+import re, time
+import numpy as np
+
+from compiled_forest import CompiledForest
+
+PARAMS_H = "firmware_raspberry/main/params.h"
+DEFAULT_HEADER = "models/model_iforest.h"
+BLOCK_SAMPLES = 1 << 20
+
+NORMAL, HOLD, VERIFY, SAFE = "NORMAL", "HOLD", "VERIFY", "SAFE"
+
+
+def read_params(path=PARAMS_H):
+    """Numeric #defines of params.h as a dict (later definitions win, like the preprocessor)."""
+    params = {}
+    with open(path) as f:
+        for name, val in re.findall(r"^\s*#define\s+(\w+)\s+(-?[0-9][0-9.eE+-]*)[fFuU]?\b", f.read(), re.M):
+            params[name] = float(val) if any(c in val for c in ".eE") else int(val)
+    return params
+
+
+def model_source(source=None):
+    """`source`, or the active registry version's header (models/model_iforest.h if none)."""
+    if source is None:
+        from model_registry import ModelRegistry, HEADER_FILE
+        reg = ModelRegistry("models/")
+        vid = reg.current()
+        source = reg.path(vid, HEADER_FILE) if vid else DEFAULT_HEADER
+    return source
+
+
+def load_scorer(source=None):
+    """
+    (CompiledForest in Q15 mode, iforest_threshold()) from a header, a .bin model image, or
+    by default the active registry version's header (see `model_source`).
+    """
+    source = model_source(source)
+    if str(source).endswith(".bin"):
+        from model_image import parse_image
+        with open(source, "rb") as f:
+            q = parse_image(f.read())
+    else:
+        from model_export import read_q15_header
+        q = read_q15_header(source)
+    f32 = np.float32
+    thr = (f32(q["model_threshold_q15"]) / f32(32767.0)) * f32(q["scale_decision_th"])
+    return CompiledForest(q, "q15"), thr
+
+
+# -------------------------------------------------
+# Features (features_if.c, vectorized per block)
+# -------------------------------------------------
+class FirmwareFeatures:
+    """
+    feats_compute() for every hop of a stream of raw blocks.
+
+    Keeps the last BUF_MAX samples between blocks, so windows and the Vout baseline that
+    straddle a block boundary are computed exactly as the ring buffer would.
+    """
+
+    COLS = ("Vin_V", "Iin_A", "Vout_V", "Iout_A", "Temp_C", "ripple_V")
+
+    def __init__(self, params):
+        fs_k = int(params["FS_HZ"]) // 1000
+        self.win = fs_k * int(params["WIN_MS"])
+        self.hop = fs_k * int(params["HOP_MS"])
+        self.buf_max = fs_k * (int(params["WIN_MS"]) + 4)
+        self.use_ripple = bool(params.get("USE_RIPPLE", 0))
+        self.dt_ms = np.float32(self.win) / np.float32(params["FS_HZ"]) * np.float32(1000.0)
+        if self.win < 2 or self.hop < 1:
+            raise ValueError("FS_HZ / WIN_MS / HOP_MS give fewer than 2 samples per window")
+        self.first_tick = -(-self.win // self.hop) - 1         # first hop with a full window
+        self.n_pushed = 0
+        self.tail = None
+
+    def push(self, block):
+        """
+        Absorb one raw block (mapping of columns, incl. time_s).
+
+        Returns:
+            tuple: (tick_n [k] samples pushed at each hop, tick_t [k] time_s of the last
+                    sample, X [k, 5] float32 features)
+        """
+        n_new = len(block["time_s"])
+        cols = {c: np.asarray(block[c], dtype=np.float32) if c in block else np.zeros(n_new, np.float32)
+                for c in self.COLS}
+        cols["time_s"] = np.asarray(block["time_s"], dtype=np.float64)
+        if self.tail is not None:
+            cols = {c: np.concatenate([self.tail[c], cols[c]]) for c in cols}
+        first = self.n_pushed - (len(cols["time_s"]) - n_new)    # absolute index of cols[...][0]
+        self.n_pushed += n_new
+        self.tail = {c: a[-self.buf_max:] for c, a in cols.items()}
+
+        lo = max(self.first_tick + 1, (self.n_pushed - n_new) // self.hop + 1) * self.hop
+        tick_n = np.arange(lo, self.n_pushed + 1, self.hop, dtype=np.int64)
+        if len(tick_n) == 0:
+            return tick_n, np.empty(0), np.empty((0, 5), np.float32)
+        e = tick_n - first                                    # window end (exclusive), local
+        s = e - self.win
+        w = np.float64(self.win)
+
+        vin, iin, vout, iout, temp = (cols[c] for c in self.COLS[:5])
+        eta = np.clip((vout * iout) / np.maximum(vin * iin, np.float32(1e-6)), 0.0, 1.2)
+        P = lambda a: np.concatenate([[0.0], np.cumsum(a, dtype=np.float64)])
+        Pv, Pe, Pt = P(vout), P(eta), P(temp)
+
+        dIdt = (iin[e - 1] - iin[s]) / self.dt_ms
+        base_n = np.minimum(np.minimum(tick_n, self.buf_max), 5 * self.win)
+        droop = (Pv[e] - Pv[e - base_n]) / base_n - (Pv[e] - Pv[s]) / w
+        if self.use_ripple:
+            Pr = P(cols["ripple_V"])
+            ripple = (Pr[e] - Pr[s]) / w
+        else:
+            ripple = np.zeros(len(e))
+        eff = (Pe[e] - Pe[s]) / w
+        q = max(self.win // 4, 1)
+        dT = ((Pt[e] - Pt[e - q]) - (Pt[s + q] - Pt[s])) / q
+        dEff = ((Pe[e] - Pe[e - q]) - (Pe[s + q] - Pe[s])) / q
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dEff_dT = np.where(np.abs(dT) < 1e-6, 0.0, dEff / dT)
+
+        X = np.column_stack([dIdt, droop, ripple, eff, dEff_dT]).astype(np.float32)
+        return tick_n, cols["time_s"][e - 1], X
+
+
+# -------------------------------------------------
+# FDIR state machine (power_fdir.c), event-jumping
+# -------------------------------------------------
+class FdirReplay:
+    """
+    fdir_step() over whole blocks of ticks.
+
+    Only ticks where something can happen are visited: the next tick whose anomaly run
+    reaches DWELL_HITS (in NORMAL), the HOLDOFF / VERIFY deadlines, and the first re-latch
+    inside a VERIFY window. Deadlines count ticks of HOP_MS on the virtual clock.
+
+    Args:
+        params (dict): params.h constants
+        safe_reset_ms (float, optional): leave SAFE after this long, standing in for the
+            operator re-enable; None keeps SAFE for the rest of the replay like the firmware
+    """
+
+    def __init__(self, params, safe_reset_ms=None):
+        hop = float(params["HOP_MS"])
+        self.dwell = int(params["DWELL_HITS"])
+        self.hold_ticks = int(np.ceil(params["HOLDOFF_MS"] / hop))
+        self.verify_ticks = int(np.ceil(params["VERIFY_MS"] / hop))
+        self.safe_ticks = None if safe_reset_ms is None else int(np.ceil(safe_reset_ms / hop))
+        self.state, self.since, self.deadline, self.run = NORMAL, 0, None, 0
+        self.transitions = []                  # (tick, new state)
+
+    def _goto(self, tick, state, deadline=None):
+        self.state, self.deadline = state, deadline
+        self.transitions.append((tick, state))
+
+    def step_block(self, j0, anomaly, relatch):
+        """Advance over ticks j0 .. j0+len-1 (absolute tick numbers)."""
+        n = len(anomaly)
+        pos = np.arange(n)
+        last_off = np.maximum.accumulate(np.where(anomaly, -1, pos))
+        run = pos - last_off
+        run[last_off == -1] += self.run                      # run continuing from the last block
+        self.run = int(run[-1]) if n else self.run
+        trig = np.flatnonzero(run >= self.dwell) + j0
+        rel = np.flatnonzero(relatch) + j0
+        j, end = j0, j0 + n
+        while j < end:
+            if self.state == NORMAL:
+                # dwell_hits counts from `since`: the window [t-DWELL+1, t] must start there
+                k = np.searchsorted(trig, max(j, self.since + self.dwell - 1))
+                if k == len(trig):
+                    break
+                t = int(trig[k])
+                self._goto(t, HOLD, t + self.hold_ticks)     # power_cut()
+                j = t + 1
+            elif self.state == HOLD:
+                if self.deadline >= end:
+                    break
+                t = self.deadline
+                self._goto(t, VERIFY, t + self.verify_ticks)  # power_restart_soft()
+                j = t + 1
+            elif self.state == VERIFY:
+                last = min(self.deadline, end - 1)
+                k = np.searchsorted(rel, j)
+                if k < len(rel) and rel[k] <= last:
+                    t = int(rel[k])
+                    self._goto(t, SAFE, None if self.safe_ticks is None else t + self.safe_ticks)
+                    j = t + 1
+                elif self.deadline < end:
+                    j = self._resume(self.deadline)
+                else:
+                    break
+            else:                                            # SAFE
+                if self.deadline is None or self.deadline >= end:
+                    break
+                j = self._resume(self.deadline)
+
+    def _resume(self, tick):
+        """Back to NORMAL with dwell_hits = 0: runs are counted from the next tick."""
+        self._goto(tick, NORMAL)
+        self.since = tick + 1
+        return self.since
+
+
+# -------------------------------------------------
+# Replay
+# -------------------------------------------------
+def _label_runs(t, label, carry):
+    """
+    Fault intervals [start, end] of one block from the per-sample label.
+
+    `carry` is (start of a fault still open at the previous block's end or None, time of the
+    previous block's last sample); returns (closed intervals, new carry).
+    """
+    open_start, prev_last = carry
+    d = np.diff(np.concatenate([[open_start is not None], label]).astype(np.int8))
+    starts = ([open_start] if open_start is not None else []) + list(t[np.flatnonzero(d == 1)])
+    ends = [t[i - 1] if i > 0 else prev_last for i in np.flatnonzero(d == -1)]
+    still_open = starts.pop() if len(label) and label[-1] else None
+    return [list(r) for r in zip(starts, ends)], (still_open, t[-1] if len(t) else prev_last)
+
+
+def replay(blocks, params=None, scorer=None, threshold=None, safe_reset_ms=None):
+    """
+    Run the detection loop over an iterable of raw blocks (column mappings with time_s;
+    fault_label optional).
+
+    Returns:
+        dict: throughput, cut / SAFE counts and per-fault detection (see `summarize`)
+    """
+    params = dict(read_params() if params is None else params)
+    default_thr = params.get("IF_THRESHOLD_F_FALLBACK", 0.56)
+    if scorer is None:
+        scorer, default_thr = load_scorer()
+    threshold = np.float32(default_thr if threshold is None else threshold)
+    feats, fdir = FirmwareFeatures(params), FdirReplay(params, safe_reset_ms)
+    didt, droop = np.float32(params["THR_DIDT_A_PER_MS"]), np.float32(params["THR_DROOP_V"])
+    thr_rip, use_rip = np.float32(params["THR_RIPPLE_V"]), bool(params.get("USE_RIPPLE", 0))
+    relatch_k = np.float32(0.8)
+
+    tick_times, faults, carry, labelled = [], [], (None, None), False
+    n_samples, n_ai, n_rule, start = 0, 0, 0, time.perf_counter()
+    for block in blocks:
+        tick_n, tick_t, X = feats.push(block)
+        n_samples += len(block["time_s"])
+        if "fault_label" in block:
+            labelled = True
+            runs, carry = _label_runs(np.asarray(block["time_s"]), np.asarray(block["fault_label"]) > 0, carry)
+            faults.extend(runs)
+        if len(X) == 0:
+            continue
+        ai = scorer.anomaly_score(X) > threshold
+        rule = (X[:, 0] > didt) & (X[:, 1] > droop)
+        if use_rip:
+            rule |= X[:, 2] > thr_rip
+        relatch = (X[:, 0] > didt * relatch_k) & (X[:, 1] > droop * relatch_k)
+        fdir.step_block(int(tick_n[0] // feats.hop) - 1, ai | rule, relatch)
+        tick_times.append(tick_t)
+        n_ai += int(ai.sum()); n_rule += int(rule.sum())
+    if carry[0] is not None:
+        faults.append([carry[0], carry[1]])
+
+    elapsed = time.perf_counter() - start
+    ticks = np.concatenate(tick_times) if tick_times else np.empty(0)
+    res = summarize(fdir.transitions, ticks, feats.first_tick, faults if labelled else None,
+                    grace_s=params["WIN_MS"] / 1000.0)
+    res.update(samples=n_samples, ticks=len(ticks), seconds=elapsed,
+               samples_per_s=n_samples / elapsed if elapsed > 0 else None,
+               ai_hits=n_ai, rule_hits=n_rule, threshold=float(threshold), final_state=fdir.state)
+    return res
+
+
+def summarize(transitions, tick_times, first_tick, faults, grace_s=0.002):
+    """
+    Match cuts (entries into HOLD) to labelled faults.
+
+    A cut detects a fault if it falls between the fault's first sample and its last sample
+    plus `grace_s` (one feature window); latency = cut time - fault start. Cuts matching no
+    fault are false cuts. Without labels only the cut and SAFE counts are reported.
+    """
+    at = lambda tick: float(tick_times[tick - first_tick])
+    cuts = [at(j) for j, s in transitions if s == HOLD]
+    safes = [at(j) for j, s in transitions if s == SAFE]
+    res = {"cuts": len(cuts), "safe_entries": len(safes), "cut_times": cuts, "safe_times": safes}
+    if faults is None:
+        res.update(faults=None, detected=None, missed=None, false_cuts=None, latency_ms=None)
+        return res
+    cuts_a = np.asarray(cuts)
+    used = np.zeros(len(cuts_a), dtype=bool)
+    per_fault = []
+    for t0, t1 in faults:
+        hit = np.flatnonzero((cuts_a >= t0) & (cuts_a <= t1 + grace_s))
+        used[hit] = True
+        per_fault.append({"start": float(t0), "end": float(t1),
+                          "latency_ms": float((cuts_a[hit[0]] - t0) * 1e3) if len(hit) else None})
+    lat = np.array([f["latency_ms"] for f in per_fault if f["latency_ms"] is not None])
+    res.update(faults=per_fault, detected=len(lat), missed=len(per_fault) - len(lat),
+               false_cuts=int((~used).sum()),
+               latency_ms={"p50": float(np.percentile(lat, 50)), "p99": float(np.percentile(lat, 99)),
+                           "max": float(lat.max())} if len(lat) else None)
+    return res
+
+
+# -------------------------------------------------
+# Sources
+# -------------------------------------------------
+def capture_blocks(path, chunk_rows=BLOCK_SAMPLES):
+    """Raw blocks from a .praw (chunk by chunk, decoded) or CSV capture (chunked read)."""
+    from rawcap import RawCapture, SUFFIX
+    if str(path).endswith(SUFFIX):
+        yield from RawCapture(path).iter_chunks(decode=True)
+        return
+    import pandas as pd
+    for df in pd.read_csv(path, chunksize=chunk_rows):
+        yield {c: df[c].to_numpy() for c in df.columns}
+
+
+def capture_rate(path):
+    """Sample rate of a capture (.praw header, else from time_s)."""
+    from rawcap import RawCapture, SUFFIX
+    if str(path).endswith(SUFFIX):
+        return RawCapture(path).fs
+    import pandas as pd
+    t = pd.read_csv(path, usecols=["time_s"], nrows=10001)["time_s"].to_numpy()
+    return round((len(t) - 1) / (t[-1] - t[0]))
+
+
+def print_report(res):
+    print(f"Replayed {res['samples']} samples ({res['ticks']} ticks) in {res['seconds']:.2f} s "
+          f"→ {res['samples_per_s'] / 1e6:.2f} M samples/s")
+    print(f"  IF threshold {res['threshold']:.6f}: {res['ai_hits']} model hits, {res['rule_hits']} rule hits")
+    print(f"  cuts {res['cuts']}, SAFE entries {res['safe_entries']}, final state {res['final_state']}")
+    if res["faults"] is None:
+        print("  no fault_label in the log: detection latency / false cuts not evaluated")
+        return
+    print(f"  faults {len(res['faults'])}: detected {res['detected']}, missed {res['missed']}, "
+          f"false cuts {res['false_cuts']}")
+    if res["latency_ms"]:
+        l = res["latency_ms"]
+        print(f"  detection latency: p50 {l['p50']:.1f} ms, p99 {l['p99']:.1f} ms, max {l['max']:.1f} ms")
+
+
+if __name__ == "__main__":
+    import argparse, json
+    ap = argparse.ArgumentParser(description="Replay raw logs through the firmware detection loop")
+    ap.add_argument("capture", nargs="?", help="raw capture (.praw or CSV)")
+    ap.add_argument("--synth", metavar="SCENARIO", help="replay synthetic telemetry (synth_telemetry.py)")
+    ap.add_argument("--duration", default="60", help="synthetic duration, e.g. 90, 15m, 1h")
+    ap.add_argument("--fs", type=int, help="synthetic sample rate (default: FS_HZ)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--model", help="model header (.h) or image (.bin); default: active version")
+    ap.add_argument("--params", default=PARAMS_H)
+    ap.add_argument("--set", nargs="*", default=[], metavar="NAME=VALUE", help="override params.h values")
+    ap.add_argument("--threshold", type=float, help="override iforest_threshold()")
+    ap.add_argument("--safe-reset-ms", type=float, help="leave SAFE after this long (default: never)")
+    ap.add_argument("--json", help="write the full report here")
+    args = ap.parse_args()
+
+    params = read_params(args.params)
+    for kv in args.set:
+        name, val = kv.split("=", 1)
+        params[name] = float(val) if "." in val else int(val)
+    if args.synth:
+        from synth_telemetry import TelemetrySynth, parse_duration
+        fs = args.fs or int(params["FS_HZ"])
+        synth = TelemetrySynth(parse_duration(args.duration), fs, args.synth, args.seed)
+        blocks = synth.chunks(BLOCK_SAMPLES / fs)
+    elif args.capture:
+        fs = capture_rate(args.capture)
+        blocks = capture_blocks(args.capture)
+    else:
+        ap.error("give a capture path or --synth SCENARIO")
+    if int(fs) != int(params["FS_HZ"]):
+        print(f"FS_HZ {params['FS_HZ']} → {int(fs)} (the log's sample rate)")
+        params["FS_HZ"] = int(fs)
+
+    scorer, thr = load_scorer(args.model)
+    res = replay(blocks, params, scorer, thr if args.threshold is None else args.threshold, args.safe_reset_ms)
+    print_report(res)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(res, f, indent=1)
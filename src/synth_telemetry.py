@@ -0,0 +1,309 @@
+# src/synth_telemetry.py
+"""
+Synthetic raw regulator telemetry with injected SEL events, for load and accuracy testing.
+
+Output follows the logger_mcp3008.c schema (time_s, Vin_V, Iin_A, Vout_V, Iout_A, Temp_C,
+ripple_V) plus fault_label, as CSV or .praw (rawcap.py), streamed in chunks.
+
+Signal model:
+  - nominal operating point taken from data/cubesat_features.csv (≈8 mV dropout, η ≈ 0.88)
+  - sensor noise, switching ripple (aliased tone), load steps (random telegraph)
+  - thermal drift: orbital sinusoid + random walk; Vout and efficiency follow temperature
+  - SEL events (Poisson): input current step with a fast rise, Vout droop, decaying
+    ripple burst; fault_label = 1 while the latch lasts
+
+Everything is vectorized per chunk. Noise is drawn per 1 s frame from (seed, frame), and the
+slow processes and the event list are fixed up front, so a (scenario, seed, fs) triple gives the
+same samples whatever the chunk or file size.
+
+  PYTHONPATH=src python src/synth_telemetry.py run.praw --duration 1h --fs 20000 --scenario storm
+  PYTHONPATH=src python src/synth_telemetry.py --buffer data/buffer/ --duration 10m --pace 1
+"""
+import os, time
+import numpy as np
+
+from rawcap import LOGGER_COLUMNS, RawCaptureWriter, SUFFIX as RAWCAP_SUFFIX
+
+COLUMNS = LOGGER_COLUMNS + ["fault_label"]
+
+NOMINAL = dict(
+    vin=3.308, vin_noise=0.004,               # V
+    vout=3.300, vout_noise=0.005,             # V
+    vout_tempco=-5e-5,                        # V/°C
+    ripple=0.004, ripple_hz=3100.0,           # V amplitude; tone as aliased by the ADC
+    iout=0.44, iout_noise=0.01,               # A
+    load_step=0.05, load_switch_per_h=60.0,   # A; payload on/off toggles
+    eff=0.88, eff_tempco=-5e-4,               # 1/°C
+    iin_noise=0.01,                           # A
+    temp=25.0, temp_noise=0.1,                # °C
+    temp_orbit_amp=8.0, orbit_s=5400.0,       # °C, s
+    temp_walk=0.02,                           # °C/√s
+    sel_rate_per_h=2.0,
+    sel_di=(0.05, 0.3),                       # A, uniform; spans the fault windows of the
+    sel_dv=(0.02, 0.12),                      # V  reference set (η ≈ 0.79, droop 30–100 mV)
+    sel_ripple=(0.01, 0.03),                  # V, burst σ at onset
+    sel_duration_s=(0.005, 0.05),
+    sel_rise_s=2e-4, sel_burst_s=3e-3,
+)
+
+SCENARIOS = {
+    "nominal": {},
+    "quiet":   dict(sel_rate_per_h=0.0, load_switch_per_h=0.0),
+    "storm":   dict(sel_rate_per_h=360.0),                      # SAA pass / solar particle event
+    "thermal": dict(temp_orbit_amp=25.0, temp_walk=0.1),
+    "noisy":   dict(vin_noise=0.01, vout_noise=0.012, iin_noise=0.02, iout_noise=0.02, ripple=0.008),
+}
+
+EVENT_DTYPE = [("t_start", "f8"), ("duration_s", "f8"), ("di", "f4"), ("dv", "f4"), ("ripple", "f4")]
+
+
+def parse_duration(s):
+    """'90', '90s', '15m' or '2h' → seconds."""
+    s = str(s).strip()
+    unit = {"s": 1, "m": 60, "h": 3600}.get(s[-1:])
+    return float(s[:-1]) * unit if unit else float(s)
+
+
+def parse_overrides(pairs):
+    """
+    KEY=VALUE strings (`--set`) → NOMINAL overrides. Values are floats, "lo,hi" a range; a
+    single value for a range parameter (sel_di, sel_duration_s, ...) means exactly (v, v).
+    """
+    overrides = {}
+    for kv in pairs:
+        key, val = kv.split("=", 1)
+        v = tuple(float(x) for x in val.split(",")) if "," in val else float(val)
+        if isinstance(NOMINAL.get(key), tuple):
+            v = v if isinstance(v, tuple) else (v, v)
+            if len(v) != 2:
+                raise ValueError(f"{key} takes one value or lo,hi")
+        elif isinstance(v, tuple):
+            raise ValueError(f"{key} takes a single value")
+        overrides[key] = v
+    return overrides
+
+
+class TelemetrySynth:
+    """
+    Seeded generator for one synthetic capture.
+
+    Args:
+        duration_s (float): length of the capture
+        fs (int): sample rate in Hz
+        scenario (str): key of SCENARIOS, applied over NOMINAL
+        seed (int): seed for noise, drift, load steps and events
+        t0 (float): time_s of the first sample
+        **overrides: any NOMINAL parameter
+    """
+
+    def __init__(self, duration_s, fs=20000, scenario="nominal", seed=0, t0=0.0, **overrides):
+        if scenario not in SCENARIOS:
+            raise KeyError(f"Unknown scenario {scenario!r} (choose from {', '.join(SCENARIOS)})")
+        unknown = set(overrides) - set(NOMINAL)
+        if unknown:
+            raise KeyError(f"Unknown parameter(s): {', '.join(sorted(unknown))}")
+        self.p = {**NOMINAL, **SCENARIOS[scenario], **overrides}
+        self.fs, self.seed, self.t0 = int(fs), int(seed), float(t0)
+        self.n_samples = int(round(duration_s * self.fs))
+        self.duration_s = self.n_samples / self.fs
+        self._frame = (None, None)
+
+        p, T = self.p, self.duration_s
+        rng = np.random.default_rng([self.seed, 1])
+        self._orbit_phase, self._ripple_phase = rng.uniform(0, 2 * np.pi, 2)
+        n_knots = int(np.ceil(T)) + 2                     # 1 s knots for the thermal random walk
+        self._walk = np.concatenate([[0.0], np.cumsum(rng.standard_normal(n_knots - 1) * p["temp_walk"])])
+        self._switches = np.sort(rng.uniform(0, T, rng.poisson(p["load_switch_per_h"] * T / 3600.0)))
+        self.events = self._draw_events(np.random.default_rng([self.seed, 2]))
+
+    def _draw_events(self, rng):
+        p = self.p
+        n = rng.poisson(p["sel_rate_per_h"] * self.duration_s / 3600.0)
+        ev = np.zeros(n, dtype=EVENT_DTYPE)
+        ev["t_start"] = np.sort(rng.uniform(0, self.duration_s, n))
+        ev["duration_s"] = rng.uniform(*p["sel_duration_s"], n)
+        ev["di"] = rng.uniform(*p["sel_di"], n)
+        ev["dv"] = rng.uniform(*p["sel_dv"], n)
+        ev["ripple"] = rng.uniform(*p["sel_ripple"], n)
+        return ev
+
+    # ---------------- noise frames ----------------
+    def _noise(self, a, b):
+        """(6, b - a) float32 unit normals for samples [a, b), built from 1 s frames."""
+        parts, fs = [], self.fs
+        for f in range(a // fs, (b - 1) // fs + 1):
+            if self._frame[0] != f:
+                rng = np.random.default_rng([self.seed, 3, f])
+                self._frame = (f, rng.standard_normal((6, fs), dtype=np.float32))
+            lo, hi = max(a, f * fs) - f * fs, min(b, (f + 1) * fs) - f * fs
+            parts.append(self._frame[1][:, lo:hi])
+        return parts[0] if len(parts) == 1 else np.concatenate(parts, axis=1)
+
+    # ---------------- signal ----------------
+    def block(self, a, b):
+        """Samples [a, b) as a dict of column arrays (time_s float64, fault_label int8, rest float32)."""
+        p, n = self.p, b - a
+        t = np.arange(a, b) / self.fs                     # relative time; t0 added on output
+        z = self._noise(a, b)
+        f32 = np.float32
+
+        temp = (p["temp"] + p["temp_orbit_amp"] * np.sin(2 * np.pi * t / p["orbit_s"] + self._orbit_phase)
+                + np.interp(t, np.arange(len(self._walk)), self._walk)).astype(f32)
+
+        # load: random telegraph between iout and iout + load_step
+        k0, k1 = np.searchsorted(self._switches, [t[0], t[-1]], side="right")
+        iout = np.full(n, p["iout"] + (k0 % 2) * p["load_step"], dtype=f32)
+        for k in range(k0, k1):
+            i = int(np.ceil((self._switches[k] - t[0]) * self.fs))
+            iout[i:] = p["iout"] + ((k + 1) % 2) * p["load_step"]
+
+        tone = (p["ripple"] * np.sin(2 * np.pi * p["ripple_hz"] * t + self._ripple_phase)).astype(f32)
+        vout = p["vout"] + p["vout_tempco"] * (temp - p["temp"]) + tone
+        vin = np.full(n, p["vin"], dtype=f32)
+        eff = p["eff"] + p["eff_tempco"] * (temp - p["temp"])
+        iin = vout * iout / (eff * vin)
+        ripple_v = np.abs(tone)
+        label = np.zeros(n, dtype=np.int8)
+
+        self._inject(t, iin, vout, ripple_v, z[5], label)
+
+        return {
+            "time_s":   self.t0 + t,
+            "Vin_V":    vin + p["vin_noise"] * z[0],
+            "Iin_A":    iin + p["iin_noise"] * z[1],
+            "Vout_V":   vout + p["vout_noise"] * z[2],
+            "Iout_A":   iout + p["iout_noise"] * z[3],
+            "Temp_C":   temp + p["temp_noise"] * z[4],
+            "ripple_V": ripple_v,
+            "fault_label": label,
+        }
+
+    def _inject(self, t, iin, vout, ripple_v, z, label):
+        """Add every SEL event overlapping this block, in place."""
+        ev, p = self.events, self.p
+        if len(ev) == 0:
+            return
+        lo = np.searchsorted(ev["t_start"], t[0] - p["sel_duration_s"][1], side="left")
+        hi = np.searchsorted(ev["t_start"], t[-1], side="right")
+        for e in ev[lo:hi]:
+            i0 = max(0, int(np.ceil((e["t_start"] - t[0]) * self.fs)))
+            i1 = min(len(t), int(np.ceil((e["t_start"] + e["duration_s"] - t[0]) * self.fs)))
+            if i1 <= i0:
+                continue
+            tau = (t[i0:i1] - e["t_start"]).astype(np.float32)
+            rise = 1 - np.exp(-tau / p["sel_rise_s"])
+            burst = e["ripple"] * np.exp(-tau / p["sel_burst_s"])
+            iin[i0:i1] += e["di"] * rise
+            vout[i0:i1] += -e["dv"] * rise + burst * z[i0:i1]
+            ripple_v[i0:i1] += burst
+            label[i0:i1] = 1
+
+    def chunks(self, chunk_s=1.0):
+        """Yield consecutive blocks of `chunk_s` seconds covering the capture."""
+        step = max(1, int(round(chunk_s * self.fs)))
+        for a in range(0, self.n_samples, step):
+            yield self.block(a, min(a + step, self.n_samples))
+
+    def event_table(self):
+        """Injected events as a DataFrame (absolute t_start)."""
+        import pandas as pd
+        df = pd.DataFrame(self.events)
+        df["t_start"] += self.t0
+        return df
+
+
+# -------------------------------------------------
+# Writers
+# -------------------------------------------------
+def write_capture(path, synth, chunk_s=1.0, fixed_point=False):
+    """Stream `synth` to .praw (one chunk per `chunk_s`) or, for other suffixes, logger-style CSV."""
+    if str(path).endswith(RAWCAP_SUFFIX):
+        with RawCaptureWriter(path, COLUMNS, fs=synth.fs, fixed_point=fixed_point, t0=synth.t0) as w:
+            for block in synth.chunks(chunk_s):
+                w.write(block)
+        return path
+    import pandas as pd
+    with open(path, "w", newline="") as f:
+        for k, block in enumerate(synth.chunks(chunk_s)):
+            pd.DataFrame(block).to_csv(f, header=(k == 0), index=False, float_format="%.6f")
+    return path
+
+
+def fill_buffer(buffer_dir, duration_s, file_s=10.0, fmt="praw", pace=0.0, fs=20000,
+                scenario="nominal", seed=0, **overrides):
+    """
+    Drop a capture into `buffer_dir` every `file_s` seconds of signal, the way the logger does.
+
+    Files are written under a temporary name and renamed into place, so the ingest watcher
+    only ever sees complete captures. `pace` > 0 throttles to `pace` × real time.
+
+    Returns:
+        list: written paths
+    """
+    os.makedirs(buffer_dir, exist_ok=True)
+    synth = TelemetrySynth(duration_s, fs, scenario, seed, **overrides)
+    suffix = RAWCAP_SUFFIX if fmt == "praw" else ".csv"
+    step = int(round(file_s * synth.fs))
+    paths, start = [], time.monotonic()
+    for k, a in enumerate(range(0, synth.n_samples, step)):
+        b = min(a + step, synth.n_samples)
+        name = os.path.join(buffer_dir, f"synth_{scenario}_{seed}_{k:06d}{suffix}")
+        _write_slice(name + ".tmp", synth, a, b, fmt)
+        os.replace(name + ".tmp", name)
+        paths.append(name)
+        if pace > 0:
+            time.sleep(max(0.0, start + b / synth.fs / pace - time.monotonic()))
+    return paths
+
+
+def _write_slice(path, synth, a, b, fmt):
+    block = synth.block(a, b)
+    if fmt == "praw":
+        with RawCaptureWriter(path, COLUMNS, fs=synth.fs, t0=block["time_s"][0]) as w:
+            w.write(block)
+    else:
+        import pandas as pd
+        pd.DataFrame(block).to_csv(path, index=False, float_format="%.6f")
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Generate synthetic regulator telemetry with SEL events")
+    ap.add_argument("output", nargs="?", help=f"capture path (.csv or {RAWCAP_SUFFIX})")
+    ap.add_argument("--duration", default="60", help="e.g. 90, 15m, 2h")
+    ap.add_argument("--fs", type=int, default=20000)
+    ap.add_argument("--scenario", choices=list(SCENARIOS), default="nominal")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--chunk", type=float, default=1.0, help="seconds per written chunk")
+    ap.add_argument("--fixed-point", action="store_true", help=f"int16 columns ({RAWCAP_SUFFIX} only)")
+    ap.add_argument("--events", help="also write the injected events to this CSV")
+    ap.add_argument("--set", nargs="*", default=[], metavar="KEY=VALUE", help="override NOMINAL parameters")
+    ap.add_argument("--buffer", help="drop files into this buffer directory instead of one capture")
+    ap.add_argument("--file-s", type=float, default=10.0, help="seconds per buffer file")
+    ap.add_argument("--format", choices=["praw", "csv"], default="praw", help="buffer file format")
+    ap.add_argument("--pace", type=float, default=0.0, help="buffer mode: × real time (0 = unthrottled)")
+    args = ap.parse_args()
+
+    try:
+        overrides = parse_overrides(args.set)
+    except ValueError as e:
+        ap.error(str(e))
+    duration = parse_duration(args.duration)
+
+    t = time.perf_counter()
+    if args.buffer:
+        paths = fill_buffer(args.buffer, duration, args.file_s, args.format, args.pace, args.fs,
+                            args.scenario, args.seed, **overrides)
+        synth = TelemetrySynth(duration, args.fs, args.scenario, args.seed, **overrides)
+        what = f"{len(paths)} files in {args.buffer}"
+    elif args.output:
+        synth = TelemetrySynth(duration, args.fs, args.scenario, args.seed, **overrides)
+        write_capture(args.output, synth, args.chunk, args.fixed_point)
+        what = f"{args.output} ({os.path.getsize(args.output)} B)"
+    else:
+        ap.error("give an output path or --buffer")
+    dt = time.perf_counter() - t
+    if args.events:
+        synth.event_table().to_csv(args.events, index=False)
+    print(f"{synth.n_samples} samples ({synth.duration_s:g} s @ {synth.fs} Hz, {len(synth.events)} SEL events) "
+          f"→ {what} in {dt:.1f} s ({synth.n_samples / dt / 1e6:.1f} M samples/s)")
@@ -0,0 +1,34 @@
+# tests/conftest.py
+import json, os, sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+
+@pytest.fixture
+def make_regulator(tmp_path):
+    """
+    make_regulator(threshold=None, **kw) → a Regulator under tmp_path whose active model is
+    fitted on quiet synthetic telemetry; `threshold` goes into its operating_point.json.
+    """
+    from sklearn.preprocessing import StandardScaler
+    from synth_telemetry import TelemetrySynth, write_capture
+    from ingest import extract_buffer_file
+    from healthy_store import RunningStats
+    from model_registry import ModelRegistry, train_and_publish, OPERATING_POINT_FILE
+    from regulator import Regulator
+
+    root = str(tmp_path / "models")
+    quiet = write_capture(str(tmp_path / "quiet.praw"), TelemetrySynth(20.0, fs=10000, scenario="quiet", seed=1))
+    X = extract_buffer_file(quiet)["features"][0]
+    scaler = StandardScaler().fit(X)
+    ModelRegistry(root).activate(train_and_publish(root, X, scaler, RunningStats.from_scaler(scaler), 0.56,
+                                                   dict(n_estimators=50, random_state=0)))
+
+    def make(threshold=None, **kw):
+        if threshold is not None:
+            with open(os.path.join(root, OPERATING_POINT_FILE), "w") as f:
+                json.dump({"threshold": threshold}, f)
+        return Regulator(root, str(tmp_path / "buffer"), **kw)
+    return make
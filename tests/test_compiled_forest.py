@@ -0,0 +1,65 @@
+# tests/test_compiled_forest.py
+"""CompiledForest against the scorers it replaces: sklearn (float mode) and features_if.c (Q15 mode)."""
+import ctypes, os, shutil, subprocess
+
+import numpy as np
+import pytest
+from sklearn.ensemble import IsolationForest
+from sklearn.preprocessing import StandardScaler
+
+from compiled_forest import CompiledForest
+from model_export import export_to_q15_header, quantize_model
+from ingest import extract_buffer_file
+from synth_telemetry import TelemetrySynth, write_capture
+
+FIRMWARE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "firmware_raspberry", "main")
+THRESHOLD = 0.56
+
+
+@pytest.fixture(scope="module")
+def model(tmp_path_factory):
+    """(iso, scaler, X raw): a forest fitted on nominal synthetic windows, X with SEL windows too."""
+    tmp = tmp_path_factory.mktemp("forest")
+    X = np.vstack([extract_buffer_file(write_capture(str(tmp / f"{s}.praw"), TelemetrySynth(
+        3.0, fs=10000, scenario=s, seed=4, sel_rate_per_h=3600.0)))["features"][0] for s in ("nominal", "storm")])
+    scaler = StandardScaler().fit(X)
+    iso = IsolationForest(n_estimators=40, random_state=0).fit(scaler.transform(X))
+    return iso, scaler, X
+
+
+def test_float_mode_matches_sklearn(model):
+    iso, scaler, X = model
+    Xs = scaler.transform(X)
+    cf = CompiledForest.from_estimator(iso)
+    np.testing.assert_array_equal(cf.score_samples(Xs), iso.score_samples(Xs))
+    np.testing.assert_array_equal(cf.decision_function(Xs), iso.decision_function(Xs))
+
+
+class _Features(ctypes.Structure):
+    _fields_ = [(name, ctypes.c_float) for name in ("dI_dt", "Vout_droop", "ripple_RMS", "efficiency", "dEff_dT")]
+
+
+def _firmware_scorer(iso, scaler, build_dir):
+    """iforest_score() of features_if.c with the model compiled in, or None without a C compiler."""
+    cc = shutil.which("cc") or shutil.which("gcc")
+    if cc is None:
+        return None
+    for name in ("features_if.c", "features_if.h", "params.h"):
+        shutil.copy(os.path.join(FIRMWARE_DIR, name), build_dir)
+    os.makedirs(os.path.join(build_dir, "ml"))
+    export_to_q15_header(iso, scaler, os.path.join(build_dir, "ml", "model_iforest.h"), threshold=THRESHOLD)
+    lib = os.path.join(build_dir, "libfeatures_if.so")
+    subprocess.run([cc, "-O2", "-shared", "-fPIC", "-ffp-contract=off", "-I", build_dir, "-o", lib,
+                    os.path.join(build_dir, "features_if.c"), "-lm"], check=True, capture_output=True)
+    fn = ctypes.CDLL(lib).iforest_score
+    fn.argtypes, fn.restype = [ctypes.POINTER(_Features)], ctypes.c_float
+    return lambda X: np.array([fn(ctypes.byref(_Features(*map(float, row)))) for row in X], dtype=np.float32)
+
+
+def test_q15_mode_is_bit_exact_with_the_firmware(model, tmp_path):
+    iso, scaler, X = model
+    firmware = _firmware_scorer(iso, scaler, str(tmp_path))
+    if firmware is None:
+        pytest.skip("no C compiler to build features_if.c")
+    ours = CompiledForest.from_q15(quantize_model(iso, scaler, THRESHOLD)).anomaly_score(X)
+    np.testing.assert_array_equal(np.asarray(ours, dtype=np.float32), firmware(X.astype(np.float32)))
@@ -0,0 +1,52 @@
+# tests/test_event_capture.py
+"""Event capture in the ingest path, and the packet encoding of non-finite samples."""
+import os
+
+import numpy as np
+
+from synth_telemetry import TelemetrySynth, write_capture
+from ingest import process_buffer_file
+from event_capture import EventCapture, encode_event, decode_event, decode_packets
+
+THRESHOLD = 0.70      # anomaly score: above the quiet windows of this model, below the SEL windows
+
+
+def test_labelled_sel_capture_produces_packets(make_regulator, tmp_path):
+    reg = make_regulator(THRESHOLD, event_dir=str(tmp_path / "events"))
+    synth = TelemetrySynth(10.0, fs=10000, scenario="storm", seed=1, sel_rate_per_h=1800.0)
+    path = write_capture(os.path.join(reg.buffer_dir, "storm.praw"), synth)
+    res = process_buffer_file(path, reg.iso, reg.scaler, reg.healthy_score, reg.version, capture=reg.event_options())
+    assert res["error"] is None and "events_error" not in res
+    assert res["events"], "no event triggered on a capture with labelled SELs"
+    kept = -reg.iso.decision_function(reg.scaler.transform(res["healthy"]))
+    assert (kept <= reg.event_options()["threshold"]).all(), "an event window was kept as healthy"
+
+    reg.save_events(res)
+    data = b"".join(open(e.path, "rb").read() for e in os.scandir(reg.event_dir))
+    events, problems = decode_packets(data)
+    assert not problems and len(events) == len(res["events"])
+    assert any((ev["raw"]["fault_label"] > 0).any() for ev in events)
+    for ev in events:                     # packet scores and threshold are in the same units
+        assert ev["score"] > ev["threshold"]
+
+
+def test_non_finite_samples_decode_as_nan():
+    fs, n = 10000.0, 2000
+    t = np.arange(n) / fs
+    raw = {"time_s": t, "Vin_V": 3.3 + 0.001 * np.sin(t * 50), "Temp_C": np.full(n, 25.0)}
+    raw["Temp_C"][[0, 700, 701, 1500]] = [np.nan, np.nan, np.inf, np.nan]
+    cap = EventCapture(fs, threshold=0.5, pre_ms=20.0, post_ms=50.0)
+    times = t[::20][10:-10]
+    scores = np.zeros(len(times))
+    scores[len(times) // 2] = 1.0
+    events = cap.push(raw, times, np.zeros((len(times), 5)), scores) + cap.flush()
+    assert len(events) == 1
+
+    ev = events[0]
+    out = decode_event(encode_event(ev))["raw"]
+    temp = np.asarray(ev["raw"])[:, list(ev["columns"]).index("Temp_C")]
+    bad = ~np.isfinite(temp)
+    assert bad.any()
+    assert np.isnan(out["Temp_C"].values[bad]).all()
+    np.testing.assert_allclose(out["Temp_C"].values[~bad], 25.0, atol=0.01)
+    np.testing.assert_allclose(out["Vin_V"].values, np.asarray(ev["raw"])[:, 1], atol=0.001)
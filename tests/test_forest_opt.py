@@ -0,0 +1,33 @@
+# tests/test_forest_opt.py
+"""Node index encodings of forest_opt.encode_layout."""
+import numpy as np
+import pytest
+
+from forest_opt import encode_layout
+from model_export import LAYOUT_TREE_LOCAL, LAYOUT_NARROW
+
+
+def _chain_tree(n_internal):
+    """One tree of `n_internal` splits, each with a leaf on the left: 2 * n_internal + 1 nodes."""
+    n = 2 * n_internal + 1
+    left, right = np.full(n, -1, np.int32), np.full(n, -1, np.int32)
+    split = np.arange(0, n - 1, 2)
+    left[split], right[split] = split + 1, split + 2
+    return {"feature": np.where(left >= 0, 0, -2).astype(np.int16), "threshold": np.zeros(n),
+            "children_left": left, "children_right": right, "node_samples": np.ones(n, np.int32),
+            "tree_offsets": np.zeros(1, np.int32), "max_samples": 256}
+
+
+def test_narrow_rejects_child_indices_beyond_int16():
+    flat = _chain_tree(20000)
+    with pytest.raises(ValueError, match="int16"):
+        encode_layout(flat, narrow=True)
+    wide = encode_layout(flat, tree_local=True)
+    assert wide["layout"] & LAYOUT_TREE_LOCAL and not wide["layout"] & LAYOUT_NARROW
+    assert wide["children_right"].max() == 2 * 20000
+
+
+def test_narrow_keeps_indices_that_fit():
+    flat = encode_layout(_chain_tree(1000), narrow=True)
+    assert flat["children_left"].dtype == np.int16 and flat["layout"] & LAYOUT_NARROW
+    np.testing.assert_array_equal(flat["children_right"], _chain_tree(1000)["children_right"])
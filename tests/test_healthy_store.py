@@ -0,0 +1,49 @@
+# tests/test_healthy_store.py
+"""HealthyStore checkpoints reopened with other settings."""
+import os
+
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+
+from healthy_store import HealthyStore
+
+
+def _saved_store(tmp_path, rows=1000, capacity=500, half_life_s=None):
+    scaler = StandardScaler().fit(np.random.default_rng(0).normal(size=(100, 5)))
+    path = str(tmp_path / "healthy_store.npz")
+    store = HealthyStore.open(path, scaler, capacity=capacity, half_life_s=half_life_s)
+    store.add(np.random.default_rng(1).normal(size=(rows, 5)), t=1000.0)
+    store.save()
+    return path, scaler, store
+
+
+def test_smaller_capacity_subsamples_on_open(tmp_path):
+    path, scaler, saved = _saved_store(tmp_path)
+    store = HealthyStore.open(path, scaler, capacity=200)
+    assert store.capacity == 200 and len(store) == 200
+    assert (store.rows[:, None, :] == saved.rows[None]).all(axis=2).any(axis=1).all()   # a subset of the saved rows
+    assert store.n_seen == saved.n_seen and store.stats.count == saved.stats.count
+
+    store.add(np.zeros((50, 5)))
+    assert len(store) == 200
+
+
+def test_larger_capacity_keeps_every_row(tmp_path):
+    path, scaler, saved = _saved_store(tmp_path)
+    store = HealthyStore.open(path, scaler, capacity=800)
+    assert store.capacity == 800 and len(store) == len(saved)
+    store.add(np.zeros((1000, 5)))
+    assert len(store) == 800
+
+
+def test_sampling_mode_is_converted_on_open(tmp_path):
+    path, scaler, saved = _saved_store(tmp_path)
+    store = HealthyStore.open(path, scaler, capacity=500, half_life_s=60.0)
+    assert store.half_life_s == 60.0 and len(store.keys) == len(store) == 500
+    store.add(np.ones((500, 5)), t=os.path.getmtime(path) + 600.0)   # ten half-lives newer than the kept rows
+    assert len(store) == 500 and (store.rows == 1.0).all(axis=1).mean() > 0.9
+
+    store.save()
+    back = HealthyStore.open(path, scaler, capacity=300)
+    assert back.half_life_s is None and len(back.keys) == 0 and len(back) == 300
+    back.add(np.zeros((10, 5)))
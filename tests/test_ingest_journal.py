@@ -0,0 +1,108 @@
+# tests/test_ingest_journal.py
+"""The claim / record / commit / recover protocol, through a Regulator and its restarts."""
+import os
+
+import regulator
+from synth_telemetry import TelemetrySynth, write_capture
+from ingest import process_buffer_file, extract_buffer_file
+from ingest_journal import DONE, PARTIAL, FAILED, QUARANTINED
+
+
+def _capture(reg, name, seconds=2.0, seed=3):
+    return write_capture(os.path.join(reg.buffer_dir, name), TelemetrySynth(seconds, fs=10000, seed=seed))
+
+
+def _ingest(reg, path, complete=True):
+    """One file through the service path: claim, score, record, into the store (no checkpoint)."""
+    work = reg.claim(path, complete)
+    assert work is not None
+    res = process_buffer_file(path, reg.iso, reg.scaler, reg.healthy_score, reg.version, *work)
+    reg.absorb([reg.record(res)])
+    return res
+
+
+def _restart(reg, make_regulator):
+    """Power cut: the in-memory store and everything after the last checkpoint are lost."""
+    reg.journal.close()
+    reg = make_regulator()
+    reg.start()
+    return reg
+
+
+def test_crash_before_commit_reads_the_file_again(make_regulator):
+    reg = make_regulator()
+    path = _capture(reg, "a.praw")
+    kept = len(_ingest(reg, path)["healthy"])
+    assert kept
+
+    reg = _restart(reg, make_regulator)
+    assert len(reg.store) == 0 and os.path.exists(path)
+    assert len(_ingest(reg, path)["healthy"]) == kept
+    reg.checkpoint()
+    assert len(reg.store) == kept and not os.path.exists(path)
+
+
+def test_crash_after_store_save_commits_once(make_regulator):
+    reg = make_regulator()
+    path = _capture(reg, "a.praw")
+    kept = len(_ingest(reg, path)["healthy"])
+    reg.journal.sync()                          # checkpoint() up to the store save, then the crash
+    reg.store.epoch += 1
+    reg.store.save()
+
+    reg = _restart(reg, make_regulator)
+    assert len(reg.store) == kept
+    assert not os.path.exists(path)             # committed by recover() and deleted, not read again
+    assert reg.claim(path) is None
+
+
+def test_growing_csv_continues_from_its_byte_offset(make_regulator):
+    reg = make_regulator()
+    whole = _capture(reg, "whole.csv", seconds=1.0)
+    data = open(whole, "rb").read()
+    ref = extract_buffer_file(whole)
+    os.remove(whole)
+
+    path = os.path.join(reg.buffer_dir, "growing.csv")
+    with open(path, "wb") as f:
+        f.write(data[:len(data) // 2 + 7])     # ends mid-line and mid-window
+    first = _ingest(reg, path, complete=False)
+    assert 0 < first["byte_end"] < len(data) // 2
+    reg.checkpoint()
+    row = reg.journal.get(path)
+    assert row["status"] == PARTIAL and row["byte_done"] == first["byte_end"]
+
+    with open(path, "ab") as f:
+        f.write(data[len(data) // 2 + 7:])
+    work = reg.claim(path)
+    assert work == (first["rows_end"], first["byte_end"])
+    second = process_buffer_file(path, reg.iso, reg.scaler, reg.healthy_score, reg.version, *work)
+    reg.absorb([reg.record(second)])
+    assert first["n_windows"] + second["n_windows"] == ref["n_windows"]
+    assert (second["rows_end"], second["byte_end"]) == (ref["rows_end"], ref["byte_end"])
+    reg.checkpoint()
+    assert not os.path.exists(path) and reg.journal.status(path) == DONE
+
+
+def test_failing_capture_is_quarantined_after_max_attempts(make_regulator):
+    reg = make_regulator()
+    path = os.path.join(reg.buffer_dir, "broken.csv")
+    with open(path, "w") as f:
+        f.write("time_s,Vin_V\n0.0,3.3\n")
+    for attempt in range(1, regulator.INGEST_MAX_ATTEMPTS + 1):
+        res = _ingest(reg, path)
+        assert res["error"]
+        row = reg.journal.get(path)
+        assert row["attempts"] == attempt
+        assert row["status"] == (QUARANTINED if attempt == regulator.INGEST_MAX_ATTEMPTS else FAILED)
+    assert not os.path.exists(path)
+    assert os.path.exists(os.path.join(reg.quarantine_dir, "broken.csv"))
+
+
+def test_checkpoint_forgets_deleted_captures(make_regulator, monkeypatch):
+    monkeypatch.setattr(regulator, "JOURNAL_FORGET_SEC", -1.0)
+    reg = make_regulator()
+    path = _capture(reg, "a.praw")
+    _ingest(reg, path)
+    reg.checkpoint()
+    assert not os.path.exists(path) and reg.journal.counts() == {}
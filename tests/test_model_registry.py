@@ -0,0 +1,23 @@
+# tests/test_model_registry.py
+"""ModelRegistry side effects."""
+import os
+
+import numpy as np
+from sklearn.ensemble import IsolationForest
+from sklearn.preprocessing import StandardScaler
+
+from model_registry import ModelRegistry
+
+
+def test_versions_dir_is_created_by_the_first_publish(tmp_path):
+    root = str(tmp_path / "models")
+    os.makedirs(root)
+    reg = ModelRegistry(root)
+    assert reg.versions() == [] and reg.current() is None
+    assert os.listdir(root) == []
+
+    X = np.random.default_rng(0).normal(size=(200, 5))
+    scaler = StandardScaler().fit(X)
+    vid = reg.publish(IsolationForest(n_estimators=10, random_state=0).fit(scaler.transform(X)), scaler)
+    assert reg.versions() == [vid]
+    assert reg.activate(vid) == vid and reg.current() == vid
@@ -0,0 +1,61 @@
+# tests/test_watchdog.py
+"""Heartbeat daemon gating on the liveness file, and its reset reaction latency."""
+import os, time, threading, importlib.util
+
+import liveness
+
+HEARTBEAT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "watchdog system",
+                         "Raspberypi Heartbeat.py")
+_spec = importlib.util.spec_from_file_location("heartbeat", HEARTBEAT)
+hb = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(hb)
+
+
+def _pulses(gpio):
+    return sum(1 for _, pin, level in gpio.history if pin == hb.HEARTBEAT_PIN and not level)
+
+
+def _run_for(daemon, seconds):
+    t = threading.Thread(target=daemon.run)
+    t.start()
+    time.sleep(seconds)
+    daemon.stop()
+    t.join(timeout=5)
+    assert not t.is_alive()
+
+
+def _daemon(path, period=0.02):
+    gpio = hb.MemoryGPIOBackend()
+    d = hb.HeartbeatDaemon(gpio, liveness_path=path, period=period, boot_grace=0.0, on_reset=lambda: None)
+    d.setup()
+    return gpio, d
+
+
+def test_missing_file_is_ungated(tmp_path):
+    path = str(tmp_path / "liveness.json")
+    assert liveness.stale(path) == []
+    gpio, d = _daemon(path)
+    _run_for(d, 0.2)
+    assert d.withheld == 0 and _pulses(gpio) >= 5
+
+
+def test_stale_stage_withholds_heartbeat(tmp_path):
+    path = str(tmp_path / "liveness.json")
+    beats = liveness.Liveness(path)
+    beats.beat(*liveness.STAGES)
+    beats.flush()
+    assert liveness.stale(path) == []
+    now = time.time()
+    assert liveness.stale(path, now=now + 60) == ["ingest", "retrain"]
+
+    gpio, d = _daemon(path)
+    d.max_age = {"ingest": 0.05, "score": 10.0, "retrain": 10.0}
+    time.sleep(0.1)
+    _run_for(d, 0.2)
+    assert _pulses(gpio) == 0 and d.withheld >= 5
+
+
+def test_reset_reaction_latency():
+    lat = hb.simulate(n=20, period=0.02)
+    assert len(lat) == 20 and all(x is not None for x in lat)
+    assert max(lat) < 0.05                # edge callback, not the heartbeat period
@@ -1,99 +1,285 @@
 #!/usr/bin/env python3
-import RPi.GPIO as GPIO
+"""
+Raspberry Pi side of the ESP32 hardware watchdog.
+
+- Heartbeat: a 10 ms LOW pulse on HEARTBEAT_PIN every 2 s, sent only while the ML pipeline
+  (src/main.py or src/rails.py) reports every stage live in models/liveness.json (see src/liveness.py).
+  The first BOOT_GRACE_S after start are not gated, so the pipeline has time to come up.
+- Reset: a falling-edge callback on RESET_PIN wakes the main loop at once; there is no
+  polling delay between the ESP32 pulling the line low and the graceful shutdown.
+- GPIO goes through a backend: RPiGPIOBackend on the Pi, MemoryGPIOBackend anywhere else.
+
+  sudo python3 "Raspberypi Heartbeat.py"
+  python3 "Raspberypi Heartbeat.py" --simulate 200     # reset reaction latency, no hardware
+"""
+import os
+import sys
 import time
 import logging
-import os
+import threading
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+import liveness
 
 # GPIO setup
 HEARTBEAT_PIN = 17    # GPIO17 -> ESP32 D25
 RESET_PIN = 27        # GPIO27 <- ESP32 D26 (reset signal)
 STATUS_LED = 18       # GPIO18 for status LED (optional)
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/var/log/heartbeat.log'),
-        logging.StreamHandler()
-    ]
-)
-
-def setup_gpio():
-    GPIO.setmode(GPIO.BCM)
-    GPIO.setup(HEARTBEAT_PIN, GPIO.OUT)
-    GPIO.setup(RESET_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-    GPIO.setup(STATUS_LED, GPIO.OUT)
-    
-    GPIO.output(HEARTBEAT_PIN, GPIO.HIGH)
-    GPIO.output(STATUS_LED, GPIO.LOW)
-
-def send_heartbeat():
-    """Send heartbeat pulse to ESP32"""
-    GPIO.output(HEARTBEAT_PIN, GPIO.LOW)
-    time.sleep(0.01)  # 10ms pulse
-    GPIO.output(HEARTBEAT_PIN, GPIO.HIGH)
-
-def blink_led():
-    """Toggle status LED"""
-    GPIO.output(STATUS_LED, not GPIO.input(STATUS_LED))
-
-def check_reset_signal():
-    """Check if ESP32 is sending reset signal"""
-    return GPIO.input(RESET_PIN) == GPIO.LOW
+HEARTBEAT_PERIOD_S = 2.0
+PULSE_S = 0.01
+BOOT_GRACE_S = 120.0
+LIVENESS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "models", "liveness.json")
+STATUS_EVERY_S = 30.0
+
+log = logging.getLogger("heartbeat")
+
+
+# -------------------------------------------------
+# GPIO backends
+# -------------------------------------------------
+class GPIOBackend:
+    """Pin access used by the daemon; levels are True (HIGH) / False (LOW)."""
+
+    def setup_output(self, pin, level):
+        raise NotImplementedError
+
+    def setup_input(self, pin, pull_up=True):
+        raise NotImplementedError
+
+    def write(self, pin, level):
+        raise NotImplementedError
+
+    def read(self, pin):
+        raise NotImplementedError
+
+    def on_falling(self, pin, callback, bouncetime_ms=50):
+        """Call `callback(pin)` on every falling edge of an input pin."""
+        raise NotImplementedError
+
+    def cleanup(self):
+        pass
+
+
+class RPiGPIOBackend(GPIOBackend):
+    """RPi.GPIO, BCM numbering; edge callbacks run on RPi.GPIO's event thread."""
+
+    def __init__(self):
+        import RPi.GPIO as GPIO
+        self.GPIO = GPIO
+        GPIO.setmode(GPIO.BCM)
+
+    def setup_output(self, pin, level):
+        self.GPIO.setup(pin, self.GPIO.OUT, initial=self.GPIO.HIGH if level else self.GPIO.LOW)
+
+    def setup_input(self, pin, pull_up=True):
+        self.GPIO.setup(pin, self.GPIO.IN, pull_up_down=self.GPIO.PUD_UP if pull_up else self.GPIO.PUD_DOWN)
+
+    def write(self, pin, level):
+        self.GPIO.output(pin, self.GPIO.HIGH if level else self.GPIO.LOW)
+
+    def read(self, pin):
+        return self.GPIO.input(pin) == self.GPIO.HIGH
+
+    def on_falling(self, pin, callback, bouncetime_ms=50):
+        self.GPIO.add_event_detect(pin, self.GPIO.FALLING, callback=callback, bouncetime=bouncetime_ms)
+
+    def cleanup(self):
+        self.GPIO.cleanup()
+
+
+class MemoryGPIOBackend(GPIOBackend):
+    """
+    In-memory pins for tests and simulation. `drive(pin, level)` plays the other end of a
+    wire (the ESP32); every output change is kept in `history` as (monotonic time, pin, level).
+    """
+
+    def __init__(self):
+        self.levels = {}
+        self.history = []
+        self._callbacks = {}
+        self._lock = threading.Lock()
+
+    def setup_output(self, pin, level):
+        self.write(pin, level)
+
+    def setup_input(self, pin, pull_up=True):
+        self.levels.setdefault(pin, pull_up)
+
+    def write(self, pin, level):
+        with self._lock:
+            self.levels[pin] = bool(level)
+            self.history.append((time.monotonic(), pin, bool(level)))
+
+    def read(self, pin):
+        return self.levels.get(pin, True)
+
+    def on_falling(self, pin, callback, bouncetime_ms=50):
+        self._callbacks.setdefault(pin, []).append(callback)
+
+    def drive(self, pin, level):
+        prev = self.levels.get(pin, True)
+        self.levels[pin] = bool(level)
+        if prev and not level:
+            for cb in self._callbacks.get(pin, []):
+                cb(pin)
+
+
+# -------------------------------------------------
+# Daemon
+# -------------------------------------------------
+class HeartbeatDaemon:
+    def __init__(self, gpio, liveness_path=LIVENESS_PATH, period=HEARTBEAT_PERIOD_S,
+                 boot_grace=BOOT_GRACE_S, on_reset=None, max_age=liveness.MAX_AGE_S):
+        self.gpio = gpio
+        self.liveness_path = liveness_path
+        self.period, self.boot_grace, self.max_age = period, boot_grace, max_age
+        self.on_reset = on_reset or graceful_shutdown
+        self.reset_event = threading.Event()
+        self.reset_at = None                # monotonic time of the falling edge
+        self.stopped = threading.Event()
+        self.heartbeat_count = 0
+        self.withheld = 0
+        self.started = None
+
+    def setup(self):
+        self.gpio.setup_output(HEARTBEAT_PIN, True)
+        self.gpio.setup_input(RESET_PIN, pull_up=True)
+        self.gpio.setup_output(STATUS_LED, False)
+        self.gpio.on_falling(RESET_PIN, self._reset_edge)
+
+    def _reset_edge(self, pin):
+        if self.reset_at is None:
+            self.reset_at = time.monotonic()
+        self.reset_event.set()
+
+    def send_heartbeat(self):
+        """Send heartbeat pulse to ESP32"""
+        self.gpio.write(HEARTBEAT_PIN, False)
+        self.reset_event.wait(PULSE_S)      # cut short by a reset edge
+        self.gpio.write(HEARTBEAT_PIN, True)
+
+    def blink_led(self):
+        """Toggle status LED"""
+        self.gpio.write(STATUS_LED, not self.gpio.read(STATUS_LED))
+
+    def pipeline_stale(self):
+        """Stages that stopped beating; empty while ungated (no liveness file, boot grace)."""
+        if self.liveness_path is None or time.monotonic() - self.started < self.boot_grace:
+            return []
+        return liveness.stale(self.liveness_path, self.max_age)
+
+    def run(self):
+        """Heartbeat until a reset edge (→ on_reset) or stop(); returns the reaction latency."""
+        self.started = time.monotonic()
+        next_beat = last_status = self.started
+        last_stale = []
+        while not self.stopped.is_set():
+            if self.reset_event.wait(timeout=max(0.0, next_beat - time.monotonic())):
+                if self.stopped.is_set():
+                    break
+                latency = time.monotonic() - self.reset_at
+                log.info(f"Reset signal received from ESP32 ({latency * 1e3:.2f} ms after the edge)")
+                self.gpio.write(STATUS_LED, True)     # solid ON: shutting down
+                self.on_reset()
+                return latency
+            stale = self.pipeline_stale()
+            if stale:
+                self.withheld += 1
+                if stale != last_stale:
+                    log.warning(f"Withholding heartbeat: pipeline stages not live: {', '.join(stale)}")
+            else:
+                if last_stale:
+                    log.info("Pipeline live again; heartbeats resumed")
+                self.send_heartbeat()
+                self.heartbeat_count += 1
+                self.blink_led()
+            last_stale = stale
+            next_beat += self.period
+            now = time.monotonic()
+            if now - last_status > STATUS_EVERY_S:
+                log.info(f"Heartbeats sent: {self.heartbeat_count}, withheld: {self.withheld}")
+                last_status = now
+        return None
+
+    def stop(self):
+        self.stopped.set()
+        self.reset_event.set()
+
 
 def graceful_shutdown():
     """Perform graceful shutdown when reset signal is received"""
-    logging.info("Reset signal received from ESP32! Performing graceful shutdown...")
-    
-    # Turn LED solid ON to indicate shutdown
-    GPIO.output(STATUS_LED, GPIO.HIGH)
-    
-    # Perform shutdown and reboot
-    os.system("sudo shutdown -r now")
+    log.info("Performing graceful shutdown...")
+    subprocess.call(["sudo", "shutdown", "-r", "now"])
+
+
+def simulate(n=100, period=0.05):
+    """
+    Reset reaction latency with the in-memory backend: a simulated ESP32 pulls RESET_PIN low
+    at a random point of the heartbeat cycle, `n` times.
+
+    Returns:
+        list: latencies in seconds (edge → on_reset)
+    """
+    import random
+    lat = []
+    for i in range(n):
+        gpio = MemoryGPIOBackend()
+        d = HeartbeatDaemon(gpio, liveness_path=None, period=period, on_reset=lambda: None)
+        d.setup()
+        esp32 = threading.Timer(random.uniform(0, 3 * period), gpio.drive, (RESET_PIN, False))
+        esp32.start()
+        lat.append(d.run())
+    return lat
+
 
 def main():
-    setup_gpio()
-    logging.info("Raspberry Pi Heartbeat Started")
-    
-    # Blink LED quickly at startup
-    for i in range(5):
-        GPIO.output(STATUS_LED, GPIO.HIGH)
-        time.sleep(0.2)
-        GPIO.output(STATUS_LED, GPIO.LOW)
-        time.sleep(0.2)
-    
-    heartbeat_count = 0
-    last_status_time = time.time()
-    
+    import argparse
+    ap = argparse.ArgumentParser(description="Raspberry Pi heartbeat for the ESP32 watchdog")
+    ap.add_argument("--liveness", default=LIVENESS_PATH, help="pipeline liveness file ('' → ungated)")
+    ap.add_argument("--boot-grace", type=float, default=BOOT_GRACE_S)
+    ap.add_argument("--simulate", type=int, metavar="N", help="measure reset reaction latency, no hardware")
+    args = ap.parse_args()
+
+    if args.simulate:
+        logging.basicConfig(level=logging.WARNING)
+        lat = sorted(simulate(args.simulate))
+        pct = lambda q: lat[min(len(lat) - 1, int(q * len(lat)))] * 1e3
+        print(f"{len(lat)} resets: reaction latency p50 {pct(0.5):.3f} ms, p99 {pct(0.99):.3f} ms, "
+              f"max {lat[-1] * 1e3:.3f} ms (the old 2 s poll: up to 2000 ms)")
+        return
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('/var/log/heartbeat.log'),
+            logging.StreamHandler()
+        ]
+    )
+    gpio = RPiGPIOBackend()
+    daemon = HeartbeatDaemon(gpio, liveness_path=args.liveness or None, boot_grace=args.boot_grace)
     try:
-        while True:
-            # Send heartbeat every 2 seconds
-            send_heartbeat()
-            heartbeat_count += 1
-            
-            # Blink LED during normal operation
-            blink_led()
-            
-            # Check for reset signal from ESP32
-            if check_reset_signal():
-                graceful_shutdown()
-                break
-            
-            # Print status every 30 seconds
-            if time.time() - last_status_time > 30:
-                logging.info(f"Heartbeats sent: {heartbeat_count}")
-                last_status_time = time.time()
-            
-            time.sleep(1.99)  # ~2 second cycle
-            
+        daemon.setup()
+        log.info("Raspberry Pi Heartbeat Started")
+
+        # Blink LED quickly at startup
+        for i in range(5):
+            gpio.write(STATUS_LED, True)
+            time.sleep(0.2)
+            gpio.write(STATUS_LED, False)
+            time.sleep(0.2)
+
+        daemon.run()
     except KeyboardInterrupt:
-        logging.info("Heartbeat monitor stopped by user")
-        GPIO.output(STATUS_LED, GPIO.LOW)
+        log.info("Heartbeat monitor stopped by user")
+        gpio.write(STATUS_LED, False)
     except Exception as e:
-        logging.error(f"Error in heartbeat monitor: {e}")
+        log.error(f"Error in heartbeat monitor: {e}")
     finally:
-        GPIO.cleanup()
+        gpio.cleanup()
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,157 +1,433 @@
 #!/usr/bin/env python3
-import time
-import threading
+"""
+Discrete-event simulation of the ESP32 / Raspberry Pi hardware watchdog.
+
+Everything runs on a virtual clock (a heap of timed events), so a hang-and-reset cycle that
+takes tens of seconds on the bench is simulated in microseconds, and Monte-Carlo campaigns
+of thousands of randomized scenarios finish in seconds.
+
+The wires are GPIO lines with edge callbacks, as on the hardware (both idle HIGH):
+  heartbeat  Pi GPIO17 -> ESP32 D25, 10 ms LOW pulse per cycle, ESP32 ISR on FALLING
+  reset      ESP32 D26 -> Pi GPIO27, held LOW for 1 s on a watchdog timeout
+
+ESP32Simulator follows `esp 32 watchdog.cpp`: the ISR stamps the heartbeat, loop() runs every
+100 ms and resets once millis() - lastHeartbeat > 10 s while piRunning, then blocks 3 s in
+resetPi() and clears piRunning. `esp_detect="poll"` instead samples the line level once
+per loop, like the old threaded simulation (which mostly missed the 10 ms pulse).
+
+RaspberryPiSimulator follows `Raspberypi Heartbeat.py`: a pulse every 2 s. How it notices
+the reset line is `pi_reset`:
+  poll   level read once per cycle, right after the pulse (the original script)
+  edge   falling-edge callback (the daemon); an edge that arrives while the Pi hangs is
+         handled on resume
+  hard   reset wired to the RUN pin: the Pi restarts whatever state it is in
+
+  python3 "Watchdog simulation.py"                          # scripted hang / recovery timeline
+  python3 "Watchdog simulation.py" --campaign 5000          # randomized scenarios, statistics
+  python3 "Watchdog simulation.py" --campaign 5000 --esp-detect poll --pi-reset hard
+"""
+import bisect
+import heapq
+import itertools
+import math
 import random
+import time
+
+HEARTBEAT_PERIOD_S = 2.0      # Pi cycle (send_heartbeat + sleep 1.99)
+PULSE_S = 0.01                # heartbeat pulse width
+WATCHDOG_TIMEOUT_S = 10.0     # WATCHDOG_TIMEOUT
+ESP_LOOP_S = 0.1              # delay(100) in loop()
+RESET_HOLD_S = 1.0            # RESET_PIN held LOW
+RESET_BLOCK_S = 3.0           # resetPi() returns after 1 s + 2 s of delay()
+BOOT_S = 25.0                 # Pi reboot until the heartbeat script runs (incl. 2 s LED blink)
+HORIZON_S = 180.0             # virtual seconds per Monte-Carlo scenario
+SCENARIOS = {"hang": 0.4, "transient": 0.2, "reboot": 0.2, "jitter": 0.2}
+
+
+class Simulator:
+    """Virtual clock and event queue; events at the same time run in scheduling order."""
 
-class VirtualGPIOSystem:
     def __init__(self):
-        self.heartbeat_line = False
-        self.reset_line = False
+        self.now = 0.0
+        self._queue = []
+        self._seq = itertools.count()
+        self.events = 0
+
+    def at(self, t, fn, *args):
+        heapq.heappush(self._queue, (t, next(self._seq), fn, args))
+
+    def after(self, dt, fn, *args):
+        self.at(self.now + dt, fn, *args)
+
+    def run(self, until):
+        q = self._queue
+        while q and q[0][0] <= until:
+            t, _, fn, args = heapq.heappop(q)
+            self.now = t
+            self.events += 1
+            fn(*args)
+        self.now = until
+
+
+class Line:
+    """One GPIO line: a level plus callbacks on its falling and rising edges."""
+
+    def __init__(self, sim, level=True):
+        self.sim = sim
+        self.level = level
+        self._callbacks = {False: [], True: []}     # new level -> callbacks
+
+    def on_falling(self, fn):
+        self._callbacks[False].append(fn)
+
+    def on_rising(self, fn):
+        self._callbacks[True].append(fn)
+
+    def set(self, level):
+        if level == self.level:
+            return
+        self.level = level
+        for fn in self._callbacks[level]:
+            fn()
+
+    def pulse(self, width, level=False):
+        self.set(level)
+        self.sim.after(width, self.set, not level)
+
+
+class VirtualGPIOSystem:
+    def __init__(self, sim):
+        self.sim = sim
+        self.heartbeat_line = Line(sim)
+        self.reset_line = Line(sim)
         self.esp32_led = False
-        
-    def pi_send_heartbeat(self):
-        """Raspberry Pi sends heartbeat pulse"""
-        self.heartbeat_line = True
-        time.sleep(0.01)  # 10ms pulse
-        self.heartbeat_line = False
-        
+
+    def pi_send_heartbeat(self, width=PULSE_S):
+        """Raspberry Pi sends heartbeat pulse (active low)"""
+        self.heartbeat_line.pulse(width)
+
     def esp32_detect_heartbeat(self):
-        """ESP32 detects heartbeat"""
-        return self.heartbeat_line
-    
-    def esp32_send_reset(self):
-        """ESP32 sends reset signal"""
-        self.reset_line = True
-        time.sleep(1)  # 1 second reset pulse
-        self.reset_line = False
-        
+        """Level seen by a polling ESP32"""
+        return not self.heartbeat_line.level
+
+    def esp32_send_reset(self, hold=RESET_HOLD_S):
+        """ESP32 holds the reset line low"""
+        self.reset_line.pulse(hold)
+
     def pi_detect_reset(self):
-        """Raspberry Pi detects reset signal"""
-        return self.reset_line
+        """Level seen by a polling Raspberry Pi"""
+        return not self.reset_line.level
+
 
 class ESP32Simulator:
-    def __init__(self, gpio_system):
+    def __init__(self, gpio_system, timeout=WATCHDOG_TIMEOUT_S, loop_s=ESP_LOOP_S, detect="edge",
+                 phase=0.0, log=None):
+        if detect not in ("edge", "poll"):
+            raise ValueError(f"Unknown heartbeat detection: {detect}")
         self.gpio = gpio_system
-        self.last_heartbeat = time.time()
-        self.timeout = 10  # seconds
+        self.sim = gpio_system.sim
+        self.timeout, self.loop_s, self.detect = timeout, loop_s, detect
+        self.log = log or (lambda who, msg: None)
+        self.last_heartbeat = self.sim.now
         self.pi_running = False
-        self.led_state = False
-        
-    def run(self):
-        print("ESP32: Watchdog started - Monitoring Raspberry Pi")
-        
-        while True:
-            current_time = time.time()
-            
-            # Check for heartbeat
-            if self.gpio.esp32_detect_heartbeat():
-                self.last_heartbeat = current_time
-                self.pi_running = True
-                print("ESP32: Heartbeat detected")
-                
-            # Check for timeout
-            if current_time - self.last_heartbeat > self.timeout:
-                if self.pi_running:
-                    print("ESP32: *** WATCHDOG TIMEOUT - RESETTING RASPBERRY PI ***")
-                    self.gpio.esp32_send_reset()
-                    self.pi_running = False
-                    self.last_heartbeat = current_time
-                    print("ESP32: Reset completed")
-                    
-            # Blink LED
-            if int(current_time) % 2 == 0:
-                self.led_state = not self.led_state
-                
-            time.sleep(0.1)
+        self.heartbeats_seen = 0
+        self.resets = []                    # virtual times the reset line went low
+        self._tick0 = self.sim.now + phase  # loop() iterations run at _tick0 + k * loop_s
+        self._gen = 0                       # invalidates scheduled timeout checks
+        self._blocked_until = -math.inf
+
+    def start(self):
+        self.log("ESP32", "Watchdog started - Monitoring Raspberry Pi")
+        if self.detect == "edge":
+            self.gpio.heartbeat_line.on_falling(self._isr)
+        else:
+            self.sim.at(self._tick0, self._poll)
+
+    def _isr(self):
+        self.last_heartbeat = self.sim.now
+        self.pi_running = True
+        self.heartbeats_seen += 1
+        self._arm()
+
+    def _next_tick(self, t):
+        """First loop() iteration strictly after t."""
+        k = math.floor((t - self._tick0) / self.loop_s) + 1
+        return self._tick0 + k * self.loop_s
+
+    def _arm(self):
+        # loop() only acts once the timeout has passed; skip the idle iterations
+        self._gen += 1
+        if self.pi_running:
+            t = max(self._next_tick(self.last_heartbeat + self.timeout), self._blocked_until)
+            self.sim.at(t, self._check, self._gen)
+
+    def _check(self, gen):
+        if gen == self._gen and self.pi_running and self.sim.now - self.last_heartbeat > self.timeout:
+            self._reset_pi()
+
+    def _poll(self):
+        if self.gpio.esp32_detect_heartbeat():
+            self.last_heartbeat = self.sim.now
+            self.pi_running = True
+            self.heartbeats_seen += 1
+        if self.pi_running and self.sim.now - self.last_heartbeat > self.timeout:
+            self._reset_pi()
+            return
+        self.sim.after(self.loop_s, self._poll)
+
+    def _reset_pi(self):
+        now = self.sim.now
+        self.log("ESP32", "*** WATCHDOG TIMEOUT - RESETTING RASPBERRY PI ***")
+        self.resets.append(now)
+        self.gpio.esp32_led = True
+        self.gpio.esp32_send_reset()
+        self._blocked_until = now + RESET_BLOCK_S
+        self.sim.at(self._blocked_until, self._reset_done)
+
+    def _reset_done(self):
+        # heartbeats seen during the delay() calls are overwritten, as in resetPi()
+        self.gpio.esp32_led = False
+        self.last_heartbeat = self.sim.now
+        self.pi_running = False
+        self._tick0 = self.sim.now
+        self.log("ESP32", "Reset completed")
+        if self.detect == "poll":
+            self.sim.after(self.loop_s, self._poll)
+        else:
+            self._gen += 1
+
 
 class RaspberryPiSimulator:
-    def __init__(self, gpio_system):
+    def __init__(self, gpio_system, period=HEARTBEAT_PERIOD_S, jitter=0.0, boot_s=BOOT_S,
+                 reset_mode="edge", rng=None, log=None):
+        if reset_mode not in ("poll", "edge", "hard"):
+            raise ValueError(f"Unknown reset handling: {reset_mode}")
         self.gpio = gpio_system
+        self.sim = gpio_system.sim
+        self.period, self.jitter, self.boot_s, self.reset_mode = period, jitter, boot_s, reset_mode
+        self.rng = rng or random.Random(0)
+        self.log = log or (lambda who, msg: None)
+        self.state = "running"              # running | hung | booting
+        self.history = [(self.sim.now, self.state)]
+        self.heartbeat_count = 0            # since the last boot
+        self.heartbeats_sent = 0
+        self.reboots = []                   # (time, cause)
+        self._gen = 0                       # invalidates the scheduled heartbeat cycle
+        self._reset_latched = False
+
+    def start(self, delay=0.0):
+        self.log("Raspberry Pi", "System started - Sending heartbeats")
+        if self.reset_mode != "poll":
+            self.gpio.reset_line.on_falling(self._reset_edge)
+        self.sim.after(delay, self._cycle, self._gen)
+
+    def _cycle(self, gen):
+        if gen != self._gen or self.state != "running":
+            return
+        self.gpio.pi_send_heartbeat()
+        self.heartbeat_count += 1
+        self.heartbeats_sent += 1
+        if self.reset_mode == "poll" and self.gpio.pi_detect_reset():
+            self.reboot("reset")
+            return
+        dt = self.period + (self.rng.uniform(-self.jitter, self.jitter) if self.jitter else 0.0)
+        self.sim.after(max(dt, PULSE_S), self._cycle, gen)
+
+    def _set_state(self, state):
+        self.state = state
+        self.history.append((self.sim.now, state))
+
+    def state_before(self, t):
+        """State just before time t (so a reset sees what it interrupted)."""
+        i = bisect.bisect_left(self.history, (t,)) - 1
+        return self.history[max(i, 0)][1]
+
+    def _reset_edge(self):
+        if self.reset_mode == "hard" or self.state == "running":
+            self.reboot("reset")
+        elif self.state == "hung":
+            self._reset_latched = True      # the callback runs when the Pi comes back
+
+    def hang(self, duration=math.inf):
+        if self.state == "hung":
+            return
+        self.log("Raspberry Pi", "*** SIMULATING HANG - No heartbeats ***")
+        self._set_state("hung")
+        self._gen += 1
+        if math.isfinite(duration):
+            self.sim.after(duration, self._resume, self._gen)
+
+    def _resume(self, gen):
+        if gen != self._gen or self.state != "hung":
+            return
+        self.log("Raspberry Pi", "Resuming normal operation")
+        self._set_state("running")
+        if self._reset_latched:
+            self.reboot("reset")
+        else:
+            self._cycle(self._gen)
+
+    def reboot(self, cause="reset", boot_s=None):
+        self.log("Raspberry Pi", f"*** REBOOTING ({cause}) ***")
+        self.reboots.append((self.sim.now, cause))
+        self._set_state("booting")
+        self._reset_latched = False
+        self._gen += 1
+        self.sim.after(self.boot_s if boot_s is None else boot_s, self._booted, self._gen)
+
+    def _booted(self, gen):
+        if gen != self._gen:
+            return
+        self.log("Raspberry Pi", "System rebooted")
+        self._set_state("running")
         self.heartbeat_count = 0
-        self.is_running = True
-        self.simulate_hang = False
-        
-    def run(self):
-        print("Raspberry Pi: System started - Sending heartbeats")
-        
-        while self.is_running:
-            if not self.simulate_hang:
-                # Normal operation - send heartbeat
-                self.gpio.pi_send_heartbeat()
-                self.heartbeat_count += 1
-                
-                # Print status occasionally
-                if self.heartbeat_count % 5 == 0:
-                    print(f"Raspberry Pi: Heartbeat #{self.heartbeat_count}")
-                    
-            else:
-                # Hang simulation - no heartbeats
-                print("Raspberry Pi: *** SIMULATING HANG - No heartbeats ***")
-                time.sleep(15)
-                self.simulate_hang = False
-                print("Raspberry Pi: Resuming normal operation")
-                
-            # Check for reset signal
-            if self.gpio.pi_detect_reset():
-                print("Raspberry Pi: *** RESET SIGNAL RECEIVED - Rebooting ***")
-                time.sleep(3)  # Simulate reboot time
-                self.heartbeat_count = 0
-                print("Raspberry Pi: System rebooted")
-                
-            time.sleep(2)  # 2 second cycle
+        self._cycle(self._gen)
+
+
+# -------------------------------------------------
+# Scenarios
+# -------------------------------------------------
+def build(esp_detect="edge", pi_reset="edge", jitter=0.0, boot_s=BOOT_S, rng=None, log=None, sim=None):
+    """Wired-up (sim, gpio, esp32, pi); the ESP32 loop phase is random when `rng` is given."""
+    rng = rng or random.Random(0)
+    sim = sim or Simulator()
+    gpio = VirtualGPIOSystem(sim)
+    esp32 = ESP32Simulator(gpio, detect=esp_detect, phase=rng.uniform(0, ESP_LOOP_S), log=log)
+    pi = RaspberryPiSimulator(gpio, jitter=jitter, boot_s=boot_s, reset_mode=pi_reset, rng=rng, log=log)
+    esp32.start()
+    pi.start(delay=rng.uniform(0, HEARTBEAT_PERIOD_S))
+    return sim, gpio, esp32, pi
+
+
+def run_scenario(kind, rng, esp_detect="edge", pi_reset="edge", horizon=HORIZON_S):
+    """
+    One randomized scenario:
+      hang       the Pi hangs for good at a random time (also while booting)
+      transient  the Pi hangs for 1-30 s, then carries on by itself
+      reboot     the Pi reboots by itself (boot time 5-40 s)
+      jitter     no fault; heartbeat period jitter up to ±10 s
+
+    Returns:
+        dict: kind, fault time, heartbeats sent / seen, resets, false resets (resets that
+              interrupted a Pi that was not hung), reset latency (fault to the first reset)
+              and recovery latency (fault to the next heartbeat sent) in seconds, or None
+    """
+    jitter = rng.uniform(0, 10.0) if kind == "jitter" else rng.uniform(0, 0.05)
+    boot_s = rng.uniform(15.0, 35.0)
+    sim, gpio, esp32, pi = build(esp_detect, pi_reset, jitter, boot_s, rng)
+    t_fault = rng.uniform(20.0, 60.0)
+
+    if kind == "hang":
+        sim.at(t_fault, pi.hang)
+    elif kind == "transient":
+        sim.at(t_fault, pi.hang, rng.uniform(1.0, 30.0))
+    elif kind == "reboot":
+        sim.at(t_fault, pi.reboot, "spontaneous", rng.uniform(5.0, 40.0))
+    elif kind != "jitter":
+        raise ValueError(f"Unknown scenario: {kind}")
+
+    recovered = []
+    gpio.heartbeat_line.on_falling(lambda: recovered.append(sim.now) if sim.now > t_fault else None)
+    sim.run(horizon)
+
+    resets_after = [t for t in esp32.resets if t >= t_fault]
+    fault = kind != "jitter"
+    return {
+        "kind": kind,
+        "t_fault": t_fault if fault else None,
+        "sent": pi.heartbeats_sent,
+        "seen": esp32.heartbeats_seen,
+        "resets": len(esp32.resets),
+        "false_resets": sum(1 for t in esp32.resets if pi.state_before(t) != "hung"),
+        "reset_latency": resets_after[0] - t_fault if fault and resets_after else None,
+        "recovery_latency": recovered[0] - t_fault if fault and recovered else None,
+        "events": sim.events,
+    }
+
+
+def campaign(n, seed=0, mix=SCENARIOS, **cfg):
+    """`n` scenarios drawn from `mix` (kind -> weight), each with its own seeded RNG."""
+    kinds, weights = list(mix), list(mix.values())
+    picker = random.Random(seed)
+    return [run_scenario(picker.choices(kinds, weights)[0], random.Random(f"{seed}:{i}"), **cfg)
+            for i in range(n)]
+
+
+def _pct(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] if values else None
+
+
+def summarize(results):
+    """Per scenario kind: counts, missed-heartbeat rate, false resets, latency percentiles."""
+    table = {}
+    for kind in sorted({r["kind"] for r in results}):
+        rs = [r for r in results if r["kind"] == kind]
+        sent = sum(r["sent"] for r in rs)
+        reset_lat = [r["reset_latency"] for r in rs if r["reset_latency"] is not None]
+        recov_lat = [r["recovery_latency"] for r in rs if r["recovery_latency"] is not None]
+        table[kind] = {
+            "n": len(rs),
+            "missed_hb_rate": (sent - sum(r["seen"] for r in rs)) / sent if sent else 0.0,
+            "resets": sum(r["resets"] for r in rs),
+            "false_resets": sum(r["false_resets"] for r in rs),
+            "runs_with_false_reset": sum(1 for r in rs if r["false_resets"]),
+            "reset": {q: _pct(reset_lat, q) for q in (0.5, 0.9, 0.99, 1.0)},
+            "reset_n": len(reset_lat),
+            "recovery": {q: _pct(recov_lat, q) for q in (0.5, 0.9, 0.99, 1.0)},
+            "unrecovered": sum(1 for r in rs if r["t_fault"] is not None and r["recovery_latency"] is None),
+        }
+    return table
+
+
+def print_summary(table):
+    fmt = lambda v: "     -" if v is None else f"{v:6.2f}"
+    print(f"{'scenario':<10} {'runs':>5} {'missed hb':>9} {'resets':>6} {'false':>5} "
+          f"{'reset latency p50/p90/p99/max (s)':>35} {'recovery p50/p90/p99/max (s)':>31} {'unrecovered':>11}")
+    for kind, s in table.items():
+        print(f"{kind:<10} {s['n']:5d} {s['missed_hb_rate']:9.1%} {s['resets']:6d} {s['false_resets']:5d} "
+              f"{' '.join(fmt(v) for v in s['reset'].values()):>35} "
+              f"{' '.join(fmt(v) for v in s['recovery'].values()):>31} {s['unrecovered']:11d}")
+
+
+def timeline(esp_detect="edge", pi_reset="edge", until=60.0):
+    """The old auto-test sequence on the virtual clock: 10 s normal, then a 15 s hang."""
+    sim = Simulator()
+    log = lambda who, msg: print(f"[{sim.now:8.3f} s] {who}: {msg}")
+    sim, gpio, esp32, pi = build(esp_detect, pi_reset, log=log, sim=sim)
+    sim.at(10.0, pi.hang, 15.0)
+    sim.run(until)
+    print(f"Heartbeats sent {pi.heartbeats_sent}, seen by ESP32 {esp32.heartbeats_seen}, "
+          f"resets {len(esp32.resets)}, Pi reboots {len(pi.reboots)} ({sim.events} events)")
+
 
 def main():
+    import argparse
+    ap = argparse.ArgumentParser(description="ESP32 + Raspberry Pi watchdog simulation (virtual clock)")
+    ap.add_argument("--campaign", type=int, metavar="N", help="run N randomized scenarios")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--esp-detect", choices=["edge", "poll"], default="edge")
+    ap.add_argument("--pi-reset", choices=["poll", "edge", "hard"], default="edge")
+    ap.add_argument("--scenario", choices=list(SCENARIOS), action="append",
+                    help="restrict the campaign to these kinds (repeatable)")
+    ap.add_argument("--until", type=float, default=60.0, help="timeline length in virtual seconds")
+    args = ap.parse_args()
+
     print("=" * 60)
     print("ESP32 + Raspberry Pi Watchdog Simulation")
     print("=" * 60)
-    
-    # Create virtual GPIO system
-    gpio_system = VirtualGPIOSystem()
-    
-    # Create simulators
-    esp32 = ESP32Simulator(gpio_system)
-    raspberry_pi = RaspberryPiSimulator(gpio_system)
-    
-    # Start simulators in separate threads
-    esp32_thread = threading.Thread(target=esp32.run, daemon=True)
-    pi_thread = threading.Thread(target=raspberry_pi.run, daemon=True)
-    
-    esp32_thread.start()
-    pi_thread.start()
-    
-    # Manual control interface
-    try:
-        while True:
-            print("\nCommands:")
-            print("1 - Simulate Raspberry Pi hang")
-            print("2 - Show status") 
-            print("3 - Quit")
-            print("4 - Auto-test sequence")
-            
-            choice = input("Enter choice: ").strip()
-            
-            if choice == "1":
-                raspberry_pi.simulate_hang = True
-                print("Manual hang simulation triggered!")
-            elif choice == "2":
-                status = "HANGING" if raspberry_pi.simulate_hang else "RUNNING"
-                print(f"Raspberry Pi: {status}, Heartbeats: {raspberry_pi.heartbeat_count}")
-                print(f"ESP32: Pi Running: {esp32.pi_running}")
-            elif choice == "3":
-                raspberry_pi.is_running = False
-                break
-            elif choice == "4":
-                print("\n*** Starting auto-test sequence ***")
-                print("Normal operation for 10 seconds...")
-                time.sleep(10)
-                print("Simulating hang for 15 seconds...")
-                raspberry_pi.simulate_hang = True
-                time.sleep(20)  # Wait for reset and recovery
-                print("Auto-test completed!")
-                
-    except KeyboardInterrupt:
-        raspberry_pi.is_running = False
-        print("\nSimulation stopped")
+    if not args.campaign:
+        timeline(args.esp_detect, args.pi_reset, args.until)
+        return
+    mix = {k: SCENARIOS[k] for k in args.scenario} if args.scenario else SCENARIOS
+    t = time.perf_counter()
+    results = campaign(args.campaign, args.seed, mix, esp_detect=args.esp_detect, pi_reset=args.pi_reset)
+    dt = time.perf_counter() - t
+    events = sum(r["events"] for r in results)
+    print(f"{len(results)} scenarios x {HORIZON_S:g} s virtual in {dt:.2f} s ({events / dt / 1e6:.2f} M events/s), "
+          f"ESP32 {args.esp_detect} detection, Pi reset {args.pi_reset}")
+    print_summary(summarize(results))
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()